@@ -7,11 +7,19 @@ from models.tool_model import ToolModel
 from widgets.calibration_view.measurement_widget import MeasurementWidget
 
 from utils.file_io import FileIOHandler
+from utils.kinematic_calibration import (
+    DEFAULT_IDENTIFIED_GROUPS,
+    KinematicCalibrationResult,
+    KinematicCalibrator,
+    correction_pose_from_transform,
+    load_calibration_poses,
+    pack_parameters,
+)
+from utils.measurement_csv_reader import MeasurementParseReport, iter_frame_blocks
 from utils.popup import show_error_popup, show_warning_popup
 import utils.math_utils as math_utils
 import numpy as np
 import os
-import csv
 import math
 
 
@@ -28,6 +36,7 @@ class MeasurementController(QObject):
         self.robot_model = robot_model
         self.tool_model = tool_model
         self.measurement_widget = measurement_widget
+        self._identification_result: KinematicCalibrationResult | None = None
         self._setup_connections()
     
     def _setup_connections(self) -> None:
@@ -37,6 +46,7 @@ class MeasurementController(QObject):
 
         # Signals from View
         self.measurement_widget.import_measurements_requested.connect(self._on_view_import_measurements_requested)
+        self.measurement_widget.identify_poses_requested.connect(self._on_view_identify_poses_requested)
         self.measurement_widget.clear_measurements_requested.connect(self._on_view_clear_measurements_requested)
         self.measurement_widget.set_as_reference_requested.connect(self._on_view_set_as_reference_requested)
         self.measurement_widget.repere_selected.connect(self._on_view_repere_selected)
@@ -115,7 +125,7 @@ class MeasurementController(QObject):
         self.display_measured_dh_parameters()
         self.measurement_widget.set_measured_controls_enabled(True)
 
-    def _parse_csv_measurements(self, file_path: str) -> list:
+    def _parse_csv_measurements(self, file_path: str, decimate: int = 1) -> list:
         """
         Parse un fichier CSV contenant des matrices 4x4 avec le format :
         // Col::Object,T c0,T c1,T c2,T c3,[Timestamp]
@@ -126,77 +136,71 @@ class MeasurementController(QObject):
 
         Retourne une liste de dictionnaires contenant les mesures
         (World_Frame + R1 a R6). La rotation est conservee en matrice 3x3.
+        Le fichier est lu par blocs vectorises ; les lignes invalides sont
+        regroupees dans un seul avertissement. `decimate` ne garde qu'une
+        occurrence sur N de chaque repere (captures de suivi continu).
         """
         measurements = []
+        report = MeasurementParseReport()
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                next(csvfile)  # skip header
-                lines = csvfile.readlines()
-                i = 0
-
-                while i < len(lines):
-                    line = lines[i].strip()
-                    if not line:
-                        i += 1
-                        continue
-
-                    if not line.startswith(','):
-                        try:
-                            row = line.split(',')
-                            label = row[0].strip()
-                            repere_name = label.split("::")[-1] if "::" in label else label
-                            repere_name = repere_name.replace("'", "").strip()
-
-                            matrix_data = []
-                            for j in range(1, 5):
-                                if j < len(row):
-                                    matrix_data.append(float(row[j]))
-
-                            for _ in range(3):
-                                if i + 1 < len(lines):
-                                    i += 1
-                                    next_line = lines[i].strip()
-                                    if next_line.startswith(','):
-                                        row = next_line[1:].split(',')
-                                        for j in range(4):
-                                            if j < len(row):
-                                                matrix_data.append(float(row[j]))
-
-                            if len(matrix_data) == 16:
-                                T = np.array(matrix_data).reshape(4, 4)
-
-                                x = float(T[0, 3])
-                                y = float(T[1, 3])
-                                z = float(T[2, 3])
-                                R = T[:3, :3]
-
-                                measurement = {
-                                    "name": repere_name,
-                                    "X": x,
-                                    "Y": y,
-                                    "Z": z,
-                                    "R": R,
-                                    "T": T,
-                                }
-                                measurements.append(measurement)
-                            else:
-                                show_warning_popup("Mesure invalide", f"Matrice incomplète pour le repère '{repere_name}' (attendu 16 éléments).")
-                        except (ValueError, IndexError) as e:
-                            show_warning_popup("Ligne invalide", f"Erreur de lecture d'une ligne CSV : {e}")
-
-                    i += 1
-
+            for block in iter_frame_blocks(file_path, decimate=decimate, report=report):
+                positions = block.transforms[:, :3, 3]
+                for name, T, xyz in zip(block.names, block.transforms, positions):
+                    measurements.append({
+                        "name": name,
+                        "X": float(xyz[0]),
+                        "Y": float(xyz[1]),
+                        "Z": float(xyz[2]),
+                        "R": T[:3, :3],
+                        "T": T,
+                    })
         except IOError as e:
             show_error_popup("Erreur fichier", f"Impossible de lire le fichier CSV : {e}")
             return []
 
+        if report.has_errors():
+            show_warning_popup("Lignes invalides", report.summary())
+
         return measurements
 
+    def _on_view_identify_poses_requested(self) -> None:
+        currentDir = os.getcwd()
+        measurementsDir = os.path.join(currentDir, MeasurementController.DEFAULT_MEASUREMENTS_DIRECTORY)
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.measurement_widget,
+            "Importer des poses de calibration",
+            measurementsDir if os.path.exists(measurementsDir) else currentDir,
+            "Fichiers CSV (*.csv)"
+        )
+        if not file_path:
+            return
+
+        try:
+            joints_deg, measurements = load_calibration_poses(file_path)
+            self.identify_from_poses(joints_deg, measurements)
+        except (OSError, ValueError, np.linalg.LinAlgError) as e:
+            show_error_popup("Identification impossible", f"Impossible d'identifier le modèle : {e}")
+            return
+
+        self.measurement_widget.set_measure_filename(os.path.splitext(os.path.basename(file_path))[0])
+        self.measurement_widget.set_measured_controls_enabled(True)
+
+    def get_identification_result(self) -> KinematicCalibrationResult | None:
+        """Dernière identification multi-poses (base, outil, corrections), None si aucune."""
+        return self._identification_result
+
+    def _clear_identification(self) -> None:
+        """Oublie l'identification multi-poses : la table DH mesurée ne vient plus de ces poses."""
+        self._identification_result = None
+        self.measurement_widget.clear_identification()
+
     def _on_view_clear_measurements_requested(self) -> None:
         self.robot_model.clear_measurements()
         self.robot_model.clear_measurement_points()
         self.measurement_widget.clear_measurements()
+        self._clear_identification()
         self.measurement_widget.set_measured_controls_enabled(False)
         self._update_tcp_offsets_from_selection()
     
@@ -498,8 +502,59 @@ class MeasurementController(QObject):
 
         return dh_measured
 
+    def identify_from_poses(
+        self,
+        joints_deg: np.ndarray,
+        measurements: np.ndarray,
+        groups: tuple[str, ...] = DEFAULT_IDENTIFIED_GROUPS,
+        huber_threshold_mm: float | None = None,
+    ) -> KinematicCalibrationResult:
+        """Identification moindres carrés sur N poses (articulaires + TCP ou repère mesuré).
+
+        Le modèle théorique (DH, corrections, outil) sert de point de départ ; le repère de
+        base est identifié depuis le repère de mesure. Les DH identifiés sont affichés dans
+        la table DH mesurée, la base et l'outil dans le bilan d'identification ; le résultat
+        est conservé pour « Appliquer à la configuration robot » (outil, corrections).
+        """
+        tool_pose = correction_pose_from_transform(self.robot_model.get_T_tool(self.tool_model.get_tool()))
+        initial = pack_parameters(
+            self.robot_model.get_dh_params(),
+            self.robot_model.get_corrections(),
+            tool_pose=tool_pose,
+        )
+        calibrator = KinematicCalibrator(joints_deg, measurements, self.robot_model.get_axis_reversed())
+        result = calibrator.solve(initial, groups=groups, huber_threshold_mm=huber_threshold_mm)
+        self._identification_result = result
+        self.measurement_widget.populate_dh_measured_deviations(result.dh_params_as_dicts())
+        self.measurement_widget.display_identification(
+            result.base_pose_abc,
+            result.tool_pose_abc,
+            self._format_identification_summary(calibrator.pose_count, result),
+        )
+        self._update_tcp_offsets_from_selection()
+        return result
+
+    @staticmethod
+    def _format_identification_summary(pose_count: int, result: KinematicCalibrationResult) -> str:
+        summary = (
+            f"{pose_count} poses : RMS {result.rms_mm:.3f} mm, max {result.max_mm:.3f} mm "
+            f"(initial {result.initial_rms_mm:.3f} mm), {len(result.identified_parameters)} paramètres identifiés"
+        )
+        if result.unidentifiable_parameters:
+            summary += f", non identifiables : {', '.join(result.unidentifiable_parameters)}"
+        if result.outlier_indices:
+            summary += f", poses aberrantes : {', '.join(str(index + 1) for index in result.outlier_indices)}"
+        if result.stalled:
+            summary += " (non convergé : aucun pas ne réduit plus l'écart)"
+        elif not result.converged:
+            summary += " (non convergé)"
+        return summary
+
     def display_measured_dh_parameters(self) -> None:
         """Compute and display measured DH parameters in table_dh_measured."""
+        # DH recalculés depuis les repères mesurés : l'outil et les corrections d'une identification
+        # multi-poses précédente ne doivent plus être appliqués avec eux.
+        self._clear_identification()
         dh_measured = self.calculate_measured_dh_parameters()
         if not dh_measured:
             show_warning_popup("Calibration incomplète", "Aucun paramètre DH calculé. Vérifiez que les mesures contiennent au moins un repère robot (R1, R2...).")
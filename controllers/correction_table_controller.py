@@ -24,5 +24,4 @@ class CorrectionTableController(QObject):
         self.correction_table_widget.set_corrections(self.robot_model.get_corrections())
 
     def _on_view_corrections_changed(self, corrections: list[list[float]]):
-        self.robot_model._set_corrections(corrections)
-        self.robot_model._update_tcp_pose()
+        self.robot_model.set_corrections(corrections)
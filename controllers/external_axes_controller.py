@@ -11,6 +11,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from models.external_axis import ExternalAxis
 from models.external_axes_model import ExternalAxesModel
 from models.workspace_model import WorkspaceModel
+from utils.dirty_state_tracker import DirtyStateTracker
 from utils.file_io import FileIOHandler
 from utils.reference_frame_utils import FrameTransform
 from utils.math_utils import matrix_to_pose_zyx
@@ -70,11 +71,12 @@ class ExternalAxesController(QObject):
         self._panel: ExternalAxesPanelWidget = external_axes_view.get_panel_widget()
         self._current_config_file = ""
         self._is_loading_configuration = False
-        self._saved_snapshot: str | None = None
+        self._dirty_tracker = DirtyStateTracker()
         self._has_saved_reference = False
         self._clean_status_text = ExternalAxesController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._validation_icon_visible = False
+        self._setup_dirty_tracking()
         self._setup_connections()
         self._refresh_view()
         self._mark_as_none_reference()
@@ -83,6 +85,16 @@ class ExternalAxesController(QObject):
     # Connexions
     # ------------------------------------------------------------------
 
+    def _setup_dirty_tracking(self) -> None:
+        """Une section par axe, relue seulement quand la révision de l'axe change.
+
+        Les valeurs articulaires (axes_values_changed) ne sont pas enregistrées : le jog ne relit rien.
+        """
+        tracker = self._dirty_tracker
+        tracker.add_item_section("axes", self.model.get_axis_revisions, self._read_axis_section)
+        tracker.add_section("robot_mount", self.model.get_robot_mount_parent_id)
+        tracker.bind(self.model.mount_topology_changed, "robot_mount")
+
     def _setup_connections(self) -> None:
         # Vue → modèle
         self._panel.axis_added.connect(self._on_axis_added)
@@ -156,40 +168,40 @@ class ExternalAxesController(QObject):
     def _has_axes_configuration(self) -> bool:
         return bool(self.model.get_axes())
 
-    def _capture_current_snapshot(self) -> str:
-        return ExternalAxesController._normalized_serialized_state(self.get_serializable_state())
+    def _read_axis_section(self, axis_id: str) -> dict | None:
+        axis = self.model.get_axis(axis_id)
+        return ExternalAxesController._serializable_axis_data(axis.to_dict()) if axis is not None else None
 
     def _mark_as_saved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = ExternalAxesController.STATUS_SAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_loaded_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = ExternalAxesController.STATUS_LOADED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_unsaved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = ExternalAxesController.STATUS_UNSAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_none_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = ExternalAxesController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _is_dirty(self) -> bool:
-        current_snapshot = self._capture_current_snapshot()
-        return self._saved_snapshot is None or current_snapshot != self._saved_snapshot
+        return self._dirty_tracker.is_dirty()
 
     def _refresh_configuration_status(self) -> None:
         self._refresh_configuration_header()
@@ -369,13 +381,18 @@ class ExternalAxesController(QObject):
 
     def get_serializable_state(self) -> dict:
         data = self.model.to_dict()
-        ExternalAxesController._strip_runtime_axis_values(data)
-        for axis_data in data.get("axes", []):
-            axis_data["base_cad_model"] = _normalize_project_path(axis_data.get("base_cad_model", ""))
-            for joint_data in axis_data.get("joints", []):
-                joint_data["cad_model"] = _normalize_project_path(joint_data.get("cad_model", ""))
+        data["axes"] = [ExternalAxesController._serializable_axis_data(axis_data) for axis_data in data.get("axes", [])]
         return data
 
+    @staticmethod
+    def _serializable_axis_data(axis_data: dict) -> dict:
+        """Axe tel qu'enregistré : sans valeurs articulaires, chemins CAO relatifs au projet."""
+        axis_data["base_cad_model"] = _normalize_project_path(axis_data.get("base_cad_model", ""))
+        for joint_data in axis_data.get("joints", []):
+            joint_data.pop("value", None)
+            joint_data["cad_model"] = _normalize_project_path(joint_data.get("cad_model", ""))
+        return axis_data
+
     def restore_state(self, data: dict, file_path: str = "") -> None:
         if not data:
             return
@@ -10,7 +10,12 @@ from models.reference_frame import ReferenceFrame
 from views.jog_view import JogView
 import utils.math_utils as math_utils
 from models.types import Pose6
-from utils.cartesian_jog import compute_cartesian_jog_target
+from utils.cartesian_jog import (
+    compute_cartesian_jog_target,
+    compute_damped_joint_increment,
+    compute_geometric_jacobian,
+    compute_pose_twist,
+)
 from utils.external_axes_kinematics import compute_target_in_robot_base, get_effective_robot_base_in_world
 from utils.reference_frame_utils import convert_pose_from_base_frame
 
@@ -45,6 +50,9 @@ class JogController(QObject):
         self.jog_step_joint: float = 1  # Incrément en degrés pour jog articulaire
         self.jog_step_cartesian: float = 1  # Incrément en mm pour jog cartésien
         self.jog_timer_interval: int = 20  # Intervalle de mise à jour en ms
+        # Jog cartésien différentiel (jacobienne) ; le MGI complet n'est résolu qu'au
+        # relâchement ou lors d'un changement de configuration.
+        self.differential_cartesian_jog: bool = True
         
         # Référentiel actuel (Base ou Tool)
         self.base_tool_reference = "Base"
@@ -54,6 +62,13 @@ class JogController(QObject):
         self._jog_active_cartesian: Optional[Tuple[int, int]] = None  # (index, direction: -1 or 1)
         self._jog_active_external: Optional[Tuple[str, int, int]] = None  # (axis_id, joint_idx, dir)
         self._jog_active_cartesian_external: Optional[Tuple[str, int, int]] = None
+        # Consigne intégrée du jog différentiel : la dérive de linéarisation est rattrapée
+        # au pas suivant au lieu de s'accumuler.
+        self._jog_target_pose: Optional[Pose6] = None
+        self._jog_axis_config = None
+        # État MGI d'avant le jog différentiel, mémorisé une seule fois par séquence de jog
+        self._differential_jog_running = False
+        self._ik_inhibited_before_jog = False
 
         # Timer pour jog continu
         self.jog_timer = QTimer()
@@ -132,11 +147,8 @@ class JogController(QObject):
             return
         
         # Arrêter tout jog en cours
-        self.jog_timer.stop()
+        self._stop_jog()
         self._jog_active_joint = (joint_index, direction)
-        self._jog_active_cartesian = None
-        self._jog_active_external = None
-        self._jog_active_cartesian_external = None
         
         # Démarrer le timer pour le jog continu
         self.jog_timer.start(self.jog_timer_interval)
@@ -153,12 +165,13 @@ class JogController(QObject):
         if not self.robot_model.has_configuration:
             return
         
-        # Arrêter tout jog en cours
+        # Arrêter tout jog en cours (un jog cartésien déjà actif garde son état MGI d'origine)
         self.jog_timer.stop()
         self._jog_active_cartesian = (axis_index, direction)
         self._jog_active_joint = None
         self._jog_active_external = None
         self._jog_active_cartesian_external = None
+        self._begin_differential_jog()
         
         # Démarrer le timer pour le jog continu
         self.jog_timer.start(self.jog_timer_interval)
@@ -169,6 +182,34 @@ class JogController(QObject):
         if self._jog_active_cartesian and self._jog_active_cartesian[0] == axis_index:
             self.jog_timer.stop()
             self._jog_active_cartesian = None
+            self._end_differential_jog()
+
+    def _stop_jog(self) -> None:
+        """Arrête le jog en cours, quel qu'il soit, et restaure l'état MGI d'un jog cartésien."""
+        self.jog_timer.stop()
+        self._jog_active_joint = None
+        self._jog_active_cartesian = None
+        self._jog_active_external = None
+        self._jog_active_cartesian_external = None
+        self._end_differential_jog()
+
+    def _begin_differential_jog(self) -> None:
+        self._jog_target_pose = None
+        self._jog_axis_config = self.robot_model.get_current_axis_config()
+        if self.differential_cartesian_jog and not self._differential_jog_running:
+            self._differential_jog_running = True
+            self._ik_inhibited_before_jog = self.robot_model.is_ik_inhibited()
+            self.robot_model.inhibit_ik(True)
+
+    def _end_differential_jog(self) -> None:
+        self._jog_target_pose = None
+        if not self._differential_jog_running:
+            return
+        self._differential_jog_running = False
+        self.robot_model.inhibit_ik(self._ik_inhibited_before_jog)
+        if not self._ik_inhibited_before_jog:
+            # MGI complet une seule fois, au relâchement (panneau des solutions MGI).
+            self.robot_model.compute_fk_tcp()
     
     def _on_jog_timer_tick(self) -> None:
         """Appelé périodiquement pour effectuer le jog continu"""
@@ -219,6 +260,9 @@ class JogController(QObject):
             reference_frame = (
                 ReferenceFrame.TOOL if self.base_tool_reference == "Tool" else ReferenceFrame.ROBOT
             )
+            if self.differential_cartesian_jog and self._jog_cartesian_differential(reference_frame, axis_index, delta):
+                return
+
             target = compute_cartesian_jog_target(
                 self.robot_model.get_tcp_pose(),
                 reference_frame,
@@ -235,6 +279,43 @@ class JogController(QObject):
         except Exception as e:
             self.jog_error.emit(f"Erreur lors du jog cartésien : {e}")
 
+    def _jog_cartesian_differential(self, reference_frame: ReferenceFrame, axis_index: int, delta: float) -> bool:
+        """Pas de jog par la jacobienne au point courant (moindres carrés amortis).
+
+        Retourne False si le pas ne peut pas être fait ainsi (MGD indisponible) : le jog
+        retombe alors sur le MGI complet.
+        """
+        dh_matrices = self.robot_model.get_current_tcp_dh_matrices()
+        if len(dh_matrices) < 8:
+            return False
+
+        current_pose = self.robot_model.get_tcp_pose()
+        previous_target = self._jog_target_pose if self._jog_target_pose is not None else current_pose
+        target = compute_cartesian_jog_target(previous_target, reference_frame, axis_index, delta)
+        jacobian = compute_geometric_jacobian(dh_matrices, self.robot_model.get_axis_reversed())
+        increment, _ = compute_damped_joint_increment(jacobian, compute_pose_twist(current_pose, target))
+
+        current_joints = self.robot_model.get_joints()
+        new_joints = []
+        clamped = False
+        for joint_index in range(6):
+            min_limit, max_limit = self.robot_model.get_axis_limit(joint_index)
+            value = current_joints[joint_index] + float(increment[joint_index])
+            bounded = max(min_limit, min(max_limit, value))
+            clamped = clamped or bounded != value
+            new_joints.append(bounded)
+
+        self.robot_model.set_joints(new_joints)
+        # En butée ou freiné par l'amortissement, la consigne se recale sur la pose atteinte
+        # pour ne pas accumuler un retard qui ferait repartir le robot au relâchement.
+        self._jog_target_pose = None if clamped else target
+
+        axis_config = self.robot_model.get_current_axis_config()
+        if axis_config != self._jog_axis_config:
+            self._jog_axis_config = axis_config
+            self.robot_model.refresh_current_tcp_mgi_result()
+        return True
+
     def _on_base_tool_changed(self, reference: str) -> None:
         """Appelé quand l'utilisateur change de référentiel (Base/Tool)"""
         self.base_tool_reference = reference
@@ -243,10 +324,7 @@ class JogController(QObject):
         self._update_display_from_model()
 
     def _on_jog_external_pressed(self, axis_id: str, joint_index: int, direction: int) -> None:
-        self.jog_timer.stop()
-        self._jog_active_joint = None
-        self._jog_active_cartesian = None
-        self._jog_active_cartesian_external = None
+        self._stop_jog()
         self._jog_active_external = (axis_id, joint_index, direction)
         self.jog_timer.start(self.jog_timer_interval)
 
@@ -264,10 +342,7 @@ class JogController(QObject):
     def _on_jog_cartesian_external_pressed(self, axis_id: str, joint_index: int, direction: int) -> None:
         if not self.robot_model.has_configuration or self.external_axes_model is None:
             return
-        self.jog_timer.stop()
-        self._jog_active_joint = None
-        self._jog_active_cartesian = None
-        self._jog_active_external = None
+        self._stop_jog()
         self._jog_active_cartesian_external = (axis_id, joint_index, direction)
         self.jog_timer.start(self.jog_timer_interval)
 
@@ -40,6 +40,7 @@ from models.external_axes_model import ExternalAxesModel
 from models.robot_model import RobotModel
 from models.tool_model import ToolModel
 from models.tooling_model import ToolingModel
+from models.types import Pose6
 from models.workspace_model import WorkspaceModel
 from models.workpiece_model import WorkpieceModel
 from utils.status_badge import apply_status_badge
@@ -239,7 +240,15 @@ class MainController(QObject):
         )
 
     def _on_apply_measured_dh_requested(self) -> None:
-        measured_dh = self.calibration_controller.measurement_controller.get_selected_measured_dh_params()
+        measurement_controller = self.calibration_controller.measurement_controller
+        measured_dh = measurement_controller.get_selected_measured_dh_params()
+        identification = measurement_controller.get_identification_result()
+        if identification is not None:
+            # Identification multi-poses : l'outil et les corrections identifiés accompagnent les DH
+            if "tool" in identification.groups:
+                self.tool_model.set_tool_pose(Pose6(*identification.tool_pose_abc))
+            if "corrections" in identification.groups:
+                self.robot_model.set_corrections(identification.corrections)
         self.robot_model.set_measured_dh_params(measured_dh)
         self.robot_model.set_measured_dh_enabled(True)
         self.robot_controller.dh_controller.robot_configuration_widget.set_measured_dh_params(measured_dh)
@@ -4,6 +4,7 @@ from bisect import bisect_left
 from dataclasses import dataclass, replace
 from pathlib import Path
 import time
+from typing import Callable
 
 import numpy as np
 from PyQt6.QtCore import QTimer, Qt
@@ -28,7 +29,6 @@ from models.program_generation_settings import ProgramGenerationSettings
 from models.robot_model import RobotModel
 from models.robot_program import MotionRole, ProgramBaseSource, ProgramBaseSpec, ProgramOrigin
 from models.tool_model import ToolModel
-from models.types.approach_retract import ApproachAxisRef
 from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
 from models.types import JointAngles6, Pose6
 from models.workspace_model import WorkspaceModel
@@ -36,9 +36,14 @@ from utils.math_utils import invert_homogeneous_transform
 from utils.reference_frame_utils import matrix_to_pose, pose_to_matrix
 from utils.program_simulator import ProgramSimulator
 from utils.mgi import RobotTool
-from utils.aptsource_parser import load_aptsource_program
-from utils.catnc_parser import load_catnc_program
-from utils.robot_program_kuka import export_kuka_src_program, generate_program_to_path, load_kuka_src_program
+from utils.program_preparation import (
+    load_robot_program,
+    program_with_base_pose,
+    program_with_simulation_overrides,
+    rebuild_derived_motions,
+)
+from utils.robot_program_kuka import export_kuka_src_program, generate_program_to_path
+from utils.trajectory_result_archive import ARCHIVE_EXTENSION, save_program_simulation_npz
 from widgets.program_view.program_target_dialog import ProgramTargetDialog
 from widgets.program_view.program_keypoints_widget import ProgramKeypointsWidget
 from widgets.program_view.program_playback_widget import ProgramPlaybackWidget
@@ -156,12 +161,12 @@ class ProgramController:
         # Guard : True pendant l'application d'un état de playback (les signaux
         # axes externes / pièce ne doivent alors PAS invalider la simulation)
         self._suppress_context_invalidation = False
-        self._nominal_segments_cache: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
-        self._measured_segments_cache: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
         self._compensated_segments_cache: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
         # Géométrie nominale pré-construite une fois (étape 2 perf)
         self._nom_seg_pts: list[np.ndarray] = []   # pts robot-frame par segment, (K,3)
         self._nom_seg_times: list[np.ndarray] = [] # temps par vertex par segment, (K,)
+        self._meas_seg_pts: list[np.ndarray] = []
+        self._meas_seg_times: list[np.ndarray] = []
         self._current_time_s = 0.0
         self._last_split_sample_index: int = -1
         self._last_traj_refresh_wall_s: float = 0.0
@@ -195,6 +200,7 @@ class ProgramController:
         self.header_widget.clear_requested.connect(self._on_clear_requested)
         self.actions_widget.recompute_requested.connect(self._on_recompute_requested)
         self.actions_widget.export_requested.connect(self._on_export_requested)
+        self.actions_widget.export_simulation_requested.connect(self._on_export_simulation_requested)
         self._connect_playback_widget(self.playback_widget)
         self.actions_widget.trajectory_visibility_changed.connect(self._on_trajectory_visibility_changed)
         self.actions_widget.compute_compensation_requested.connect(self._on_compute_compensation_requested)
@@ -329,13 +335,7 @@ class ProgramController:
     def _load_program_from_path(self, file_path: str) -> None:
         from models.robot_program import ProgramOrigin
         try:
-            suffix = Path(file_path).suffix.lower()
-            if suffix in {".apt", ".aptsource", ".cls", ".cl"}:
-                loaded = load_aptsource_program(file_path)
-            elif suffix in {".nc", ".cnc", ".mpf", ".gcode", ".catnccode"}:
-                loaded = load_catnc_program(file_path)
-            else:
-                loaded = load_kuka_src_program(file_path)
+            loaded = load_robot_program(file_path)
 
             is_imported = loaded.origin in {ProgramOrigin.IMPORTED_APT, ProgramOrigin.IMPORTED_CATNC}
             self._file_base_pose = loaded.program_base_pose.copy()
@@ -443,11 +443,11 @@ class ProgramController:
             self._display_keypoint_tools = []
             self._display_target_refs = []
             self._motion_end_world_xyz = {}
-            self._nominal_segments_cache = []
-            self._measured_segments_cache = []
             self._compensated_segments_cache = []
             self._nom_seg_pts = []
             self._nom_seg_times = []
+            self._meas_seg_pts = []
+            self._meas_seg_times = []
             self._last_split_sample_index = -1
             self._refresh_view()
             return
@@ -543,12 +543,8 @@ class ProgramController:
                     _p = _last_s.nominal_pose_world
                     self._motion_end_world_xyz[_mi] = (_p.x, _p.y, _p.z)
 
-        self._nominal_segments_cache, self._measured_segments_cache = self._build_nominal_and_measured_segments(
-            _theo_samples,
-            self._get_nominal_color(),
-            self.MEASURED_COLOR,
-        )
         self._nom_seg_pts, self._nom_seg_times = self._build_nom_segs_np(_theo_samples)
+        self._meas_seg_pts, self._meas_seg_times = self._build_meas_segs_np(_theo_samples)
         self._compensated_segments_cache = []
         self._simulation_dirty = False
 
@@ -585,6 +581,7 @@ class ProgramController:
             self.header_widget.set_program_save_as_enabled(False)
             self.header_widget.set_program_status(ProgramController.STATUS_NONE, "#808080")
             self.actions_widget.set_export_enabled(False)
+            self.actions_widget.set_simulation_export_enabled(False)
             self.actions_widget.set_simulation_enabled(False)
             self.actions_widget.set_compensation_enabled(False)
             return
@@ -609,6 +606,7 @@ class ProgramController:
         )
         self.actions_widget.set_simulation_enabled(self._simulation_dirty)
         is_simulated = self.current_result is not None and not self._simulation_dirty
+        self.actions_widget.set_simulation_export_enabled(is_simulated)
         self.actions_widget.set_compensation_enabled(is_simulated and measured_model_available)
         self.actions_widget.set_compensated_checkbox_enabled(
             measured_model_available and self._compensation_computed
@@ -750,56 +748,39 @@ class ProgramController:
             self.viewer3d_controller.clear_trajectory_path()
             return
 
-        segments: list[tuple[np.ndarray | list[list[float]], tuple[float, float, float, float] | np.ndarray]] = []
+        segments: list[tuple] = []
 
-        show_split = self._current_time_s > 1e-9
         theoretical_visible = self.actions_widget.is_theoretical_visible()
         measured_visible = self.actions_widget.is_measured_visible()
+        accent = self.viewer3d_controller.get_accent_color_rgba()
 
-        # Trajectoire nominale : geometry pré-construite, couleurs par-vertex vectorisées
-        if theoretical_visible and self._nom_seg_pts:
-            nominal_color_arr = np.array(self._get_nominal_color(), dtype=np.float64)
-            if show_split:
-                done_color_arr = np.array(
-                    self.viewer3d_controller.get_accent_color_rgba(), dtype=np.float64
-                )
-                t_split = self._current_time_s
-                for pts, times in zip(self._nom_seg_pts, self._nom_seg_times):
-                    n = len(pts)
-                    colors = np.empty((n, 4), dtype=np.float64)
-                    mask = times <= t_split
-                    colors[mask] = done_color_arr
-                    colors[~mask] = nominal_color_arr
-                    segments.append((pts, colors))
-            else:
-                for pts in self._nom_seg_pts:
-                    segments.append((pts, tuple(nominal_color_arr)))
+        # Géométrie pré-construite pleine résolution ; les temps par point servent de clé
+        # de split : la lecture ne recolore ensuite qu'une plage (set_trajectory_path_split).
+        if theoretical_visible:
+            nominal_color = self._get_nominal_color()
+            for pts, times in zip(self._nom_seg_pts, self._nom_seg_times):
+                segments.append((pts, nominal_color, times, accent))
 
-        # Trajectoire mesurée (chemin non critique, approche legacy)
         if measured_visible:
-            if show_split:
-                done_measured = self._compute_done_color(self.MEASURED_COLOR)
-                motion_mode = self.config_widget.get_motion_mode()
-                _, split_meas = self._build_nominal_and_measured_segments(
-                    self._get_samples_for_modes("THEORETICAL", motion_mode),
-                    self._get_nominal_color(),
-                    self.MEASURED_COLOR,
-                    done_nominal_color=self.viewer3d_controller.get_accent_color_rgba(),
-                    done_measured_color=done_measured,
-                    split_time_s=self._current_time_s,
-                )
-                segments.extend(split_meas)
-            else:
-                segments.extend(self._measured_segments_cache)
+            done_measured = self._compute_done_color(self.MEASURED_COLOR)
+            for pts, times in zip(self._meas_seg_pts, self._meas_seg_times):
+                segments.append((pts, self.MEASURED_COLOR, times, done_measured))
 
         if self._compensation_computed and self.actions_widget.is_compensated_visible():
             segments.extend(self._compensated_segments_cache)
 
         if segments:
-            self.viewer3d_controller.set_trajectory_path_segments(segments, in_world=True)
+            self.viewer3d_controller.set_trajectory_path_segments(
+                segments,
+                in_world=True,
+                split_key=self._current_split_time(),
+            )
         else:
             self.viewer3d_controller.clear_trajectory_path()
 
+    def _current_split_time(self) -> float | None:
+        return self._current_time_s if self._current_time_s > 1e-9 else None
+
 
 
     def _refresh_viewer_keypoints(self) -> None:
@@ -963,14 +944,15 @@ class ProgramController:
         # Mise à jour directe du viewer (chemin léger, bypasse _refresh_robot_state_items)
         if self.viewer3d_controller.is_playback_active():
             self.viewer3d_controller.update_robot_poses_for_playback()
-        # Met à jour la portion "réalisée" et les overlays programme (throttlé à ~30 Hz).
+        # Met à jour la portion "réalisée" (recoloration d'une plage, sans reconstruire
+        # le chemin) et les overlays programme (throttlés à ~30 Hz).
         new_split_index = sample_index if self._current_time_s > 1e-9 else -1
         if new_split_index != self._last_split_sample_index:
             self._last_split_sample_index = new_split_index
+            self.viewer3d_controller.set_trajectory_path_split(self._current_split_time())
             now = time.perf_counter()
             if now - self._last_traj_refresh_wall_s >= self._TRAJ_REFRESH_INTERVAL_S:
                 self._last_traj_refresh_wall_s = now
-                self._refresh_viewer_segments()
                 if self.viewer3d_controller.is_playback_active():
                     self._refresh_program_overlays_for_playback()
 
@@ -1163,6 +1145,27 @@ class ProgramController:
 
 
 
+    def _on_export_simulation_requested(self) -> None:
+        if self.current_program is None or self.current_result is None or self._simulation_dirty:
+            QMessageBox.warning(self.program_view, "Programme robot", "Aucune simulation a exporter.")
+            return
+        source_path = Path(self.current_program.source_path)
+        default_path = str(source_path.with_name(f"{source_path.stem}_simulation{ARCHIVE_EXTENSION}"))
+        file_path, _selected_filter = QFileDialog.getSaveFileName(
+            self.program_view,
+            "Exporter la simulation",
+            default_path,
+            "Archives NPZ (*.npz)",
+        )
+        if not file_path:
+            return
+        try:
+            written_path = save_program_simulation_npz(file_path, self.current_result)
+        except OSError as exc:
+            QMessageBox.critical(self.program_view, "Programme robot", f"Impossible d'exporter la simulation.\n{exc}")
+            return
+        QMessageBox.information(self.program_view, "Programme robot", f"Simulation exportee :\n{written_path}")
+
     def _on_go_to_requested(self, row: int) -> None:
 
         if row < 0 or row >= len(self._display_keypoints):
@@ -1245,35 +1248,12 @@ class ProgramController:
         if self.current_program is None:
             return None
 
-        tool_pose = self._effective_tool_pose()
-        constant_speed_mmps = self._generation_settings.constant_speed_mmps
-        orientation_override = self._orientation_override
-        if tool_pose is None and constant_speed_mmps is None and orientation_override is None:
-            return self.current_program
-
-        updated_motions: list[RobotProgramMotion] = []
-        for motion in self.current_program.motions:
-            updated_motion = motion
-            if tool_pose is not None:
-                updated_motion = replace(updated_motion, tool_pose=tool_pose.copy())
-            if (
-                constant_speed_mmps is not None
-                and motion.role == MotionRole.NORMAL
-                and motion.mode in {RobotProgramMotionMode.LINEAR, RobotProgramMotionMode.CIRCULAR}
-            ):
-                updated_motion = replace(updated_motion, cp_speed_mps=float(constant_speed_mmps) / 1000.0)
-            if (
-                orientation_override is not None
-                and motion.target.target_type == RobotProgramTargetType.CARTESIAN
-            ):
-                cp = motion.target.cartesian_pose
-                overridden_pose = Pose6(
-                    x=cp.x, y=cp.y, z=cp.z,
-                    a=orientation_override.a, b=orientation_override.b, c=orientation_override.c,
-                )
-                updated_motion = replace(updated_motion, target=replace(motion.target, cartesian_pose=overridden_pose))
-            updated_motions.append(updated_motion)
-        return replace(self.current_program, motions=updated_motions)
+        return program_with_simulation_overrides(
+            self.current_program,
+            tool_pose=self._effective_tool_pose(),
+            constant_speed_mmps=self._generation_settings.constant_speed_mmps,
+            orientation_override=self._orientation_override,
+        )
 
 
 
@@ -1897,17 +1877,7 @@ class ProgramController:
 
     @staticmethod
     def _program_with_updated_base_pose(program: RobotProgram | None, base_pose: Pose6) -> RobotProgram | None:
-
-        if program is None:
-
-            return None
-
-        updated_motions = [
-            replace(motion, base_pose=base_pose.copy())
-            for motion in program.motions
-        ]
-
-        return replace(program, program_base_pose=base_pose.copy(), motions=updated_motions)
+        return program_with_base_pose(program, base_pose)
 
     def _update_program_base_pose(self, base_pose: Pose6) -> None:
 
@@ -1919,8 +1889,8 @@ class ProgramController:
         # Transmettre le descripteur de source aux simulateurs : il leur permet de suivre
         # l'élément source (pièce / axe externe) quand les axes bougent pendant le programme.
         base_spec = self._build_base_spec()
-        self.program_simulator._base_spec = base_spec
-        self._derived_simulator._base_spec = base_spec
+        self.program_simulator.set_base_spec(base_spec)
+        self._derived_simulator.set_base_spec(base_spec)
         self.current_program = self._program_with_updated_base_pose(self.current_program, updated_base_pose)
         self._articular_program = self._program_with_updated_base_pose(self._articular_program, updated_base_pose)
         self._cartesian_program = self._program_with_updated_base_pose(self._cartesian_program, updated_base_pose)
@@ -1950,11 +1920,11 @@ class ProgramController:
         self._compensated_articular_result = None
         self._compensation_computed = False
         self._simulation_dirty = True
-        self._nominal_segments_cache = []
-        self._measured_segments_cache = []
         self._compensated_segments_cache = []
         self._nom_seg_pts = []
         self._nom_seg_times = []
+        self._meas_seg_pts = []
+        self._meas_seg_times = []
         self._last_split_sample_index = -1
         self.actions_widget.set_compensated_checkbox_enabled(False)
         self.actions_widget.set_simulation_enabled(True)
@@ -2028,46 +1998,6 @@ class ProgramController:
 
 
 
-    @staticmethod
-
-    def _downsample_segments(
-
-        segments: list[tuple[list[list[float]], tuple[float, float, float, float]]],
-
-        max_points: int = 3000,
-
-    ) -> list[tuple[list[list[float]], tuple[float, float, float, float]]]:
-
-        total_points = sum(len(points) for points, _color in segments)
-
-        if total_points <= max_points:
-
-            return segments
-
-        stride = max(1, int(total_points / max_points))
-
-        reduced_segments: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
-
-        for points, color in segments:
-
-            if len(points) <= 2:
-
-                reduced_segments.append((points, color))
-
-                continue
-
-            reduced_points = points[::stride]
-
-            if reduced_points[-1] != points[-1]:
-
-                reduced_points.append(points[-1])
-
-            reduced_segments.append((reduced_points, color))
-
-        return reduced_segments
-
-
-
     def _motion_target_to_keypoint(
 
         self,
@@ -2394,12 +2324,8 @@ class ProgramController:
         )
 
         _theo_samples_2 = self._get_samples_for_modes("THEORETICAL", motion_mode)
-        self._nominal_segments_cache, self._measured_segments_cache = self._build_nominal_and_measured_segments(
-            _theo_samples_2,
-            self._get_nominal_color(),
-            self.MEASURED_COLOR,
-        )
         self._nom_seg_pts, self._nom_seg_times = self._build_nom_segs_np(_theo_samples_2)
+        self._meas_seg_pts, self._meas_seg_times = self._build_meas_segs_np(_theo_samples_2)
         self._compensated_segments_cache = self._build_segments(
             self._get_samples_for_modes("COMPENSATED", motion_mode),
             self.COMPENSATED_COLOR,
@@ -2533,96 +2459,11 @@ class ProgramController:
         return (done.redF(), done.greenF(), done.blueF(), 1.0)
 
     @staticmethod
-    def _build_nominal_and_measured_segments(
-        samples: list[ProgramSimulationSample],
-        nominal_color: tuple[float, float, float, float],
-        measured_color: tuple[float, float, float, float],
-        done_nominal_color: tuple[float, float, float, float] | None = None,
-        done_measured_color: tuple[float, float, float, float] | None = None,
-        split_time_s: float | None = None,
-    ) -> tuple[
-        list[tuple[list[list[float]], tuple[float, float, float, float]]],
-        list[tuple[list[list[float]], tuple[float, float, float, float]]],
-    ]:
-        """Construit les segments d'affichage en repère MONDE (poses world des samples)."""
-        nominal_segments: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
-        measured_segments: list[tuple[list[list[float]], tuple[float, float, float, float]]] = []
-
-        use_split = (split_time_s is not None
-                     and done_nominal_color is not None
-                     and done_measured_color is not None)
-
-        nom_points: list[list[float]] = []
-        meas_points: list[list[float]] = []
-        current_key: tuple[str, int] | None = None
-        current_nom_is_done: bool = False
-        current_meas_is_done: bool = False
-
-        def _flush_nom(is_done: bool) -> None:
-            if len(nom_points) >= 2:
-                color = done_nominal_color if is_done else nominal_color
-                nominal_segments.append((nom_points[:], color))
-
-        def _flush_meas(is_done: bool) -> None:
-            if len(meas_points) >= 2:
-                color = done_measured_color if is_done else measured_color
-                measured_segments.append((meas_points[:], color))
-
-        def _nom_xyz(sample: ProgramSimulationSample) -> list[float]:
-            nom = sample.nominal_pose_world if sample.nominal_pose_world is not None else sample.nominal_pose_base
-            return [nom.x, nom.y, nom.z]
-
-        for sample in samples:
-            nom_pose = sample.nominal_pose_base
-            meas_pose = sample.measured_pose_world if sample.measured_pose_world is not None else sample.measured_pose_base
-            if nom_pose is None and meas_pose is None:
-                continue
-
-            motion_key = (sample.motion_mode.value, int(sample.source_line))
-            sample_is_done = use_split and float(sample.time_s) <= split_time_s
-
-            motion_break = current_key is not None and motion_key != current_key
-
-            if motion_break:
-                _flush_nom(current_nom_is_done)
-                nom_points = [nom_points[-1]] if nom_points else []
-                _flush_meas(current_meas_is_done)
-                meas_points = [meas_points[-1]] if meas_points else []
-                current_nom_is_done = sample_is_done
-                current_meas_is_done = sample_is_done
-            elif use_split and nom_points and sample_is_done != current_nom_is_done:
-                _flush_nom(current_nom_is_done)
-                nom_points = [nom_points[-1]]
-                current_nom_is_done = sample_is_done
-            elif use_split and meas_points and sample_is_done != current_meas_is_done:
-                _flush_meas(current_meas_is_done)
-                meas_points = [meas_points[-1]]
-                current_meas_is_done = sample_is_done
-
-            current_key = motion_key
-            if not use_split:
-                current_nom_is_done = False
-                current_meas_is_done = False
-            else:
-                current_nom_is_done = sample_is_done
-                current_meas_is_done = sample_is_done
-
-            if nom_pose is not None:
-                nom_points.append(_nom_xyz(sample))
-            if meas_pose is not None:
-                meas_points.append([meas_pose.x, meas_pose.y, meas_pose.z])
-
-        if current_key is not None:
-            _flush_nom(current_nom_is_done)
-            _flush_meas(current_meas_is_done)
-
-        return nominal_segments, measured_segments
-
-    @staticmethod
-    def _build_nom_segs_np(
+    def _build_world_segs_np(
         samples: list[ProgramSimulationSample],
+        xyz_of: Callable[[ProgramSimulationSample], list[float] | None],
     ) -> tuple[list[np.ndarray], list[np.ndarray]]:
-        """Pré-construit les segments nominaux comme numpy arrays, en repère MONDE.
+        """Découpe les positions MONDE des samples en segments par mouvement.
 
         Retourne deux listes parallèles :
         - pts_segs  : (K, 3) float64 par segment
@@ -2639,12 +2480,9 @@ class ProgramController:
                 pts_segs.append(np.array(cur_pts, dtype=np.float64))
                 time_segs.append(np.array(cur_times, dtype=np.float64))
 
-        def _nom_xyz(sample: ProgramSimulationSample) -> list[float]:
-            nom = sample.nominal_pose_world if sample.nominal_pose_world is not None else sample.nominal_pose_base
-            return [nom.x, nom.y, nom.z]
-
         for sample in samples:
-            if sample.nominal_pose_base is None and sample.nominal_pose_world is None:
+            xyz = xyz_of(sample)
+            if xyz is None:
                 continue
             key = (sample.motion_mode.value, int(sample.source_line))
             if cur_key is not None and key != cur_key:
@@ -2652,12 +2490,40 @@ class ProgramController:
                 cur_pts = [cur_pts[-1]] if cur_pts else []
                 cur_times = [cur_times[-1]] if cur_times else []
             cur_key = key
-            cur_pts.append(_nom_xyz(sample))
+            cur_pts.append(xyz)
             cur_times.append(float(sample.time_s))
 
         _flush()
         return pts_segs, time_segs
 
+    @classmethod
+    def _build_nom_segs_np(
+        cls,
+        samples: list[ProgramSimulationSample],
+    ) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Pré-construit les segments nominaux comme numpy arrays, en repère MONDE."""
+        def _nom_xyz(sample: ProgramSimulationSample) -> list[float] | None:
+            nom = sample.nominal_pose_world if sample.nominal_pose_world is not None else sample.nominal_pose_base
+            if nom is None:
+                return None
+            return [nom.x, nom.y, nom.z]
+
+        return cls._build_world_segs_np(samples, _nom_xyz)
+
+    @classmethod
+    def _build_meas_segs_np(
+        cls,
+        samples: list[ProgramSimulationSample],
+    ) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Pré-construit les segments mesurés comme numpy arrays, en repère MONDE."""
+        def _meas_xyz(sample: ProgramSimulationSample) -> list[float] | None:
+            meas = sample.measured_pose_world if sample.measured_pose_world is not None else sample.measured_pose_base
+            if meas is None:
+                return None
+            return [meas.x, meas.y, meas.z]
+
+        return cls._build_world_segs_np(samples, _meas_xyz)
+
     def _build_segments(
         self,
         samples: list[ProgramSimulationSample],
@@ -2821,160 +2687,9 @@ class ProgramController:
         settings: ProgramGenerationSettings,
     ) -> RobotProgram:
         """Retire les motions dérivées (rôle ≠ NORMAL) et reconstruit HOME/APPROACH/RETRACT."""
-        # Garder uniquement les NORMAL
-        normal_motions = [m for m in program.motions if m.role == MotionRole.NORMAL]
-
-        derived_prefix: list[RobotProgramMotion] = []
-        derived_suffix: list[RobotProgramMotion] = []
-
-        effective_base = self._compute_effective_base()
-
-        if settings.home_enabled:
-            home_values = self.robot_model.get_home_position()
-            home_joints = JointAngles6.from_values(home_values)
-
-            # Retirer les PTP JOINT home en début/fin du programme source pour éviter les doublons
-            def _is_home_motion(m: RobotProgramMotion) -> bool:
-                if m.target.target_type != RobotProgramTargetType.JOINT:
-                    return False
-                if m.target.joint_angles is None:
-                    return False
-                return all(
-                    abs(a - b) < 0.5
-                    for a, b in zip(m.target.joint_angles.to_list(), home_values)
-                )
-
-            while normal_motions and _is_home_motion(normal_motions[0]):
-                normal_motions = normal_motions[1:]
-            while normal_motions and _is_home_motion(normal_motions[-1]):
-                normal_motions = normal_motions[:-1]
-
-            home_target = RobotProgramTarget(
-                target_type=RobotProgramTargetType.JOINT,
-                joint_angles=home_joints,
-            )
-            home_start = RobotProgramMotion(
-                mode=RobotProgramMotionMode.PTP,
-                target=home_target,
-                line_number=0,
-                source="; HOME",
-                base_pose=effective_base,
-                role=MotionRole.HOME_START,
-            )
-            home_end = replace(home_start, role=MotionRole.HOME_END)
-            derived_prefix.append(home_start)
-            derived_suffix.append(home_end)
-
-        first_cartesian = next(
-            (m for m in normal_motions if m.target.target_type == RobotProgramTargetType.CARTESIAN),
-            None,
+        return rebuild_derived_motions(
+            program,
+            settings,
+            self.robot_model.get_home_position(),
+            self._compute_effective_base(),
         )
-        last_cartesian = next(
-            (m for m in reversed(normal_motions) if m.target.target_type == RobotProgramTargetType.CARTESIAN),
-            None,
-        )
-
-        if settings.approach.enabled and first_cartesian is not None:
-            for step in settings.approach.steps:
-                signed_dist = step.distance_mm * (-1 if step.inverted else 1)
-                approach_pose = self._compute_offset_pose(
-                    first_cartesian.target.cartesian_pose,
-                    first_cartesian.tool_pose,
-                    first_cartesian.base_pose,
-                    step.axis_ref,
-                    signed_dist,
-                )
-                approach_target = RobotProgramTarget(
-                    target_type=RobotProgramTargetType.CARTESIAN,
-                    cartesian_pose=approach_pose,
-                )
-                approach_motion = replace(
-                    first_cartesian,
-                    mode=RobotProgramMotionMode.LINEAR,
-                    target=approach_target,
-                    cp_speed_mps=step.speed_mps,
-                    role=MotionRole.APPROACH,
-                    line_number=0,
-                    source="; APPROACH",
-                )
-                derived_prefix.append(approach_motion)
-
-        retract_motions: list[RobotProgramMotion] = []
-        if settings.retract.enabled and last_cartesian is not None:
-            for step in settings.retract.steps:
-                signed_dist = step.distance_mm * (-1 if step.inverted else 1)
-                retract_pose = self._compute_offset_pose(
-                    last_cartesian.target.cartesian_pose,
-                    last_cartesian.tool_pose,
-                    last_cartesian.base_pose,
-                    step.axis_ref,
-                    signed_dist,
-                )
-                retract_target = RobotProgramTarget(
-                    target_type=RobotProgramTargetType.CARTESIAN,
-                    cartesian_pose=retract_pose,
-                )
-                retract_motion = replace(
-                    last_cartesian,
-                    mode=RobotProgramMotionMode.LINEAR,
-                    target=retract_target,
-                    cp_speed_mps=step.speed_mps,
-                    role=MotionRole.RETRACT,
-                    line_number=0,
-                    source="; RETRACT",
-                )
-                retract_motions.append(retract_motion)
-
-        # Retrait avant HOME_END
-        all_motions = derived_prefix + normal_motions + retract_motions + derived_suffix
-        return replace(program, motions=all_motions)
-
-    def _compute_offset_pose(
-        self,
-        target_pose: Pose6,
-        tool_pose: Pose6,
-        base_pose: Pose6,
-        axis_ref: ApproachAxisRef,
-        distance_mm: float,
-    ) -> Pose6:
-        """Calcule une pose décalée de distance_mm dans la direction axis_ref."""
-        import utils.math_utils as math_utils
-
-        # Axe de décalage en repère robot
-        if axis_ref == ApproachAxisRef.TOOL_Z:
-            # -Z outil : l'approche vient de devant l'outil (Z sortant = direction pièce)
-            T_base = math_utils.pose_zyx_to_matrix(base_pose)
-            T_target_in_prog = math_utils.pose_zyx_to_matrix(target_pose)
-            T_target_in_robot = T_base @ T_target_in_prog
-            direction = -T_target_in_robot[:3, 2]
-        elif axis_ref == ApproachAxisRef.PIECE_X:
-            T_base = math_utils.pose_zyx_to_matrix(base_pose)
-            direction = T_base[:3, 0]
-        elif axis_ref == ApproachAxisRef.PIECE_Y:
-            T_base = math_utils.pose_zyx_to_matrix(base_pose)
-            direction = T_base[:3, 1]
-        else:  # PIECE_Z
-            T_base = math_utils.pose_zyx_to_matrix(base_pose)
-            direction = T_base[:3, 2]
-
-        norm = float(np.linalg.norm(direction))
-        if norm < 1e-9:
-            return target_pose
-
-        direction = direction / norm
-
-        # Décalage en repère programme
-        T_base = math_utils.pose_zyx_to_matrix(base_pose)
-        T_base_inv = math_utils.invert_homogeneous_transform(T_base)
-        offset_robot = direction * distance_mm
-        offset_prog = T_base_inv[:3, :3] @ offset_robot
-
-        return Pose6(
-            target_pose.x + offset_prog[0],
-            target_pose.y + offset_prog[1],
-            target_pose.z + offset_prog[2],
-            target_pose.a,
-            target_pose.b,
-            target_pose.c,
-        )
-
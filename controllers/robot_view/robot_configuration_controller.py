@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from PyQt6.QtCore import QObject
 from PyQt6.QtCore import pyqtSignal
-import json
 import os
 from typing import TYPE_CHECKING
 
@@ -11,6 +10,8 @@ from models.primitive_collider_models import RobotAxisColliderData
 from models.robot_model import RobotModel
 from models.robot_configuration_file import RobotConfigurationFile
 from models.types import XYZ3
+from models.types.cad_color_palette import CadColorPalette
+from utils.dirty_state_tracker import DirtyStateTracker
 from utils.file_io import FileIOHandler
 from utils.popup import show_error_popup
 from widgets.robot_view.robot_configuration_widget import RobotConfigurationWidget
@@ -51,15 +52,77 @@ class RobotConfigurationController(QObject):
         self.external_axes_model = external_axes_model
         self._default_tool_profile = ""
         self._default_tool_auto_load_on_startup = False
-        self._saved_snapshot: str | None = None
+        self._dirty_tracker = DirtyStateTracker()
         self._has_saved_reference = False
         self._clean_status_text = RobotConfigurationController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._validation_icon_visible = False
+        self._setup_dirty_tracking()
         self._setup_connections()
         self._on_robot_configuration_changed()
         self._mark_as_none_reference()
 
+    def _setup_dirty_tracking(self) -> None:
+        """Sections du fichier de configuration, invalidées par les signaux du modèle.
+
+        Connecté avant _setup_connections : les sections sont marquées avant le rafraîchissement du statut.
+        """
+        model = self.robot_model
+        tracker = self._dirty_tracker
+        tracker.add_section("name", model.get_robot_name)
+        tracker.add_section("dh", model.get_dh_params)
+        tracker.add_section(
+            "measured_dh",
+            lambda: (model.get_measured_dh_params(), model.get_measured_dh_enabled()),
+        )
+        tracker.add_section("corrections", model.get_corrections)
+        tracker.add_section(
+            "axis_config",
+            lambda: (
+                model.get_axis_limits(),
+                model.get_cartesian_slider_limits_xyz(),
+                model.get_axis_speed_limits(),
+                model.get_axis_accel_limits(),
+                model.get_axis_jerk_limits(),
+                model.get_axis_reversed(),
+            ),
+        )
+        tracker.add_section("axis_colliders", model.get_axis_collider_data, model.get_axis_colliders_revision)
+        tracker.add_section("joint_weights", model.get_joint_weights)
+        tracker.add_section("allowed_configs", lambda: sorted(config.name for config in model.get_allowed_configurations()))
+        tracker.add_section(
+            "positions",
+            lambda: (model.get_home_position(), model.get_position_zero(), model.get_position_calibration()),
+        )
+        tracker.add_section(
+            "cad",
+            lambda: (model.get_robot_cad_models(), CadColorPalette(model.get_robot_cad_colors()).to_hex_list()),
+        )
+        tracker.add_section(
+            "default_tool",
+            lambda: (self._default_tool_profile, self._default_tool_auto_load_on_startup),
+        )
+
+        tracker.bind(model.configuration_changed)
+        tracker.bind(model.robot_name_changed, "name")
+        tracker.bind(model.dh_params_changed, "dh")
+        tracker.bind(model.measured_dh_params_changed, "measured_dh")
+        tracker.bind(model.measured_dh_enabled_changed, "measured_dh")
+        tracker.bind(model.corrections_changed, "corrections")
+        for signal in (
+            model.axis_limits_changed,
+            model.cartesian_slider_limits_changed,
+            model.axis_speed_limits_changed,
+            model.axis_accel_limits_changed,
+            model.axis_jerk_limits_changed,
+            model.axis_reversed_changed,
+        ):
+            tracker.bind(signal, "axis_config")
+        tracker.bind(model.joint_weights_changed, "joint_weights")
+        tracker.bind(model.allowed_config_changed, "allowed_configs")
+        tracker.bind(model.robot_cad_models_changed, "cad")
+        tracker.bind(model.robot_cad_colors_changed, "cad")
+
     def _setup_connections(self) -> None:
         self.robot_model.configuration_changed.connect(self._on_robot_configuration_changed)
         self.robot_model.robot_name_changed.connect(self._on_robot_name_changed)
@@ -176,6 +239,8 @@ class RobotConfigurationController(QObject):
         self.robot_model.set_position_zero(position_zero)
         self.robot_model.set_position_calibration(position_calibration)
         self.robot_model.set_home_position(home_position)
+        # Pas de signal modèle pour les positions : invalidation explicite
+        self._dirty_tracker.invalidate("positions")
         self._refresh_configuration_status()
 
     def _on_view_go_to_position_requested(self, joint_values: list[float]) -> None:
@@ -197,20 +262,24 @@ class RobotConfigurationController(QObject):
 
     def _on_view_default_tool_profile_changed(self, profile_path: str) -> None:
         self._default_tool_profile = str(profile_path).strip()
+        self._dirty_tracker.invalidate("default_tool")
         self._refresh_configuration_status()
 
     def _on_view_default_tool_profile_selected(self, profile_path: str) -> None:
         self._default_tool_profile = str(profile_path).strip()
         self._load_default_tool_profile(show_errors=True, only_if_enabled=False)
+        self._dirty_tracker.invalidate("default_tool")
         self._refresh_configuration_status()
 
     def _on_view_default_tool_auto_load_on_startup_changed(self, enabled: bool) -> None:
         self._default_tool_auto_load_on_startup = bool(enabled)
+        self._dirty_tracker.invalidate("default_tool")
         self._refresh_configuration_status()
 
     def clear_default_tool_profile(self) -> None:
         self._default_tool_profile = ""
         self.robot_configuration_widget.set_default_tool_profile("")
+        self._dirty_tracker.invalidate("default_tool")
         self._refresh_configuration_status()
 
     def _on_view_load_config_requested(self) -> None:
@@ -276,59 +345,36 @@ class RobotConfigurationController(QObject):
             self._default_tool_auto_load_on_startup
         )
 
-    @staticmethod
-    def _normalize_snapshot_value(value: object) -> object:
-        if isinstance(value, float):
-            return round(value, 9)
-        if isinstance(value, list):
-            return [RobotConfigurationController._normalize_snapshot_value(item) for item in value]
-        if isinstance(value, dict):
-            return {
-                str(key): RobotConfigurationController._normalize_snapshot_value(item)
-                for key, item in value.items()
-            }
-        return value
-
-    def _capture_current_snapshot(self) -> str:
-        config_dict = RobotConfigurationFile.from_robot_model(
-            self.robot_model,
-            default_tool_profile=self._default_tool_profile,
-            default_tool_auto_load_on_startup=self._default_tool_auto_load_on_startup,
-        ).to_dict()
-        normalized_config_dict = RobotConfigurationController._normalize_snapshot_value(config_dict)
-        return json.dumps(normalized_config_dict, sort_keys=True, ensure_ascii=True)
-
     def _mark_as_saved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = RobotConfigurationController.STATUS_SAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_loaded_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = RobotConfigurationController.STATUS_LOADED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_unsaved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = RobotConfigurationController.STATUS_UNSAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_none_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = RobotConfigurationController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _is_dirty(self) -> bool:
-        current_snapshot = self._capture_current_snapshot()
-        return self._saved_snapshot is None or current_snapshot != self._saved_snapshot
+        return self._dirty_tracker.is_dirty()
 
     def _refresh_configuration_status(self) -> None:
         show_validation_icon = self._should_show_validation_icon()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -9,6 +8,7 @@ from PyQt6.QtWidgets import QMessageBox
 from models.primitive_collider_models import PrimitiveColliderData
 from models.tool_config_file import ToolConfigFile
 from models.tool_model import ToolModel
+from utils.dirty_state_tracker import DirtyStateTracker
 from utils.mgi import RobotTool
 from widgets.tool_view.tool_configuration_widget import ToolConfigurationWidget
 
@@ -38,15 +38,31 @@ class ToolController(QObject):
         self.tool_model = tool_model
         self.robot_configuration_widget = robot_configuration_widget
         self.viewer3d_controller = viewer3d_controller
-        self._saved_snapshot: str | None = None
+        self._dirty_tracker = DirtyStateTracker()
         self._has_saved_reference = False
         self._clean_status_text = ToolController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._validation_icon_visible = False
+        self._setup_dirty_tracking()
         self._setup_connections()
         self.update_tool_view()
         self._mark_as_none_reference()
 
+    def _setup_dirty_tracking(self) -> None:
+        """Sections du profil tool ; connecté avant _setup_connections pour invalider avant le rafraîchissement."""
+        tracker = self._dirty_tracker
+        tracker.add_section("name", self.robot_configuration_widget.get_tool_name)
+        tracker.add_section("tool", lambda: self.tool_model.get_tool_pose().to_list())
+        tracker.add_section(
+            "visual",
+            lambda: (self.tool_model.get_tool_cad_model(), float(self.tool_model.get_tool_cad_offset_rz())),
+        )
+        tracker.add_section("colliders", self.tool_model.get_tool_collider_data, self.tool_model.get_tool_colliders_revision)
+        tracker.add_section("evaluated_robot_axis_colliders", self.tool_model.get_evaluated_robot_axis_colliders)
+        tracker.bind(self.tool_model.tool_changed, "tool")
+        tracker.bind(self.tool_model.tool_visual_changed, "visual")
+        tracker.bind(self.tool_model.tool_evaluated_robot_axis_colliders_changed, "evaluated_robot_axis_colliders")
+
     def _setup_connections(self) -> None:
         self.tool_model.tool_changed.connect(self.update_tool_view)
         self.tool_model.tool_visual_changed.connect(self.update_tool_view)
@@ -70,6 +86,7 @@ class ToolController(QObject):
         self._refresh_configuration_status()
 
     def _on_view_tool_name_changed(self, _name: str) -> None:
+        self._dirty_tracker.invalidate("name")
         self._refresh_configuration_status()
 
     def _on_view_tool_cad_model_changed(self, tool_cad_model: str) -> None:
@@ -151,62 +168,36 @@ class ToolController(QObject):
             self.viewer3d_controller.end_loading_feedback()
         return True
 
-    @staticmethod
-    def _normalize_snapshot_value(value: object) -> object:
-        if isinstance(value, float):
-            return round(value, 9)
-        if isinstance(value, list):
-            return [ToolController._normalize_snapshot_value(item) for item in value]
-        if isinstance(value, dict):
-            return {
-                str(key): ToolController._normalize_snapshot_value(item)
-                for key, item in value.items()
-            }
-        return value
-
-    def _capture_current_snapshot(self) -> str:
-        tool_dict = ToolConfigFile.from_robot_tool(
-            self.robot_configuration_widget.get_tool_name(),
-            self.tool_model.get_tool(),
-            self.tool_model.get_tool_cad_model(),
-            self.tool_model.get_tool_cad_offset_rz(),
-            self.tool_model.get_tool_collider_data(),
-            self.tool_model.get_evaluated_robot_axis_colliders(),
-        ).to_dict()
-        normalized_tool_dict = ToolController._normalize_snapshot_value(tool_dict)
-        return json.dumps(normalized_tool_dict, sort_keys=True, ensure_ascii=True)
-
     def _mark_as_saved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = ToolController.STATUS_SAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_loaded_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = True
         self._clean_status_text = ToolController.STATUS_LOADED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_unsaved_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = ToolController.STATUS_UNSAVED
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _mark_as_none_reference(self) -> None:
-        self._saved_snapshot = self._capture_current_snapshot()
+        self._dirty_tracker.set_reference()
         self._has_saved_reference = False
         self._clean_status_text = ToolController.STATUS_NONE
         self._was_dirty_since_reference = False
         self._refresh_configuration_status()
 
     def _is_dirty(self) -> bool:
-        current_snapshot = self._capture_current_snapshot()
-        return self._saved_snapshot is None or current_snapshot != self._saved_snapshot
+        return self._dirty_tracker.is_dirty()
 
     def _refresh_configuration_status(self) -> None:
         show_validation_icon = self._should_show_validation_icon()
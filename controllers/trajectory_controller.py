@@ -4,6 +4,7 @@ from bisect import bisect_left
 from pathlib import Path
 import time
 
+import numpy as np
 from PyQt6.QtCore import QObject, QTimer, Qt
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
@@ -26,15 +27,32 @@ from models.reference_frame import ReferenceFrame
 from trajectory_engine.adapters import TrajectoryControllerBuildBridge
 from trajectory_engine.managers import TrajectoryBuildManager
 from trajectory_engine.models.pipeline import TrajectoryBuildTriggerMode
+from trajectory_engine.sampling import joints_at_time, resample_fixed_dt
 from utils.trajectory_keypoint_utils import resolve_keypoint_xyz
-from utils.trajectory_status import build_trajectory_issue_messages, build_trajectory_warning_messages
+from utils.trajectory_status import (
+    build_trajectory_clearance_warning_messages,
+    build_trajectory_issue_messages,
+    build_trajectory_singularity_warning_messages,
+    build_trajectory_warning_messages,
+)
 from utils.trajectory_paths import get_trajectories_directory
+from utils.trajectory_result_archive import (
+    ARCHIVE_EXTENSION,
+    PROGRAM_ARCHIVE_KIND,
+    load_program_simulation_npz,
+    load_trajectory_result_npz,
+    read_archive_kind,
+    save_trajectory_result_npz,
+    trajectory_result_from_program_samples,
+)
+from utils.reachability_map import ReachabilityKinematics, ReachabilityMap, load_cached_reachability_map
 from utils.reference_frame_utils import (
     convert_pose_from_base_frame,
     convert_pose_to_base_frame,
     twist_base_to_world,
 )
 from views.trajectory_view import TrajectoryView
+from widgets.reachability_map_loader import ReachabilityMapLoader
 from controllers.viewer3d_controller import Viewer3DController
 import utils.math_utils as math_utils
 
@@ -83,6 +101,8 @@ class TrajectoryController(QObject):
             build_manager=self._build_manager,
             parent=self,
         )
+        self._reachability_loader = ReachabilityMapLoader(parent=self)
+        self._reachability_heatmap_visible = False
         self.current_trajectory = TrajectoryResult()
         self.current_samples: list[TrajectorySample] = []
         self.current_sample_times: list[float] = []
@@ -92,6 +112,8 @@ class TrajectoryController(QObject):
         self._trajectory_start_joints: JointAngles6 | None = None
         self._trajectory_analysis_pending = False
         self._displayed_keypoints: list[TrajectoryKeypoint] = []
+        # Nom de l'archive affichée : le résultat ne provient pas des keypoints de l'éditeur
+        self._imported_trajectory_name: str | None = None
         self._current_time_s = 0.0
         self._playback_index = 0
         self._is_playing = False
@@ -114,6 +136,7 @@ class TrajectoryController(QObject):
     def shutdown(self) -> None:
         self._stop_playback()
         self._build_bridge.shutdown()
+        self._reachability_loader.shutdown()
 
     def set_trajectory_benchmark_logging(self, enabled: bool) -> None:
         self._build_manager.set_verbose_logging(enabled)
@@ -122,6 +145,8 @@ class TrajectoryController(QObject):
         self.config_widget.showRobotGhostRequested.connect(self._on_show_robot_ghost_requested)
         self.config_widget.hideRobotGhostRequested.connect(self._on_hide_robot_ghost_requested)
         self.config_widget.updateRobotGhostRequested.connect(self._on_update_robot_ghost_requested)
+        self.config_widget.reachabilityMapRequested.connect(self._on_reachability_map_requested)
+        self.config_widget.reachabilityHeatmapToggled.connect(self._on_reachability_heatmap_toggled)
         self.config_widget.keypointSelectionChanged.connect(self._on_keypoint_selection_changed)
         self.config_widget.goToRequested.connect(self._on_go_to_requested)
         self.config_widget.editingSessionStarted.connect(self._on_editing_session_started)
@@ -131,19 +156,27 @@ class TrajectoryController(QObject):
         self.config_widget.keypoints_changed.connect(self._on_keypoints_changed)
         self.config_widget.timeSmoothingChanged.connect(self._on_time_smoothing_changed)
         self.config_widget.jerkCheckChanged.connect(self._on_jerk_check_changed)
+        self.config_widget.timeOptimalChanged.connect(self._on_time_optimal_changed)
+        self.config_widget.adaptiveSamplingChanged.connect(self._on_adaptive_sampling_changed)
         self.config_widget.cartesianDynamicsChanged.connect(self._on_cartesian_dynamics_changed)
         self.config_widget.cartesianDisplayFrameChanged.connect(self._on_cartesian_display_frame_changed)
         self.actions_widget.compute_requested.connect(self._on_compute_requested)
         self.actions_widget.export_trajectory_requested.connect(self._on_export_trajectory_requested)
+        self.actions_widget.import_trajectory_requested.connect(self._on_import_trajectory_requested)
         self.actions_widget.home_position_requested.connect(self._on_home_position_requested)
         self.actions_widget.play_requested.connect(self._on_play_requested)
         self.actions_widget.pause_requested.connect(self._on_pause_requested)
         self.actions_widget.stop_requested.connect(self._on_stop_requested)
         self.actions_widget.time_value_changed.connect(self._on_time_value_changed)
+        self.graphs_widget.get_clearance_graph_widget().safetyMarginChanged.connect(self._on_safety_margin_changed)
+        self.graphs_widget.get_singularity_graph_widget().thresholdsChanged.connect(self._on_singularity_thresholds_changed)
         self.workspace_model.workspace_changed.connect(self._on_workspace_changed)
         self._build_bridge.preview_ready.connect(self._on_engine_preview_ready)
         self._build_bridge.result_ready.connect(self._on_engine_result_ready)
         self._build_bridge.build_failed.connect(self._on_engine_build_failed)
+        self._reachability_loader.map_loaded.connect(self._on_reachability_map_loaded)
+        self._reachability_loader.map_failed.connect(self._on_reachability_map_failed)
+        self._reachability_loader.progress_changed.connect(self.config_widget.set_reachability_progress)
 
     def _on_show_robot_ghost_requested(self) -> None:
         self.viewer3d_controller.show_robot_ghost()
@@ -195,6 +228,16 @@ class TrajectoryController(QObject):
             return
         self._recompute_trajectory(trigger_mode=TrajectoryBuildTriggerMode.DEBOUNCED_FULL)
 
+    def _on_time_optimal_changed(self, _enabled: bool) -> None:
+        if self._is_keypoint_preview_active:
+            return
+        self._recompute_trajectory(trigger_mode=TrajectoryBuildTriggerMode.DEBOUNCED_FULL)
+
+    def _on_adaptive_sampling_changed(self, _enabled: bool) -> None:
+        if self._is_keypoint_preview_active:
+            return
+        self._recompute_trajectory(trigger_mode=TrajectoryBuildTriggerMode.DEBOUNCED_FULL)
+
     def _on_cartesian_dynamics_changed(self) -> None:
         if self._is_keypoint_preview_active:
             return
@@ -208,11 +251,57 @@ class TrajectoryController(QObject):
         self._editing_keypoint_index = row_index if row_index >= 0 else None
         self.actions_widget.set_editing_locked(True)
         self._update_3d_keypoint_overlays()
+        self._load_cached_reachability_map()
 
     def _on_editing_session_finished(self) -> None:
         self._editing_keypoint_index = None
         self.actions_widget.set_editing_locked(False)
         self._update_3d_keypoint_overlays()
+        self._reachability_heatmap_visible = False
+        self.viewer3d_controller.clear_reachability_heatmap()
+
+    # ====================================================================
+    # RÉGION: Carte d'atteignabilité
+    # ====================================================================
+
+    def _load_cached_reachability_map(self) -> None:
+        """Relit la carte déjà calculée pour le robot et l'outil courants (sans calcul)."""
+        if self._reachability_loader.is_pending():
+            return
+        kinematics = ReachabilityKinematics.from_robot_model(self.robot_model, self.tool_model.get_tool())
+        current_map = self.config_widget.get_reachability_map()
+        if current_map is not None and current_map.robot_hash == kinematics.robot_hash:
+            return
+        self.config_widget.set_reachability_map(load_cached_reachability_map(kinematics.robot_hash))
+
+    def _on_reachability_map_requested(self) -> None:
+        kinematics = ReachabilityKinematics.from_robot_model(self.robot_model, self.tool_model.get_tool())
+        self.config_widget.set_reachability_progress(0, 1)
+        self._reachability_loader.request(kinematics)
+
+    def _on_reachability_map_loaded(self, grid_map: ReachabilityMap) -> None:
+        self.config_widget.set_reachability_map(grid_map)
+        self._refresh_reachability_heatmap()
+
+    def _on_reachability_map_failed(self, message: str) -> None:
+        self.config_widget.set_reachability_map(self.config_widget.get_reachability_map())
+        QMessageBox.warning(
+            self.trajectory_view,
+            "Carte d'atteignabilité",
+            f"Le calcul de la carte d'atteignabilité a échoué :\n{message}",
+        )
+
+    def _on_reachability_heatmap_toggled(self, visible: bool) -> None:
+        self._reachability_heatmap_visible = bool(visible)
+        self._refresh_reachability_heatmap()
+
+    def _refresh_reachability_heatmap(self) -> None:
+        grid_map = self.config_widget.get_reachability_map()
+        if not self._reachability_heatmap_visible or grid_map is None:
+            self.viewer3d_controller.clear_reachability_heatmap()
+            return
+        ratios = grid_map.reachability_ratio(set(self.robot_model.get_allowed_configurations()))
+        self.viewer3d_controller.set_reachability_heatmap(grid_map.cell_centers(), ratios)
 
     def _on_trajectory_preview_requested(self, keypoints: list[TrajectoryKeypoint]) -> None:
         self._is_keypoint_preview_active = True
@@ -230,6 +319,12 @@ class TrajectoryController(QObject):
     def _on_cartesian_display_frame_changed(self, _frame: str) -> None:
         self._update_graphs()
 
+    def _on_safety_margin_changed(self, _margin_mm: float) -> None:
+        self._update_trajectory_issue_messages()
+
+    def _on_singularity_thresholds_changed(self) -> None:
+        self._update_trajectory_issue_messages()
+
     def _on_workspace_changed(self) -> None:
         self._update_graphs()
         self._update_3d_trajectory_path()
@@ -352,6 +447,10 @@ class TrajectoryController(QObject):
             )
         return "|".join(parts)
 
+    def _pose_from_joints(self, joints: list[float]) -> list[float] | None:
+        fk_result = self.robot_model.compute_fk_joints(joints, tool=self.tool_model.get_tool())
+        return None if fk_result is None else fk_result.dh_pose.to_list()
+
     def _on_export_trajectory_requested(self) -> None:
         if self._trajectory_analysis_pending:
             QMessageBox.warning(
@@ -370,14 +469,25 @@ class TrajectoryController(QObject):
 
         start_dir = get_trajectories_directory(create=True)
         default_path = str(Path(start_dir) / "trajectory_samples.csv")
-        path, _ = QFileDialog.getSaveFileName(
+        path, selected_filter = QFileDialog.getSaveFileName(
             self.trajectory_view,
             "Exporter la trajectoire calculée",
             default_path,
-            "Fichiers CSV (*.csv);;Tous les fichiers (*.*)",
+            "Fichiers CSV (*.csv);;Archives NPZ (*.npz);;Tous les fichiers (*.*)",
         )
         if not path:
             return
+        if Path(path).suffix.lower() == ARCHIVE_EXTENSION or "*.npz" in selected_filter:
+            # Résultat brut (repère robot, échantillons calculés), relu tel quel par l'import
+            try:
+                save_trajectory_result_npz(path, self.current_trajectory)
+            except Exception as exc:
+                QMessageBox.warning(
+                    self.trajectory_view,
+                    "Export trajectoire",
+                    f"Impossible d'exporter la trajectoire.\n{exc}",
+                )
+            return
 
         header = self._trajectory_export_header()
 
@@ -388,7 +498,8 @@ class TrajectoryController(QObject):
             with open(path, "w", encoding="utf-8", newline="") as handle:
                 writer = csv.writer(handle, delimiter=";")
                 writer.writerow(header)
-                for sample in self.current_samples:
+                # Export toujours au pas fixe, même après un calcul adaptatif
+                for sample in resample_fixed_dt(self.current_samples, self._sample_dt_s, self._pose_from_joints):
                     pose = convert_pose_from_base_frame(
                         Pose6(*sample.pose[:6]),
                         ReferenceFrame.from_value(display_frame),
@@ -447,6 +558,38 @@ class TrajectoryController(QObject):
                 f"Impossible d'exporter la trajectoire.\n{exc}",
             )
 
+    def _on_import_trajectory_requested(self) -> None:
+        start_dir = get_trajectories_directory(create=True)
+        path, _ = QFileDialog.getOpenFileName(
+            self.trajectory_view,
+            "Importer des résultats de trajectoire",
+            start_dir,
+            "Archives NPZ (*.npz);;Tous les fichiers (*.*)",
+        )
+        if not path:
+            return
+        try:
+            if read_archive_kind(path) == PROGRAM_ARCHIVE_KIND:
+                trajectory = trajectory_result_from_program_samples(load_program_simulation_npz(path).nominal_samples)
+            else:
+                trajectory = load_trajectory_result_npz(path)
+        except Exception as exc:
+            QMessageBox.warning(
+                self.trajectory_view,
+                "Import trajectoire",
+                f"Impossible de relire l'archive.\n{exc}",
+            )
+            return
+        # Affichage direct du résultat archivé : aucun recalcul, les analyses en cours sont abandonnées.
+        # L'archive ne contient pas de keypoints : ceux de l'éditeur ne sont plus affichés et un
+        # avertissement signale que la prochaine modification relance le calcul à partir d'eux.
+        self._trajectory_generation_sequence += 1
+        self._cancel_collision_analysis()
+        self._stop_playback()
+        self._imported_trajectory_name = Path(path).name
+        self._displayed_keypoints = []
+        self._on_engine_result_ready(trajectory)
+
     def _recompute_trajectory(
         self,
         keypoints_override: list[TrajectoryKeypoint] | None = None,
@@ -455,6 +598,7 @@ class TrajectoryController(QObject):
         self._trajectory_generation_sequence += 1
         self._cancel_collision_analysis()
         self._stop_playback()
+        self._imported_trajectory_name = None
         if keypoints_override is None:
             keypoints = self.config_widget.get_keypoints()
         else:
@@ -487,6 +631,9 @@ class TrajectoryController(QObject):
                 cartesian_accel_limit_mm_s2=self.config_widget.get_cartesian_accel_limit_mm_s2(),
                 cartesian_jerk_limit_mm_s3=self.config_widget.get_cartesian_jerk_limit_mm_s3(),
                 trigger_mode=trigger_mode,
+                time_optimal_enabled=self.config_widget.is_time_optimal_enabled(),
+                adaptive_sampling_enabled=self.config_widget.is_adaptive_sampling_enabled(),
+                singularity_thresholds=self.graphs_widget.get_singularity_graph_widget().get_thresholds(),
             )
             return
 
@@ -514,6 +661,9 @@ class TrajectoryController(QObject):
             cartesian_accel_limit_mm_s2=self.config_widget.get_cartesian_accel_limit_mm_s2(),
             cartesian_jerk_limit_mm_s3=self.config_widget.get_cartesian_jerk_limit_mm_s3(),
             trigger_mode=trigger_mode,
+            time_optimal_enabled=self.config_widget.is_time_optimal_enabled(),
+            adaptive_sampling_enabled=self.config_widget.is_adaptive_sampling_enabled(),
+            singularity_thresholds=self.graphs_widget.get_singularity_graph_widget().get_thresholds(),
         )
 
     @staticmethod
@@ -627,12 +777,16 @@ class TrajectoryController(QObject):
         articular_panel = self.graphs_widget.get_articular_panel()
         cartesian_panel = self.graphs_widget.get_cartesian_panel()
         config_timeline = self.graphs_widget.get_configuration_timeline_widget()
+        clearance_graph = self.graphs_widget.get_clearance_graph_widget()
+        singularity_graph = self.graphs_widget.get_singularity_graph_widget()
 
         if not self.current_samples:
-            empty_series = [[] for _ in range(6)]
+            empty_series = np.zeros((6, 0))
             articular_panel.set_trajectories([], empty_series, empty_series, empty_series, empty_series)
             cartesian_panel.set_trajectories([], empty_series, empty_series, empty_series, empty_series)
             config_timeline.set_configuration_data([], [])
+            clearance_graph.clear()
+            singularity_graph.clear()
             articular_panel.set_key_times([])
             cartesian_panel.set_key_times([])
             config_timeline.set_key_times([])
@@ -643,16 +797,26 @@ class TrajectoryController(QObject):
 
         include_origin = self._should_prepend_graph_origin(self.current_sample_times)
         times = self._graph_times_with_origin(self.current_sample_times)
-        cartesian_samples = self._cartesian_samples_for_display()
-        cart_positions = [[sample[0][axis] for sample in cartesian_samples] for axis in range(6)]
-        cart_velocities = [[sample[1][axis] for sample in cartesian_samples] for axis in range(6)]
-        cart_accelerations = [[sample[2][axis] for sample in cartesian_samples] for axis in range(6)]
-        cart_jerks = [[sample[3][axis] for sample in cartesian_samples] for axis in range(6)]
-        art_positions = [[sample.joints[axis] for sample in self.current_samples] for axis in range(6)]
-        art_velocities = [[sample.articular_velocity[axis] for sample in self.current_samples] for axis in range(6)]
-        art_accelerations = [[sample.articular_acceleration[axis] for sample in self.current_samples] for axis in range(6)]
-        art_jerks = [[sample.articular_jerk[axis] for sample in self.current_samples] for axis in range(6)]
+        # Un seul passage sur les échantillons : (N, 4, 6) puis vues (6, N) par grandeur, sans listes par axe.
+        cartesian = np.asarray(self._cartesian_samples_for_display(), dtype=float).reshape(-1, 4, 6)
+        articular = np.asarray(
+            [
+                (sample.joints[:6], sample.articular_velocity[:6], sample.articular_acceleration[:6], sample.articular_jerk[:6])
+                for sample in self.current_samples
+            ],
+            dtype=float,
+        ).reshape(-1, 4, 6)
+        cart_positions, cart_velocities, cart_accelerations, cart_jerks = self._axis_series(cartesian)
+        art_positions, art_velocities, art_accelerations, art_jerks = self._axis_series(articular)
+        clearances_mm: list[float | None] = [
+            None if sample.clearance is None else sample.clearance.distance_mm for sample in self.current_samples
+        ]
+        singularity_indices: list[float | None] = [sample.singularity_index for sample in self.current_samples]
+        singularity_kinds = [sample.singularity_kind for sample in self.current_samples]
         if include_origin:
+            clearances_mm.insert(0, None)
+            singularity_indices.insert(0, None)
+            singularity_kinds.insert(0, None)
             cart_positions = self._prepend_axis_values(self._initial_graph_pose_for_display(), cart_positions)
             zero_axis_values = [0.0] * 6
             cart_velocities = self._prepend_axis_values(zero_axis_values, cart_velocities)
@@ -667,15 +831,21 @@ class TrajectoryController(QObject):
         cartesian_panel.set_trajectories(times, cart_positions, cart_velocities, cart_accelerations, cart_jerks)
         articular_panel.set_trajectories(times, art_positions, art_velocities, art_accelerations, art_jerks)
         config_timeline.set_configuration_data(times, self.current_samples)
+        clearance_graph.set_clearance_data(times, clearances_mm)
+        singularity_graph.set_singularity_data(times, singularity_indices, singularity_kinds)
         cartesian_panel.set_key_times(key_times)
         articular_panel.set_key_times(key_times)
         config_timeline.set_key_times(key_times)
+        clearance_graph.set_key_times(key_times)
+        singularity_graph.set_key_times(key_times)
 
     def _update_preview_graphs(self) -> None:
         articular_panel = self.graphs_widget.get_articular_panel()
         cartesian_panel = self.graphs_widget.get_cartesian_panel()
         config_timeline = self.graphs_widget.get_configuration_timeline_widget()
         empty_series = [[] for _ in range(6)]
+        self.graphs_widget.get_clearance_graph_widget().clear()
+        self.graphs_widget.get_singularity_graph_widget().clear()
         if not self.current_preview_samples:
             articular_panel.set_trajectories([], empty_series, empty_series, empty_series, empty_series)
             cartesian_panel.set_trajectories([], empty_series, empty_series, empty_series, empty_series)
@@ -783,8 +953,14 @@ class TrajectoryController(QObject):
         return [0.0] + times
 
     @staticmethod
-    def _prepend_axis_values(origin_values: list[float], series_by_axis: list[list[float]]) -> list[list[float]]:
-        return [[float(origin_values[axis])] + series_by_axis[axis] for axis in range(6)]
+    def _prepend_axis_values(origin_values: list[float], series_by_axis: list[list[float]] | np.ndarray) -> np.ndarray:
+        series = np.asarray(series_by_axis, dtype=float).reshape(6, -1)
+        return np.concatenate([np.asarray(origin_values[:6], dtype=float).reshape(6, 1), series], axis=1)
+
+    @staticmethod
+    def _axis_series(values: np.ndarray) -> list[np.ndarray]:
+        """(N, 4, 6) -> quatre tableaux (6, N) contigus : position, vitesse, accélération, jerk."""
+        return [np.ascontiguousarray(values[:, quantity, :].T) for quantity in range(4)]
 
     def _initial_graph_joints(self) -> list[float]:
         if self._trajectory_start_joints is not None:
@@ -1069,6 +1245,24 @@ class TrajectoryController(QObject):
     def _update_trajectory_issue_messages(self) -> None:
         issues = build_trajectory_issue_messages(self.current_trajectory)
         warnings = build_trajectory_warning_messages(self.current_trajectory)
+        warnings.extend(
+            build_trajectory_clearance_warning_messages(
+                self.current_trajectory,
+                self.graphs_widget.get_clearance_graph_widget().get_safety_margin_mm(),
+            )
+        )
+        warnings.extend(
+            build_trajectory_singularity_warning_messages(
+                self.current_trajectory,
+                self.graphs_widget.get_singularity_graph_widget().get_thresholds(),
+            )
+        )
+        if self._imported_trajectory_name is not None:
+            warnings.insert(
+                0,
+                f"Résultat importé ({self._imported_trajectory_name}) : il ne correspond pas aux keypoints "
+                "de l'éditeur, toute modification le remplace par un recalcul.",
+            )
         self.actions_widget.set_issue_messages(issues)
         self.actions_widget.set_warning_messages(warnings)
 
@@ -1089,6 +1283,8 @@ class TrajectoryController(QObject):
         articular_panel.set_time_indicator(time_s)
         cartesian_panel.set_time_indicator(time_s)
         config_timeline.set_time_indicator(time_s)
+        self.graphs_widget.get_clearance_graph_widget().set_time_indicator(time_s)
+        self.graphs_widget.get_singularity_graph_widget().set_time_indicator(time_s)
 
         sample = self._sample_at_time(time_s)
         if sample is None:
@@ -1099,7 +1295,9 @@ class TrajectoryController(QObject):
         if sample.reachable:
             if force_real_robot:
                 self.viewer3d_controller.hide_robot_ghost()
-                self.robot_model.set_joints(sample.joints)
+                # Échantillonnage adaptatif : interpolation entre échantillons calculés
+                joints = joints_at_time(self.current_samples, self.current_sample_times, time_s)
+                self.robot_model.set_joints(sample.joints if joints is None else joints)
             elif not self._is_keypoint_preview_active:
                 # Simulation timeline should not spawn the ghost outside edition mode.
                 self.viewer3d_controller.hide_robot_ghost()
@@ -451,8 +451,12 @@ class Viewer3DController(QObject):
         self,
         segments: list,
         in_world: bool = False,
+        split_key: float | None = None,
     ) -> None:
-        self.viewer_3d_widget.set_trajectory_path_segments(segments, in_world=in_world)
+        self.viewer_3d_widget.set_trajectory_path_segments(segments, in_world=in_world, split_key=split_key)
+
+    def set_trajectory_path_split(self, split_key: float | None) -> None:
+        self.viewer_3d_widget.set_trajectory_path_split(split_key)
 
     def clear_trajectory_path(self) -> None:
         self.viewer_3d_widget.clear_trajectory_path()
@@ -476,6 +480,12 @@ class Viewer3DController(QObject):
     def clear_trajectory_keypoints(self) -> None:
         self.viewer_3d_widget.clear_trajectory_keypoints()
 
+    def set_reachability_heatmap(self, points_xyz, values) -> None:
+        self.viewer_3d_widget.set_reachability_heatmap(points_xyz, values)
+
+    def clear_reachability_heatmap(self) -> None:
+        self.viewer_3d_widget.clear_reachability_heatmap()
+
     def set_trajectory_edit_tangents(
         self,
         tangent_out_segments: list[TangentSegment] | None,
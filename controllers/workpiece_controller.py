@@ -14,6 +14,7 @@ from models.tooling_model import ToolingModel
 from models.types.pose6 import Pose6
 from models.workspace_model import WorkspaceModel
 from models.workpiece_model import WorkpieceModel
+from utils.dirty_state_tracker import DirtyStateTracker
 from utils.external_axes_kinematics import get_effective_robot_base_in_world
 from utils.math_utils import invert_homogeneous_transform, pose_zyx_to_matrix
 from views.workpiece_view import WorkpieceView
@@ -58,12 +59,13 @@ class WorkpieceController(QObject):
         self._piece_widget: WorkpieceConfigWidget = workpiece_view.get_piece_config()
         self._current_config_file = ""
         self._current_config_display_name = ""
-        self._reference_data: dict | None = None
+        self._dirty_tracker = DirtyStateTracker()
         self._has_reference = False
         self._was_dirty_since_reference = False
         self._clean_status_text = STATUS_NONE
         self._validation_icon_visible = False
 
+        self._setup_dirty_tracking()
         self._setup_connections()
         self._refresh_parent_frames()
         self._tooling_panel.set_from_model(self.tooling_model)
@@ -86,50 +88,36 @@ class WorkpieceController(QObject):
     def new_configuration(self) -> None:
         self._on_new()
 
-    def _has_configuration_content(self, data: dict | None = None) -> bool:
-        if data is None:
-            data = self.get_serializable_state()
-        tooling = data.get("tooling") or {}
-        workpiece = data.get("workpiece") or {}
+    def _has_configuration_content(self) -> bool:
         return bool(
-            tooling.get("parent_frame_id")
-            or tooling.get("elements")
-            or workpiece.get("cad_model")
-            or workpiece.get("parent_frame_id")
-            or workpiece.get("pose_in_parent") != Pose6.zeros().to_list()
-            or workpiece.get("workpiece_frame_pose") != Pose6.zeros().to_list()
+            self.tooling_model.get_parent_frame_id()
+            or self.tooling_model.has_elements()
+            or self.workpiece_model.get_cad_model()
+            or self.workpiece_model.get_parent_frame_id()
+            or self.workpiece_model.get_pose_in_parent() != Pose6.zeros()
+            or self.workpiece_model.get_workpiece_frame_pose() != Pose6.zeros()
         )
 
-    @staticmethod
-    def _normalized_serialized_state(data: dict) -> str:
-        return json.dumps(json.loads(json.dumps(data)), sort_keys=True, ensure_ascii=True)
-
     def _mark_current_configuration_as_reference(self, clean_status_text: str) -> None:
-        self._reference_data = self.get_serializable_state()
+        self._dirty_tracker.set_reference()
         self._has_reference = True
         self._was_dirty_since_reference = False
         self._clean_status_text = clean_status_text
         self._refresh_configuration_status()
 
     def _is_dirty(self) -> bool:
-        if self._reference_data is None:
-            return True
-        return (
-            WorkpieceController._normalized_serialized_state(self.get_serializable_state())
-            != WorkpieceController._normalized_serialized_state(self._reference_data)
-        )
+        return self._dirty_tracker.is_dirty()
 
     def _refresh_configuration_status(self) -> None:
         self._refresh_configuration_header()
-        current_data = self.get_serializable_state()
-        show_validation_icon = self._should_show_validation_icon(current_data)
+        show_validation_icon = self._should_show_validation_icon()
         if show_validation_icon != self._validation_icon_visible:
             self._validation_icon_visible = show_validation_icon
             self.validation_state_changed.emit(show_validation_icon)
 
         if not self._has_reference:
             self.view.set_configuration_status(
-                STATUS_UNSAVED if self._has_configuration_content(current_data) else STATUS_NONE,
+                STATUS_UNSAVED if self._has_configuration_content() else STATUS_NONE,
                 "#808080",
             )
             return
@@ -144,15 +132,10 @@ class WorkpieceController(QObject):
             self._was_dirty_since_reference = False
         self.view.set_configuration_status(self._clean_status_text, STATUS_OK_COLOR)
 
-    def _should_show_validation_icon(self, current_data: dict | None = None) -> bool:
+    def _should_show_validation_icon(self) -> bool:
         if not self._has_reference:
             return False
-        if current_data is None:
-            current_data = self.get_serializable_state()
-        if (
-            WorkpieceController._normalized_serialized_state(current_data)
-            != WorkpieceController._normalized_serialized_state(self._reference_data)
-        ):
+        if self._is_dirty():
             return False
         return self._clean_status_text in {
             STATUS_SAVED,
@@ -164,6 +147,26 @@ class WorkpieceController(QObject):
     # Connexions
     # ------------------------------------------------------------------
 
+    def _setup_dirty_tracking(self) -> None:
+        # Sections du fichier pièce lues par accesseurs, sans sérialisation complète ;
+        # les écritures faites signaux bloqués invalident explicitement
+        tracker = self._dirty_tracker
+        tooling = self.tooling_model
+        workpiece = self.workpiece_model
+        tracker.add_section("tooling_frame", tooling.get_parent_frame_id)
+        tracker.add_section("tooling_elements", lambda: [e.to_dict() for e in tooling.get_elements()])
+        tracker.add_section("workpiece_cad", lambda: (workpiece.get_cad_model(), workpiece.get_cad_color()))
+        tracker.add_section(
+            "workpiece_placement",
+            lambda: (
+                workpiece.get_parent_frame_id(),
+                workpiece.get_pose_in_parent().to_list(),
+                workpiece.get_workpiece_frame_pose().to_list(),
+            ),
+        )
+        tracker.bind(tooling.tooling_changed, "tooling_frame", "tooling_elements")
+        tracker.bind(workpiece.workpiece_changed, "workpiece_cad", "workpiece_placement")
+
     def _setup_connections(self) -> None:
         # Widget → modèle
         self._tooling_panel.tooling_changed.connect(self._on_tooling_widget_changed)
@@ -200,6 +203,7 @@ class WorkpieceController(QObject):
         self.tooling_model._parent_frame_id = self._tooling_panel.get_parent_frame_id()
         self.tooling_model._elements = [e.copy() for e in new_elements]
         self.tooling_model.blockSignals(False)
+        self._dirty_tracker.invalidate("tooling_frame", "tooling_elements")
         # Rebâtir le combo pièce (outillage peut avoir été ajouté/supprimé)
         self._refresh_piece_parent_combo()
         self._refresh_viewer()
@@ -214,6 +218,7 @@ class WorkpieceController(QObject):
         self.workpiece_model.set_pose_in_parent(Pose6(*data["pose_in_parent"]))
         self.workpiece_model.set_workpiece_frame_pose(Pose6(*data["workpiece_frame_pose"]))
         self.workpiece_model.blockSignals(False)
+        self._dirty_tracker.invalidate("workpiece_cad", "workpiece_placement")
         self._refresh_viewer()
         self._refresh_configuration_status()
 
@@ -448,7 +453,7 @@ class WorkpieceController(QObject):
         self.workpiece_model.from_dict({})
         self._current_config_file = ""
         self._current_config_display_name = ""
-        self._reference_data = None
+        self._dirty_tracker.clear_reference()
         self._has_reference = False
         self._was_dirty_since_reference = False
         self._clean_status_text = STATUS_NONE
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -11,6 +10,7 @@ from models.workspace_model import WorkspaceModel
 from models.types import Pose6
 from models.workspace_cad_element import WorkspaceCadElement
 from models.workspace_primitive_zone_models import WorkspacePrimitiveZoneData
+from utils.dirty_state_tracker import DirtyStateTracker
 from views.workspace_view import WorkspaceView
 from widgets.workspace_view.workspace_configuration_widget import WorkspaceConfigurationWidget
 
@@ -40,16 +40,39 @@ class WorkspaceController(QObject):
         self.workspace_widget = workspace_view.get_configuration_widget()
         self.viewer3d_controller = viewer3d_controller
         self._updating_from_view = False
-        self._reference_data: dict | None = None
+        self._dirty_tracker = DirtyStateTracker()
         self._has_reference = False
         self._was_dirty_since_reference = False
         self._clean_status_text = STATUS_NONE
         self._validation_icon_visible = False
 
+        self._setup_dirty_tracking()
         self._setup_connections()
         self._update_workspace_view()
         self._update_configuration_status()
 
+    def _setup_dirty_tracking(self) -> None:
+        """Sections du fichier scène, relues seulement quand leur compteur de révision du modèle change."""
+        model = self.workspace_model
+        tracker = self._dirty_tracker
+        tracker.add_section("scene_name", model.get_workspace_scene_name)
+        tracker.add_section(
+            "robot_base_pose_world",
+            lambda: model.get_robot_base_pose_world().to_list(),
+            model.get_robot_base_revision,
+        )
+        tracker.add_section(
+            "structure",
+            lambda: (
+                model.get_workspace_cad_elements(),
+                model.get_workspace_tcp_zones(),
+                model.get_workspace_collision_zones(),
+            ),
+            model.get_workspace_structure_revision,
+        )
+        # Le nom de scène n'a pas de révision dédiée : toute émission de workspace_changed le relit (lecture triviale)
+        tracker.bind(model.workspace_changed, "scene_name")
+
     def _setup_connections(self) -> None:
         self.workspace_model.workspace_changed.connect(self._update_workspace_view)
 
@@ -213,7 +236,7 @@ class WorkspaceController(QObject):
 
     def _on_clear_workspace_requested(self) -> None:
         self.workspace_model.clear_workspace()
-        self._reference_data = None
+        self._dirty_tracker.clear_reference()
         self._has_reference = False
         self._was_dirty_since_reference = False
         self._clean_status_text = STATUS_NONE
@@ -266,47 +289,35 @@ class WorkspaceController(QObject):
         if self.viewer3d_controller is not None:
             self.viewer3d_controller.end_loading_feedback()
 
-    def _current_configuration_data(self) -> dict:
-        return WorkspaceFile.from_workspace_model(self.workspace_model).to_dict()
-
-    @staticmethod
-    def _normalized_serialized_state(data: dict) -> str:
-        return json.dumps(json.loads(json.dumps(data)), sort_keys=True, ensure_ascii=True)
-
     def _mark_current_configuration_as_reference(self, clean_status_text: str) -> None:
-        self._reference_data = self._current_configuration_data()
+        self._dirty_tracker.set_reference()
         self._has_reference = True
         self._was_dirty_since_reference = False
         self._clean_status_text = clean_status_text
         self._update_configuration_status()
 
     def _is_dirty(self) -> bool:
-        if self._reference_data is None:
-            return True
-        return (
-            WorkspaceController._normalized_serialized_state(self._current_configuration_data())
-            != WorkspaceController._normalized_serialized_state(self._reference_data)
+        return self._dirty_tracker.is_dirty()
+
+    def _has_configuration_content(self) -> bool:
+        model = self.workspace_model
+        return bool(
+            model.get_workspace_cad_elements()
+            or model.get_workspace_tcp_zones()
+            or model.get_workspace_collision_zones()
+            or model.get_workspace_scene_name() != WorkspaceModel.DEFAULT_WORKSPACE_SCENE_NAME
+            or model.get_robot_base_pose_world() != Pose6.zeros()
         )
 
     def _update_configuration_status(self) -> None:
-        current_data = self._current_configuration_data()
-        show_validation_icon = self._should_show_validation_icon(current_data)
+        show_validation_icon = self._should_show_validation_icon()
         if show_validation_icon != self._validation_icon_visible:
             self._validation_icon_visible = show_validation_icon
             self.validation_state_changed.emit(show_validation_icon)
 
         if not self._has_reference:
-            has_content = any(
-                (
-                    current_data.get("cad_elements"),
-                    current_data.get("tcp_zones"),
-                    current_data.get("collision_zones"),
-                    current_data.get("scene_name") != WorkspaceModel.DEFAULT_WORKSPACE_SCENE_NAME,
-                    current_data.get("robot_base_pose_world") != Pose6.zeros().to_list(),
-                )
-            )
             self.workspace_widget.set_configuration_status(
-                STATUS_UNSAVED if has_content else STATUS_NONE,
+                STATUS_UNSAVED if self._has_configuration_content() else STATUS_NONE,
                 "#808080",
             )
             return
@@ -321,15 +332,10 @@ class WorkspaceController(QObject):
             self._was_dirty_since_reference = False
         self.workspace_widget.set_configuration_status(self._clean_status_text, STATUS_OK_COLOR)
 
-    def _should_show_validation_icon(self, current_data: dict | None = None) -> bool:
+    def _should_show_validation_icon(self) -> bool:
         if not self._has_reference:
             return False
-        if current_data is None:
-            current_data = self._current_configuration_data()
-        if (
-            WorkspaceController._normalized_serialized_state(current_data)
-            != WorkspaceController._normalized_serialized_state(self._reference_data)
-        ):
+        if self._is_dirty():
             return False
         return self._clean_status_text in {
             STATUS_SAVED,
@@ -19,6 +19,7 @@ from models.tool_model import ToolModel
 from models.tooling_model import ToolingModel
 from models.workspace_model import WorkspaceModel
 from models.workpiece_model import WorkpieceModel
+from utils.span_recorder import get_span_recorder
 from utils.user_data_paths import ensure_user_data_directories
 from views.main_window import MainWindow
 
@@ -34,6 +35,11 @@ def parse_startup_options(argv: list[str]) -> dict[str, str]:
         default=MainController.DEFAULT_SESSION_FILE,
         help="Chemin vers le fichier de session applicative JSON.",
     )
+    parser.add_argument(
+        "--trace",
+        dest="trace_path",
+        help="Enregistre les spans de chronométrage et écrit une trace Chrome/Perfetto JSON à la fermeture.",
+    )
     args = parser.parse_args(argv)
 
     return {
@@ -41,6 +47,7 @@ def parse_startup_options(argv: list[str]) -> dict[str, str]:
         "tool": args.tool_path or "",
         "workspace": args.workspace_path or "",
         "session": args.session_path or MainController.DEFAULT_SESSION_FILE,
+        "trace": args.trace_path or "",
     }
 
 
@@ -48,6 +55,9 @@ class CalibraxApplication:
     def __init__(self, startup_options: dict[str, str]):
         self.app = QApplication(sys.argv)
         ensure_user_data_directories()
+        self.trace_path = startup_options.get("trace") or ""
+        if self.trace_path:
+            get_span_recorder().enable()
 
         current_dir = os.getcwd()
         icon_path = os.path.join(current_dir, "appicon.ico")
@@ -76,6 +86,12 @@ class CalibraxApplication:
         )
 
         self.app.aboutToQuit.connect(self.main_controller.shutdown)
+        if self.trace_path:
+            # Après l'arrêt des workers : les derniers spans sont dans la trace.
+            self.app.aboutToQuit.connect(self._save_trace)
+
+    def _save_trace(self) -> None:
+        get_span_recorder().save_chrome_trace(self.trace_path)
 
     def run(self):
         self.main_window.show_maximized_on_startup()
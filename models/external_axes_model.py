@@ -26,6 +26,9 @@ class ExternalAxesModel(QObject):
         super().__init__(parent)
         self._axes: list[ExternalAxis] = []
         self._robot_mount_parent_id: str | None = None
+        # Révision par axe, incrémentée à chaque modification enregistrable (pas les valeurs q_i)
+        self._revision = 0
+        self._axis_revisions: dict[str, int] = {}
 
     # ------------------------------------------------------------------
     # CRUD axes
@@ -40,18 +43,29 @@ class ExternalAxesModel(QObject):
                 return a.copy()
         return None
 
+    def get_axis_revisions(self) -> list[tuple[str, int]]:
+        """(id, révision) de chaque axe, dans l'ordre de la configuration."""
+        return [(a.id, self._axis_revisions.get(a.id, 0)) for a in self._axes]
+
+    def _touch_axis(self, axis_id: str) -> None:
+        self._revision += 1
+        self._axis_revisions[axis_id] = self._revision
+
     def add_axis(self, axis: ExternalAxis) -> None:
         self._axes.append(axis.copy())
+        self._touch_axis(self._axes[-1].id)
         self.axes_changed.emit()
 
     def remove_axis(self, axis_id: str) -> None:
         for i, a in enumerate(self._axes):
             if a.id == axis_id:
                 self._axes.pop(i)
+                self._axis_revisions.pop(axis_id, None)
                 # Nettoyer les références parentales
                 for other in self._axes:
                     if other.mount_parent_id == axis_id:
                         other.mount_parent_id = None
+                        self._touch_axis(other.id)
                 if self._robot_mount_parent_id == axis_id:
                     self._robot_mount_parent_id = None
                     self.mount_topology_changed.emit()
@@ -65,6 +79,7 @@ class ExternalAxesModel(QObject):
                 new_axis.id = axis_id  # conserver l'ID stable
                 old = self._axes[i]
                 self._axes[i] = new_axis
+                self._touch_axis(axis_id)
                 if old.mount_parent_id != new_axis.mount_parent_id:
                     self.mount_topology_changed.emit()
                 self.axes_changed.emit()
@@ -132,36 +147,43 @@ class ExternalAxesModel(QObject):
         """
         world_transforms: dict[str, dict] = {}
         IDENTITY = np.eye(4, dtype=float)
+        for a, parent_id in self.resolve_mount_order():
+            parent_T = IDENTITY if parent_id is None else world_transforms[parent_id]["end"]
+            joint_vals = [values.get((a.id, i), j.value) for i, j in enumerate(a.joints)]
+            world_transforms[a.id] = a.compute_chain_with_values(parent_T, joint_vals)
+        return world_transforms
+
+    def resolve_mount_order(self) -> list[tuple[ExternalAxis, str | None]]:
+        """Axes dans un ordre où chaque parent précède ses enfants, avec le parent effectif.
 
+        Un parent introuvable ou un cycle de montage retombe sur le repère monde (parent None),
+        comme dans compute_world_transforms_for. Les axes retournés sont les instances internes :
+        ne pas les muter.
+        """
+        order: list[tuple[ExternalAxis, str | None]] = []
+        resolved: set[str] = set()
         remaining = list(self._axes)
-        max_iters = len(remaining) + 1
-        iters = 0
         while remaining:
-            iters += 1
-            if iters > max_iters:
-                for a in remaining:
-                    joint_vals = [values.get((a.id, i), j.value) for i, j in enumerate(a.joints)]
-                    world_transforms[a.id] = a.compute_chain_with_values(IDENTITY, joint_vals)
-                break
             pending_again = []
             for a in remaining:
                 if a.mount_parent_id is None:
-                    parent_T = IDENTITY
-                elif a.mount_parent_id in world_transforms:
-                    parent_T = world_transforms[a.mount_parent_id]["end"]
+                    order.append((a, None))
+                    resolved.add(a.id)
+                elif a.mount_parent_id in resolved:
+                    order.append((a, a.mount_parent_id))
+                    resolved.add(a.id)
                 else:
                     pending_again.append(a)
-                    continue
-                joint_vals = [values.get((a.id, i), j.value) for i, j in enumerate(a.joints)]
-                world_transforms[a.id] = a.compute_chain_with_values(parent_T, joint_vals)
             if len(pending_again) == len(remaining):
                 for a in pending_again:
-                    joint_vals = [values.get((a.id, i), j.value) for i, j in enumerate(a.joints)]
-                    world_transforms[a.id] = a.compute_chain_with_values(IDENTITY, joint_vals)
+                    order.append((a, None))
                 break
             remaining = pending_again
+        return order
 
-        return world_transforms
+    def joint_value_keys(self) -> list[tuple[str, int]]:
+        """Clés (axis_id, joint_idx) dans l'ordre des snapshots d'axes externes (axes puis joints)."""
+        return [(a.id, i) for a in self._axes for i in range(len(a.joints))]
 
     def compute_world_transforms(self) -> dict[str, dict]:
         """Calcule les matrices monde avec les valeurs live des joints."""
@@ -202,5 +224,8 @@ class ExternalAxesModel(QObject):
     def from_dict(self, data: dict) -> None:
         self._axes = [ExternalAxis.from_dict(d) for d in data.get("axes", [])]
         self._robot_mount_parent_id = data.get("robot_mount_parent_id")
+        self._axis_revisions = {}
+        for a in self._axes:
+            self._touch_axis(a.id)
         self.axes_changed.emit()
         self.mount_topology_changed.emit()
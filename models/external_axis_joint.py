@@ -89,6 +89,29 @@ class ExternalAxisJoint:
             ], dtype=float)
         return T
 
+    def joint_transforms_for_values(self, q_user: np.ndarray) -> np.ndarray:
+        """Matrices (N, 4, 4) pour N valeurs articulaires, même formule que joint_transform_for_value."""
+        q = np.asarray(q_user, dtype=float).reshape(-1) + self.offset
+        T = np.broadcast_to(np.eye(4, dtype=float), (len(q), 4, 4)).copy()
+        axis = np.asarray(self.axis, dtype=float)
+        if self.joint_type == ExternalAxisJointType.LINEAR:
+            T[:, :3, 3] = q[:, None] * axis
+            return T
+        n = vector_norm3(self.axis)
+        if n < 1e-9:
+            return T
+        u = axis / n
+        q_rad = np.radians(q)
+        c = np.cos(q_rad)[:, None, None]
+        s = np.sin(q_rad)[:, None, None]
+        cross = np.array([
+            [0.0, -u[2], u[1]],
+            [u[2], 0.0, -u[0]],
+            [-u[1], u[0], 0.0],
+        ])
+        T[:, :3, :3] = c * np.eye(3) + (1.0 - c) * np.outer(u, u) + s * cross
+        return T
+
     def link_pose_matrix(self) -> np.ndarray:
         return pose_zyx_to_matrix(self.link_pose_in_prev)
 
@@ -60,6 +60,9 @@ class ProgramGenerationSettings:
     )
     # Vitesse constante imposée le long de la trajectoire (mm/s). None = vitesses du programme.
     constant_speed_mmps: float | None = None
+    # Découpage de l'export KRL en sous-programmes (None = pas de borne sur ce critère).
+    split_max_motions: int | None = None
+    split_max_bytes: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -69,12 +72,16 @@ class ProgramGenerationSettings:
             "header_text": self.header_text,
             "default_approximation": _approximation_to_dict(self.default_approximation),
             "constant_speed_mmps": self.constant_speed_mmps,
+            "split_max_motions": self.split_max_motions,
+            "split_max_bytes": self.split_max_bytes,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any] | None) -> ProgramGenerationSettings:
         payload = data if isinstance(data, dict) else {}
         raw_speed = payload.get("constant_speed_mmps")
+        raw_split_motions = payload.get("split_max_motions")
+        raw_split_bytes = payload.get("split_max_bytes")
         return cls(
             home_enabled=bool(payload.get("home_enabled", True)),
             approach=_approach_retract_from_dict(
@@ -91,6 +98,8 @@ class ProgramGenerationSettings:
                 else MotionApproximation(mode=ApproximationMode.C_DIS, value=1.0)
             ),
             constant_speed_mmps=float(raw_speed) if raw_speed is not None else None,
+            split_max_motions=int(raw_split_motions) if raw_split_motions else None,
+            split_max_bytes=int(raw_split_bytes) if raw_split_bytes else None,
         )
 
 
@@ -506,6 +506,15 @@ class RobotModel(QObject):
     def inhibit_ik(self, inhibit: bool) -> None:
         self._inhibit_ik = inhibit
 
+    def is_ik_inhibited(self) -> bool:
+        return self._inhibit_ik
+
+    def refresh_current_tcp_mgi_result(self, tool: RobotTool | None = None) -> None:
+        """Recalcule les solutions MGI de la pose TCP courante, sans refaire le MGD."""
+        if not self.has_configuration:
+            return
+        self.current_tcp_mgi_result = self.compute_ik_target(self.tcp_pose, tool=tool)
+
     def inhibit_ui_signals(self, inhibit: bool) -> None:
         self._inhibit_ui_signals = inhibit
 
@@ -1006,6 +1015,11 @@ class RobotModel(QObject):
         self.corrections = [row[:6] + [0]*(6-len(row)) for row in self.corrections[:6]]
         self.corrections_changed.emit()
 
+    def set_corrections(self, corrections: list[list[float]]):
+        """Remplace les corrections 6D et recalcule la pose TCP"""
+        self._set_corrections(corrections)
+        self._update_tcp_pose()
+
     def compute_corrections(self):
         """Calcule les corrections 6D basées sur les mesures"""
         # TODO : Implémenter le calcul des corrections
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+DEFAULT_WARNING_INDEX = 0.03
+DEFAULT_ERROR_INDEX = 0.01
+
+
+class SingularityKind(Enum):
+    WRIST = "WRIST"
+    SHOULDER = "SHOULDER"
+    ELBOW = "ELBOW"
+
+
+class SingularitySeverity(Enum):
+    ERROR = "ERROR"
+    WARNING = "WARNING"
+
+
+@dataclass(frozen=True)
+class SingularityThresholds:
+    """Seuils sur l'indice de singularité (inverse du conditionnement, 0 = singulier, 1 = isotrope).
+
+    Avec les lignes d'orientation pondérées comme pour le jog, 0.03 correspond à A5 ≈ 9° et
+    0.01 à A5 ≈ 3° sur un poignet sphérique usuel.
+    """
+    warning_index: float = DEFAULT_WARNING_INDEX
+    error_index: float = DEFAULT_ERROR_INDEX
+
+
+@dataclass(frozen=True)
+class SingularityInterval:
+    """Passage continu sous le seuil d'alerte, décrit au point le plus proche de la singularité."""
+    kind: SingularityKind
+    severity: SingularitySeverity
+    start_time_s: float
+    end_time_s: float
+    min_index: float
+    min_time_s: float
+    limit: float
+    start_sample_index: int
+    end_sample_index: int
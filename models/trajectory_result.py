@@ -1,7 +1,8 @@
 from enum import Enum
 
+from models.singularity import SingularityInterval, SingularityKind
 from models.trajectory_keypoint import KeypointMotionMode, TrajectoryKeypoint
-from models.types import TrajectorySampleKinematics
+from models.types import TrajectorySampleKinematics, XYZ3
 from utils.mgi import MgiConfigKey
 
 
@@ -85,6 +86,28 @@ class TrajectoryCollisionDiagnostic:
         self.source_index_b = None if source_index_b is None else int(source_index_b)
 
 
+class TrajectoryClearanceDiagnostic:
+    def __init__(
+        self,
+        domain: TrajectoryCollisionDomain,
+        owner_a: str,
+        name_a: str,
+        owner_b: str,
+        name_b: str,
+        distance_mm: float,
+        point_a_world: XYZ3,
+        point_b_world: XYZ3,
+    ) -> None:
+        self.domain = domain
+        self.owner_a = str(owner_a)
+        self.name_a = str(name_a)
+        self.owner_b = str(owner_b)
+        self.name_b = str(name_b)
+        self.distance_mm = float(distance_mm)
+        self.point_a_world = point_a_world.copy()
+        self.point_b_world = point_b_world.copy()
+
+
 class TrajectorySampleMgiSolution:
     def __init__(
         self,
@@ -128,6 +151,9 @@ class TrajectorySample:
         self.articular_jerk_valid = False
         self.dynamic_violations: list[TrajectoryDynamicViolation] = []
         self.collisions: list[TrajectoryCollisionDiagnostic] = []
+        self.clearance: TrajectoryClearanceDiagnostic | None = None
+        self.singularity_index: float | None = None
+        self.singularity_kind: SingularityKind | None = None
         self.error_code = TrajectorySampleErrorCode.NONE
         self.error_axis: int | None = None
         self.mgi_solutions: dict[MgiConfigKey, TrajectorySampleMgiSolution] = {}
@@ -159,6 +185,7 @@ class SegmentResult:
         self.joints_stats = [JointDynamicStats() for _ in range(6)]
         self.first_error_sample_index: int | None = None
         self.first_error_axis: int | None = None
+        self.singularity_intervals: list[SingularityInterval] = []
 
 
 class TrajectoryResult:
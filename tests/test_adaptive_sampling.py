@@ -0,0 +1,92 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.trajectory_keypoint import KeypointMotionMode, TrajectoryKeypoint
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.models.pipeline import TrajectoryComputationStatus, TrajectorySample, TrajectorySegment
+from trajectory_engine.sampling import AdaptiveSamplingPolicy, joints_at_time, resample_fixed_dt
+from utils.mgi import MgiConfigKey
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+START_JOINTS = [0.0, -90.0, 90.0, 0.0, 45.0, 0.0]
+
+
+def _sample(time_s, joints, configuration=MgiConfigKey.FUN):
+    sample = TrajectorySample()
+    sample.time = time_s
+    sample.joints = list(joints)
+    sample.configuration = configuration
+    return sample
+
+
+class AdaptiveSamplingTest(unittest.TestCase):
+    def test_policy_refines_on_curvature_configuration_and_clearance(self):
+        policy = AdaptiveSamplingPolicy(max_stride_ticks=8, boundary_ticks=2)
+        self.assertEqual(policy.coarse_indices(20), [0, 1, 8, 16, 18, 19])
+
+        left = _sample(0.0, [0.0, -90.0, 90.0, 0.0, 45.0, 0.0])
+        right = _sample(0.1, [10.0, -90.0, 90.0, 0.0, 45.0, 0.0])
+        straight = _sample(0.05, [5.0, -90.0, 90.0, 0.0, 45.0, 0.0])
+        bent = _sample(0.05, [5.5, -90.0, 90.0, 0.0, 45.0, 0.0])
+        self.assertFalse(policy.needs_refinement(left, straight, right, 0.5))
+        self.assertTrue(policy.needs_refinement(left, bent, right, 0.5))
+        self.assertTrue(policy.needs_refinement(left, _sample(0.05, straight.joints, MgiConfigKey.FUF), right, 0.5))
+
+        policy.clearance_probe = lambda sample: 20.0 if sample.joints[0] > 8.0 else None
+        self.assertTrue(policy.needs_refinement(left, straight, right, 0.5))
+
+    def test_adaptive_build_matches_fixed_dt_build_with_fewer_samples(self):
+        robot_model = RobotModel()
+        with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+            robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+        tool_model = ToolModel()
+
+        def pose(joints):
+            return robot_model.compute_fk_joints(joints, tool=tool_model.get_tool()).dh_pose.copy()
+
+        start = TrajectoryKeypoint(cartesian_target=pose([0.0, -70.0, 70.0, 0.0, 30.0, 0.0]), mode=KeypointMotionMode.PTP)
+        end = TrajectoryKeypoint(
+            cartesian_target=pose([40.0, -60.0, 80.0, 20.0, 40.0, 10.0]),
+            mode=KeypointMotionMode.LINEAR,
+            linear_speed_mps=0.05,
+        )
+        segments = [TrajectorySegment(start, end)]
+
+        results = {}
+        for enabled in (False, True):
+            builder = TrajectoryBuilder(robot_model, tool_model, WorkspaceModel())
+            builder.set_adaptive_sampling(enabled)
+            results[enabled] = builder.compute_trajectory(START_JOINTS, segments)
+
+        dense = [sample for segment in results[False].segments for sample in segment.samples]
+        sparse = [sample for segment in results[True].segments for sample in segment.samples]
+        self.assertEqual(results[True].status, TrajectoryComputationStatus.SUCCESS)
+        self.assertEqual(results[True].segments[-1].last_time, results[False].segments[-1].last_time)
+        self.assertLess(len(sparse), len(dense) / 4)
+        self.assertFalse(any(sample.dynamic_violations for sample in sparse))
+
+        def pose_of(joints):
+            return robot_model.compute_fk_joints(joints, tool=tool_model.get_tool()).dh_pose.to_list()
+
+        resampled = resample_fixed_dt(sparse, builder.sample_dt_s, pose_of)
+        self.assertEqual(len(resampled), len(dense))
+        np.testing.assert_allclose([s.time for s in resampled], [s.time for s in dense], atol=1e-9)
+        np.testing.assert_allclose([s.joints for s in resampled], [s.joints for s in dense], atol=0.05)
+        self.assertIs(resample_fixed_dt(dense, builder.sample_dt_s)[10], dense[10])
+
+        times = [sample.time for sample in sparse]
+        middle = 0.5 * (sparse[40].time + sparse[41].time)
+        expected = 0.5 * (np.array(sparse[40].joints) + np.array(sparse[41].joints))
+        np.testing.assert_allclose(joints_at_time(sparse, times, middle), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
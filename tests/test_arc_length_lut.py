@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+
+from models.trajectory_keypoint import KeypointMotionMode
+from models.types import Pose6, XYZ3
+from trajectory_engine.arc_length import (
+    build_adaptive_arc_length_lut,
+    build_arc_length_lut,
+    parameter_at_distance,
+    parameters_at_distances,
+)
+from trajectory_engine.geometry import Bezier7Curve3D
+from trajectory_engine.models.trajectory_primitives import ArcLengthLut, RuntimeSegment, SegmentSpeedProfile
+from trajectory_engine.runtime import evaluate_pose_at_distance, evaluate_poses_at_distances
+
+
+def _curved() -> Bezier7Curve3D:
+    return Bezier7Curve3D.from_handles(XYZ3(0.0, 0.0, 0.0), XYZ3(50.0, 0.0, 0.0), XYZ3(300.0, 300.0, 0.0), XYZ3(300.0, -300.0, 0.0))
+
+
+class ArcLengthLutTest(unittest.TestCase):
+    def test_vectorized_curve_matches_scalar_evaluation(self):
+        curve = _curved()
+        u = np.linspace(-0.1, 1.1, 25)
+
+        points = curve.points(u)
+        derivatives = curve.first_derivatives(u)
+
+        for index, value in enumerate(u):
+            np.testing.assert_allclose(points[index], curve.point(value).to_list(), atol=1e-9)
+            np.testing.assert_allclose(derivatives[index], curve.first_derivative(value).to_list(), atol=1e-9)
+        step = 1e-6
+        inner = np.linspace(0.1, 0.9, 9)
+        finite_difference = (curve.points(inner + step) - curve.points(inner - step)) / (2.0 * step)
+        np.testing.assert_allclose(curve.first_derivatives(inner), finite_difference, atol=1e-3)
+        second = np.array([curve.second_derivative(value).to_list() for value in inner])
+        derivative_difference = (curve.first_derivatives(inner + step) - curve.first_derivatives(inner - step)) / (2.0 * step)
+        np.testing.assert_allclose(second, derivative_difference, atol=1e-2)
+
+    def test_adaptive_table_meets_tolerance(self):
+        curve = _curved()
+        reference = build_arc_length_lut(curve, 200_000)
+        for tolerance in (1e-2, 1e-3):
+            lut = build_adaptive_arc_length_lut(curve, tolerance)
+            distances = np.linspace(0.0, lut.total_length_mm, 2001)
+            reached = np.interp(parameters_at_distances(lut, distances), reference.parameters_u, reference.distances_mm)
+
+            self.assertAlmostEqual(lut.total_length_mm, reference.total_length_mm, delta=tolerance)
+            self.assertLessEqual(float(np.max(np.abs(reached - distances))), tolerance)
+            self.assertTrue(np.all(np.diff(lut.parameters_u) > 0.0))
+        self.assertLess(len(build_adaptive_arc_length_lut(curve, 1e-2).parameters_u), len(lut.parameters_u))
+
+        linear = build_adaptive_arc_length_lut(Bezier7Curve3D.linear(XYZ3(0.0, 0.0, 0.0), XYZ3(300.0, 400.0, 0.0)))
+        self.assertEqual(linear.parameters_u, [0.0, 1.0])
+        self.assertAlmostEqual(linear.total_length_mm, 500.0, places=9)
+
+    def test_batch_inversion_matches_scalar_lookup(self):
+        lut = build_adaptive_arc_length_lut(_curved(), 1e-2)
+        distances = np.concatenate(([-5.0, 0.0], np.linspace(0.0, lut.total_length_mm, 301), [lut.total_length_mm + 1.0]))
+
+        expected = [parameter_at_distance(lut, value) for value in distances]
+
+        np.testing.assert_allclose(parameters_at_distances(lut, distances), expected, atol=1e-12)
+        flat = ArcLengthLut(parameters_u=[0.0, 1.0], distances_mm=[0.0, 0.0], total_length_mm=0.0)
+        np.testing.assert_array_equal(parameters_at_distances(flat, [0.0, 1.0]), [0.0, 0.0])
+
+    def test_batch_poses_match_scalar_evaluation(self):
+        curve = _curved()
+        lut = build_adaptive_arc_length_lut(curve)
+        segment = RuntimeSegment(
+            mode=KeypointMotionMode.BEZIER,
+            curve=curve,
+            arc_lut=lut,
+            start_pose=Pose6(0.0, 0.0, 0.0, 170.0, 0.0, -90.0),
+            end_pose=Pose6(50.0, 0.0, 0.0, -170.0, 30.0, 90.0),
+            speed_profile=SegmentSpeedProfile(0, lut.total_length_mm, 100.0, 0.0, 0.0),
+            out_direction=XYZ3(300.0, 300.0, 0.0),
+            in_direction=XYZ3(300.0, -300.0, 0.0),
+        )
+        distances = np.linspace(-1.0, lut.total_length_mm + 1.0, 97)
+
+        poses = evaluate_poses_at_distances(segment, distances)
+
+        expected = np.array([evaluate_pose_at_distance(segment, value).to_list() for value in distances])
+        np.testing.assert_allclose(poses, expected, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
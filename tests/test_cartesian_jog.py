@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+
+import utils.math_utils as math_utils
+from controllers.jog_controller import JogController
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.types import Pose6
+from models.workspace_model import WorkspaceModel
+from utils.cartesian_jog import (
+    compute_damped_joint_increment,
+    compute_geometric_jacobian,
+    compute_pose_twist,
+)
+
+
+DH = [
+    [0.0, 0.0, 0.0, 400.0],
+    [-90.0, 25.0, 0.0, 0.0],
+    [0.0, 560.0, -90.0, 0.0],
+    [-90.0, 35.0, 0.0, 515.0],
+    [90.0, 0.0, 0.0, 0.0],
+    [-90.0, 0.0, 180.0, 80.0],
+]
+AXIS_REVERSED = [-1, 1, 1, -1, 1, -1]
+TOOL = np.eye(4)
+TOOL[:3, 3] = [10.0, -5.0, 120.0]
+
+
+def _dh_matrices(joints: np.ndarray) -> list[np.ndarray]:
+    matrices = [np.eye(4)]
+    T = np.eye(4)
+    for i, (alpha, d, theta, r) in enumerate(DH):
+        theta_rad = np.radians(theta + joints[i] * AXIS_REVERSED[i])
+        T = T @ math_utils.dh_modified(np.radians(alpha), d, theta_rad, r)
+        matrices.append(T)
+    matrices.append(T @ TOOL)
+    return matrices
+
+
+class CartesianJogTest(unittest.TestCase):
+    def test_jacobian_matches_finite_differences(self):
+        joints = np.array([20.0, -70.0, 95.0, 30.0, 40.0, -15.0])
+        jacobian = compute_geometric_jacobian(_dh_matrices(joints), AXIS_REVERSED)
+        base_tcp = _dh_matrices(joints)[-1]
+
+        step = 1e-5
+        for joint_index in range(6):
+            shifted = joints.copy()
+            shifted[joint_index] += step
+            tcp = _dh_matrices(shifted)[-1]
+            np.testing.assert_allclose(jacobian[:3, joint_index], (tcp[:3, 3] - base_tcp[:3, 3]) / step, atol=1e-4)
+            rotation = math_utils.rotation_matrix_to_rotation_vector(tcp[:3, :3] @ base_tcp[:3, :3].T)
+            np.testing.assert_allclose(jacobian[3:, joint_index], rotation / step, atol=1e-6)
+
+    def test_damped_step_converges_to_target(self):
+        joints = np.array([10.0, -80.0, 100.0, 5.0, 35.0, 0.0])
+        target = math_utils.matrix_to_pose_zyx(_dh_matrices(joints)[-1])
+        target = Pose6(target.x + 2.0, target.y - 1.0, target.z + 1.5, target.a + 0.5, target.b, target.c - 0.3)
+
+        for _ in range(3):
+            matrices = _dh_matrices(joints)
+            twist = compute_pose_twist(math_utils.matrix_to_pose_zyx(matrices[-1]), target)
+            increment, sigma_min = compute_damped_joint_increment(
+                compute_geometric_jacobian(matrices, AXIS_REVERSED), twist
+            )
+            joints = joints + increment
+
+        final_twist = compute_pose_twist(math_utils.matrix_to_pose_zyx(_dh_matrices(joints)[-1]), target)
+        self.assertLess(float(np.linalg.norm(final_twist[:3])), 1e-4)
+        self.assertLess(float(np.linalg.norm(final_twist[3:])), 1e-6)
+        self.assertGreater(sigma_min, 1.0)
+
+    def test_damping_bounds_joint_step_at_wrist_singularity(self):
+        joints = np.array([0.0, -90.0, 90.0, 0.0, 0.0, 0.0])
+        matrices = _dh_matrices(joints)
+        jacobian = compute_geometric_jacobian(matrices, AXIS_REVERSED)
+        twist = np.array([0.5, 0.2, -0.3, 1e-3, 2e-3, 1e-3])
+
+        increment, sigma_min = compute_damped_joint_increment(jacobian, twist)
+
+        self.assertLess(sigma_min, 1e-6)
+        self.assertTrue(np.all(np.isfinite(increment)))
+        self.assertLess(float(np.max(np.abs(increment))), 5.0)
+
+
+class JogIkInhibitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.robot_model = RobotModel()
+        self.robot_model.has_configuration = True
+        self.controller = JogController(self.robot_model, ToolModel(), WorkspaceModel(), mock.MagicMock())
+        self.compute_fk_tcp = mock.patch.object(self.robot_model, "compute_fk_tcp").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_second_cartesian_press_restores_ik_on_release(self):
+        self.controller._on_jog_cartesian_pressed(0, 1)
+        self.controller._on_jog_cartesian_pressed(1, 1)
+        self.assertTrue(self.robot_model.is_ik_inhibited())
+
+        self.controller._on_jog_cartesian_released(1)
+        self.controller._on_jog_cartesian_released(0)
+
+        self.assertFalse(self.robot_model.is_ik_inhibited())
+        self.compute_fk_tcp.assert_called_once()
+
+    def test_joint_press_ends_cartesian_jog(self):
+        self.controller._on_jog_cartesian_pressed(0, 1)
+        self.controller._on_jog_joint_pressed(2, -1)
+
+        self.assertFalse(self.robot_model.is_ik_inhibited())
+        self.compute_fk_tcp.assert_called_once()
+        self.controller._on_jog_cartesian_released(0)
+        self.controller._on_jog_joint_released(2)
+        self.assertFalse(self.robot_model.is_ik_inhibited())
+        self.compute_fk_tcp.assert_called_once()
+
+    def test_previous_inhibit_state_is_kept(self):
+        self.robot_model.inhibit_ik(True)
+        self.controller._on_jog_cartesian_pressed(0, 1)
+        self.controller._on_jog_cartesian_pressed(3, -1)
+        self.controller._on_jog_cartesian_released(3)
+
+        self.assertTrue(self.robot_model.is_ik_inhibited())
+        self.compute_fk_tcp.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
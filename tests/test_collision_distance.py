@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from models.primitive_collider_models import PrimitiveColliderShape
+from utils.collision_utils import (
+    CollisionDistanceCache,
+    CollisionShape,
+    GjkWarmStart,
+    compute_distance,
+    find_minimum_clearance,
+    intersects,
+)
+
+
+def _translation(x: float, y: float, z: float) -> np.ndarray:
+    transform = np.eye(4, dtype=float)
+    transform[:3, 3] = [x, y, z]
+    return transform
+
+
+def _sphere(name: str, x: float, y: float, z: float, radius: float) -> CollisionShape:
+    return CollisionShape("robot", name, PrimitiveColliderShape.SPHERE, _translation(x, y, z), radius=radius)
+
+
+def _box() -> CollisionShape:
+    return CollisionShape(
+        "workspace",
+        "Table",
+        PrimitiveColliderShape.BOX,
+        np.eye(4, dtype=float),
+        size_x=100.0,
+        size_y=100.0,
+        size_z=50.0,
+    )
+
+
+class CollisionDistanceTest(unittest.TestCase):
+    def test_separated_spheres_return_distance_and_witness_points(self):
+        result = compute_distance(_sphere("A", 0.0, 0.0, 0.0, 10.0), _sphere("B", 30.0, 0.0, 0.0, 5.0))
+
+        self.assertAlmostEqual(result.distance, 15.0, places=6)
+        self.assertFalse(result.intersecting)
+        np.testing.assert_allclose(result.point_a, [10.0, 0.0, 0.0], atol=1e-6)
+        np.testing.assert_allclose(result.point_b, [25.0, 0.0, 0.0], atol=1e-6)
+
+    def test_sphere_above_box_face(self):
+        result = compute_distance(_sphere("A", 10.0, 5.0, 80.0, 10.0), _box())
+
+        self.assertAlmostEqual(result.distance, 20.0, delta=1e-2)
+        self.assertAlmostEqual(float(result.point_b[2]), 50.0, places=6)
+
+    def test_penetration_depth_is_negative_and_consistent_with_intersects(self):
+        sphere = _sphere("A", 10.0, 5.0, 45.0, 10.0)
+        box = _box()
+
+        result = compute_distance(sphere, box)
+
+        self.assertTrue(intersects(sphere, box))
+        self.assertTrue(result.intersecting)
+        self.assertAlmostEqual(result.distance, -15.0, delta=1e-2)
+
+    def test_warm_start_matches_cold_query_along_coherent_motion(self):
+        box = _box()
+        warm_start = GjkWarmStart()
+        for step in range(50):
+            cylinder = CollisionShape(
+                "robot",
+                "J1",
+                PrimitiveColliderShape.CYLINDER,
+                _translation(10.0 + 2.0 * step, 5.0, 120.0),
+                radius=10.0,
+                height=40.0,
+            )
+            warm = compute_distance(cylinder, box, warm_start=warm_start)
+            cold = compute_distance(cylinder, box)
+            self.assertAlmostEqual(warm.distance, cold.distance, delta=1e-2)
+            self.assertTrue(warm_start.directions)
+
+    def test_minimum_clearance_picks_closest_pair(self):
+        near = _sphere("Near", 0.0, 0.0, 70.0, 10.0)
+        far = _sphere("Far", 0.0, 0.0, 300.0, 10.0)
+
+        clearance = find_minimum_clearance([far, near], [_box()], CollisionDistanceCache())
+
+        self.assertIsNotNone(clearance)
+        self.assertEqual(clearance.pair.name_a, "Near")
+        self.assertAlmostEqual(clearance.distance, 10.0, delta=1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()
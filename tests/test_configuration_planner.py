@@ -0,0 +1,87 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.trajectory_keypoint import ConfigurationPolicy, KeypointMotionMode, TrajectoryKeypoint
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.configuration_planner import ConfigurationPlanner
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.models.pipeline import TrajectoryComputationStatus, TrajectorySegment
+from utils.mgi import MgiConfigKey
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+START_JOINTS = [0.0, -90.0, 90.0, 0.0, 45.0, 0.0]
+
+
+class ConfigurationPlannerTest(unittest.TestCase):
+    def setUp(self):
+        self.robot_model = RobotModel()
+        with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+            self.robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+        # A4 restreint : le LIN ci-dessous sort des limites dans la branche la plus proche du départ.
+        limits = self.robot_model.get_axis_limits()
+        limits[3] = (-100.0, 100.0)
+        self.robot_model.set_axis_limits(limits)
+        self.tool_model = ToolModel()
+        self.workspace_model = WorkspaceModel()
+
+    def _pose(self, joints):
+        return self.robot_model.compute_fk_joints(joints, tool=self.tool_model.get_tool()).dh_pose.copy()
+
+    def _segments(self, **to_options):
+        start = TrajectoryKeypoint(cartesian_target=self._pose([10.0, -80.0, 80.0, 90.0, 40.0, 0.0]), mode=KeypointMotionMode.PTP)
+        end = TrajectoryKeypoint(
+            cartesian_target=self._pose([10.0, -80.0, 80.0, 150.0, 40.0, 0.0]),
+            mode=KeypointMotionMode.LINEAR,
+            linear_speed_mps=0.05,
+            **to_options,
+        )
+        return [TrajectorySegment(start, end)]
+
+    def _build(self, segments, planning_enabled):
+        builder = TrajectoryBuilder(self.robot_model, self.tool_model, self.workspace_model)
+        builder.set_configuration_planning_enabled(planning_enabled)
+        return builder.compute_trajectory(START_JOINTS, segments)
+
+    @staticmethod
+    def _max_joint_step(segment_result):
+        joints = np.array([sample.joints for sample in segment_result.samples])
+        return float(np.abs(np.diff(joints, axis=0)).max())
+
+    def test_global_plan_avoids_the_greedy_configuration_jump(self):
+        segments = self._segments()
+
+        greedy = self._build(segments, planning_enabled=False)
+        planned = self._build(segments, planning_enabled=True)
+
+        self.assertNotEqual(greedy.status, TrajectoryComputationStatus.SUCCESS)
+        self.assertGreater(self._max_joint_step(greedy.segments[-1]), 90.0)
+        self.assertEqual(planned.status, TrajectoryComputationStatus.SUCCESS)
+        self.assertLess(self._max_joint_step(planned.segments[-1]), 5.0)
+        configurations = {sample.configuration for sample in planned.segments[-1].samples}
+        self.assertEqual(len(configurations), 1)
+
+    def test_plan_respects_forced_configuration_and_reports_infeasible_sequences(self):
+        builder = TrajectoryBuilder(self.robot_model, self.tool_model, self.workspace_model)
+        segments = self._segments()
+        start = builder._synthetic_start_keypoint(START_JOINTS, segments[0].from_keypoint)
+        plan = ConfigurationPlanner(builder).plan([TrajectorySegment(start, segments[0].from_keypoint)] + segments)
+
+        self.assertIsNotNone(plan)
+        self.assertEqual(len(plan.configs), 3)
+        self.assertEqual(plan.configs[1], plan.configs[2])
+        self.assertEqual(set(plan.configs_by_keypoint()), {id(segments[0].from_keypoint), id(segments[0].to_keypoint)})
+
+        forced = self._segments(configuration_policy=ConfigurationPolicy.FORCED, forced_config=MgiConfigKey.FUN)
+        start = builder._synthetic_start_keypoint(START_JOINTS, forced[0].from_keypoint)
+        self.assertIsNone(ConfigurationPlanner(builder).plan([TrajectorySegment(start, forced[0].from_keypoint)] + forced))
+
+
+if __name__ == "__main__":
+    unittest.main()
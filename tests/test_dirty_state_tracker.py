@@ -0,0 +1,112 @@
+import unittest
+
+from models.external_axes_model import ExternalAxesModel
+from models.external_axis import ExternalAxis
+from models.external_axis_joint import ExternalAxisJoint
+from utils.dirty_state_tracker import DirtyStateTracker
+
+
+class _CountingReader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class DirtyStateTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = DirtyStateTracker()
+        self.dh = _CountingReader([[0.0, 0.0, 400.0, 0.0]] * 6)
+        self.name = _CountingReader("rocky")
+        self.tracker.add_section("dh", self.dh)
+        self.tracker.add_section("name", self.name)
+
+    def test_without_reference_everything_is_dirty(self):
+        self.assertTrue(self.tracker.is_dirty())
+        self.tracker.set_reference()
+        self.assertFalse(self.tracker.is_dirty())
+        self.tracker.clear_reference()
+        self.assertFalse(self.tracker.has_reference())
+        self.assertTrue(self.tracker.is_dirty())
+
+    def test_only_invalidated_sections_are_read(self):
+        self.tracker.set_reference()
+        self.assertEqual((self.dh.calls, self.name.calls), (1, 1))
+
+        self.dh.value = [[0.0, 0.0, 450.0, 0.0]] + [[0.0, 0.0, 400.0, 0.0]] * 5
+        self.assertFalse(self.tracker.is_dirty())
+        self.tracker.invalidate("dh")
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertEqual((self.dh.calls, self.name.calls), (2, 1))
+
+        # Revenir à la valeur enregistrée (aux arrondis près) rend la section propre.
+        self.dh.value = [[0.0, 0.0, 400.0 + 1e-12, 0.0]] + [[0.0, 0.0, 400.0, 0.0]] * 5
+        self.tracker.invalidate("dh")
+        self.assertFalse(self.tracker.is_dirty())
+
+        self.name.value = "rocky_2"
+        self.tracker.invalidate()
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertEqual((self.dh.calls, self.name.calls), (4, 2))
+
+    def test_revision_counter_triggers_read(self):
+        revision = [0]
+        colliders = _CountingReader({"L1": {"radius": 40.0}})
+        self.tracker.add_section("colliders", colliders, lambda: revision[0])
+        self.tracker.set_reference()
+
+        self.assertFalse(self.tracker.is_dirty())
+        self.assertEqual(colliders.calls, 1)
+
+        colliders.value = {"L1": {"radius": 55.0}}
+        revision[0] += 1
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertEqual(colliders.calls, 2)
+        self.tracker.set_reference()
+        self.assertFalse(self.tracker.is_dirty())
+
+    def test_item_section_reads_only_modified_axes(self):
+        model = ExternalAxesModel()
+        model.add_axis(ExternalAxis(name="Rail", axis_id="rail", joints=[ExternalAxisJoint()]))
+        model.add_axis(ExternalAxis(name="Positionneur", axis_id="pos", joints=[ExternalAxisJoint()]))
+        reads: list[str] = []
+
+        def read_axis(axis_id):
+            reads.append(axis_id)
+            data = model.get_axis(axis_id).to_dict()
+            for joint_data in data["joints"]:
+                joint_data.pop("value", None)
+            return data
+
+        self.tracker.add_item_section("axes", model.get_axis_revisions, read_axis)
+        self.tracker.set_reference()
+        self.assertEqual(sorted(reads), ["pos", "rail"])
+
+        reads.clear()
+        model.set_axis_joint_value("rail", 0, 0.5)
+        self.assertFalse(self.tracker.is_dirty())
+        self.assertEqual(reads, [])
+
+        renamed = model.get_axis("pos")
+        renamed.name = "Plateau"
+        model.update_axis("pos", renamed)
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertEqual(reads, ["pos"])
+
+        renamed.name = "Positionneur"
+        model.update_axis("pos", renamed)
+        self.assertFalse(self.tracker.is_dirty())
+
+        model.reorder_axes(["pos", "rail"])
+        self.assertTrue(self.tracker.is_dirty())
+        model.remove_axis("pos")
+        self.assertTrue(self.tracker.is_dirty())
+        self.assertEqual(reads, ["pos", "pos"])
+
+
+if __name__ == "__main__":
+    unittest.main()
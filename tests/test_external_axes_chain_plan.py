@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+from models.external_axes_model import ExternalAxesModel
+from models.external_axis import ExternalAxis
+from models.tooling_element import ToolingElement
+from models.tooling_model import ToolingModel
+from models.types import Pose6
+from models.workpiece_model import WorkpieceModel
+from models.workspace_model import WorkspaceModel
+from utils.external_axes_kinematics import ExternalAxesChainPlan, piece_frame_world, tooling_frame_world
+
+
+def _build_cell() -> tuple[ExternalAxesModel, WorkspaceModel, WorkpieceModel, ToolingModel, list[str]]:
+    axes_model = ExternalAxesModel()
+    rail = ExternalAxis.make_linear_rail()
+    rail.base_pose_in_parent = Pose6(100.0, -50.0, 0.0, 10.0, 0.0, 0.0)
+    turntable = ExternalAxis.make_rotary_1axis()
+    turntable.base_pose_in_parent = Pose6(1500.0, 0.0, 300.0, 0.0, 0.0, 0.0)
+    tilt = ExternalAxis.make_rotary_2axis()
+    tilt.mount_parent_id = turntable.id
+    tilt.axis_frame_in_base = Pose6(0.0, 0.0, 120.0, 0.0, 15.0, 0.0)
+    # Enfant déclaré avant son parent : l'ordre de montage doit être résolu.
+    for axis in (rail, tilt, turntable):
+        axes_model.add_axis(axis)
+    axes_model.set_robot_mount_parent_id(rail.id)
+
+    workspace = WorkspaceModel()
+    workpiece = WorkpieceModel()
+    workpiece.set_pose_in_parent(Pose6(10.0, 20.0, 30.0, 0.0, 0.0, 90.0))
+    workpiece.set_workpiece_frame_pose(Pose6(5.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+    tooling = ToolingModel()
+    tooling.set_parent_frame_id(f"ext:{tilt.id}")
+    tooling.add_element(ToolingElement(pose_in_prev=Pose6(0.0, 0.0, 50.0, 0.0, 0.0, 45.0)))
+    return axes_model, workspace, workpiece, tooling, [rail.id, tilt.id, turntable.id]
+
+
+class ExternalAxesChainPlanTest(unittest.TestCase):
+    def test_batch_transforms_match_per_state_chain_evaluation(self):
+        axes_model, workspace, workpiece, tooling, (rail_id, tilt_id, _turntable_id) = _build_cell()
+        plan = ExternalAxesChainPlan(axes_model, workspace, workpiece, tooling)
+        rng = np.random.default_rng(3)
+        values = rng.uniform(-90.0, 90.0, size=(25, len(plan.value_keys)))
+        workspace_base = np.array(workspace.get_robot_base_transform_world().matrix, dtype=float)
+
+        for parent_id in (f"ext:{tilt_id}", WorkpieceModel.FRAME_ROBOT, WorkpieceModel.FRAME_TOOLING):
+            workpiece.set_parent_frame_id(parent_id)
+            plan = ExternalAxesChainPlan(axes_model, workspace, workpiece, tooling)
+            ends = plan.world_end_transforms(values)
+            robot_bases = plan.robot_base_world(values)
+            pieces = plan.piece_frame_world(values)
+            for row in range(len(values)):
+                state = dict(zip(plan.value_keys, values[row]))
+                expected = axes_model.compute_world_transforms_for(state)
+                for axis_id, entry in expected.items():
+                    np.testing.assert_allclose(ends[axis_id][row], entry["end"], atol=1e-9)
+                np.testing.assert_allclose(robot_bases[row], expected[rail_id]["end"], atol=1e-9)
+                tooling_matrix = tooling_frame_world(
+                    tooling.get_parent_frame_id(), tooling.get_elements(), expected, robot_bases[row]
+                )
+                expected_piece = piece_frame_world(
+                    parent_id,
+                    expected,
+                    workpiece.get_pose_in_parent(),
+                    workpiece.get_workpiece_frame_pose(),
+                    workspace_base,
+                    expected[rail_id]["end"],
+                    tooling_matrix,
+                )
+                np.testing.assert_allclose(pieces[row], expected_piece, atol=1e-9)
+
+    def test_missing_values_fall_back_to_live_joints_and_world_mount(self):
+        axes_model, workspace, _workpiece, _tooling, (rail_id, _tilt_id, turntable_id) = _build_cell()
+        axes_model.set_axis_joint_value(rail_id, 0, 750.0)
+        plan = ExternalAxesChainPlan(axes_model, workspace)
+
+        np.testing.assert_allclose(
+            plan.robot_base_world(np.zeros((1, 0)))[0],
+            axes_model.get_robot_world_base_matrix(),
+            atol=1e-9,
+        )
+        self.assertEqual(plan.values_from_dict({})[plan.value_keys.index((rail_id, 0))], 750.0)
+
+        axes_model.set_robot_mount_parent_id(None)
+        static = ExternalAxesChainPlan(axes_model, workspace).robot_base_world(np.zeros((3, 4)))
+        self.assertEqual(static.shape, (3, 4, 4))
+        np.testing.assert_allclose(static[2], workspace.get_robot_base_transform_world().matrix, atol=1e-12)
+        unknown = ExternalAxesChainPlan(axes_model, workspace).axis_end_world(np.zeros((2, 4)), "missing")
+        np.testing.assert_allclose(unknown, np.broadcast_to(np.eye(4), (2, 4, 4)))
+        self.assertIn(turntable_id, ExternalAxesChainPlan(axes_model).world_end_transforms(np.zeros((1, 4))))
+
+
+if __name__ == "__main__":
+    unittest.main()
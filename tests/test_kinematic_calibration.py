@@ -0,0 +1,194 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+import utils.math_utils as math_utils
+from utils.kinematic_calibration import (
+    PARAMETER_NAMES,
+    KinematicCalibrator,
+    correction_pose_from_transform,
+    forward_kinematics_batch,
+    load_calibration_poses,
+    pack_parameters,
+)
+from models.types import Pose6
+
+
+NOMINAL_DH = [
+    [0.0, 0.0, 0.0, 400.0],
+    [-90.0, 25.0, 0.0, 0.0],
+    [0.0, 560.0, -90.0, 0.0],
+    [-90.0, 35.0, 0.0, 515.0],
+    [90.0, 0.0, 0.0, 0.0],
+    [-90.0, 0.0, 180.0, 80.0],
+]
+AXIS_REVERSED = [-1, 1, 1, -1, 1, -1]
+BASE_POSE = [1500.0, -200.0, 30.0, 0.5, -0.3, 25.0]
+TOOL_POSE = [10.0, -5.0, 120.0, 0.0, 0.0, 0.0]
+
+
+def _pose_transform(pose: list[float]) -> np.ndarray:
+    transform = np.eye(4)
+    transform[:3, :3] = math_utils.rot_z(pose[5]) @ math_utils.rot_y(pose[4]) @ math_utils.rot_x(pose[3])
+    transform[:3, 3] = pose[:3]
+    return transform
+
+
+def _random_joints(count: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    low = np.array([-170.0, -120.0, -100.0, -180.0, -110.0, -180.0])
+    high = np.array([170.0, 20.0, 140.0, 180.0, 110.0, 180.0])
+    return rng.uniform(low, high, size=(count, 6))
+
+
+def _true_parameters() -> np.ndarray:
+    dh = np.array(NOMINAL_DH, dtype=float)
+    dh[1, 1] += 0.8
+    dh[2, 1] -= 0.6
+    dh[3, 3] += 0.4
+    dh[2, 2] += 0.05
+    dh[4, 0] += 0.03
+    return pack_parameters(dh.tolist(), base_pose=BASE_POSE, tool_pose=TOOL_POSE)
+
+
+class KinematicCalibrationTest(unittest.TestCase):
+    def test_batch_fk_matches_dh_and_correction_chain(self):
+        corrections = [[0.2, -0.1, 0.3, 1.0, -2.0, 3.0]] * 6
+        params = pack_parameters(NOMINAL_DH, corrections, BASE_POSE, TOOL_POSE)
+        joints = _random_joints(4)
+
+        transforms = forward_kinematics_batch(params, joints, AXIS_REVERSED)
+
+        for pose_index, q in enumerate(joints):
+            T = _pose_transform(BASE_POSE)
+            for i in range(6):
+                alpha, d, theta, r = NOMINAL_DH[i]
+                theta_rad = np.radians(theta + q[i] * AXIS_REVERSED[i])
+                T = T @ math_utils.dh_modified(np.radians(alpha), d, theta_rad, r)
+                T = math_utils.correction_6d(T, *corrections[i])
+            T = T @ _pose_transform(TOOL_POSE)
+            np.testing.assert_allclose(transforms[pose_index], T, atol=1e-9)
+
+    def test_analytic_jacobian_matches_finite_differences(self):
+        params = _true_parameters()
+        joints = _random_joints(3)
+        calibrator = KinematicCalibrator(joints, np.zeros((3, 4, 4)) + np.eye(4), AXIS_REVERSED)
+
+        jac, _ = calibrator.jacobian(params)
+
+        step = 1e-6
+        base_T = forward_kinematics_batch(params, joints, AXIS_REVERSED)
+        for index in range(len(PARAMETER_NAMES)):
+            shifted = params.copy()
+            shifted[index] += step
+            T = forward_kinematics_batch(shifted, joints, AXIS_REVERSED)
+            numeric = (T[:, :3, 3] - base_T[:, :3, 3]) / step
+            np.testing.assert_allclose(jac[:, :3, index], numeric, atol=1e-4, err_msg=PARAMETER_NAMES[index])
+
+    def test_recovers_tcp_model_from_noisy_position_measurements(self):
+        joints = _random_joints(500)
+        true_params = _true_parameters()
+        rng = np.random.default_rng(7)
+        measured = forward_kinematics_batch(true_params, joints, AXIS_REVERSED)[:, :3, 3]
+        measured = measured + rng.normal(scale=0.02, size=measured.shape)
+        initial = pack_parameters(NOMINAL_DH, base_pose=[1490.0, -190.0, 20.0, 0.0, 0.0, 24.0], tool_pose=TOOL_POSE)
+
+        calibrator = KinematicCalibrator(joints, measured, AXIS_REVERSED)
+        start = time.perf_counter()
+        result = calibrator.solve(initial)
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(result.converged)
+        self.assertGreater(result.initial_rms_mm, 10.0)
+        self.assertLess(result.rms_mm, 0.05)
+        self.assertIn("a1.r", result.unidentifiable_parameters)
+        self.assertIn("a3.d", result.identified_parameters)
+        self.assertLess(elapsed, 10.0)
+        self.assertFalse(result.stalled)
+
+        check_joints = _random_joints(50, seed=11)
+        fitted_tcp = forward_kinematics_batch(result.parameters, check_joints, AXIS_REVERSED)[:, :3, 3]
+        true_tcp = forward_kinematics_batch(true_params, check_joints, AXIS_REVERSED)[:, :3, 3]
+        self.assertLess(float(np.max(np.linalg.norm(fitted_tcp - true_tcp, axis=1))), 0.05)
+
+    def test_stalled_fit_is_not_reported_as_converged(self):
+        joints = _random_joints(20)
+        measured = forward_kinematics_batch(_true_parameters(), joints, AXIS_REVERSED)[:, :3, 3]
+        initial = pack_parameters(NOMINAL_DH, base_pose=BASE_POSE, tool_pose=TOOL_POSE)
+
+        class _NoDescentCalibrator(KinematicCalibrator):
+            # Tout pas hors du point de départ augmente le coût : aucun pas amorti n'est accepté.
+            def residuals(self, params):
+                position, orientation = super().residuals(params)
+                if not np.array_equal(params, initial):
+                    position = position + 1000.0
+                return position, orientation
+
+        result = _NoDescentCalibrator(joints, measured, AXIS_REVERSED).solve(initial)
+
+        self.assertTrue(result.stalled)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 1)
+
+    def test_huber_weighting_flags_outlier_pose(self):
+        joints = _random_joints(200)
+        true_params = _true_parameters()
+        measured = forward_kinematics_batch(true_params, joints, AXIS_REVERSED)[:, :3, 3]
+        measured[17] += [25.0, 0.0, 0.0]
+
+        result = KinematicCalibrator(joints, measured, AXIS_REVERSED).solve(
+            pack_parameters(NOMINAL_DH, base_pose=BASE_POSE, tool_pose=TOOL_POSE),
+            huber_threshold_mm=1.0,
+        )
+
+        self.assertEqual(result.outlier_indices, [17])
+        inliers = np.delete(result.position_residuals_mm, 17)
+        self.assertLess(float(np.max(inliers)), 0.5)
+
+    def test_correction_pose_round_trip(self):
+        pose = [12.0, -3.0, 50.0, 10.0, -20.0, 30.0]
+        np.testing.assert_allclose(correction_pose_from_transform(_pose_transform(pose)), pose, atol=1e-9)
+
+    def test_identified_frames_use_project_pose_convention(self):
+        joints = _random_joints(120)
+        measured = forward_kinematics_batch(_true_parameters(), joints, AXIS_REVERSED)[:, :3, 3]
+
+        result = KinematicCalibrator(joints, measured, AXIS_REVERSED).solve(
+            pack_parameters(NOMINAL_DH, base_pose=BASE_POSE, tool_pose=[0.0, 0.0, 100.0, 0.0, 0.0, 0.0])
+        )
+
+        self.assertEqual(result.groups, ("base", "dh", "tool"))
+        np.testing.assert_allclose(
+            math_utils.pose_zyx_to_matrix(Pose6(*result.base_pose_abc)), _pose_transform(result.base_pose), atol=1e-9
+        )
+        self.assertLess(result.rms_mm, 1e-6)
+        self.assertEqual(result.tool_pose_abc[:3], result.tool_pose[:3])
+
+    def test_pose_file_loads_positions_or_frames(self):
+        joints = _random_joints(3)
+        frames = forward_kinematics_batch(_true_parameters(), joints, AXIS_REVERSED)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            positions_path = os.path.join(temp_dir, "positions.csv")
+            with open(positions_path, "w", encoding="utf-8") as file:
+                file.write("A1;A2;A3;A4;A5;A6;X;Y;Z\n")
+                for q, frame in zip(joints, frames):
+                    file.write(";".join(f"{value:.12f}" for value in [*q, *frame[:3, 3]]) + "\n")
+            frames_path = os.path.join(temp_dir, "frames.csv")
+            with open(frames_path, "w", encoding="utf-8") as file:
+                for q, frame in zip(joints, frames):
+                    pose = math_utils.matrix_to_pose_zyx(frame)
+                    file.write(",".join(f"{value:.12f}" for value in [*q, *pose.to_list()]) + "\n")
+
+            loaded_joints, positions = load_calibration_poses(positions_path)
+            _joints, loaded_frames = load_calibration_poses(frames_path)
+
+        np.testing.assert_allclose(loaded_joints, joints, atol=1e-9)
+        np.testing.assert_allclose(positions, frames[:, :3, 3], atol=1e-9)
+        np.testing.assert_allclose(loaded_frames, frames, atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from utils.kinematics_snapshot import (
+    MGI_CONFIG_KEY_NAMES,
+    compare_snapshot_record,
+    compute_snapshot_record,
+    extend_kinematics_snapshot,
+    load_kinematics_snapshot,
+    load_snapshot_robot,
+    record_kinematics_snapshot,
+    replay_kinematics_snapshot,
+    snapshot_config_path,
+    write_kinematics_snapshot,
+)
+
+
+class KinematicsSnapshotTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.snapshot = load_kinematics_snapshot()
+        cls.config_path = snapshot_config_path(cls.snapshot)
+
+    def test_every_recorded_case_replays_within_tolerance(self):
+        results = replay_kinematics_snapshot(self.snapshot, self.config_path)
+
+        self.assertEqual(len(results), self.snapshot["meta"]["count"] + 4)
+        failures = {index: comparison.mismatches for index, comparison in results if comparison.mismatches}
+        self.assertEqual(failures, {})
+        self.assertLess(max(comparison.fk_error for _index, comparison in results), 1e-9)
+
+    def test_snapshot_covers_every_configuration_key(self):
+        valid_keys = set()
+        expanded_keys = set()
+        for record in self.snapshot["records"]:
+            self.assertEqual(sorted(record["ik_configurations"]), sorted(MGI_CONFIG_KEY_NAMES))
+            self.assertEqual(len(record["ik_solution_configs"]), len(record["ik_solutions"]))
+            valid_keys.update(key for key, entry in record["ik_configurations"].items() if entry["status"] == "VALID")
+            expanded_keys.update(record["ik_solution_configs"])
+        self.assertEqual(valid_keys, set(MGI_CONFIG_KEY_NAMES))
+        self.assertEqual(expanded_keys, set(MGI_CONFIG_KEY_NAMES))
+
+    def test_deviations_are_reported(self):
+        robot_model = load_snapshot_robot(self.config_path)
+        recorded = self.snapshot["records"][1]
+        replayed = compute_snapshot_record(robot_model, recorded["joints"])
+        replayed["dh_matrix"][3] += 1e-6
+        replayed["ik_solutions"][0][2] += 1e-3
+        key = next(key for key, entry in recorded["ik_configurations"].items() if "joints" in entry)
+        replayed["ik_configurations"][key]["joints"][0] += 360.0
+
+        mismatches = compare_snapshot_record(recorded, replayed).mismatches
+
+        self.assertEqual([item.split(":")[0] for item in mismatches], ["dh_matrix", "ik_solutions"])
+
+    def test_recording_reproduces_the_stored_snapshot(self):
+        snapshot = record_kinematics_snapshot(self.config_path, count=6, seed=self.snapshot["meta"]["seed"])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "snapshot.json")
+            write_kinematics_snapshot(path, snapshot)
+            reloaded = load_kinematics_snapshot(path)
+
+        self.assertEqual(reloaded["meta"]["config"], self.snapshot["meta"]["config"])
+        self.assertEqual(len(reloaded["records"]), 10)
+        for recorded, regenerated in zip(self.snapshot["records"], reloaded["records"]):
+            self.assertEqual(regenerated["joints"], recorded["joints"])
+            self.assertEqual(compare_snapshot_record(recorded, regenerated).mismatches, [])
+
+    def test_extending_keeps_the_recorded_values(self):
+        recorded = [dict(record) for record in self.snapshot["records"][:3]]
+        recorded[1]["dh_matrix"] = list(recorded[1]["dh_matrix"])
+        recorded[1]["dh_matrix"][3] += 1e-12
+        for record in recorded:
+            del record["ik_configurations"]
+            del record["ik_solution_configs"]
+
+        extended = extend_kinematics_snapshot({"meta": self.snapshot["meta"], "records": recorded}, self.config_path)
+
+        for original, record in zip(recorded, extended["records"]):
+            self.assertEqual({name: record[name] for name in original}, original)
+        for stored, record in zip(self.snapshot["records"], extended["records"]):
+            self.assertEqual(record["ik_configurations"], stored["ik_configurations"])
+            self.assertEqual(record["ik_solution_configs"], stored["ik_solution_configs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from models.program_generation_settings import ProgramGenerationSettings
+from models.robot_program import (
+    MotionRole,
+    ProgramOrigin,
+    RobotProgram,
+    RobotProgramBrand,
+    RobotProgramMotion,
+    RobotProgramMotionMode,
+    RobotProgramTarget,
+    RobotProgramTargetType,
+)
+from models.types import JointAngles6, Pose6
+from utils.robot_program_kuka import KrlSplitLimits, generate_kuka_src_text, generate_program_to_path, write_kuka_src_program
+
+
+HEADER = "&ACCESS RVP\nDEF {PROGRAM_NAME} ( )\nBAS (#INITMOV,0)\n; Points : {N_MOTIONS}"
+
+
+def _program(path: Path, count: int) -> RobotProgram:
+    home = RobotProgramMotion(
+        mode=RobotProgramMotionMode.PTP,
+        target=RobotProgramTarget(RobotProgramTargetType.JOINT, joint_angles=JointAngles6(0.0, -90.0, 90.0, 0.0, 45.0, 0.0)),
+        line_number=0,
+        source="",
+        role=MotionRole.HOME_START,
+    )
+    motions = [home] + [
+        RobotProgramMotion(
+            mode=RobotProgramMotionMode.LINEAR,
+            target=RobotProgramTarget(RobotProgramTargetType.CARTESIAN, cartesian_pose=Pose6(800.0 + i, 0.0, 500.0, 0.0, 90.0, 0.0)),
+            line_number=i + 1,
+            source="",
+        )
+        for i in range(count)
+    ]
+    return RobotProgram(
+        brand=RobotProgramBrand.KUKA,
+        source_path=str(path),
+        source_text="",
+        motions=motions,
+        origin=ProgramOrigin.IMPORTED_APT,
+    )
+
+
+def _motion_lines(text: str) -> list[str]:
+    return [line for line in text.splitlines() if line.startswith(("LIN ", "PTP "))]
+
+
+class KrlChunkedExportTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_unbounded_export_streams_the_same_text(self):
+        path = self.directory / "CELL.src"
+        program = _program(path, 50)
+        settings = ProgramGenerationSettings(header_text=HEADER)
+
+        written = generate_program_to_path(path, program, settings)
+
+        self.assertEqual(written, [path])
+        self.assertEqual(path.read_text(encoding="utf-8"), generate_kuka_src_text(program, HEADER, settings))
+
+    def test_split_by_motion_count_and_size(self):
+        path = self.directory / "CELL.src"
+        program = _program(path, 1000)
+        settings = ProgramGenerationSettings(header_text=HEADER)
+        reference = _motion_lines(generate_kuka_src_text(program, HEADER, settings))
+
+        written = write_kuka_src_program(path, program, HEADER, settings, limits=KrlSplitLimits(max_motions=300))
+
+        self.assertEqual([p.name for p in written], ["CELL.src", "CELL_001.src", "CELL_002.src", "CELL_003.src", "CELL_004.src"])
+        main = written[0].read_text(encoding="utf-8")
+        self.assertEqual(_motion_lines(main), [])
+        self.assertIn("CELL_001()\nCELL_002()\nCELL_003()\nCELL_004()", main)
+        parts = [p.read_text(encoding="utf-8") for p in written[1:]]
+        self.assertIn("DEF CELL_002 ( )", parts[1])
+        self.assertIn("; Points : 300", parts[1])
+        self.assertTrue(all("$TOOL = " in part and part.endswith("END\n") for part in parts))
+        self.assertEqual(sum((_motion_lines(part) for part in parts), []), reference)
+
+        max_bytes = 8 * 1024
+        for stale in written:
+            stale.unlink()
+        written = write_kuka_src_program(path, program, HEADER, settings, limits=KrlSplitLimits(max_bytes=max_bytes))
+        self.assertGreater(len(written), 3)
+        self.assertTrue(all(p.stat().st_size <= max_bytes for p in written[1:]))
+        parts = [p.read_text(encoding="utf-8") for p in written[1:]]
+        self.assertEqual(sum((_motion_lines(part) for part in parts), []), reference)
+
+        restored = ProgramGenerationSettings.from_dict(ProgramGenerationSettings(split_max_bytes=max_bytes).to_dict())
+        self.assertEqual(KrlSplitLimits.from_settings(restored), KrlSplitLimits(max_bytes=max_bytes))
+
+    def test_reexport_with_fewer_parts_removes_stale_parts(self):
+        path = self.directory / "CELL.src"
+        program = _program(path, 1000)
+        settings = ProgramGenerationSettings(header_text=HEADER)
+        other = self.directory / "OTHER_001.src"
+        other.write_text("DEF OTHER_001 ( )\nEND\n", encoding="utf-8")
+        handwritten = self.directory / "CELL_009.src"
+        handwritten.write_text("DEF CELL_009 ( )\nEND\n", encoding="utf-8")
+
+        write_kuka_src_program(path, program, HEADER, settings, limits=KrlSplitLimits(max_motions=300))
+        written = write_kuka_src_program(path, program, HEADER, settings, limits=KrlSplitLimits(max_motions=600))
+
+        self.assertEqual([p.name for p in written], ["CELL.src", "CELL_001.src", "CELL_002.src"])
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()), ["CELL.src", "CELL_001.src", "CELL_002.src", "CELL_009.src", "OTHER_001.src"])
+
+        written = generate_program_to_path(path, program, settings)
+        self.assertEqual(written, [path])
+        self.assertEqual(sorted(p.name for p in self.directory.iterdir()), ["CELL.src", "CELL_009.src", "OTHER_001.src"])
+
+
+if __name__ == "__main__":
+    unittest.main()
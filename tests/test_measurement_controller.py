@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+
+from controllers.calibration_view import measurement_controller as measurement_module
+from controllers.calibration_view.measurement_controller import MeasurementController
+from controllers.main_controller import MainController
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from utils.kinematic_calibration import correction_pose_from_transform, forward_kinematics_batch, pack_parameters
+from widgets.calibration_view.measurement_widget import MeasurementWidget
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+HEADER = "// Col::Object,T c0,T c1,T c2,T c3,[Timestamp]\n"
+
+
+def _frame_lines(label: str, transform: np.ndarray) -> list[str]:
+    lines = [label + "," + ",".join(f"{value:.6f}" for value in transform[0]) + ",0.001\n"]
+    lines.extend("," + ",".join(f"{value:.6f}" for value in row) + "\n" for row in transform[1:])
+    return lines
+
+
+class MeasurementControllerIdentificationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.robot_model = RobotModel()
+        with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+            self.robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+        self.tool_model = ToolModel()
+        self.controller = MeasurementController(self.robot_model, self.tool_model, MeasurementWidget())
+        for name in ("show_warning_popup", "show_error_popup"):
+            patcher = mock.patch.object(measurement_module, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _import_measurements(self) -> None:
+        path = os.path.join(self._tmp.name, "frames.csv")
+        lines = [HEADER]
+        for name in ("World_Frame", "Geo robot::R1", "Geo robot::R2"):
+            lines.extend(_frame_lines(name, np.eye(4)))
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+        with mock.patch.object(measurement_module.QFileDialog, "getOpenFileName", return_value=(path, "")):
+            self.controller._on_view_import_measurements_requested()
+
+    def _identify(self) -> None:
+        joints = np.random.default_rng(5).uniform(-60.0, 60.0, size=(30, 6))
+        tool_pose = correction_pose_from_transform(self.robot_model.get_T_tool(self.tool_model.get_tool()))
+        params = pack_parameters(self.robot_model.get_dh_params(), self.robot_model.get_corrections(), tool_pose=tool_pose)
+        measured = forward_kinematics_batch(params, joints, self.robot_model.get_axis_reversed())[:, :3, 3]
+        self.controller.identify_from_poses(joints, measured)
+
+    def _apply(self) -> mock.MagicMock:
+        main = mock.MagicMock()
+        main.calibration_controller.measurement_controller = self.controller
+        with mock.patch("controllers.main_controller.QMessageBox"):
+            MainController._on_apply_measured_dh_requested(main)
+        return main
+
+    def test_reimport_discards_previous_identification(self):
+        self._import_measurements()
+        self._identify()
+        self.assertIsNotNone(self.controller.get_identification_result())
+        self.assertTrue(self._apply().tool_model.set_tool_pose.called)
+
+        self._import_measurements()
+
+        self.assertIsNone(self.controller.get_identification_result())
+        main = self._apply()
+        main.tool_model.set_tool_pose.assert_not_called()
+        main.robot_model.set_corrections.assert_not_called()
+        main.robot_model.set_measured_dh_params.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
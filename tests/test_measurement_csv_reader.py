@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.measurement_csv_reader import (
+    MeasurementParseReport,
+    iter_frame_blocks,
+    read_xyz_measurements,
+)
+
+
+HEADER = "// Col::Object,T c0,T c1,T c2,T c3,[Timestamp]\n"
+
+
+def _frame_lines(label: str, transform: np.ndarray) -> list[str]:
+    lines = [label + "," + ",".join(f"{value:.6f}" for value in transform[0]) + ",0.001\n"]
+    lines.extend("," + ",".join(f"{value:.6f}" for value in row) + "\n" for row in transform[1:])
+    return lines
+
+
+class MeasurementCsvReaderTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, lines: list[str]) -> str:
+        path = os.path.join(self._tmp.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+        return path
+
+    def test_frames_spanning_blocks_are_rebuilt_and_errors_collected(self):
+        rng = np.random.default_rng(0)
+        transforms = rng.normal(size=(50, 4, 4))
+        lines = [HEADER]
+        for index, transform in enumerate(transforms):
+            lines.extend(_frame_lines(f"Geo robot::R{index % 6 + 1}'", transform))
+        lines[1 + 4 * 10 + 2] = ",abc,1,2,3\n"
+        path = self._write("frames.csv", lines)
+
+        report = MeasurementParseReport()
+        blocks = list(iter_frame_blocks(path, block_rows=7, report=report))
+
+        names = [name for block in blocks for name in block.names]
+        read = np.concatenate([block.transforms for block in blocks])
+        self.assertEqual(len(names), 49)
+        self.assertEqual(names[0], "R1")
+        np.testing.assert_allclose(read[10], transforms[11], atol=1e-6)
+        self.assertEqual(report.error_count, 2)
+        self.assertEqual(sorted(line for line, _ in report.errors), [42, 44])
+
+    def test_frame_decimation_keeps_every_nth_occurrence_per_name(self):
+        lines = [HEADER]
+        for index in range(30):
+            lines.extend(_frame_lines("TCP" if index % 2 else "World", np.eye(4) * (index + 1)))
+        path = self._write("tracking.csv", lines)
+
+        blocks = list(iter_frame_blocks(path, decimate=5))
+
+        names = [name for block in blocks for name in block.names]
+        self.assertEqual(names.count("TCP"), 3)
+        self.assertEqual(names.count("World"), 3)
+        self.assertEqual(float(blocks[0].transforms[1][0, 0]), 2.0)
+
+    def test_xyz_reader_accepts_tabs_and_reports_invalid_lines(self):
+        path = self._write(
+            "axis.txt",
+            ["X\tY\tZ\n", "0.0,18.5,45\n", "\n", "250.1\t18.5\t45\n", "1,2\n", "500.2,18.5,45,extra\n"],
+        )
+
+        points, line_numbers, report = read_xyz_measurements(path)
+
+        np.testing.assert_allclose(points[:, 0], [0.0, 250.1, 500.2])
+        self.assertEqual(line_numbers.tolist(), [2, 4, 6])
+        self.assertEqual([line for line, _ in report.errors], [5])
+        self.assertEqual(report.rows_read, 4)
+
+    def test_xyz_header_row_is_skipped_silently(self):
+        path = self._write("export.csv", ["\n", "X;Y;Z\n", "0.0,18.5,45\n", "250.1,18.5,45\n"])
+
+        points, line_numbers, report = read_xyz_measurements(path, block_rows=1)
+
+        self.assertEqual(line_numbers.tolist(), [3, 4])
+        self.assertFalse(report.has_errors())
+        self.assertEqual(len(points), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from utils.performance_benchmark import (
+    BenchmarkCaseResult,
+    BenchmarkReport,
+    build_synthetic_cell,
+    compare_with_baseline,
+    run_benchmarks,
+    synthetic_joint_samples,
+)
+
+
+def _case(name: str, items_per_s: float) -> BenchmarkCaseResult:
+    return BenchmarkCaseResult(name, "poses", 100, 3, 100 / items_per_s, 100 / items_per_s, items_per_s, 12.0)
+
+
+class PerformanceBenchmarkTest(unittest.TestCase):
+    def test_synthetic_inputs_are_deterministic(self):
+        cell = build_synthetic_cell()
+        first = synthetic_joint_samples(cell, 20)
+        second = synthetic_joint_samples(cell, 20)
+        self.assertEqual(first.tolist(), second.tolist())
+        self.assertTrue(cell.robot_model.get_has_configuration())
+
+    def test_small_run_reports_every_selected_case(self):
+        selected = ["robot_fk", "trajectory_build", "parse_nc"]
+        report = run_benchmarks(scale=0.05, repeat=1, selected=selected)
+
+        self.assertEqual([case.name for case in report.cases], selected)
+        for case in report.cases:
+            self.assertGreater(case.items, 0)
+            self.assertGreater(case.items_per_s, 0.0)
+            self.assertGreaterEqual(case.peak_memory_kib, 0.0)
+        self.assertEqual(report.meta["sizes"]["fk_poses"], 100)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "bench", "report.json")
+            report.save(path)
+            self.assertEqual(BenchmarkReport.load(path).to_dict(), report.to_dict())
+
+        with self.assertRaises(ValueError):
+            run_benchmarks(selected=["unknown"])
+
+    def test_regressions_are_flagged_above_threshold(self):
+        baseline = BenchmarkReport(cases=[_case("robot_fk", 1000.0), _case("parse_nc", 1000.0), _case("removed", 10.0)])
+        current = BenchmarkReport(cases=[_case("robot_fk", 850.0), _case("parse_nc", 700.0), _case("added", 5.0)])
+
+        comparisons = compare_with_baseline(current, baseline, threshold=0.2)
+
+        self.assertEqual([(item.name, item.regression) for item in comparisons], [("robot_fk", False), ("parse_nc", True)])
+        self.assertAlmostEqual(comparisons[1].ratio, 0.7)
+
+
+if __name__ == "__main__":
+    unittest.main()
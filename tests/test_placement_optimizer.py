@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from utils.placement_optimizer import (
+    PLACEMENT_OK,
+    PLACEMENT_REJECTED,
+    PlacementAxisRange,
+    PlacementOptions,
+    PlacementSearchRegion,
+    PlacementSearchSpace,
+    minimal_config_changes,
+    optimize_placement,
+)
+from utils.program_batch_runner import BatchCellPaths
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+
+PROGRAM = """DEF placement()
+$BASE = {X 1000, Y 0, Z 500, A 0, B 0, C 0}
+$TOOL = {X 0, Y 0, Z 200, A 0, B 0, C 0}
+$VEL.CP = 0.5
+PTP {A1 0, A2 -90, A3 90, A4 0, A5 45, A6 0}
+LIN {X 100, Y 0, Z 300, A 0, B 180, C 0}
+LIN {X 300, Y 200, Z 300, A 0, B 180, C 0}
+END
+"""
+
+
+class PlacementOptimizerTest(unittest.TestCase):
+    def test_minimal_config_changes_follows_longest_valid_runs(self):
+        valid = np.zeros((3, 4, 8), dtype=bool)
+        valid[0, :, 2] = True
+        valid[1, :2, 0] = True
+        valid[1, 1:, 5] = True
+        valid[2, :, 0] = True
+        valid[2, 2, 0] = False
+
+        self.assertEqual(minimal_config_changes(valid).tolist(), [0, 1, -1])
+
+    def test_unreachable_placements_are_rejected_and_survivors_ranked(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            program_path = os.path.join(temp_dir, "placement.src")
+            with open(program_path, "w", encoding="utf-8") as file:
+                file.write(PROGRAM)
+
+            candidates = optimize_placement(
+                BatchCellPaths(robot=ROBOT_CONFIG),
+                program_path,
+                PlacementSearchSpace(robot_base=PlacementSearchRegion(x_mm=PlacementAxisRange(-1000.0, 1000.0, 5))),
+                PlacementOptions(simulate_top=2, check_validity=False),
+                workers=1,
+            )
+
+        by_offset = {candidate.base_offset[0]: candidate for candidate in candidates}
+        for offset in (-1000.0, -500.0, 0.0):
+            self.assertEqual(by_offset[offset].status, PLACEMENT_REJECTED)
+            self.assertGreater(by_offset[offset].unreachable_target_count, 0)
+            self.assertIsNone(by_offset[offset].cycle_time_s)
+        for offset in (500.0, 1000.0):
+            self.assertEqual(by_offset[offset].status, PLACEMENT_OK)
+            self.assertEqual(by_offset[offset].target_count, 2)
+            self.assertGreater(by_offset[offset].cycle_time_s, 0.0)
+            self.assertEqual(by_offset[offset].robot_base_pose_world[0], offset)
+
+        self.assertEqual([candidate.status for candidate in candidates[:2]], [PLACEMENT_OK, PLACEMENT_OK])
+        self.assertGreaterEqual(candidates[0].score, candidates[1].score)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from utils.plot_decimation import minmax_decimation_indices, visible_index_range
+
+
+class PlotDecimationTest(unittest.TestCase):
+    def test_envelope_keeps_isolated_peaks_under_point_budget(self) -> None:
+        x = np.linspace(0.0, 100.0, 200_001)
+        y = np.sin(x)
+        y[123_457] = 50.0
+        y[7] = -40.0
+
+        indices = minmax_decimation_indices(y, max_points=2000)
+
+        self.assertLessEqual(len(indices), 2000)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(123_457, indices.tolist())
+        self.assertIn(7, indices.tolist())
+        self.assertEqual((indices[0], indices[-1]), (0, 200_000))
+        self.assertAlmostEqual(float(y[indices].max()), 50.0)
+        self.assertAlmostEqual(float(y[indices].min()), -40.0)
+
+    def test_visible_window_is_decimated_independently(self) -> None:
+        x = np.arange(10_000, dtype=float) * 0.01
+        y = np.zeros_like(x)
+        y[5_000] = np.nan
+        y[5_010] = 3.0
+
+        start, stop = visible_index_range(x, 49.0, 51.0)
+        self.assertEqual((start, stop), (4_899, 5_102))
+        self.assertEqual(minmax_decimation_indices(y, start, stop).tolist(), list(range(start, stop)))
+
+        coarse = minmax_decimation_indices(y, start, stop, max_points=20)
+        self.assertLessEqual(len(coarse), 20)
+        self.assertIn(5_010, coarse.tolist())
+        self.assertTrue(np.all(np.isfinite(y[coarse])))
+        self.assertEqual(visible_index_range(x[:0], 0.0, 1.0), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
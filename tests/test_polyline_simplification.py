@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from utils.polyline_simplification import (
+    point_at_key,
+    simplify_polyline_indices,
+    split_crossing_pairs,
+    tolerance_for_level,
+    tolerance_level,
+)
+
+
+class PolylineSimplificationTest(unittest.TestCase):
+    def test_straight_line_keeps_only_endpoints(self) -> None:
+        points = np.column_stack([np.linspace(0.0, 1000.0, 5001), np.zeros(5001), np.zeros(5001)])
+        indices = simplify_polyline_indices(points, 0.1, anchor_spacing=10_000)
+        self.assertEqual(indices.tolist(), [0, 5000])
+        anchored = simplify_polyline_indices(points, 0.1, anchor_spacing=1000)
+        self.assertEqual(anchored.tolist(), [0, 1000, 2000, 3000, 4000, 5000])
+
+    def test_small_feature_above_tolerance_is_kept(self) -> None:
+        x = np.linspace(0.0, 100.0, 1001)
+        z = np.where(np.abs(x - 50.0) < 0.05, 0.5, 0.0)
+        points = np.column_stack([x, np.zeros_like(x), z])
+        kept = simplify_polyline_indices(points, 0.2)
+        self.assertIn(500, kept.tolist())
+        dropped = simplify_polyline_indices(points, 1.0)
+        self.assertEqual(dropped.tolist(), [0, 1000])
+
+    def test_back_and_forth_on_same_line_is_preserved(self) -> None:
+        points = np.array([[0.0, 0.0, 0.0], [100.0, 0.0, 0.0], [50.0, 0.0, 0.0]])
+        self.assertEqual(simplify_polyline_indices(points, 1.0).tolist(), [0, 1, 2])
+
+    def test_keep_mask_forces_points(self) -> None:
+        points = np.column_stack([np.arange(10.0), np.zeros(10), np.zeros(10)])
+        keep_mask = np.zeros(10, dtype=bool)
+        keep_mask[4] = True
+        self.assertEqual(simplify_polyline_indices(points, 1.0, keep_mask).tolist(), [0, 4, 9])
+
+    def test_split_ends_inside_a_simplified_pair(self) -> None:
+        times = np.arange(200_001) * 0.004
+        points = np.column_stack([times * 100.0, np.zeros_like(times), np.zeros_like(times)])
+        kept = simplify_polyline_indices(points, 1.0)
+        # Le split n'impose aucun sommet : le chemin droit reste réduit à ses ancres
+        self.assertLess(len(kept), 200)
+
+        split = 123.4567
+        pairs = split_crossing_pairs(times[kept[:-1]], times[kept[1:]], split)
+        self.assertEqual(len(pairs), 1)
+        self.assertLessEqual(times[kept[pairs[0]]], split)
+        self.assertGreater(times[kept[pairs[0] + 1]], split)
+        np.testing.assert_allclose(point_at_key(points, times, split), [split * 100.0, 0.0, 0.0])
+        self.assertEqual(len(split_crossing_pairs(np.full(3, np.inf), np.full(3, np.inf), split)), 0)
+
+    def test_tolerance_levels_are_powers_of_two(self) -> None:
+        self.assertEqual(tolerance_level(0.3), -2)
+        self.assertEqual(tolerance_level(0.26), -2)
+        self.assertEqual(tolerance_for_level(tolerance_level(3.9)), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
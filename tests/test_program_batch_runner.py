@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.program_batch_runner import (
+    STATUS_INVALID,
+    STATUS_OK,
+    BatchCellPaths,
+    BatchRunOptions,
+    discover_programs,
+    report_stem,
+    run_batch,
+)
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+
+REACHABLE_PROGRAM = """DEF reachable()
+$BASE = {X 1000, Y 0, Z 500, A 0, B 0, C 0}
+$TOOL = {X 0, Y 0, Z 200, A 0, B 0, C 0}
+$VEL.CP = 0.5
+PTP {A1 0, A2 -90, A3 90, A4 0, A5 45, A6 0}
+LIN {X 100, Y 0, Z 300, A 0, B 180, C 0}
+END
+"""
+
+UNREACHABLE_PROGRAM = REACHABLE_PROGRAM.replace("reachable", "unreachable").replace(
+    "END", "LIN {X 9000, Y 0, Z 300, A 0, B 180, C 0}\nEND"
+)
+
+
+class ProgramBatchRunnerTest(unittest.TestCase):
+    def test_batch_writes_reports_and_flags_unreached_targets(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            programs_dir = os.path.join(temp_dir, "programs")
+            os.makedirs(os.path.join(programs_dir, "lot"))
+            with open(os.path.join(programs_dir, "reachable.src"), "w", encoding="utf-8") as file:
+                file.write(REACHABLE_PROGRAM)
+            with open(os.path.join(programs_dir, "lot", "unreachable.src"), "w", encoding="utf-8") as file:
+                file.write(UNREACHABLE_PROGRAM)
+            with open(os.path.join(programs_dir, "notes.txt"), "w", encoding="utf-8") as file:
+                file.write("pas un programme")
+            output_dir = os.path.join(temp_dir, "reports")
+
+            programs = discover_programs(programs_dir)
+            reports = run_batch(
+                BatchCellPaths(robot=ROBOT_CONFIG),
+                programs,
+                output_dir,
+                BatchRunOptions(check_validity=False),
+                workers=1,
+                programs_root=programs_dir,
+            )
+
+            self.assertEqual([os.path.basename(path) for path in programs], ["unreachable.src", "reachable.src"])
+            self.assertEqual([report.status for report in reports], [STATUS_INVALID, STATUS_OK])
+            self.assertEqual(reports[0].unreached_motion_lines, [7])
+            self.assertGreater(reports[1].cycle_time_s, 0.0)
+
+            stem = report_stem(programs[0], programs_dir)
+            self.assertEqual(stem, "lot__unreachable_src")
+            with open(os.path.join(output_dir, f"{stem}.json"), "r", encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["status"], STATUS_INVALID)
+            self.assertTrue(os.path.exists(os.path.join(output_dir, f"{stem}_samples.csv")))
+            with open(os.path.join(output_dir, "summary.json"), "r", encoding="utf-8") as file:
+                summary = json.load(file)
+            self.assertEqual(summary["status_counts"], {STATUS_OK: 1, STATUS_INVALID: 1, "ERROR": 0})
+
+    def test_missing_program_is_reported_without_stopping_the_batch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            reports = run_batch(
+                BatchCellPaths(robot=ROBOT_CONFIG),
+                [os.path.join(temp_dir, "absent.src")],
+                temp_dir,
+                BatchRunOptions(check_validity=False),
+                workers=1,
+            )
+
+        self.assertEqual(reports[0].status, "ERROR")
+        self.assertIn("FileNotFoundError", reports[0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
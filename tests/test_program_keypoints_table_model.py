@@ -0,0 +1,71 @@
+import unittest
+
+from PyQt6.QtCore import Qt
+
+from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
+from models.types import Pose6
+from widgets.program_view.program_keypoints_table_model import ProgramKeypointsTableModel
+
+
+def _keypoint(x: float) -> TrajectoryKeypoint:
+    return TrajectoryKeypoint(cartesian_target=Pose6(x, 20.0, 30.0, 0.0, 180.0, 0.0), mode=KeypointMotionMode.LINEAR)
+
+
+class ProgramKeypointsTableModelTest(unittest.TestCase):
+    def setUp(self):
+        self.model = ProgramKeypointsTableModel()
+        self.changes: list[tuple[int, int]] = []
+        self.resets = 0
+        self.model.dataChanged.connect(lambda first, last, _roles: self.changes.append((first.row(), last.row())))
+        self.model.modelReset.connect(self._on_reset)
+
+    def _on_reset(self):
+        self.resets += 1
+
+    def test_cells_are_formatted_on_demand(self):
+        keypoints = [_keypoint(float(i)) for i in range(1000)]
+        keypoints[3] = TrajectoryKeypoint(
+            target_type=KeypointTargetType.JOINT,
+            joint_target=[1.0, -90.0, 90.0, 0.0, 45.0, 0.0],
+            mode=KeypointMotionMode.PTP,
+        )
+        self.model.set_external_axis_headers(["Rail J1 (mm)"])
+        self.model.set_keypoints(keypoints)
+        self.model.set_row_metadata(
+            ["HOME_START"] + ["NORMAL"] * 999,
+            ["C_DIS=1.000"] * 1000,
+            ["HOME"] + [None] * 999,
+            [(250.0,)] + [()] * 999,
+        )
+
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (1000, 11))
+        text = lambda row, column: self.model.data(self.model.index(row, column))
+        self.assertEqual([text(0, 0), text(0, 10), text(1, 0), text(1, 1), text(1, 3)], ["HOME", "250.000", "CARTESIAN", "LIN", "1.000"])
+        self.assertEqual([text(3, 0), text(3, 1), text(3, 7), text(3, 9)], ["JOINT", "PTP", "45.000", "C_DIS=1.000"])
+        self.assertIsNotNone(self.model.data(self.model.index(0, 1), Qt.ItemDataRole.ForegroundRole))
+        self.assertIsNone(self.model.data(self.model.index(1, 1), Qt.ItemDataRole.ForegroundRole))
+
+    def test_refresh_signals_only_the_edited_range(self):
+        keypoints = [_keypoint(float(i)) for i in range(500)]
+        self.model.set_keypoints(keypoints)
+        self.assertEqual(self.resets, 1)
+
+        edited = [_keypoint(float(i)) for i in range(500)]
+        edited[120] = _keypoint(-1.0)
+        edited[125] = _keypoint(-2.0)
+        self.model.set_keypoints(edited)
+        self.model.set_keypoints([_keypoint(float(i)) for i in range(500)][:120] + edited[120:])
+        self.assertEqual(self.changes, [(120, 125)])
+        self.assertEqual(self.resets, 1)
+
+        self.model.set_row_metadata(["NORMAL"] * 500, [""] * 500, [None] * 500, [])
+        self.model.set_row_metadata(["NORMAL"] * 500, [""] * 499 + ["C_VEL=50.0"], [None] * 500, [])
+        self.assertEqual(self.changes[-1], (499, 499))
+
+        self.model.set_keypoints(edited[:-1])
+        self.assertEqual(self.resets, 2)
+        self.assertEqual(self.model.rowCount(), 499)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.types import Pose6
+from utils.math_utils import matrix_to_pose_zyx
+from utils.mgi import MgiConfigKey, MgiResultStatus, RobotTool
+from utils.mgi_batch import compute_mgi_batch
+from utils.reachability_map import (
+    ReachabilityGridSpec,
+    ReachabilityKinematics,
+    ReachabilityMap,
+    build_reachability_map,
+    compute_fk_frames_batch,
+    compute_manipulability_batch,
+    load_or_build_reachability_map,
+)
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+TOOL = RobotTool(10.0, -5.0, 150.0, 0.0, 15.0, 5.0)
+
+
+def _load_robot_model() -> RobotModel:
+    robot_model = RobotModel()
+    with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+        robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+    return robot_model
+
+
+def _fk_pose(robot_model: RobotModel, joints: list[float]) -> list[float]:
+    return robot_model.compute_fk_joints(joints, tool=TOOL).dh_pose.to_list()
+
+
+class MgiBatchTest(unittest.TestCase):
+    def test_batch_solver_matches_scalar_mgi(self):
+        robot_model = _load_robot_model()
+        rng = np.random.default_rng(7)
+        joints = rng.uniform(-150.0, 150.0, (60, 6))
+        joints[:, 1] = rng.uniform(-170.0, 30.0, 60)
+        joints[:, 2] = rng.uniform(-100.0, 140.0, 60)
+        joints[0] = [0.0, -90.0, 90.0, 0.0, 0.0, 0.0]  # singularité poignet
+        poses = [_fk_pose(robot_model, list(q)) for q in joints]
+        poses.append([5000.0, 0.0, 0.0, 0.0, 90.0, 0.0])
+
+        batch = compute_mgi_batch(robot_model.mgi_params, np.array(poses), TOOL)
+
+        solver = robot_model.MGI_solver
+        solver.set_tool(TOOL)
+        solver.set_q1ValueIfSingularityQ1(0.0)
+        solver.set_q4ValueIfSingularityQ5(0.0)
+        solver.set_q6ValueIfSingularityQ5(0.0)
+        for index, pose in enumerate(poses):
+            result = solver.compute_mgi(*pose)
+            for key in MgiConfigKey:
+                solution = result.get_solution_raw(key)
+                reachable = solution.status != MgiResultStatus.UNREACHABLE
+                self.assertEqual(batch.reachable[index, key.value], reachable)
+                self.assertEqual(
+                    batch.within_limits[index, key.value],
+                    bool(result.get_solutions_expanded(key, only_valid=True)),
+                )
+                self.assertEqual(batch.j5_singularity[index, key.value], solution.j5Singularity)
+                if reachable:
+                    difference = batch.joints_deg[index, key.value] - np.asarray(solution.joints)
+                    np.testing.assert_allclose((difference + 180.0) % 360.0 - 180.0, 0.0, atol=1e-6)
+        self.assertFalse(batch.reachable[-1].any())
+
+
+class ReachabilityMapTest(unittest.TestCase):
+    def setUp(self):
+        self.robot_model = _load_robot_model()
+        self.kinematics = ReachabilityKinematics.from_robot_model(self.robot_model, TOOL)
+        self.spec = ReachabilityGridSpec(voxel_size_mm=250.0, direction_count=12)
+
+    def test_query_reports_configurations_of_sampled_pose(self):
+        grid_map = build_reachability_map(self.kinematics, self.spec)
+        cell = int(np.argmax(grid_map.reachability_ratio()))
+        orientation = int(np.argmax(grid_map.config_masks[cell] != 0))
+        center = grid_map.cell_centers()[cell]
+        rotation = grid_map.orientations[orientation]
+        pose_matrix = np.eye(4)
+        pose_matrix[:3, :3] = rotation
+        pose_matrix[:3, 3] = center
+        pose = matrix_to_pose_zyx(pose_matrix)
+
+        result = grid_map.query(pose)
+
+        self.assertTrue(result.inside_grid)
+        self.assertTrue(result.is_reachable)
+        self.assertEqual(result.config_mask, int(grid_map.config_masks[cell, orientation]))
+        self.assertGreater(result.manipulability, 0.0)
+        self.assertGreater(result.joint_margin, 0.0)
+        solver_result = self.robot_model.compute_ik_target(pose, tool=TOOL)
+        for key in result.configurations:
+            self.assertTrue(solver_result.get_solutions_expanded(key, only_valid=True))
+        self.assertFalse(grid_map.query(pose, allowed_configs=set()).is_reachable)
+        self.assertFalse(grid_map.query(Pose6(1e5, 0.0, 0.0, 0.0, 0.0, 0.0)).inside_grid)
+
+    def test_map_is_cached_on_disk_by_configuration_hash(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            built = load_or_build_reachability_map(self.kinematics, self.spec, directory=temp_dir)
+            files = os.listdir(temp_dir)
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].startswith(self.kinematics.robot_hash))
+
+            loaded = ReachabilityMap.load(os.path.join(temp_dir, files[0]))
+            np.testing.assert_array_equal(loaded.config_masks, built.config_masks)
+            np.testing.assert_array_equal(loaded.manipulability, built.manipulability)
+            self.assertEqual(loaded.shape, built.shape)
+
+            other_tool = ReachabilityKinematics.from_robot_model(self.robot_model, RobotTool(z=300.0))
+            self.assertNotEqual(other_tool.robot_hash, self.kinematics.robot_hash)
+
+    def test_manipulability_vanishes_at_wrist_singularity(self):
+        joints = np.array([[0.0, -90.0, 90.0, 0.0, 0.0, 0.0], [0.0, -90.0, 90.0, 0.0, 45.0, 0.0]])
+        frames = compute_fk_frames_batch(
+            self.kinematics.dh_rows,
+            self.kinematics.axis_reversed,
+            joints,
+            RobotModel.build_tool_transform(TOOL),
+        )
+        expected_tcp = self.robot_model.compute_fk_joints(list(joints[1]), tool=TOOL).dh_matrices[-1]
+        np.testing.assert_allclose(frames[1, 7], expected_tcp, atol=1e-9)
+
+        manipulability = compute_manipulability_batch(frames, self.kinematics.axis_reversed)
+
+        self.assertLess(manipulability[0], 1e-6)
+        self.assertGreater(manipulability[1], 1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.models.pipeline import TrajectorySegment
+from utils.reachability_map import ReachabilityKinematics
+from utils.singularity_analysis import (
+    SingularityKind,
+    SingularitySeverity,
+    SingularityThresholds,
+    compute_singularity_metrics,
+    find_singularity_intervals,
+)
+from utils.trajectory_status import build_trajectory_singularity_warning_messages
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+
+
+def _load_robot() -> RobotModel:
+    robot_model = RobotModel()
+    with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+        robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+    return robot_model
+
+
+class SingularityAnalysisTest(unittest.TestCase):
+    def test_metrics_identify_wrist_shoulder_and_elbow_singularities(self):
+        kinematics = ReachabilityKinematics.from_robot_model(_load_robot(), ToolModel().get_tool())
+        joints = np.array([
+            [0.0, -90.0, 90.0, 0.0, 45.0, 0.0],   # configuration régulière
+            [0.0, -90.0, 90.0, 0.0, 0.0, 0.0],    # axes 4 et 6 alignés
+            [0.0, -90.0, 0.0, 0.0, 45.0, 0.0],    # centre poignet sur l'axe 1
+            [0.0, 0.0, 4.0, 0.0, 45.0, 0.0],      # bras tendu
+        ])
+
+        metrics = compute_singularity_metrics(kinematics, joints)
+
+        self.assertGreater(metrics.index[0], 0.1)
+        self.assertLess(metrics.index[1], 1e-9)
+        self.assertTrue(np.all(metrics.index[1:] < SingularityThresholds().error_index))
+        self.assertEqual(
+            metrics.kinds()[1:],
+            [SingularityKind.WRIST, SingularityKind.SHOULDER, SingularityKind.ELBOW],
+        )
+
+        times = np.arange(6) * 0.1
+        index = np.array([0.2, 0.02, 0.005, np.nan, 0.025, 0.2])
+        kinds = [SingularityKind.WRIST] * 6
+        intervals = find_singularity_intervals(times, index, kinds)
+        self.assertEqual([interval.severity for interval in intervals], [SingularitySeverity.ERROR, SingularitySeverity.WARNING])
+        self.assertEqual((intervals[0].start_sample_index, intervals[0].end_sample_index), (1, 2))
+        self.assertAlmostEqual(intervals[0].min_time_s, 0.2)
+        self.assertAlmostEqual(intervals[1].min_index, 0.025)
+
+    def test_builder_reports_wrist_pass_on_every_sample(self):
+        robot_model = _load_robot()
+        start = TrajectoryKeypoint(target_type=KeypointTargetType.JOINT, joint_target=[0.0, -90.0, 90.0, 0.0, 30.0, 0.0])
+        end = TrajectoryKeypoint(
+            target_type=KeypointTargetType.JOINT,
+            joint_target=[20.0, -90.0, 90.0, 0.0, -30.0, 0.0],
+            mode=KeypointMotionMode.PTP,
+        )
+        builder = TrajectoryBuilder(robot_model, ToolModel(), WorkspaceModel())
+        result = builder.compute_trajectory([0.0, -90.0, 90.0, 0.0, 30.0, 0.0], [TrajectorySegment(start, end)])
+
+        segment = result.segments[-1]
+        self.assertTrue(all(sample.singularity_index is not None for sample in segment.samples))
+        singular = [interval for interval in segment.singularity_intervals if interval.severity == SingularitySeverity.ERROR]
+        self.assertEqual(len(singular), 1)
+        self.assertEqual(singular[0].kind, SingularityKind.WRIST)
+        crossing = min(segment.samples, key=lambda sample: abs(sample.joints[4]))
+        self.assertAlmostEqual(singular[0].min_time_s, crossing.time, delta=2.0 * builder.sample_dt_s)
+
+        messages = build_trajectory_singularity_warning_messages(result, SingularityThresholds())
+        self.assertEqual(len(messages), 1)
+        self.assertIn("passage singulier poignet", messages[0])
+        self.assertEqual(build_trajectory_singularity_warning_messages(result, SingularityThresholds(0.0, 0.0)), [])
+
+    def test_builder_uses_request_thresholds(self):
+        robot_model = _load_robot()
+        start = TrajectoryKeypoint(target_type=KeypointTargetType.JOINT, joint_target=[0.0, -90.0, 90.0, 0.0, 30.0, 0.0])
+        end = TrajectoryKeypoint(
+            target_type=KeypointTargetType.JOINT,
+            joint_target=[20.0, -90.0, 90.0, 0.0, -30.0, 0.0],
+            mode=KeypointMotionMode.PTP,
+        )
+        builder = TrajectoryBuilder(robot_model, ToolModel(), WorkspaceModel())
+        builder.set_singularity_thresholds(SingularityThresholds(0.0, 0.0))
+        result = builder.compute_trajectory([0.0, -90.0, 90.0, 0.0, 30.0, 0.0], [TrajectorySegment(start, end)])
+
+        self.assertEqual(result.segments[-1].singularity_intervals, [])
+
+    def test_result_types_import_without_qt(self):
+        code = (
+            "import sys\n"
+            "import models.trajectory_result, trajectory_engine.models.pipeline\n"
+            "print(any(name.startswith('PyQt6') for name in sys.modules))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=os.getcwd())
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
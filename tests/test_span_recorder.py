@@ -0,0 +1,131 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from trajectory_engine.core.chunking import build_validation_task_samples
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.core.validity_analyzer import ValidityAnalyzer, build_validity_context_snapshot
+from trajectory_engine.models.pipeline import BuildCancelToken, TrajectorySegment, ValidationTask
+from utils.performance_benchmark import (
+    SYNTHETIC_ROBOT_CONFIGURATION,
+    build_synthetic_cell,
+    run_benchmarks,
+    synthetic_keypoints,
+)
+from utils.span_recorder import SpanRecorder, get_span_recorder
+
+
+class SpanRecorderTest(unittest.TestCase):
+    def test_disabled_recorder_records_nothing(self):
+        recorder = SpanRecorder()
+
+        with recorder.span("build", "trajectory", samples=10) as first:
+            pass
+        recorder.instant("tick")
+        recorder.async_begin("delivery", 1)
+        recorder.async_end("delivery", 1)
+
+        self.assertIs(first, recorder.span("other"))
+        self.assertEqual(recorder.event_count(), 0)
+
+    def test_lazy_args_are_built_only_when_recording(self):
+        recorder = SpanRecorder()
+        calls = []
+
+        def describe():
+            calls.append(True)
+            return {"path": "piece.stl"}
+
+        with recorder.span("decode_stl", "mesh", lazy_args=describe):
+            pass
+        self.assertEqual(calls, [])
+
+        recorder.enable()
+        with recorder.span("decode_stl", "mesh", lazy_args=describe, faces=12):
+            pass
+        self.assertEqual(calls, [True])
+        self.assertEqual(recorder.events()[0]["args"], {"faces": 12, "path": "piece.stl"})
+
+    def test_spans_export_as_chrome_trace(self):
+        recorder = SpanRecorder()
+        recorder.enable()
+        with recorder.span("build", "trajectory", segments=2):
+            with recorder.span("ik", "trajectory"):
+                pass
+        with self.assertRaises(ValueError):
+            with recorder.span("failing"):
+                raise ValueError("échec")
+        recorder.async_begin("delivery", 7, "signal")
+        thread = threading.Thread(target=recorder.async_end, args=("delivery", 7, "signal"), name="worker")
+        thread.start()
+        thread.join()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "traces", "trace.json")
+            recorder.save_chrome_trace(path)
+            with open(path, "r", encoding="utf-8") as file:
+                trace = json.load(file)
+
+        events = trace["traceEvents"]
+        complete = {event["name"]: event for event in events if event["ph"] == "X"}
+        self.assertEqual(set(complete), {"build", "ik", "failing"})
+        self.assertEqual(complete["build"]["args"], {"segments": 2})
+        self.assertEqual(complete["failing"]["args"], {"error": "ValueError"})
+        self.assertLessEqual(complete["build"]["ts"], complete["ik"]["ts"])
+        self.assertGreaterEqual(complete["build"]["dur"], complete["ik"]["dur"])
+        begin, end = [event for event in events if event["ph"] in ("b", "e")]
+        self.assertEqual((begin["id"], end["id"]), ("7", "7"))
+        self.assertNotEqual(begin["tid"], end["tid"])
+        thread_names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+        self.assertIn("worker", thread_names)
+
+    def test_ring_buffer_keeps_latest_events(self):
+        recorder = SpanRecorder()
+        recorder.enable(max_events=3)
+        for index in range(5):
+            recorder.instant(f"event-{index}")
+
+        self.assertEqual([event["name"] for event in recorder.events()], ["event-2", "event-3", "event-4"])
+        recorder.clear()
+        self.assertEqual(recorder.event_count(), 0)
+
+    def test_pipelines_record_their_stages(self):
+        cell = build_synthetic_cell()
+        keypoints = synthetic_keypoints(4)
+        segments = [TrajectorySegment(keypoints[i], keypoints[i + 1]) for i in range(len(keypoints) - 1)]
+        recorder = get_span_recorder()
+        recorder.clear()
+        recorder.enable()
+        try:
+            builder = TrajectoryBuilder(cell.robot_model, cell.tool_model, cell.workspace_model)
+            result = builder.compute_trajectory(list(SYNTHETIC_ROBOT_CONFIGURATION["home_position"]), segments)
+            samples = build_validation_task_samples(result)
+            context = build_validity_context_snapshot(cell.robot_model, cell.tool_model, cell.workspace_model)
+            task = ValidationTask(1, 1, samples, context, 0, len(samples))
+            ValidityAnalyzer(context).analyze_task(task, BuildCancelToken())
+            run_benchmarks(scale=0.02, repeat=1, selected=["program_simulation"])
+        finally:
+            recorder.disable()
+        names = {event["name"] for event in recorder.events()}
+        recorder.clear()
+
+        expected = {
+            "compute_trajectory",
+            "segment",
+            "sampling",
+            "ik",
+            "arc_length_lut",
+            "singularities",
+            "validity_task",
+            "collision",
+            "clearance",
+            "nominal_pass",
+            "motion",
+        }
+        self.assertEqual(expected - names, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.trajectory_keypoint import KeypointMotionMode, TrajectoryKeypoint
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.dynamics import JointPathDerivatives, axis_limit_ratios, build_time_optimal_profile
+from trajectory_engine.models.pipeline import TrajectoryComputationStatus, TrajectorySegment
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+START_JOINTS = [0.0, -90.0, 90.0, 0.0, 45.0, 0.0]
+SPEED_LIMITS = [300.0, 225.0, 255.0, 381.0, 311.0, 492.0]
+ACCEL_LIMITS = [1340.0, 1060.0, 1130.0, 1690.0, 1420.0, 2104.0]
+JERK_LIMITS = [6000.0, 5000.0, 5000.0, 7500.0, 6500.0, 9000.0]
+
+
+class TimeOptimalProfileTest(unittest.TestCase):
+    def test_profile_follows_the_binding_axis_along_a_curved_joint_path(self):
+        distances = np.linspace(0.0, 400.0, 201)
+        joints = np.zeros((len(distances), 6))
+        joints[:, 0] = 0.05 * distances
+        # A4 accélère au milieu du chemin : le plafond de vitesse y est le plus bas.
+        joints[:, 3] = 60.0 * np.tanh((distances - 200.0) / 40.0)
+
+        profile = build_time_optimal_profile(
+            segment_index=0,
+            distances_mm=distances,
+            joints_deg=joints,
+            target_speed_mm_s=2000.0,
+            entry_speed_mm_s=0.0,
+            exit_speed_mm_s=0.0,
+            speed_limits=SPEED_LIMITS,
+            accel_limits=ACCEL_LIMITS,
+            jerk_limits=JERK_LIMITS,
+        )
+
+        self.assertAlmostEqual(profile.distance, 400.0, places=6)
+        self.assertAlmostEqual(profile.evaluate(0.0).velocity, 0.0)
+        self.assertAlmostEqual(profile.evaluate(profile.duration_s).velocity, 0.0)
+        _, speed, accel, jerk = axis_limit_ratios(
+            profile,
+            JointPathDerivatives.from_samples(distances, joints),
+            np.array(SPEED_LIMITS),
+            np.array(ACCEL_LIMITS),
+            np.array(JERK_LIMITS),
+        )
+        self.assertLessEqual(max(speed.max(), accel.max(), jerk.max()), 1.0 + 1e-6)
+        self.assertGreater(max(speed.max(), accel.max(), jerk.max()), 0.8)
+        middle = profile.evaluate(0.5 * profile.duration_s)
+        self.assertLess(middle.velocity, 381.0 / 1.5 + 1e-6)
+
+    def test_time_optimal_build_is_faster_and_within_axis_limits(self):
+        robot_model = RobotModel()
+        with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+            robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+        tool_model = ToolModel()
+
+        def pose(joints):
+            return robot_model.compute_fk_joints(joints, tool=tool_model.get_tool()).dh_pose.copy()
+
+        start = TrajectoryKeypoint(cartesian_target=pose([0.0, -70.0, 70.0, 0.0, 30.0, 0.0]), mode=KeypointMotionMode.PTP)
+        end = TrajectoryKeypoint(
+            cartesian_target=pose([40.0, -60.0, 80.0, 20.0, 40.0, 10.0]),
+            mode=KeypointMotionMode.LINEAR,
+            linear_speed_mps=1.5,
+        )
+        segments = [TrajectorySegment(start, end)]
+
+        results = {}
+        for enabled in (False, True):
+            builder = TrajectoryBuilder(robot_model, tool_model, WorkspaceModel())
+            builder.set_time_optimal_enabled(enabled)
+            results[enabled] = builder.compute_trajectory(START_JOINTS, segments)
+
+        for result in results.values():
+            self.assertEqual(result.status, TrajectoryComputationStatus.SUCCESS)
+            self.assertFalse(any(sample.dynamic_violations for sample in result.segments[-1].samples))
+        self.assertLess(results[True].segments[-1].duration, 0.85 * results[False].segments[-1].duration)
+        np.testing.assert_allclose(results[True].segments[-1].samples[-1].pose, results[False].segments[-1].samples[-1].pose, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.robot_program import ProgramSimulationResult, ProgramSimulationSample, RobotProgramMotionMode
+from models.tool_model import ToolModel
+from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
+from models.trajectory_result import (
+    TrajectoryClearanceDiagnostic,
+    TrajectoryCollisionDomain,
+    TrajectoryDynamicViolation,
+    TrajectoryDynamicViolationKind,
+    TrajectoryDynamicViolationSeverity,
+)
+from models.types import JointAngles6, Pose6, XYZ3
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.adapters.legacy_converters import to_legacy_trajectory
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.models.pipeline import TrajectorySegment
+from utils.trajectory_result_archive import (
+    PROGRAM_ARCHIVE_KIND,
+    TrajectoryArchiveError,
+    VALIDITY_FLAG_NAMES,
+    load_program_simulation_npz,
+    load_trajectory_result_npz,
+    read_archive_kind,
+    save_program_simulation_npz,
+    save_trajectory_result_npz,
+    trajectory_result_from_program_samples,
+)
+
+
+ROBOT_CONFIG = os.path.join("default_data", "configurations", "rocky_robodk.json")
+
+
+def _load_robot() -> RobotModel:
+    robot_model = RobotModel()
+    with open(ROBOT_CONFIG, "r", encoding="utf-8") as file:
+        robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), ROBOT_CONFIG)
+    return robot_model
+
+
+class TrajectoryResultArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_trajectory_result_round_trip(self):
+        start = TrajectoryKeypoint(target_type=KeypointTargetType.JOINT, joint_target=[0.0, -90.0, 90.0, 0.0, 30.0, 0.0])
+        end = TrajectoryKeypoint(
+            target_type=KeypointTargetType.JOINT,
+            joint_target=[20.0, -90.0, 90.0, 0.0, -30.0, 0.0],
+            mode=KeypointMotionMode.PTP,
+        )
+        builder = TrajectoryBuilder(_load_robot(), ToolModel(), WorkspaceModel())
+        result = to_legacy_trajectory(
+            builder.compute_trajectory([0.0, -90.0, 90.0, 0.0, 30.0, 0.0], [TrajectorySegment(start, end)])
+        )
+        sample = result.segments[-1].samples[5]
+        sample.dynamic_violations.append(
+            TrajectoryDynamicViolation(
+                TrajectoryDynamicViolationKind.JERK, 2, 1200.0, 1000.0, TrajectoryDynamicViolationSeverity.WARNING
+            )
+        )
+        sample.clearance = TrajectoryClearanceDiagnostic(
+            TrajectoryCollisionDomain.WORKSPACE, "robot", "L3", "workspace", "table", 12.5, XYZ3(1.0, 2.0, 3.0), XYZ3(4.0, 5.0, 6.0)
+        )
+
+        path = save_trajectory_result_npz(os.path.join(self._tmp.name, "trajectory"), result)
+        self.assertEqual(path.suffix, ".npz")
+        loaded = load_trajectory_result_npz(path)
+
+        self.assertEqual(len(loaded.segments), len(result.segments))
+        for original_segment, loaded_segment in zip(result.segments, loaded.segments):
+            self.assertEqual(loaded_segment.status, original_segment.status)
+            self.assertEqual(loaded_segment.mode, original_segment.mode)
+            self.assertAlmostEqual(loaded_segment.last_time, original_segment.last_time)
+            self.assertEqual(len(loaded_segment.samples), len(original_segment.samples))
+            self.assertEqual(
+                [(item.kind, item.severity, item.start_sample_index) for item in loaded_segment.singularity_intervals],
+                [(item.kind, item.severity, item.start_sample_index) for item in original_segment.singularity_intervals],
+            )
+        original_samples = [item for segment in result.segments for item in segment.samples]
+        loaded_samples = [item for segment in loaded.segments for item in segment.samples]
+        for name in ("joints", "pose", "articular_velocity", "cartesian_jerk"):
+            np.testing.assert_allclose(
+                [getattr(item, name) for item in loaded_samples], [getattr(item, name) for item in original_samples]
+            )
+        for name in VALIDITY_FLAG_NAMES + ("configuration", "error_code", "singularity_kind", "reachable"):
+            self.assertEqual([getattr(item, name) for item in loaded_samples], [getattr(item, name) for item in original_samples])
+
+        restored = loaded.segments[-1].samples[5]
+        violation = restored.dynamic_violations[-1]
+        self.assertEqual((violation.kind, violation.axis, violation.value), (TrajectoryDynamicViolationKind.JERK, 2, 1200.0))
+        self.assertEqual((restored.clearance.name_b, restored.clearance.distance_mm), ("table", 12.5))
+        self.assertEqual(restored.clearance.point_b_world.to_list(), [4.0, 5.0, 6.0])
+
+    def test_program_simulation_round_trip_and_trajectory_view(self):
+        samples = [
+            ProgramSimulationSample(
+                time_s=0.1 * index,
+                motion_mode=RobotProgramMotionMode.LINEAR if index >= 3 else RobotProgramMotionMode.PTP,
+                source_line=10 if index < 3 else 12,
+                joints_deg=JointAngles6.from_values([index, -90.0, 90.0, 0.0, 30.0, 0.0]),
+                nominal_pose_base=Pose6(100.0 * index, 0.0, 500.0, 0.0, 180.0, 0.0),
+                measured_pose_base=Pose6(100.0 * index, 0.5, 500.0, 0.0, 180.0, 0.0) if index % 2 else None,
+                ext_axis_values=(250.0,) if index else (),
+                nominal_pose_world=Pose6(100.0 * index, 0.0, 900.0, 0.0, 180.0, 0.0),
+            )
+            for index in range(6)
+        ]
+        result = ProgramSimulationResult(nominal_samples=samples, warnings=["ligne 12 : vitesse reduite"])
+
+        path = save_program_simulation_npz(os.path.join(self._tmp.name, "program.npz"), result)
+        self.assertEqual(read_archive_kind(path), PROGRAM_ARCHIVE_KIND)
+        with self.assertRaises(TrajectoryArchiveError):
+            load_trajectory_result_npz(path)
+        with np.load(path) as archive:
+            np.testing.assert_allclose(archive["nominal_tcp_speed_mm_s"][1:], 1000.0)
+
+        loaded = load_program_simulation_npz(path)
+        self.assertEqual(loaded.nominal_samples, samples)
+        self.assertEqual(loaded.cartesian_compensated_samples, [])
+        self.assertEqual(loaded.warnings, result.warnings)
+
+        trajectory = trajectory_result_from_program_samples(loaded.nominal_samples)
+        self.assertEqual([len(segment.samples) for segment in trajectory.segments], [3, 3])
+        self.assertEqual(trajectory.segments[1].mode, KeypointMotionMode.LINEAR)
+        self.assertAlmostEqual(trajectory.segments[1].last_time, 0.5)
+        self.assertEqual(trajectory.segments[1].samples[0].pose, [300.0, 0.0, 500.0, 0.0, 180.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from stl import mesh
+
+from widgets.viewer_mesh_loader import estimate_stl_bounds
+
+
+def _box_mesh(lower: np.ndarray, upper: np.ndarray, triangles: int) -> mesh.Mesh:
+    data = np.zeros(triangles, dtype=mesh.Mesh.dtype)
+    rng = np.random.default_rng(3)
+    data["vectors"] = rng.uniform(lower, upper, size=(triangles, 3, 3))
+    data["vectors"][0, 0] = lower
+    data["vectors"][-1, 2] = upper
+    return mesh.Mesh(data)
+
+
+class EstimateStlBoundsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_binary_bounds_from_a_sample_of_records(self):
+        lower = np.array([-120.0, 10.0, 0.0])
+        upper = np.array([80.0, 250.0, 600.0])
+        path = os.path.join(self._tmp.name, "link.stl")
+        _box_mesh(lower, upper, 50_000).save(path, mode=mesh.stl.Mode.BINARY)
+
+        bounds = estimate_stl_bounds(path, max_triangles=512)
+
+        self.assertIsNotNone(bounds)
+        found_lower, found_upper = bounds
+        np.testing.assert_allclose(found_lower, lower, atol=1e-3)
+        np.testing.assert_allclose(found_upper, upper, atol=1e-3)
+
+    def test_ascii_or_truncated_files_have_no_estimate(self):
+        path = os.path.join(self._tmp.name, "link.stl")
+        _box_mesh(np.zeros(3), np.ones(3), 4).save(path, mode=mesh.stl.Mode.ASCII)
+        self.assertIsNone(estimate_stl_bounds(path))
+
+        truncated = os.path.join(self._tmp.name, "truncated.stl")
+        with open(truncated, "wb") as file:
+            file.write(b"\0" * 40)
+        self.assertIsNone(estimate_stl_bounds(truncated))
+        self.assertIsNone(estimate_stl_bounds(os.path.join(self._tmp.name, "missing.stl")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from utils.kinematics_snapshot import (
+    DEFAULT_CONFIGURATIONS_DIR,
+    DEFAULT_SNAPSHOT_COUNT,
+    DEFAULT_SNAPSHOT_PATH,
+    DEFAULT_SNAPSHOT_SEED,
+    extend_kinematics_snapshot,
+    load_kinematics_snapshot,
+    record_kinematics_snapshot,
+    replay_kinematics_snapshot,
+    snapshot_config_path,
+    write_kinematics_snapshot,
+)
+
+
+def parse_arguments(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Instantané de non-régression MGD / MGI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Enregistre l'instantané d'une configuration robot.")
+    record.add_argument("config", help="Configuration robot JSON.")
+    record.add_argument("--output", default=DEFAULT_SNAPSHOT_PATH, help="Fichier instantané écrit.")
+    record.add_argument("--count", type=int, default=DEFAULT_SNAPSHOT_COUNT, help="Nombre de tirages aléatoires.")
+    record.add_argument("--seed", type=int, default=DEFAULT_SNAPSHOT_SEED, help="Graine des tirages.")
+
+    extend = commands.add_parser(
+        "extend",
+        help="Ajoute les champs manquants d'un instantané sans modifier les valeurs enregistrées.",
+    )
+    extend.add_argument("snapshot", nargs="?", default=DEFAULT_SNAPSHOT_PATH, help="Fichier instantané réécrit.")
+    extend.add_argument("--config", help="Configuration robot JSON (défaut : celle nommée dans l'instantané).")
+    extend.add_argument("--configurations-dir", default=DEFAULT_CONFIGURATIONS_DIR, help="Répertoire des configurations.")
+
+    check = commands.add_parser("check", help="Rejoue un instantané et liste les écarts.")
+    check.add_argument("snapshot", nargs="?", default=DEFAULT_SNAPSHOT_PATH, help="Fichier instantané.")
+    check.add_argument("--config", help="Configuration robot JSON (défaut : celle nommée dans l'instantané).")
+    check.add_argument("--configurations-dir", default=DEFAULT_CONFIGURATIONS_DIR, help="Répertoire des configurations.")
+    check.add_argument("--fk-tolerance", type=float, default=1e-9, help="Écart toléré sur les matrices MGD.")
+    check.add_argument("--ik-tolerance", type=float, default=1e-6, help="Écart toléré sur les articulations MGI (deg).")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Code retour : 0 instantané conforme (ou écrit), 1 écarts hors tolérance."""
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if args.command == "record":
+        snapshot = record_kinematics_snapshot(args.config, args.count, args.seed)
+        write_kinematics_snapshot(args.output, snapshot)
+        print(f"{len(snapshot['records'])} enregistrement(s) écrit(s) : {args.output}")
+        return 0
+
+    snapshot = load_kinematics_snapshot(args.snapshot)
+    config_path = args.config or snapshot_config_path(snapshot, args.configurations_dir)
+    if args.command == "extend":
+        write_kinematics_snapshot(args.snapshot, extend_kinematics_snapshot(snapshot, config_path))
+        print(f"{len(snapshot['records'])} enregistrement(s) complété(s) : {args.snapshot}")
+        return 0
+
+    results = replay_kinematics_snapshot(snapshot, config_path, args.fk_tolerance, args.ik_tolerance)
+    failures = [(index, comparison) for index, comparison in results if comparison.mismatches]
+    for index, comparison in failures:
+        joints = ", ".join(f"{value:.3f}" for value in snapshot["records"][index]["joints"])
+        print(f"[{index}] ({joints}) : {'; '.join(comparison.mismatches)}")
+    fk_error = max((comparison.fk_error for _index, comparison in results), default=0.0)
+    ik_error = max((comparison.ik_error_deg for _index, comparison in results), default=0.0)
+    print(
+        f"{len(results) - len(failures)}/{len(results)} enregistrement(s) conforme(s) "
+        f"(écart MGD max {fk_error:.3e}, écart MGI max {ik_error:.3e}°)."
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
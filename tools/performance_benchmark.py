@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+from utils.performance_benchmark import (
+    BENCHMARK_CASE_NAMES,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_REPEAT,
+    BenchmarkCaseResult,
+    BenchmarkReport,
+    compare_with_baseline,
+    run_benchmarks,
+)
+from utils.span_recorder import get_span_recorder
+
+
+def parse_arguments(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Banc de performance sans interface (cinématique, trajectoire, validité, simulation, parsers).",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=BENCHMARK_CASE_NAMES,
+        help="Cas à exécuter (défaut : tous).",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="Facteur sur le volume de travail de chaque cas.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Répétitions chronométrées par cas.")
+    parser.add_argument("--output", default="user_data/benchmarks/benchmark.json", help="Rapport JSON écrit.")
+    parser.add_argument("--baseline", help="Rapport JSON de référence à comparer.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Baisse de débit tolérée avant de signaler une régression (0.2 = 20 %%).",
+    )
+    parser.add_argument("--trace", help="Trace Chrome/Perfetto JSON des spans par étape, écrite en fin de banc.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Code retour : 0 sans régression, 1 régression(s) par rapport à la référence, 2 référence illisible."""
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = BenchmarkReport.load(args.baseline)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            print(f"Impossible de lire la référence : {exc}", file=sys.stderr)
+            return 2
+
+    def report_progress(case: BenchmarkCaseResult) -> None:
+        print(
+            f"{case.name:<20} {case.items:>7} {case.unit:<8} {case.median_s:>9.4f} s "
+            f"{case.items_per_s:>12.1f} {case.unit}/s  pic {case.peak_memory_kib:>10.1f} Kio",
+            flush=True,
+        )
+
+    if args.trace:
+        get_span_recorder().enable()
+    report = run_benchmarks(scale=args.scale, repeat=args.repeat, selected=args.cases, progress=report_progress)
+    report.save(args.output)
+    print(f"Rapport : {args.output}")
+    if args.trace:
+        get_span_recorder().save_chrome_trace(args.trace)
+        print(f"Trace : {args.trace}")
+
+    if baseline is None:
+        return 0
+    comparisons = compare_with_baseline(report, baseline, args.threshold)
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison.regression else "ok"
+        print(f"{comparison.name:<20} x{comparison.ratio:.2f} {flag}")
+    regressions = [comparison.name for comparison in comparisons if comparison.regression]
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0%} : {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+from utils.placement_optimizer import (
+    PLACEMENT_OK,
+    PlacementAxisRange,
+    PlacementOptions,
+    PlacementSearchRegion,
+    PlacementSearchSpace,
+    optimize_placement,
+)
+from utils.program_batch_runner import BatchCellPaths
+
+
+def parse_range(text: str) -> PlacementAxisRange:
+    """Plage au format min:max:pas (ex. -500:500:5) ou valeur fixe."""
+    parts = text.split(":")
+    if len(parts) == 1:
+        value = float(parts[0])
+        return PlacementAxisRange(value, value, 1)
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"Plage invalide : {text} (attendu min:max:pas)")
+    return PlacementAxisRange(float(parts[0]), float(parts[1]), int(parts[2]))
+
+
+def _region(args: argparse.Namespace, prefix: str) -> PlacementSearchRegion | None:
+    ranges = {axis: getattr(args, f"{prefix}_{axis}") for axis in ("x", "y", "z", "yaw")}
+    if all(value is None for value in ranges.values()):
+        return None
+    fixed = PlacementAxisRange()
+    return PlacementSearchRegion(
+        x_mm=ranges["x"] or fixed,
+        y_mm=ranges["y"] or fixed,
+        z_mm=ranges["z"] or fixed,
+        yaw_deg=ranges["yaw"] or fixed,
+    )
+
+
+def parse_arguments(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recherche du placement de la base robot et/ou de la pièce pour un programme.",
+    )
+    parser.add_argument("program", help="Programme (.src, APT, NC).")
+    parser.add_argument("--project", help="Projet CalibraX JSON décrivant la cellule.")
+    parser.add_argument("--config", help="Configuration robot JSON (remplace celle du projet).")
+    parser.add_argument("--tool", help="Profil tool JSON (remplace celui du projet).")
+    parser.add_argument("--workspace", help="Workspace JSON (remplace celui du projet).")
+    parser.add_argument("--piece", help="Configuration pièce JSON (remplace celle du projet).")
+    parser.add_argument("--external-axes", help="Configuration axes externes JSON (remplace celle du projet).")
+    parser.add_argument("--settings", help="Paramètres de génération programme JSON (HOME, approche, dégagement).")
+    for prefix, label in (("base", "base robot (repère monde)"), ("piece", "pièce (repère parent)")):
+        for axis, unit in (("x", "mm"), ("y", "mm"), ("z", "mm"), ("yaw", "deg")):
+            parser.add_argument(
+                f"--{prefix}-{axis}",
+                type=parse_range,
+                default=None,
+                help=f"Décalage {axis.upper()} de la {label}, min:max:pas ({unit}).",
+            )
+    parser.add_argument("--top", type=int, default=8, help="Nombre de candidats simulés après criblage.")
+    parser.add_argument("--no-validity", action="store_true", help="Ne pas contrôler collisions et zones TCP.")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : CPU - 1).")
+    parser.add_argument("--output", default="user_data/placement/placements.json", help="Classement JSON.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Code retour : 0 placement valide trouvé, 1 aucun placement valide, 2 cellule non chargeable."""
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    try:
+        paths = BatchCellPaths.from_project_file(args.project) if args.project else BatchCellPaths()
+        paths = paths.with_overrides(
+            robot=args.config,
+            tool=args.tool,
+            scene=args.workspace,
+            piece=args.piece,
+            external_axes=args.external_axes,
+        )
+        generation_settings = None
+        if args.settings:
+            with open(args.settings, "r", encoding="utf-8") as file:
+                generation_settings = json.load(file)
+    except (OSError, ValueError, TypeError) as exc:
+        print(f"Impossible de charger la cellule : {exc}", file=sys.stderr)
+        return 2
+    if not paths.robot:
+        print("Une configuration robot est requise (--project ou --config).", file=sys.stderr)
+        return 2
+
+    search = PlacementSearchSpace(robot_base=_region(args, "base"), workpiece=_region(args, "piece"))
+    options = PlacementOptions(
+        simulate_top=args.top,
+        check_validity=not args.no_validity,
+        generation_settings=generation_settings,
+    )
+
+    def report_progress(stage: str, done: int, total: int) -> None:
+        print(f"[{stage}] {done}/{total}", flush=True)
+
+    try:
+        candidates = optimize_placement(paths, args.program, search, options, workers=args.workers, progress=report_progress)
+    except (OSError, ValueError, TypeError) as exc:
+        print(f"Impossible de charger la cellule : {exc}", file=sys.stderr)
+        return 2
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump([candidate.to_dict() for candidate in candidates], file, indent=4, ensure_ascii=False)
+
+    for rank, candidate in enumerate(candidates[: max(1, args.top)], start=1):
+        cycle = "-" if candidate.cycle_time_s is None else f"{candidate.cycle_time_s:.2f}s"
+        print(
+            f"{rank:>3}. {candidate.status:<8} base {candidate.base_offset} pièce {candidate.workpiece_offset} "
+            f"score {candidate.score:.3f} cycle {cycle} changements config {candidate.config_changes}"
+        )
+    valid_count = sum(1 for candidate in candidates if candidate.status == PLACEMENT_OK)
+    print(f"{valid_count}/{len(candidates)} placement(s) valide(s). Classement : {args.output}")
+    return 0 if valid_count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
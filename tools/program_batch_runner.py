@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+from utils.program_batch_runner import (
+    STATUS_OK,
+    BatchCellPaths,
+    BatchRunOptions,
+    ProgramBatchReport,
+    discover_programs,
+    run_batch,
+)
+
+
+def parse_arguments(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Simulation et contrôle de validité d'un lot de programmes robot, sans interface.",
+    )
+    parser.add_argument("programs", help="Répertoire de programmes (.src, APT, NC) ou fichier programme.")
+    parser.add_argument("--project", help="Projet CalibraX JSON décrivant la cellule.")
+    parser.add_argument("--config", help="Configuration robot JSON (remplace celle du projet).")
+    parser.add_argument("--tool", help="Profil tool JSON (remplace celui du projet).")
+    parser.add_argument("--workspace", help="Workspace JSON (remplace celui du projet).")
+    parser.add_argument("--piece", help="Configuration pièce JSON (remplace celle du projet).")
+    parser.add_argument("--external-axes", help="Configuration axes externes JSON (remplace celle du projet).")
+    parser.add_argument("--settings", help="Paramètres de génération programme JSON (HOME, approche, dégagement).")
+    parser.add_argument("--output", default="user_data/batch_reports", help="Répertoire des rapports.")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : CPU - 1).")
+    parser.add_argument("--no-recursive", action="store_true", help="Ne pas parcourir les sous-répertoires.")
+    parser.add_argument("--no-validity", action="store_true", help="Ne pas contrôler collisions et zones TCP.")
+    parser.add_argument("--machining", action="store_true", help="Calculer aussi les efforts d'usinage.")
+    parser.add_argument("--compensation", action="store_true", help="Calculer aussi les programmes compensés.")
+    parser.add_argument("--no-samples", action="store_true", help="Ne pas écrire les CSV d'échantillons.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Code retour : 0 tous valides, 1 programme(s) invalide(s) ou en erreur, 2 cellule non chargeable."""
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    try:
+        paths = BatchCellPaths.from_project_file(args.project) if args.project else BatchCellPaths()
+        paths = paths.with_overrides(
+            robot=args.config,
+            tool=args.tool,
+            scene=args.workspace,
+            piece=args.piece,
+            external_axes=args.external_axes,
+        )
+        generation_settings = None
+        if args.settings:
+            with open(args.settings, "r", encoding="utf-8") as file:
+                generation_settings = json.load(file)
+    except (OSError, ValueError, TypeError) as exc:
+        print(f"Impossible de charger la cellule : {exc}", file=sys.stderr)
+        return 2
+    if not paths.robot:
+        print("Une configuration robot est requise (--project ou --config).", file=sys.stderr)
+        return 2
+
+    if os.path.isfile(args.programs):
+        program_paths = [args.programs]
+        programs_root = None
+    else:
+        program_paths = discover_programs(args.programs, recursive=not args.no_recursive)
+        programs_root = args.programs
+    if not program_paths:
+        print(f"Aucun programme trouvé dans {args.programs}.", file=sys.stderr)
+        return 1
+
+    options = BatchRunOptions(
+        check_validity=not args.no_validity,
+        run_machining=args.machining,
+        include_compensation=args.compensation,
+        write_samples_csv=not args.no_samples,
+        generation_settings=generation_settings,
+    )
+
+    def report_progress(report: ProgramBatchReport, done: int, total: int) -> None:
+        detail = f" ({report.error})" if report.error else ""
+        print(f"[{done}/{total}] {report.status:<7} {report.program}{detail}", flush=True)
+
+    try:
+        reports = run_batch(
+            paths,
+            program_paths,
+            args.output,
+            options=options,
+            workers=args.workers,
+            programs_root=programs_root,
+            progress=report_progress,
+        )
+    except (OSError, ValueError, TypeError) as exc:
+        print(f"Impossible de charger la cellule : {exc}", file=sys.stderr)
+        return 2
+
+    valid_count = sum(1 for report in reports if report.status == STATUS_OK)
+    print(f"{valid_count}/{len(reports)} programme(s) valide(s). Rapports : {args.output}")
+    return 0 if valid_count == len(reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ from models.trajectory_preview import TrajectoryPreviewSegment as LegacyPreviewS
 from models.trajectory_result import (
     JointDynamicStats as LegacyJointDynamicStats,
     SegmentResult as LegacySegmentResult,
+    TrajectoryClearanceDiagnostic as LegacyClearanceDiagnostic,
     TrajectoryCollisionDiagnostic as LegacyCollisionDiagnostic,
     TrajectoryCollisionDomain as LegacyCollisionDomain,
     TrajectoryComputationStatus as LegacyTrajectoryComputationStatus,
@@ -79,6 +80,7 @@ def to_legacy_trajectory(trajectory: TrajectoryResult) -> LegacyTrajectoryResult
         legacy_segment.last_time = float(segment.last_time)
         legacy_segment.first_error_sample_index = segment.first_error_sample_index
         legacy_segment.first_error_axis = segment.first_error_axis
+        legacy_segment.singularity_intervals = list(segment.singularity_intervals)
         legacy_segment.joints_stats = [
             LegacyJointDynamicStats(
                 max_positive_velocity=stats.max_positive_velocity,
@@ -132,6 +134,19 @@ def to_legacy_trajectory(trajectory: TrajectoryResult) -> LegacyTrajectoryResult
                 )
                 for collision in sample.collisions
             ]
+            if sample.clearance is not None:
+                legacy_sample.clearance = LegacyClearanceDiagnostic(
+                    domain=LegacyCollisionDomain[sample.clearance.domain.name],
+                    owner_a=sample.clearance.owner_a,
+                    name_a=sample.clearance.name_a,
+                    owner_b=sample.clearance.owner_b,
+                    name_b=sample.clearance.name_b,
+                    distance_mm=sample.clearance.distance_mm,
+                    point_a_world=sample.clearance.point_a_world,
+                    point_b_world=sample.clearance.point_b_world,
+                )
+            legacy_sample.singularity_index = sample.singularity_index
+            legacy_sample.singularity_kind = sample.singularity_kind
             legacy_sample.error_code = _legacy_error_code(sample.error_code)
             legacy_sample.error_axis = sample.error_axis
             legacy_sample.mgi_solutions = {
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from models.singularity import SingularityThresholds
 from models.types import JointAngles6
 from trajectory_engine.adapters.legacy_converters import to_legacy_preview, to_legacy_trajectory
 from trajectory_engine.managers.trajectory_build_manager import TrajectoryBuildManager
@@ -33,6 +34,9 @@ class TrajectoryControllerBuildBridge(QObject):
         cartesian_accel_limit_mm_s2: float,
         cartesian_jerk_limit_mm_s3: float,
         trigger_mode: TrajectoryBuildTriggerMode,
+        time_optimal_enabled: bool = False,
+        adaptive_sampling_enabled: bool = False,
+        singularity_thresholds: SingularityThresholds | None = None,
     ) -> int:
         request = TrajectoryBuildRequest(
             revision_id=0,
@@ -44,6 +48,9 @@ class TrajectoryControllerBuildBridge(QObject):
             cartesian_accel_limit_mm_s2=float(cartesian_accel_limit_mm_s2),
             cartesian_jerk_limit_mm_s3=float(cartesian_jerk_limit_mm_s3),
             trigger_mode=trigger_mode,
+            time_optimal_enabled=bool(time_optimal_enabled),
+            adaptive_sampling_enabled=bool(adaptive_sampling_enabled),
+            singularity_thresholds=singularity_thresholds if singularity_thresholds is not None else SingularityThresholds(),
         )
         return self._build_manager.submit(request)
 
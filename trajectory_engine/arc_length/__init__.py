@@ -1,3 +1,15 @@
-from trajectory_engine.arc_length.lut import build_arc_length_lut, parameter_at_distance
+from trajectory_engine.arc_length.lut import (
+    DEFAULT_ARC_LENGTH_TOLERANCE_MM,
+    build_adaptive_arc_length_lut,
+    build_arc_length_lut,
+    parameter_at_distance,
+    parameters_at_distances,
+)
 
-__all__ = ["build_arc_length_lut", "parameter_at_distance"]
+__all__ = [
+    "DEFAULT_ARC_LENGTH_TOLERANCE_MM",
+    "build_adaptive_arc_length_lut",
+    "build_arc_length_lut",
+    "parameter_at_distance",
+    "parameters_at_distances",
+]
@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import bisect
 
-from models.types import XYZ3
+import numpy as np
+
 from trajectory_engine.models.pipeline import BuildCancelToken
 from trajectory_engine.geometry import Bezier7Curve3D
 from trajectory_engine.models.trajectory_primitives import ArcLengthLut
 
 
-def _distance(a: XYZ3, b: XYZ3) -> float:
-    dx = a.x - b.x
-    dy = a.y - b.y
-    dz = a.z - b.z
-    return float((dx * dx + dy * dy + dz * dz) ** 0.5)
+DEFAULT_ARC_LENGTH_TOLERANCE_MM = 1e-3
+GAUSS_LEGENDRE_ORDER = 5
+MAX_SUBDIVISION_DEPTH = 24
+# Écart max de l'interpolation linéaire de s(u) ≈ h * (vmax - vmin) / 8 quand la vitesse varie
+# linéairement sur l'intervalle ; marge pour l'écart de vitesse mesuré aux seuls nœuds de Gauss.
+INTERPOLATION_ERROR_FACTOR = 1.0 / 6.0
+_GAUSS_NODES, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(GAUSS_LEGENDRE_ORDER)
 
 
 def _cancelled(cancel_token: BuildCancelToken | None) -> bool:
@@ -24,26 +27,81 @@ def build_arc_length_lut(
     sample_count: int,
     cancel_token: BuildCancelToken | None = None,
 ) -> ArcLengthLut:
+    """Table à pas constant en u : somme des cordes entre `sample_count` + 1 points."""
     count = max(2, int(sample_count))
-    parameters_u = [0.0]
-    distances_mm = [0.0]
-    previous = curve.point(0.0)
-    cumulative = 0.0
+    if _cancelled(cancel_token):
+        return ArcLengthLut(parameters_u=[0.0], distances_mm=[0.0], total_length_mm=0.0)
+    parameters_u = np.arange(count + 1, dtype=float) / count
+    chords = np.linalg.norm(np.diff(curve.points(parameters_u), axis=0), axis=1)
+    distances_mm = np.concatenate(([0.0], np.cumsum(chords)))
+    return ArcLengthLut(
+        parameters_u=parameters_u.tolist(),
+        distances_mm=distances_mm.tolist(),
+        total_length_mm=float(distances_mm[-1]),
+    )
+
+
+def _gauss_lengths(curve: Bezier7Curve3D, u0: np.ndarray, u1: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Longueur de chaque intervalle [u0, u1] par Gauss-Legendre (une évaluation groupée), vitesses min / max aux nœuds."""
+    half = 0.5 * (u1 - u0)
+    nodes = (0.5 * (u0 + u1))[:, None] + half[:, None] * _GAUSS_NODES[None, :]
+    speeds = curve.speeds(nodes.ravel()).reshape(nodes.shape)
+    return half * (speeds @ _GAUSS_WEIGHTS), speeds.min(axis=1), speeds.max(axis=1)
+
+
+def build_adaptive_arc_length_lut(
+    curve: Bezier7Curve3D,
+    tolerance_mm: float = DEFAULT_ARC_LENGTH_TOLERANCE_MM,
+    cancel_token: BuildCancelToken | None = None,
+    max_depth: int = MAX_SUBDIVISION_DEPTH,
+) -> ArcLengthLut:
+    """Table d'abscisse curviligne à subdivision pilotée par l'erreur.
+
+    Chaque intervalle est intégré par Gauss-Legendre en entier puis en deux moitiés ; il est
+    accepté quand l'écart de quadrature reste sous sa part de `tolerance_mm` et que l'écart
+    d'interpolation linéaire (celle de parameter_at_distance), estimé d'après l'écart de
+    vitesse aux nœuds des deux moitiés, reste sous `tolerance_mm`. Un segment à vitesse constante (LIN) tient en un intervalle.
+    Les intervalles sont traités niveau par niveau en un seul appel vectorisé à la courbe.
+    """
+    tolerance = max(1e-9, float(tolerance_mm))
+    accepted_u: list[np.ndarray] = []
+    accepted_lengths: list[np.ndarray] = []
+    u0 = np.array([0.0])
+    u1 = np.array([1.0])
+    whole, _min_speed, _max_speed = _gauss_lengths(curve, u0, u1)
 
-    for index in range(1, count + 1):
+    for depth in range(max(0, int(max_depth)) + 1):
+        if u0.size == 0:
+            break
+        middle = 0.5 * (u0 + u1)
         if _cancelled(cancel_token):
+            accepted_u.append(u0)
+            accepted_lengths.append(whole)
             break
-        u = index / count
-        point = curve.point(u)
-        cumulative += _distance(previous, point)
-        parameters_u.append(float(u))
-        distances_mm.append(float(cumulative))
-        previous = point
+        halves, min_speeds, max_speeds = _gauss_lengths(curve, np.concatenate((u0, middle)), np.concatenate((middle, u1)))
+        left, right = halves[: u0.size], halves[u0.size :]
+        speed_spread = np.maximum(max_speeds[: u0.size], max_speeds[u0.size :]) - np.minimum(min_speeds[: u0.size], min_speeds[u0.size :])
+        quadrature_error = np.abs(left + right - whole)
+        interpolation_error = INTERPOLATION_ERROR_FACTOR * (u1 - u0) * speed_spread
+        done = (quadrature_error <= tolerance * (u1 - u0)) & (interpolation_error <= tolerance)
+        if depth == max_depth:
+            done[:] = True
+        # Longueur retenue : somme des deux moitiés, plus précise que l'intégrale d'un bloc.
+        accepted_u.append(u0[done])
+        accepted_lengths.append(left[done] + right[done])
+        refine = ~done
+        u0, u1 = np.concatenate((u0[refine], middle[refine])), np.concatenate((middle[refine], u1[refine]))
+        whole = np.concatenate((left[refine], right[refine]))
 
+    starts = np.concatenate(accepted_u)
+    order = np.argsort(starts, kind="stable")
+    lengths = np.maximum(np.concatenate(accepted_lengths)[order], 0.0)
+    distances_mm = np.concatenate(([0.0], np.cumsum(lengths)))
+    parameters_u = np.concatenate((starts[order], [1.0]))
     return ArcLengthLut(
-        parameters_u=parameters_u,
-        distances_mm=distances_mm,
-        total_length_mm=float(cumulative),
+        parameters_u=parameters_u.tolist(),
+        distances_mm=distances_mm.tolist(),
+        total_length_mm=float(distances_mm[-1]),
     )
 
 
@@ -74,3 +132,25 @@ def parameter_at_distance(lut: ArcLengthLut, distance_mm: float) -> float:
         return u0
     alpha = (float(distance_mm) - s0) / span
     return u0 + (u1 - u0) * alpha
+
+
+def parameters_at_distances(lut: ArcLengthLut, distances_mm) -> np.ndarray:
+    """Version vectorisée de parameter_at_distance pour un lot d'abscisses."""
+    distances = np.asarray(distances_mm, dtype=float).reshape(-1)
+    if (
+        not lut.parameters_u
+        or len(lut.parameters_u) != len(lut.distances_mm)
+        or lut.total_length_mm <= 1e-9
+    ):
+        return np.zeros_like(distances)
+    table_s = np.asarray(lut.distances_mm, dtype=float)
+    table_u = np.asarray(lut.parameters_u, dtype=float)
+    # Premier point de chaque palier (intervalles de longueur nulle), comme bisect_left.
+    index = np.clip(np.searchsorted(table_s, distances, side="left"), 1, len(table_s) - 1)
+    s0 = table_s[index - 1]
+    span = table_s[index] - s0
+    alpha = np.divide(distances - s0, span, out=np.zeros_like(distances), where=np.abs(span) > 1e-12)
+    parameters = table_u[index - 1] + (table_u[index] - table_u[index - 1]) * alpha
+    parameters[distances <= 0.0] = 0.0
+    parameters[distances >= lut.total_length_mm] = 1.0
+    return parameters
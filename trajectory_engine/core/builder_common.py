@@ -4,22 +4,29 @@ import math
 
 from models.reference_frame import ReferenceFrame
 from models.robot_model import RobotModel
+from models.singularity import SingularityThresholds
 from models.tool_model import ToolModel
 from models.trajectory_keypoint import ConfigurationPolicy, KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
 from models.types import JointAngles6, Pose6, XYZ3
 from models.workspace_model import WorkspaceModel
 from trajectory_engine.models.pipeline import BuildCancelToken, TrajectoryBuilderBehavior, TrajectorySegment
-from trajectory_engine.arc_length import build_arc_length_lut
+from trajectory_engine.arc_length import DEFAULT_ARC_LENGTH_TOLERANCE_MM, build_adaptive_arc_length_lut
 from trajectory_engine.dynamics import build_distance_profile, ptp_duration_s, ptp_jerk_duration_s
 from trajectory_engine.geometry import Bezier7Curve3D
 from trajectory_engine.models.trajectory_primitives import DynamicLimits, RuntimeSegment, SegmentSpeedProfile, TrajectoryPassMode
+from trajectory_engine.sampling import AdaptiveSamplingPolicy
 from utils.mgi import MGI, ConfigurationIdentifier, MgiConfigKey, MgiResult, MgiResultItem
+from utils.reachability_map import ReachabilityKinematics
 from utils.reference_frame_utils import convert_pose_to_base_frame
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 class TrajectoryBuilderCommon:
     DEFAULT_SAMPLE_DT_S = 0.004
-    DEFAULT_ARC_LENGTH_SAMPLES = 300
+    DEFAULT_ARC_LENGTH_TOLERANCE_MM = DEFAULT_ARC_LENGTH_TOLERANCE_MM
     MAX_SAMPLES_PER_SEGMENT = 50_000
     _EPS = 1e-9
 
@@ -33,6 +40,9 @@ class TrajectoryBuilderCommon:
         cartesian_jerk_limit_mm_s3: float = 10000.0,
         jerk_check_enabled: bool = True,
         behavior: TrajectoryBuilderBehavior = TrajectoryBuilderBehavior.CONTINUE_ON_ERROR,
+        configuration_planning_enabled: bool = True,
+        time_optimal_enabled: bool = False,
+        adaptive_sampling_enabled: bool = False,
     ) -> None:
         self.robot_model = robot_model
         self.tool_model = tool_model
@@ -42,10 +52,18 @@ class TrajectoryBuilderCommon:
         self.cartesian_jerk_limit_mm_s3 = max(1e-6, float(cartesian_jerk_limit_mm_s3))
         self.jerk_check_enabled = bool(jerk_check_enabled)
         self.behavior = behavior
+        self.configuration_planning_enabled = bool(configuration_planning_enabled)
+        self.time_optimal_enabled = bool(time_optimal_enabled)
+        self.adaptive_sampling_enabled = bool(adaptive_sampling_enabled)
+        self.adaptive_sampling_policy = AdaptiveSamplingPolicy()
+        self.singularity_thresholds = SingularityThresholds()
         self._cancel_token: BuildCancelToken | None = None
         self._working_mgi_solver: MGI | None = None
         self._robot_allowed_configs: set[MgiConfigKey] | None = None
         self._joint_weights: list[float] | None = None
+        self._singularity_kinematics: ReachabilityKinematics | None = None
+        # Configuration retenue par la planification globale, par id de keypoint cartésien
+        self._planned_configs: dict[int, MgiConfigKey] = {}
 
     def set_cancel_token(self, cancel_token: BuildCancelToken | None) -> None:
         self._cancel_token = cancel_token
@@ -60,6 +78,20 @@ class TrajectoryBuilderCommon:
     def set_behavior(self, behavior: TrajectoryBuilderBehavior) -> None:
         self.behavior = behavior
 
+    def set_configuration_planning_enabled(self, enabled: bool) -> None:
+        self.configuration_planning_enabled = bool(enabled)
+
+    def set_time_optimal_enabled(self, enabled: bool) -> None:
+        self.time_optimal_enabled = bool(enabled)
+
+    def set_adaptive_sampling(self, enabled: bool, policy: AdaptiveSamplingPolicy | None = None) -> None:
+        self.adaptive_sampling_enabled = bool(enabled)
+        if policy is not None:
+            self.adaptive_sampling_policy = policy
+
+    def set_singularity_thresholds(self, thresholds: SingularityThresholds) -> None:
+        self.singularity_thresholds = thresholds
+
     def _is_cancelled(self) -> bool:
         return self._cancel_token is not None and self._cancel_token.is_cancelled()
 
@@ -136,7 +168,8 @@ class TrajectoryBuilderCommon:
         solver.set_q1ValueIfSingularityQ1Deg(reference_joints[0])
         solver.set_q4ValueIfSingularityQ5Deg(reference_joints[3])
         solver.set_q6ValueIfSingularityQ5Deg(reference_joints[5])
-        return solver.compute_mgi_target(pose.to_list(), returnDegrees=True)
+        with _SPANS.span("ik", "trajectory"):
+            return solver.compute_mgi_target(pose.to_list(), returnDegrees=True)
 
     def _resolve_reference_config(self, previous_joints_deg: JointAngles6 | None) -> MgiConfigKey:
         return MgiConfigKey.identify_configuration_deg(
@@ -150,6 +183,9 @@ class TrajectoryBuilderCommon:
         previous_joints_deg: JointAngles6 | None,
     ) -> set[MgiConfigKey]:
         robot_allowed = self._get_robot_allowed_configs()
+        planned = self._planned_configs.get(id(keypoint))
+        if planned is not None and keypoint.target_type == KeypointTargetType.CARTESIAN:
+            return {planned} & robot_allowed
         if keypoint.target_type == KeypointTargetType.JOINT:
             config_key = MgiConfigKey.identify_configuration_deg(
                 keypoint.joint_target.to_list(),
@@ -240,7 +276,8 @@ class TrajectoryBuilderCommon:
         if start_pose is None or end_pose is None or curve_info is None:
             return None
         curve, out_direction, in_direction = curve_info
-        arc_lut = build_arc_length_lut(curve, self.DEFAULT_ARC_LENGTH_SAMPLES, self._cancel_token)
+        with _SPANS.span("arc_length_lut", "trajectory"):
+            arc_lut = build_adaptive_arc_length_lut(curve, self.DEFAULT_ARC_LENGTH_TOLERANCE_MM, self._cancel_token)
         target_speed = self.linear_speed_mps_to_mmps(segment.to_keypoint.linear_speed_mps)
         return RuntimeSegment(
             mode=segment.to_keypoint.mode,
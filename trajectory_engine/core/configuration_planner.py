@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from models.trajectory_keypoint import ConfigurationPolicy, KeypointTargetType, TrajectoryKeypoint
+from trajectory_engine.models.pipeline import TrajectorySegment
+from trajectory_engine.runtime import evaluate_poses_at_distances
+from utils.mgi import MgiConfigKey
+from utils.mgi_batch import MgiBatchResult, compute_mgi_batch
+
+if TYPE_CHECKING:
+    from trajectory_engine.core.builder_common import TrajectoryBuilderCommon
+
+
+@dataclass(frozen=True)
+class _PlanNode:
+    config: MgiConfigKey
+    joints_deg: np.ndarray
+
+
+@dataclass
+class ConfigurationPlan:
+    """Séquence de configurations retenue, une entrée par keypoint de la séquence planifiée."""
+    keypoints: list[TrajectoryKeypoint] = field(default_factory=list)
+    configs: list[MgiConfigKey] = field(default_factory=list)
+    joints_deg: list[list[float]] = field(default_factory=list)
+    cost: float = 0.0
+
+    def configs_by_keypoint(self) -> dict[int, MgiConfigKey]:
+        """Configuration imposée par keypoint cartésien (clé : id du keypoint)."""
+        return {
+            id(keypoint): config
+            for keypoint, config in zip(self.keypoints, self.configs)
+            if keypoint.target_type == KeypointTargetType.CARTESIAN
+        }
+
+
+class ConfigurationPlanner:
+    """Choix global des configurations MGI le long d'une séquence de keypoints.
+
+    Chaque keypoint porte un nœud par configuration autorisée et par expansion 2π dans
+    les limites d'axes. Les arêtes PTP coûtent le déplacement articulaire pondéré ; les
+    arêtes cartésiennes imposent la même configuration de bout en bout et suivent le
+    chemin par sondes MGI vectorisées, calculées une fois par segment (limites, sauts).
+    La programmation dynamique sur ce graphe en couches retient la séquence de coût
+    minimal, là où la sélection au plus proche échantillon par échantillon peut
+    s'enfermer dans une branche sans issue.
+    """
+
+    PATH_PROBE_STEP_MM = 5.0
+    MIN_PATH_PROBES = 8
+    MAX_PATH_PROBES = 400
+    # Pas articulaire entre deux sondes au-delà duquel le suivi est un saut (arête rejetée)
+    JUMP_THRESHOLD_DEG = 30.0
+    _MATCH_TOLERANCE_DEG = 1e-3
+
+    def __init__(self, builder: TrajectoryBuilderCommon) -> None:
+        self.builder = builder
+        robot_model = builder.robot_model
+        self._axis_limits = np.asarray(robot_model.get_axis_limits()[:6], dtype=float)
+        self._weights = np.asarray(builder._get_joint_weights()[:6], dtype=float)
+        self._robot_allowed = builder._get_robot_allowed_configs()
+        self._config_identifier = robot_model.get_config_identifier()
+
+    def plan(self, segments: list[TrajectorySegment]) -> ConfigurationPlan | None:
+        """Plan de coût minimal pour les segments enchaînés, ou None si aucune séquence n'est faisable."""
+        if not segments:
+            return None
+        keypoints = [segments[0].from_keypoint] + [segment.to_keypoint for segment in segments]
+        layers = self._build_layers(keypoints)
+        if layers is None:
+            return None
+
+        costs = np.zeros(len(layers[0]), dtype=float)
+        back_pointers: list[np.ndarray] = []
+        for index, segment in enumerate(segments):
+            if self.builder._is_cancelled():
+                return None
+            edges = self._edge_costs(segment, layers[index], layers[index + 1])
+            total = costs[:, None] + edges
+            back_pointers.append(np.argmin(total, axis=0))
+            costs = total.min(axis=0)
+            if not np.isfinite(costs).any():
+                return None
+
+        node_index = int(np.argmin(costs))
+        plan = ConfigurationPlan(keypoints=keypoints, cost=float(costs[node_index]))
+        selected: list[_PlanNode] = [layers[-1][node_index]]
+        for layer_index in range(len(segments) - 1, -1, -1):
+            node_index = int(back_pointers[layer_index][node_index])
+            selected.append(layers[layer_index][node_index])
+        selected.reverse()
+        plan.configs = [node.config for node in selected]
+        plan.joints_deg = [node.joints_deg.tolist() for node in selected]
+        return plan
+
+    # ------------------------------------------------------------------
+    # Nœuds
+    # ------------------------------------------------------------------
+
+    def _build_layers(self, keypoints: list[TrajectoryKeypoint]) -> list[list[_PlanNode]] | None:
+        cartesian_indices = [i for i, keypoint in enumerate(keypoints) if keypoint.target_type == KeypointTargetType.CARTESIAN]
+        poses: list[list[float]] = []
+        for index in cartesian_indices:
+            pose = self.builder._resolve_keypoint_pose(keypoints[index])
+            if pose is None:
+                return None
+            poses.append(pose.to_list())
+        batch = self._solve(np.asarray(poses, dtype=float)) if poses else None
+
+        layers: list[list[_PlanNode]] = []
+        for index, keypoint in enumerate(keypoints):
+            if keypoint.target_type == KeypointTargetType.JOINT:
+                joints = keypoint.joint_target.to_list()
+                config = MgiConfigKey.identify_configuration_deg(joints, self._config_identifier)
+                nodes = [_PlanNode(config, np.asarray(joints, dtype=float))] if config in self._robot_allowed else []
+            else:
+                row = cartesian_indices.index(index)
+                nodes = []
+                valid = batch.valid_mask(self._robot_allowed)[row]
+                for config in sorted(self._candidate_configs(keypoint), key=lambda key: key.value):
+                    if not valid[config.value]:
+                        continue
+                    nodes.extend(_PlanNode(config, joints) for joints in self._expansions(batch.joints_deg[row, config.value]))
+            if not nodes:
+                return None
+            layers.append(nodes)
+        return layers
+
+    def _candidate_configs(self, keypoint: TrajectoryKeypoint) -> set[MgiConfigKey]:
+        # CURRENT_BRANCH : toutes les branches sont candidates, la contrainte porte sur l'arête.
+        if keypoint.configuration_policy == ConfigurationPolicy.FORCED:
+            return {keypoint.forced_config} & self._robot_allowed if keypoint.forced_config is not None else set()
+        return set(self._robot_allowed)
+
+    def _expansions(self, joints_deg: np.ndarray) -> list[np.ndarray]:
+        """Toutes les expansions 2π de la solution dans les limites d'axes."""
+        per_axis: list[list[float]] = []
+        for axis in range(6):
+            q_min, q_max = self._axis_limits[axis]
+            value = float(joints_deg[axis])
+            k_min = math.ceil((q_min - value) / 360.0 - 1e-9)
+            k_max = math.floor((q_max - value) / 360.0 + 1e-9)
+            per_axis.append([value + 360.0 * k for k in range(k_min, k_max + 1)])
+        grids = np.meshgrid(*per_axis, indexing="ij")
+        return list(np.stack([grid.reshape(-1) for grid in grids], axis=1))
+
+    def _solve(self, poses: np.ndarray) -> MgiBatchResult:
+        return compute_mgi_batch(self.builder.robot_model.mgi_params, poses, self.builder.tool_model.get_tool())
+
+    # ------------------------------------------------------------------
+    # Arêtes
+    # ------------------------------------------------------------------
+
+    def _edge_costs(self, segment: TrajectorySegment, from_nodes: list[_PlanNode], to_nodes: list[_PlanNode]) -> np.ndarray:
+        from_joints = np.stack([node.joints_deg for node in from_nodes])
+        to_joints = np.stack([node.joints_deg for node in to_nodes])
+        from_configs = np.array([node.config.value for node in from_nodes])
+        to_configs = np.array([node.config.value for node in to_nodes])
+
+        if not self.builder._is_cartesian_mode(segment.to_keypoint.mode):
+            # PTP : le builder interpole le plus court chemin angulaire
+            delta = (to_joints[None, :, :] - from_joints[:, None, :] + 180.0) % 360.0 - 180.0
+            costs = np.abs(delta) @ self._weights
+            if segment.to_keypoint.configuration_policy == ConfigurationPolicy.CURRENT_BRANCH:
+                costs = np.where(from_configs[:, None] == to_configs[None, :], costs, np.inf)
+            return costs
+
+        costs = np.full((len(from_nodes), len(to_nodes)), np.inf)
+        probes = self._path_probes(segment)
+        if probes is None:
+            return costs
+        for config in np.intersect1d(from_configs, to_configs):
+            if not probes.valid_mask(self._robot_allowed)[:, config].all():
+                continue
+            rows = np.nonzero(from_configs == config)[0]
+            columns = np.nonzero(to_configs == config)[0]
+            end_joints, path_costs = self._track_path(probes.joints_deg[:, config], from_joints[rows])
+            for row, end, path_cost in zip(rows, end_joints, path_costs):
+                if not np.isfinite(path_cost):
+                    continue
+                matches = np.all(np.abs(to_joints[columns] - end) < self._MATCH_TOLERANCE_DEG, axis=1)
+                costs[row, columns[matches]] = path_cost
+        return costs
+
+    def _path_probes(self, segment: TrajectorySegment) -> MgiBatchResult | None:
+        runtime_segment = self.builder._build_runtime_segment(segment, 0, 0.0, 0.0)
+        if runtime_segment is None:
+            return None
+        length_mm = runtime_segment.speed_profile.length_mm
+        count = int(math.ceil(length_mm / self.PATH_PROBE_STEP_MM))
+        count = max(self.MIN_PATH_PROBES, min(self.MAX_PATH_PROBES, count))
+        distances = np.linspace(0.0, length_mm, count + 1)[1:]
+        poses = evaluate_poses_at_distances(runtime_segment, distances)
+        # La dernière sonde est exactement la cible, comme le nœud d'arrivée.
+        end_pose = self.builder._resolve_keypoint_pose(segment.to_keypoint)
+        if end_pose is not None:
+            poses[-1] = end_pose.to_list()
+        return self._solve(poses)
+
+    def _track_path(self, raw_path_deg: np.ndarray, start_joints: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Suit les sondes (N, 6) depuis chaque départ (M, 6) par continuité angulaire.
+
+        Retourne les articulaires d'arrivée (M, 6) et le coût pondéré (inf si une sonde
+        sort des limites d'axes ou si le suivi saute).
+        """
+        current = start_joints.astype(float).copy()
+        costs = np.zeros(len(current), dtype=float)
+        q_min = self._axis_limits[:, 0]
+        q_max = self._axis_limits[:, 1]
+        for raw in raw_path_deg:
+            shifted = raw[None, :] + 360.0 * np.round((current - raw[None, :]) / 360.0)
+            step = np.abs(shifted - current)
+            costs += step @ self._weights
+            outside = np.any((shifted < q_min - 1e-9) | (shifted > q_max + 1e-9), axis=1)
+            costs[outside | (step.max(axis=1) > self.JUMP_THRESHOLD_DEG)] = np.inf
+            current = shifted
+        return current, costs
+
+
+__all__ = [
+    "ConfigurationPlan",
+    "ConfigurationPlanner",
+]
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
+from typing import Callable
+
+import numpy as np
 
 from models.trajectory_keypoint import ConfigurationPolicy, KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
 from models.types import JointAngles6, Pose6, TrajectorySampleKinematics, XYZ3
@@ -21,14 +24,18 @@ from trajectory_engine.models.pipeline import (
     TrajectoryBuilderBehavior,
 )
 from trajectory_engine.core.builder_common import TrajectoryBuilderCommon
+from trajectory_engine.core.configuration_planner import ConfigurationPlanner
+from trajectory_engine.models.trajectory_primitives import RuntimeSegment
 from trajectory_engine.dynamics import (
+    ScalarMotionProfile,
     build_distance_profile,
+    build_time_optimal_profile,
     normalized_s_curve,
     normalized_s_curve_derivative,
     normalized_s_curve_second_derivative,
     normalized_s_curve_third_derivative,
 )
-from trajectory_engine.runtime import RuntimeEvaluator
+from trajectory_engine.runtime import RuntimeEvaluator, evaluate_poses_at_distances
 from trajectory_engine.sampling import (
     reset_articular_dynamics,
     reset_cartesian_dynamics,
@@ -36,6 +43,13 @@ from trajectory_engine.sampling import (
     update_cartesian_dynamics,
 )
 from utils.mgi import MgiConfigKey, MgiResult, MgiResultStatus
+from utils.mgi_batch import compute_mgi_batch
+from utils.reachability_map import ReachabilityKinematics
+from utils.singularity_analysis import compute_singularity_metrics, find_singularity_intervals
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 @dataclass(frozen=True)
@@ -81,11 +95,20 @@ class _SampleClock:
 
 
 class TrajectoryBuilder(TrajectoryBuilderCommon):
+    TIME_OPTIMAL_PATH_STEP_MM = 2.0
+    MIN_TIME_OPTIMAL_PATH_SAMPLES = 16
+    MAX_TIME_OPTIMAL_PATH_SAMPLES = 1000
+
     def compute_trajectory(self, current_joints: list[float], segments: list[TrajectorySegment]) -> TrajectoryResult:
+        with _SPANS.span("compute_trajectory", "trajectory", segments=len(segments)):
+            return self._compute_trajectory(current_joints, segments)
+
+    def _compute_trajectory(self, current_joints: list[float], segments: list[TrajectorySegment]) -> TrajectoryResult:
         result = TrajectoryResult(build_status=BuildStatus.RUNNING)
         self._working_mgi_solver = None
         self._robot_allowed_configs = set(self.robot_model.get_allowed_configurations())
         self._joint_weights = [float(v) for v in self.robot_model.get_joint_weights()[:6]]
+        self._singularity_kinematics = ReachabilityKinematics.from_robot_model(self.robot_model, self.tool_model.get_tool())
         try:
             if self._is_cancelled():
                 result.build_status = BuildStatus.CANCELLED
@@ -94,15 +117,19 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
                 result.build_status = BuildStatus.COMPLETED
                 return result
 
+            with _SPANS.span("plan_configurations", "trajectory"):
+                self._planned_configs = self._plan_configurations(current_joints, segments)
             previous_sample: TrajectorySample | None = None
             start_time_s = 0.0
             sample_clock = _SampleClock(self.sample_dt_s, start_time_s)
-            first_segment = self.compute_first_segment(
-                current_joints,
-                segments[0].from_keypoint,
-                start_time_s,
-                sample_clock,
-            )
+            with _SPANS.span("segment", "trajectory", lazy_args=lambda: {"index": 0, "mode": segments[0].from_keypoint.mode.name}):
+                first_segment = self.compute_first_segment(
+                    current_joints,
+                    segments[0].from_keypoint,
+                    start_time_s,
+                    sample_clock,
+                )
+                self._analyze_singularities(first_segment)
             result.segments.append(first_segment)
             self._accumulate_status(result, first_segment, 0)
             if self._should_stop_on_error(first_segment):
@@ -116,22 +143,24 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
                 if self._is_cancelled():
                     result.build_status = BuildStatus.CANCELLED
                     return result
-                if self._is_cartesian_mode(segment.to_keypoint.mode):
-                    exit_speed = self._segment_exit_speed(segments, index)
-                    segment_result = self._compute_cartesian_segment(
-                        segment,
-                        index,
-                        previous_sample,
-                        start_time_s,
-                        previous_cart_exit_speed,
-                        exit_speed,
-                        sample_clock,
-                    )
-                    previous_cart_exit_speed = exit_speed
-                else:
-                    segment_result = self.compute_PTP_segment(segment, previous_sample, start_time_s, sample_clock)
-                    previous_cart_exit_speed = 0.0
-
+                with _SPANS.span("segment", "trajectory", lazy_args=lambda: {"index": index + 1, "mode": segment.to_keypoint.mode.name}):
+                    if self._is_cartesian_mode(segment.to_keypoint.mode):
+                        exit_speed = self._segment_exit_speed(segments, index)
+                        segment_result = self._compute_cartesian_segment(
+                            segment,
+                            index,
+                            previous_sample,
+                            start_time_s,
+                            previous_cart_exit_speed,
+                            exit_speed,
+                            sample_clock,
+                        )
+                        previous_cart_exit_speed = exit_speed
+                    else:
+                        segment_result = self.compute_PTP_segment(segment, previous_sample, start_time_s, sample_clock)
+                        previous_cart_exit_speed = 0.0
+
+                    self._analyze_singularities(segment_result)
                 result.segments.append(segment_result)
                 self._accumulate_status(result, segment_result, index + 1)
                 if self._should_stop_on_error(segment_result):
@@ -145,17 +174,42 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
             self._working_mgi_solver = None
             self._robot_allowed_configs = None
             self._joint_weights = None
+            self._planned_configs = {}
 
-    def compute_first_segment(
-        self,
-        current_joints: list[float],
-        to_keypoint: TrajectoryKeypoint,
-        start_time_s: float = 0.0,
-        sample_clock: _SampleClock | None = None,
-    ) -> SegmentResult:
+    def _analyze_singularities(self, segment_result: SegmentResult) -> None:
+        """Indice de singularité de tous les échantillons du segment en un seul lot, puis intervalles d'alerte."""
+        samples = segment_result.samples
+        if not samples or self._singularity_kinematics is None:
+            return
+        with _SPANS.span("singularities", "trajectory", samples=len(samples)):
+            metrics = compute_singularity_metrics(self._singularity_kinematics, np.array([sample.joints[:6] for sample in samples]))
+            index = np.where([sample.reachable for sample in samples], metrics.index, np.nan)
+            kinds = metrics.kinds()
+            for sample, value, kind in zip(samples, index, kinds):
+                if np.isnan(value):
+                    continue
+                sample.singularity_index = float(value)
+                sample.singularity_kind = kind
+            segment_result.singularity_intervals = find_singularity_intervals(
+                np.array([sample.time for sample in samples]),
+                index,
+                kinds,
+                self.singularity_thresholds,
+            )
+
+    def _plan_configurations(self, current_joints: list[float], segments: list[TrajectorySegment]) -> dict[int, MgiConfigKey]:
+        """Configurations globalement cohérentes ; vide (sélection au plus proche) si aucun plan n'existe."""
+        if not self.configuration_planning_enabled:
+            return {}
+        first = segments[0].from_keypoint
+        planned_segments = [TrajectorySegment(self._synthetic_start_keypoint(current_joints, first), first)] + list(segments)
+        plan = ConfigurationPlanner(self).plan(planned_segments)
+        return plan.configs_by_keypoint() if plan is not None else {}
+
+    def _synthetic_start_keypoint(self, current_joints: list[float], to_keypoint: TrajectoryKeypoint) -> TrajectoryKeypoint:
         joints = self._copy_joints_6(current_joints)
         config_key = MgiConfigKey.identify_configuration_deg(joints, self.robot_model.get_config_identifier())
-        synthetic_from = TrajectoryKeypoint(
+        return TrajectoryKeypoint(
             target_type=KeypointTargetType.JOINT,
             joint_target=joints,
             mode=to_keypoint.mode,
@@ -165,6 +219,15 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
             ptp_speed_percent=to_keypoint.ptp_speed_percent,
             linear_speed_mps=to_keypoint.linear_speed_mps,
         )
+
+    def compute_first_segment(
+        self,
+        current_joints: list[float],
+        to_keypoint: TrajectoryKeypoint,
+        start_time_s: float = 0.0,
+        sample_clock: _SampleClock | None = None,
+    ) -> SegmentResult:
+        synthetic_from = self._synthetic_start_keypoint(current_joints, to_keypoint)
         return self.compute_segment(TrajectorySegment(synthetic_from, to_keypoint), None, start_time_s, sample_clock)
 
     def compute_segment(
@@ -214,10 +277,8 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
         end_time_s = start_time_s + duration_s
         schedule = clock.segment_points(start_time_s, end_time_s)
         speed_limits, accel_limits, jerk_limits = self._axis_dynamic_limits()
-        previous = previous_sample
-        for point in schedule:
-            if self._is_cancelled():
-                break
+
+        def build_sample(point: _SampleSchedulePoint, previous: TrajectorySample | None) -> TrajectorySample:
             local_time_s = max(0.0, min(duration_s, point.time_s - start_time_s))
             u = 1.0 if duration_s <= self._EPS else local_time_s / duration_s
             smooth_u = normalized_s_curve(u)
@@ -229,13 +290,27 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
                 update_articular_dynamics_from_previous=False,
             )
             self._apply_ptp_analytic_articular_dynamics(sample, delta, duration_s, local_time_s)
-            self._apply_dynamic_limits(sample, speed_limits, accel_limits, jerk_limits)
-            result.samples.append(sample)
-            self._update_joint_stats(result, sample)
-            self._register_sample_error(result, sample, len(result.samples) - 1)
-            previous = sample
-            if self._should_stop_on_error(result):
-                break
+            return sample
+
+        with _SPANS.span("sampling", "trajectory", ticks=len(schedule), adaptive=self.adaptive_sampling_enabled):
+            if self.adaptive_sampling_enabled:
+                self._collect_adaptive_samples(result, schedule, build_sample, previous_sample, update_articular=False)
+                result.duration = duration_s
+                result.last_time = end_time_s
+                return result
+
+            previous = previous_sample
+            for point in schedule:
+                if self._is_cancelled():
+                    break
+                sample = build_sample(point, previous)
+                self._apply_dynamic_limits(sample, speed_limits, accel_limits, jerk_limits)
+                result.samples.append(sample)
+                self._update_joint_stats(result, sample)
+                self._register_sample_error(result, sample, len(result.samples) - 1)
+                previous = sample
+                if self._should_stop_on_error(result):
+                    break
 
         result.duration = duration_s
         result.last_time = end_time_s
@@ -266,49 +341,161 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
 
         result.out_direction = runtime_segment.out_direction.to_list()
         result.in_direction = runtime_segment.in_direction.to_list()
-        limits = self._dynamic_limits(segment)
-        profile = build_distance_profile(
-            segment_index=segment_index,
-            length_mm=runtime_segment.speed_profile.length_mm,
-            target_speed_mm_s=runtime_segment.speed_profile.target_speed_mm_s,
-            entry_speed_mm_s=runtime_segment.speed_profile.entry_speed_mm_s,
-            exit_speed_mm_s=runtime_segment.speed_profile.exit_speed_mm_s,
-            accel_limit_mm_s2=limits.cartesian_accel_mm_s2,
-            jerk_limit_mm_s3=limits.cartesian_jerk_mm_s3,
-            start_time_s=start_time_s,
-            start_position_mm=0.0,
-        )
+        speed_limits, accel_limits, jerk_limits = self._axis_dynamic_limits()
+        planned = self._planned_configs.get(id(segment.to_keypoint))
+        selection_configs = {planned} if planned is not None else None
+        profile = None
+        if self.time_optimal_enabled:
+            profile = self._time_optimal_profile(runtime_segment, segment_index, previous_sample, planned, start_time_s)
+        if profile is None:
+            limits = self._dynamic_limits(segment)
+            profile = build_distance_profile(
+                segment_index=segment_index,
+                length_mm=runtime_segment.speed_profile.length_mm,
+                target_speed_mm_s=runtime_segment.speed_profile.target_speed_mm_s,
+                entry_speed_mm_s=runtime_segment.speed_profile.entry_speed_mm_s,
+                exit_speed_mm_s=runtime_segment.speed_profile.exit_speed_mm_s,
+                accel_limit_mm_s2=limits.cartesian_accel_mm_s2,
+                jerk_limit_mm_s3=limits.cartesian_jerk_mm_s3,
+                start_time_s=start_time_s,
+                start_position_mm=0.0,
+            )
         evaluator = RuntimeEvaluator(runtime_segment, profile)
         clock = _SampleClock(self.sample_dt_s, start_time_s) if sample_clock is None else sample_clock
         duration_s = max(0.0, profile.duration_s - start_time_s)
         end_time_s = start_time_s + duration_s
         schedule = clock.segment_points(start_time_s, end_time_s)
+
+        def build_sample(point: _SampleSchedulePoint, previous: TrajectorySample | None) -> TrajectorySample:
+            local_time_s = max(0.0, min(duration_s, point.time_s - start_time_s))
+            pose = evaluator.evaluate_pose(start_time_s + local_time_s)
+            return self._build_cartesian_sample(point.time_s, pose, previous, selection_configs)
+
+        with _SPANS.span("sampling", "trajectory", ticks=len(schedule), adaptive=self.adaptive_sampling_enabled):
+            if self.adaptive_sampling_enabled:
+                self._collect_adaptive_samples(result, schedule, build_sample, previous_sample, update_articular=True)
+                result.duration = duration_s
+                result.last_time = end_time_s
+                return result
+
+            previous = previous_sample
+            for point in schedule:
+                if self._is_cancelled():
+                    break
+                sample = build_sample(point, previous)
+                self._apply_dynamic_limits(sample, speed_limits, accel_limits, jerk_limits)
+                result.samples.append(sample)
+                self._update_joint_stats(result, sample)
+                self._register_sample_error(result, sample, len(result.samples) - 1)
+                previous = sample
+                if self._should_stop_on_error(result):
+                    break
+
+        result.duration = duration_s
+        result.last_time = end_time_s
+        return result
+
+    def _collect_adaptive_samples(
+        self,
+        result: SegmentResult,
+        schedule: list[_SampleSchedulePoint],
+        build_sample: Callable[[_SampleSchedulePoint, TrajectorySample | None], TrajectorySample],
+        previous_sample: TrajectorySample | None,
+        update_articular: bool,
+    ) -> None:
+        """Échantillonnage adaptatif : ticks grossiers puis bissection selon la politique du builder.
+
+        Les échantillons sont calculés hors ordre (le voisin gauche sert de référence de
+        continuité MGI) ; dynamiques, limites et erreurs sont ensuite évaluées dans l'ordre
+        chronologique avec des différences finies à pas non uniforme.
+        """
+        policy = self.adaptive_sampling_policy
+        samples: dict[int, TrajectorySample] = {}
         previous = previous_sample
-        speed_limits, accel_limits, jerk_limits = self._axis_dynamic_limits()
-        for point in schedule:
+        coarse = policy.coarse_indices(len(schedule))
+        for index in coarse:
             if self._is_cancelled():
-                break
-            local_time_s = max(0.0, min(duration_s, point.time_s - start_time_s))
-            profile_time_s = start_time_s + local_time_s
-            pose = evaluator.evaluate_pose(profile_time_s)
-            sample = self._build_cartesian_sample(point.time_s, pose, previous)
+                return
+            samples[index] = build_sample(schedule[index], previous)
+            previous = samples[index]
+        pending = [(left, right) for left, right in zip(coarse, coarse[1:]) if right - left > 1]
+        while pending:
+            if self._is_cancelled():
+                return
+            left, right = pending.pop()
+            middle = (left + right) // 2
+            samples[middle] = build_sample(schedule[middle], samples[left])
+            ratio = (middle - left) / (right - left)
+            if policy.needs_refinement(samples[left], samples[middle], samples[right], ratio):
+                pending.extend((a, b) for a, b in ((left, middle), (middle, right)) if b - a > 1)
+
+        speed_limits, accel_limits, jerk_limits = self._axis_dynamic_limits()
+        previous = previous_sample
+        previous_dt_s: float | None = None
+        for index in sorted(samples):
+            sample = samples[index]
+            self._update_sample_dynamics(
+                sample,
+                previous,
+                update_articular=update_articular,
+                previous_dt_s=previous_dt_s,
+            )
             self._apply_dynamic_limits(sample, speed_limits, accel_limits, jerk_limits)
             result.samples.append(sample)
             self._update_joint_stats(result, sample)
             self._register_sample_error(result, sample, len(result.samples) - 1)
+            previous_dt_s = sample.time - previous.time if previous is not None else None
             previous = sample
             if self._should_stop_on_error(result):
                 break
 
-        result.duration = duration_s
-        result.last_time = end_time_s
-        return result
+    def _time_optimal_profile(
+        self,
+        runtime_segment: RuntimeSegment,
+        segment_index: int,
+        previous_sample: TrajectorySample | None,
+        planned_config: MgiConfigKey | None,
+        start_time_s: float,
+    ) -> ScalarMotionProfile | None:
+        """Profil temps-optimal sous limites d'axes ; None (profil cartésien) si le chemin n'est pas suivable."""
+        length_mm = runtime_segment.speed_profile.length_mm
+        if length_mm <= self._EPS or previous_sample is None or not previous_sample.reachable:
+            return None
+        config = planned_config if planned_config is not None else previous_sample.configuration
+        if config is None:
+            return None
+        count = int(math.ceil(length_mm / self.TIME_OPTIMAL_PATH_STEP_MM))
+        count = max(self.MIN_TIME_OPTIMAL_PATH_SAMPLES, min(self.MAX_TIME_OPTIMAL_PATH_SAMPLES, count))
+        with _SPANS.span("time_optimal_profile", "trajectory", path_samples=count + 1):
+            distances = np.linspace(0.0, length_mm, count + 1)
+            poses = evaluate_poses_at_distances(runtime_segment, distances)
+            batch = compute_mgi_batch(self.robot_model.mgi_params, poses, self.tool_model.get_tool())
+            if not batch.valid_mask(self._get_robot_allowed_configs())[:, config.value].all():
+                return None
+            # Continuité angulaire depuis l'échantillon précédent, comme la sélection au plus proche
+            joints = np.unwrap(batch.joints_deg[:, config.value], period=360.0, axis=0)
+            previous_joints = np.asarray(previous_sample.joints[:6], dtype=float)
+            joints += 360.0 * np.round((previous_joints - joints[0]) / 360.0)
+            speed_limits, accel_limits, jerk_limits = self._axis_dynamic_limits()
+            return build_time_optimal_profile(
+                segment_index=segment_index,
+                distances_mm=distances,
+                joints_deg=joints,
+                target_speed_mm_s=runtime_segment.speed_profile.target_speed_mm_s,
+                entry_speed_mm_s=runtime_segment.speed_profile.entry_speed_mm_s,
+                exit_speed_mm_s=runtime_segment.speed_profile.exit_speed_mm_s,
+                speed_limits=speed_limits,
+                accel_limits=accel_limits,
+                jerk_limits=jerk_limits if self.jerk_check_enabled else None,
+                start_time_s=start_time_s,
+            )
 
     def _build_cartesian_sample(
         self,
         time_s: float,
         pose: Pose6,
         previous_sample: TrajectorySample | None,
+        selection_configs: set[MgiConfigKey] | None = None,
     ) -> TrajectorySample:
         sample = TrajectorySample()
         sample.time = float(time_s)
@@ -317,7 +504,9 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
         allowed_configs = set(self._get_robot_allowed_configs())
         mgi_result = self._compute_mgi_for_pose(pose, previous_joints)
         sample.mgi_solutions = self._compact_mgi_solutions(mgi_result, allowed_configs)
-        selected = self._select_best_solution(mgi_result, previous_joints, allowed_configs)
+        # Plan global : la configuration du segment est imposée, sinon la plus proche parmi les autorisées.
+        selection = allowed_configs & selection_configs if selection_configs is not None else allowed_configs
+        selected = self._select_best_solution(mgi_result, previous_joints, selection)
         if selected is None:
             sample.reachable = False
             sample.error_code = TrajectorySampleErrorCode.POINT_UNREACHABLE
@@ -377,6 +566,7 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
         previous_sample: TrajectorySample | None,
         update_cartesian: bool = True,
         update_articular: bool = True,
+        previous_dt_s: float | None = None,
     ) -> None:
         if previous_sample is None:
             if update_cartesian:
@@ -388,9 +578,9 @@ class TrajectoryBuilder(TrajectoryBuilderCommon):
         if dt <= self._EPS:
             dt = self.sample_dt_s
         if update_cartesian:
-            update_cartesian_dynamics(sample, previous_sample, dt)
+            update_cartesian_dynamics(sample, previous_sample, dt, previous_dt_s)
         if update_articular:
-            update_articular_dynamics(sample, previous_sample, dt)
+            update_articular_dynamics(sample, previous_sample, dt, previous_dt_s)
 
     @staticmethod
     def _apply_ptp_analytic_articular_dynamics(
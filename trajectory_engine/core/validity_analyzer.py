@@ -14,6 +14,7 @@ from trajectory_engine.models.pipeline import (
     BuildCancelToken,
     SampleValidationResult,
     SegmentResult,
+    TrajectoryClearanceDiagnostic,
     TrajectoryCollisionDiagnostic,
     TrajectoryCollisionDomain,
     TrajectoryComputationStatus,
@@ -25,12 +26,17 @@ from trajectory_engine.models.pipeline import (
     ValidityContextSnapshot,
 )
 from utils.collision_utils import (
+    CollisionClearance,
     CollisionPair,
     CollisionWorldCache,
     build_world_frame_transforms,
     resolve_flange_world_transform,
 )
 import utils.math_utils as math_utils
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 @dataclass
@@ -168,6 +174,34 @@ class ValidityAnalyzer:
             )
         return diagnostics
 
+    def _minimum_clearance(self) -> TrajectoryClearanceDiagnostic | None:
+        candidates = [
+            (TrajectoryCollisionDomain.WORKSPACE, self._collision_cache.find_workspace_clearance()),
+            (
+                TrajectoryCollisionDomain.ROBOT_TOOL,
+                self._collision_cache.find_robot_tool_clearance(self.context.evaluated_robot_axis_colliders),
+            ),
+        ]
+        best: tuple[TrajectoryCollisionDomain, CollisionClearance] | None = None
+        for domain, clearance in candidates:
+            if clearance is None:
+                continue
+            if best is None or clearance.distance < best[1].distance:
+                best = (domain, clearance)
+        if best is None:
+            return None
+        domain, clearance = best
+        return TrajectoryClearanceDiagnostic(
+            domain=domain,
+            owner_a=clearance.pair.owner_a,
+            name_a=clearance.pair.name_a,
+            owner_b=clearance.pair.owner_b,
+            name_b=clearance.pair.name_b,
+            distance_mm=clearance.distance,
+            point_a_world=XYZ3.from_values(clearance.result.point_a.tolist()),
+            point_b_world=XYZ3.from_values(clearance.result.point_b.tolist()),
+        )
+
     def analyze_sample(
         self,
         sample: TrajectorySample,
@@ -175,6 +209,7 @@ class ValidityAnalyzer:
         sample_index: int,
         global_sample_index: int,
         cancel_token: BuildCancelToken,
+        robot_base_transform_world: np.ndarray | None = None,
     ) -> SampleValidationResult | None:
         if cancel_token.is_cancelled():
             return None
@@ -187,31 +222,38 @@ class ValidityAnalyzer:
         if sample.kinematics is not None:
             corrected_matrices = sample.kinematics.corrected_matrices
         if corrected_matrices is None:
-            corrected_matrices = self._kinematics.compute_corrected_matrices(sample.joints)
+            with _SPANS.span("kinematics", "validity"):
+                corrected_matrices = self._kinematics.compute_corrected_matrices(sample.joints)
         if corrected_matrices is None:
             return None
         if cancel_token.is_cancelled():
             return None
 
+        # Base robot propre à l'échantillon quand un axe externe porte le robot.
+        if robot_base_transform_world is None:
+            robot_base_transform_world = self.context.robot_base_transform_world
         frame_world_transforms = build_world_frame_transforms(
             corrected_matrices,
-            self.context.robot_base_transform_world,
+            robot_base_transform_world,
         )
         flange_world_transform = resolve_flange_world_transform(frame_world_transforms)
-        self._collision_cache.update_dynamic_world_shapes(frame_world_transforms, flange_world_transform)
+        with _SPANS.span("collision", "validity"):
+            self._collision_cache.update_dynamic_world_shapes(frame_world_transforms, flange_world_transform)
 
-        diagnostics = ValidityAnalyzer._diagnostics_from_pairs(
-            self._collision_cache.find_workspace_collisions(),
-            TrajectoryCollisionDomain.WORKSPACE,
-        )
-        diagnostics.extend(
-            ValidityAnalyzer._diagnostics_from_pairs(
-                self._collision_cache.find_robot_tool_collisions(
-                    self.context.evaluated_robot_axis_colliders
-                ),
-                TrajectoryCollisionDomain.ROBOT_TOOL,
+            diagnostics = ValidityAnalyzer._diagnostics_from_pairs(
+                self._collision_cache.find_workspace_collisions(),
+                TrajectoryCollisionDomain.WORKSPACE,
             )
-        )
+            diagnostics.extend(
+                ValidityAnalyzer._diagnostics_from_pairs(
+                    self._collision_cache.find_robot_tool_collisions(
+                        self.context.evaluated_robot_axis_colliders
+                    ),
+                    TrajectoryCollisionDomain.ROBOT_TOOL,
+                )
+            )
+        with _SPANS.span("clearance", "validity"):
+            clearance = self._minimum_clearance()
         if diagnostics:
             return SampleValidationResult(
                 global_sample_index=global_sample_index,
@@ -220,6 +262,7 @@ class ValidityAnalyzer:
                 error_code=TrajectorySampleErrorCode.COLLISION_DETECTED,
                 collisions=diagnostics,
                 tcp_world_xyz=_tcp_world_xyz(frame_world_transforms),
+                clearance=clearance,
             )
 
         tcp_world_xyz = _tcp_world_xyz(frame_world_transforms)
@@ -233,9 +276,20 @@ class ValidityAnalyzer:
                 error_code=TrajectorySampleErrorCode.TCP_WORKSPACE_EXIT,
                 collisions=[],
                 tcp_world_xyz=tcp_world_xyz,
+                clearance=clearance,
             )
 
-        return None
+        if clearance is None:
+            return None
+        return SampleValidationResult(
+            global_sample_index=global_sample_index,
+            segment_index=segment_index,
+            sample_index=sample_index,
+            error_code=TrajectorySampleErrorCode.NONE,
+            collisions=[],
+            tcp_world_xyz=tcp_world_xyz,
+            clearance=clearance,
+        )
 
     def analyze_task(
         self,
@@ -243,23 +297,24 @@ class ValidityAnalyzer:
         cancel_token: BuildCancelToken,
     ) -> ValidationResult:
         sample_results: list[SampleValidationResult] = []
-        for entry in task.samples:
-            if cancel_token.is_cancelled():
-                return ValidationResult(
-                    revision_id=task.revision_id,
-                    task_id=task.task_id,
-                    cancelled=True,
-                    sample_results=[],
+        with _SPANS.span("validity_task", "validity", task_id=task.task_id, samples=len(task.samples)):
+            for entry in task.samples:
+                if cancel_token.is_cancelled():
+                    return ValidationResult(
+                        revision_id=task.revision_id,
+                        task_id=task.task_id,
+                        cancelled=True,
+                        sample_results=[],
+                    )
+                sample_result = self.analyze_sample(
+                    entry.sample,
+                    entry.segment_index,
+                    entry.sample_index,
+                    entry.global_sample_index,
+                    cancel_token,
                 )
-            sample_result = self.analyze_sample(
-                entry.sample,
-                entry.segment_index,
-                entry.sample_index,
-                entry.global_sample_index,
-                cancel_token,
-            )
-            if sample_result is not None:
-                sample_results.append(sample_result)
+                if sample_result is not None:
+                    sample_results.append(sample_result)
         return ValidationResult(
             revision_id=task.revision_id,
             task_id=task.task_id,
@@ -272,6 +327,9 @@ def prepare_trajectory_validity_analysis(trajectory: TrajectoryResult) -> bool:
     changed = False
     for segment in trajectory.segments:
         for sample in segment.samples:
+            if sample.clearance is not None:
+                sample.clearance = None
+                changed = True
             if sample.error_code not in _VALIDITY_ERROR_CODES:
                 continue
             sample.error_code = TrajectorySampleErrorCode.NONE
@@ -304,6 +362,10 @@ def apply_validation_result(
         if not sample.reachable:
             continue
 
+        sample.clearance = sample_result.clearance
+        if sample_result.error_code == TrajectorySampleErrorCode.NONE:
+            changed = True
+            continue
         sample.collisions = list(sample_result.collisions)
         sample.error_code = sample_result.error_code
         sample.error_axis = None
@@ -13,6 +13,12 @@ from trajectory_engine.dynamics.scurve import (
     ptp_duration_s,
     resolve_segment_dynamic_profile,
 )
+from trajectory_engine.dynamics.topp import (
+    JointPathDerivatives,
+    axis_limit_ratios,
+    build_time_optimal_profile,
+    path_dynamic_limits,
+)
 from trajectory_engine.models.trajectory_primitives import SegmentDynamicProfileKind, SegmentDynamicResolution
 
 __all__ = [
@@ -20,14 +26,18 @@ __all__ = [
     "S_CURVE_JERK_FROM_VELOCITY_SCALE",
     "S_CURVE_PEAK_JERK_SCALE",
     "S_CURVE_PEAK_SPEED_SCALE",
+    "JointPathDerivatives",
     "SegmentDynamicProfileKind",
     "SegmentDynamicResolution",
     "ScalarMotionProfile",
+    "axis_limit_ratios",
     "build_distance_profile",
+    "build_time_optimal_profile",
     "normalized_s_curve",
     "normalized_s_curve_derivative",
     "normalized_s_curve_second_derivative",
     "normalized_s_curve_third_derivative",
+    "path_dynamic_limits",
     "ptp_jerk_duration_s",
     "ptp_duration_s",
     "resolve_segment_dynamic_profile",
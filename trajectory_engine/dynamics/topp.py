@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+
+from trajectory_engine.dynamics.scurve import (
+    ScalarMotionPhase,
+    ScalarMotionProfile,
+    _transition_distance,
+    build_distance_profile,
+)
+from trajectory_engine.models.trajectory_primitives import SegmentDynamicPhaseKind
+
+
+# Part du budget d'accélération d'axe laissée au terme centripète q''(s)·ṡ²
+TOPP_CENTRIPETAL_SHARE = 0.5
+# Tronçons fusionnés tant que leurs plafonds restent dans ce rapport
+TOPP_CHUNK_MERGE_RATIO = 0.9
+TOPP_MAX_REFINEMENT_PASSES = 8
+TOPP_REFINEMENT_MARGIN = 0.03
+TOPP_CHECK_DT_S = 0.002
+_EPS = 1e-9
+
+
+@dataclass
+class JointPathDerivatives:
+    """Dérivées du chemin articulaire par rapport à l'abscisse curviligne (deg/mm, deg/mm², deg/mm³)."""
+    distances_mm: np.ndarray
+    first: np.ndarray
+    second: np.ndarray
+    third: np.ndarray
+
+    @classmethod
+    def from_samples(cls, distances_mm: np.ndarray, joints_deg: np.ndarray) -> JointPathDerivatives:
+        distances = np.asarray(distances_mm, dtype=float)
+        joints = np.asarray(joints_deg, dtype=float)
+        edge_order = 2 if len(distances) >= 3 else 1
+        first = np.gradient(joints, distances, axis=0, edge_order=edge_order)
+        second = np.gradient(first, distances, axis=0, edge_order=edge_order)
+        third = np.gradient(second, distances, axis=0, edge_order=edge_order)
+        return cls(distances, first, second, third)
+
+    def at(self, positions_mm: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Interpolation linéaire des trois dérivées aux abscisses données (M,) -> 3 x (M, 6)."""
+        positions = np.clip(np.asarray(positions_mm, dtype=float), self.distances_mm[0], self.distances_mm[-1])
+        index = np.clip(np.searchsorted(self.distances_mm, positions, side="right") - 1, 0, len(self.distances_mm) - 2)
+        span = np.maximum(self.distances_mm[index + 1] - self.distances_mm[index], _EPS)
+        weight = ((positions - self.distances_mm[index]) / span)[:, None]
+        return tuple(values[index] * (1.0 - weight) + values[index + 1] * weight for values in (self.first, self.second, self.third))
+
+
+@dataclass
+class _PathChunk:
+    start_mm: float
+    end_mm: float
+    speed_limit: float
+    accel_limit: float
+    jerk_limit: float
+
+    def length_mm(self) -> float:
+        return self.end_mm - self.start_mm
+
+
+def path_dynamic_limits(
+    derivatives: JointPathDerivatives,
+    target_speed_mm_s: float,
+    speed_limits: np.ndarray,
+    accel_limits: np.ndarray,
+    jerk_limits: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Limites de vitesse, d'accélération et de jerk le long du chemin, projetées depuis les axes.
+
+    |q'|·ṡ ≤ v, |q'·s̈ + q''·ṡ²| ≤ a et |q'|·s⃛ ≤ j par axe, évalués sur tous les
+    échantillons à la fois. Le terme centripète est borné par TOPP_CENTRIPETAL_SHARE et,
+    à vitesse constante, |q'''|·ṡ³ seul ne doit pas dépasser le jerk d'axe.
+    """
+    first = np.abs(derivatives.first)
+    second = np.abs(derivatives.second)
+    third = np.abs(derivatives.third)
+    with np.errstate(divide="ignore"):
+        speed_cap = np.min(np.where(first > _EPS, speed_limits / first, np.inf), axis=1)
+        centripetal_cap = np.sqrt(np.min(np.where(second > _EPS, TOPP_CENTRIPETAL_SHARE * accel_limits / second, np.inf), axis=1))
+        speed = np.minimum(max(0.0, float(target_speed_mm_s)), np.minimum(speed_cap, centripetal_cap))
+        if jerk_limits is not None:
+            curvature_rate_cap = np.cbrt(np.min(np.where(third > _EPS, jerk_limits / third, np.inf), axis=1))
+            speed = np.minimum(speed, curvature_rate_cap)
+        remaining_accel = np.maximum(accel_limits - second * (speed * speed)[:, None], 0.0)
+        accel = np.min(np.where(first > _EPS, remaining_accel / first, np.inf), axis=1)
+        if jerk_limits is None:
+            jerk = np.full(len(speed), np.inf)
+        else:
+            jerk = np.min(np.where(first > _EPS, jerk_limits / first, np.inf), axis=1)
+    return speed, accel, jerk
+
+
+def _path_chunks(distances_mm: np.ndarray, speed: np.ndarray, accel: np.ndarray, jerk: np.ndarray) -> list[_PathChunk]:
+    # Plafond d'un intervalle : le plus contraignant de ses deux extrémités.
+    interval_speed = np.minimum(speed[:-1], speed[1:])
+    interval_accel = np.minimum(accel[:-1], accel[1:])
+    interval_jerk = np.minimum(jerk[:-1], jerk[1:])
+    chunks: list[_PathChunk] = []
+    high_speed = high_accel = 0.0
+    for index in range(len(interval_speed)):
+        start, end = float(distances_mm[index]), float(distances_mm[index + 1])
+        values = float(interval_speed[index]), float(interval_accel[index]), float(interval_jerk[index])
+        if chunks:
+            chunk = chunks[-1]
+            merged_speed = min(chunk.speed_limit, values[0])
+            merged_accel = min(chunk.accel_limit, values[1])
+            if (
+                merged_speed >= TOPP_CHUNK_MERGE_RATIO * max(high_speed, values[0])
+                and merged_accel >= TOPP_CHUNK_MERGE_RATIO * max(high_accel, values[1])
+            ):
+                chunk.end_mm = end
+                chunk.speed_limit = merged_speed
+                chunk.accel_limit = merged_accel
+                chunk.jerk_limit = min(chunk.jerk_limit, values[2])
+                high_speed = max(high_speed, values[0])
+                high_accel = max(high_accel, values[1])
+                continue
+        chunks.append(_PathChunk(start, end, *values))
+        high_speed, high_accel = values[0], values[1]
+    return chunks
+
+
+def _reachable_speed(start_speed: float, length_mm: float, cap: float, accel_limit: float, jerk_limit: float) -> float:
+    """Vitesse maximale (≤ cap) atteignable depuis start_speed sur length_mm avec une transition en S."""
+    if cap <= start_speed or _transition_distance(start_speed, cap, accel_limit, jerk_limit) <= length_mm:
+        return cap
+    low, high = start_speed, cap
+    for _ in range(48):
+        mid = 0.5 * (low + high)
+        if _transition_distance(start_speed, mid, accel_limit, jerk_limit) <= length_mm:
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+def _boundary_speeds(chunks: list[_PathChunk], entry_speed: float, exit_speed: float) -> list[float]:
+    speeds = [min(entry_speed, chunks[0].speed_limit)]
+    speeds.extend(min(chunks[k].speed_limit, chunks[k + 1].speed_limit) for k in range(len(chunks) - 1))
+    speeds.append(min(exit_speed, chunks[-1].speed_limit))
+    # Passe arrière (décélérations à anticiper) puis passe avant (accélérations atteignables)
+    for k in range(len(chunks) - 1, -1, -1):
+        chunk = chunks[k]
+        speeds[k] = min(speeds[k], _reachable_speed(speeds[k + 1], chunk.length_mm(), speeds[k], chunk.accel_limit, chunk.jerk_limit))
+    for k, chunk in enumerate(chunks):
+        speeds[k + 1] = min(speeds[k + 1], _reachable_speed(speeds[k], chunk.length_mm(), speeds[k + 1], chunk.accel_limit, chunk.jerk_limit))
+    return speeds
+
+
+def _assemble_profile(segment_index: int, chunks: list[_PathChunk], boundary_speeds: list[float], start_time_s: float) -> ScalarMotionProfile:
+    phases: list[ScalarMotionPhase] = []
+    cursor_time = float(start_time_s)
+    for k, chunk in enumerate(chunks):
+        chunk_profile = build_distance_profile(
+            segment_index=segment_index,
+            length_mm=chunk.length_mm(),
+            target_speed_mm_s=chunk.speed_limit,
+            entry_speed_mm_s=boundary_speeds[k],
+            exit_speed_mm_s=boundary_speeds[k + 1],
+            accel_limit_mm_s2=chunk.accel_limit,
+            jerk_limit_mm_s3=chunk.jerk_limit,
+            start_time_s=cursor_time,
+            start_position_mm=chunk.start_mm,
+        )
+        phases.extend(phase for phase in chunk_profile.phases if phase.duration_s > _EPS)
+        cursor_time = chunk_profile.duration_s
+    if not phases:
+        phases.append(
+            ScalarMotionPhase(
+                kind=SegmentDynamicPhaseKind.TRANSITION,
+                segment_index=segment_index,
+                start_time_s=start_time_s,
+                duration_s=0.0,
+                start_position=0.0,
+                start_speed=0.0,
+                end_speed=0.0,
+            )
+        )
+    return ScalarMotionProfile(phases)
+
+
+def axis_limit_ratios(
+    profile: ScalarMotionProfile,
+    derivatives: JointPathDerivatives,
+    speed_limits: np.ndarray,
+    accel_limits: np.ndarray,
+    jerk_limits: np.ndarray | None,
+    check_dt_s: float = TOPP_CHECK_DT_S,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Rapports |q̇|/v, |q̈|/a et |q⃛|/j (max sur les axes) sur une grille temporelle du profil.
+
+    Retourne (positions, vitesse, accélération, jerk) ; la règle de dérivation en chaîne
+    q̈ = q'·s̈ + q''·ṡ² et q⃛ = q'·s⃛ + 3·q''·ṡ·s̈ + q'''·ṡ³ est évaluée vectoriellement.
+    """
+    start = profile.phases[0].start_time_s if profile.phases else 0.0
+    count = max(2, int(math.ceil((profile.duration_s - start) / max(check_dt_s, _EPS))) + 1)
+    states = [profile.evaluate(float(time_s)) for time_s in np.linspace(start, profile.duration_s, count)]
+    position = np.array([state.position for state in states])
+    velocity = np.array([state.velocity for state in states])[:, None]
+    acceleration = np.array([state.acceleration for state in states])[:, None]
+    jerk = np.array([state.jerk for state in states])[:, None]
+    first, second, third = derivatives.at(position)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speed_ratio = np.max(np.abs(first * velocity) / speed_limits, axis=1)
+        accel_ratio = np.max(np.abs(first * acceleration + second * velocity**2) / accel_limits, axis=1)
+        if jerk_limits is None:
+            jerk_ratio = np.zeros(len(position))
+        else:
+            axis_jerk = first * jerk + 3.0 * second * velocity * acceleration + third * velocity**3
+            jerk_ratio = np.max(np.abs(axis_jerk) / jerk_limits, axis=1)
+    return position, np.nan_to_num(speed_ratio), np.nan_to_num(accel_ratio), np.nan_to_num(jerk_ratio)
+
+
+def build_time_optimal_profile(
+    segment_index: int,
+    distances_mm: np.ndarray,
+    joints_deg: np.ndarray,
+    target_speed_mm_s: float,
+    entry_speed_mm_s: float,
+    exit_speed_mm_s: float,
+    speed_limits: list[float],
+    accel_limits: list[float],
+    jerk_limits: list[float] | None,
+    start_time_s: float = 0.0,
+) -> ScalarMotionProfile:
+    """Profil d'abscisse curviligne le plus rapide respectant les limites d'axes le long du chemin.
+
+    Adaptation à jerk borné de la paramétrisation temps-optimale (TOPP-RA) : les limites
+    d'axes sont projetées sur le chemin échantillonné (distances (N,), articulaires (N, 6)),
+    le chemin est découpé en tronçons de plafonds homogènes, les vitesses de jonction sont
+    fixées par passes arrière/avant puis chaque tronçon reçoit les transitions en S usuelles.
+    Une vérification a posteriori resserre les tronçons encore en dépassement.
+    """
+    speed_array = np.maximum(np.asarray(speed_limits[:6], dtype=float), _EPS)
+    accel_array = np.maximum(np.asarray(accel_limits[:6], dtype=float), _EPS)
+    jerk_array = None if jerk_limits is None else np.maximum(np.asarray(jerk_limits[:6], dtype=float), _EPS)
+    derivatives = JointPathDerivatives.from_samples(distances_mm, joints_deg)
+    speed, accel, jerk = path_dynamic_limits(derivatives, target_speed_mm_s, speed_array, accel_array, jerk_array)
+    chunks = _path_chunks(derivatives.distances_mm, speed, accel, jerk)
+    entry_speed = max(0.0, float(entry_speed_mm_s))
+    exit_speed = max(0.0, float(exit_speed_mm_s))
+
+    profile = _assemble_profile(segment_index, chunks, _boundary_speeds(chunks, entry_speed, exit_speed), start_time_s)
+    starts = np.array([chunk.start_mm for chunk in chunks])
+    for _ in range(TOPP_MAX_REFINEMENT_PASSES):
+        position, speed_ratio, accel_ratio, jerk_ratio = axis_limit_ratios(profile, derivatives, speed_array, accel_array, jerk_array)
+        chunk_index = np.clip(np.searchsorted(starts, position, side="right") - 1, 0, len(chunks) - 1)
+        worst = np.zeros((len(chunks), 3))
+        np.maximum.at(worst, chunk_index, np.stack([speed_ratio, accel_ratio, jerk_ratio], axis=1))
+        if np.all(worst <= 1.0):
+            break
+        scale = 1.0 + TOPP_REFINEMENT_MARGIN
+        for chunk, (ratio_speed, ratio_accel, ratio_jerk) in zip(chunks, worst):
+            # Les termes en q''·ṡ² et q'''·ṡ³ ne baissent qu'avec la vitesse : elle est réduite aussi.
+            if ratio_speed > 1.0:
+                chunk.speed_limit /= ratio_speed * scale
+            if ratio_accel > 1.0:
+                chunk.accel_limit /= ratio_accel * scale
+                chunk.speed_limit /= math.sqrt(ratio_accel * scale)
+            if ratio_jerk > 1.0:
+                chunk.jerk_limit /= ratio_jerk * scale
+                chunk.speed_limit /= math.cbrt(ratio_jerk * scale)
+        profile = _assemble_profile(segment_index, chunks, _boundary_speeds(chunks, entry_speed, exit_speed), start_time_s)
+    return profile
+
+
+__all__ = [
+    "JointPathDerivatives",
+    "TOPP_CENTRIPETAL_SHARE",
+    "axis_limit_ratios",
+    "build_time_optimal_profile",
+    "path_dynamic_limits",
+]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from models.types import XYZ3
 from trajectory_engine.models.trajectory_primitives import Bezier7Coefficients3D, Bezier7ControlPoints3D
 
@@ -41,10 +43,29 @@ def _combine(
     )
 
 
+def _horner(terms: list[XYZ3], u: float) -> XYZ3:
+    """Somme des terms[k] * u**k (schéma de Horner)."""
+    result = terms[-1]
+    for term in reversed(terms[:-1]):
+        result = _add(_scale(result, u), term)
+    return result
+
+
 class Bezier7Curve3D:
     def __init__(self, control_points: Bezier7ControlPoints3D) -> None:
         self.control_points = control_points
         self.coefficients = self._compute_coefficients(control_points)
+        c = self.coefficients
+        # Lignes a0..a7 (8 x 3) pour l'évaluation vectorisée sur un tableau de paramètres.
+        self._coefficient_rows = np.array(
+            [[a.x, a.y, a.z] for a in (c.a0, c.a1, c.a2, c.a3, c.a4, c.a5, c.a6, c.a7)],
+            dtype=float,
+        )
+        self._derivative_rows = self._coefficient_rows[1:] * np.arange(1.0, 8.0)[:, None]
+        # |dB/du|² est un polynôme de degré 12 : une seule évaluation scalaire par paramètre.
+        self._speed_squared_coefficients = sum(
+            np.convolve(self._derivative_rows[:, axis], self._derivative_rows[:, axis]) for axis in range(3)
+        )
 
     @staticmethod
     def _compute_coefficients(points: Bezier7ControlPoints3D) -> Bezier7Coefficients3D:
@@ -135,63 +156,51 @@ class Bezier7Curve3D:
     def first_derivative(self, u: float) -> XYZ3:
         u = max(0.0, min(1.0, float(u)))
         c = self.coefficients
-        return _add(
-            _scale(
-                _add(
-                    _scale(
-                        _add(
-                            _scale(
-                                _add(
-                                    _scale(
-                                        _add(_scale(_add(_scale(c.a7, 7.0), _scale(c.a6, 6.0)), u),
-                                             _scale(c.a5, 5.0)),
-                                        u,
-                                    ),
-                                    _scale(c.a4, 4.0),
-                                ),
-                                u,
-                            ),
-                            _scale(c.a3, 3.0),
-                        ),
-                        u,
-                    ),
-                    _scale(c.a2, 2.0),
-                ),
-                u,
-            ),
-            c.a1,
+        return _horner(
+            [c.a1, _scale(c.a2, 2.0), _scale(c.a3, 3.0), _scale(c.a4, 4.0), _scale(c.a5, 5.0), _scale(c.a6, 6.0), _scale(c.a7, 7.0)],
+            u,
         )
 
     def second_derivative(self, u: float) -> XYZ3:
         u = max(0.0, min(1.0, float(u)))
         c = self.coefficients
-        return _add(
-            _scale(
-                _add(
-                    _scale(
-                        _add(
-                            _scale(_add(_scale(_add(_scale(c.a7, 42.0), _scale(c.a6, 30.0)), u), _scale(c.a5, 20.0)), u),
-                            _scale(c.a4, 12.0),
-                        ),
-                        u,
-                    ),
-                    _scale(c.a3, 6.0),
-                ),
-                u,
-            ),
-            _scale(c.a2, 2.0),
+        return _horner(
+            [_scale(c.a2, 2.0), _scale(c.a3, 6.0), _scale(c.a4, 12.0), _scale(c.a5, 20.0), _scale(c.a6, 30.0), _scale(c.a7, 42.0)],
+            u,
         )
 
     def third_derivative(self, u: float) -> XYZ3:
         u = max(0.0, min(1.0, float(u)))
         c = self.coefficients
-        return _add(
-            _scale(
-                _add(
-                    _scale(_add(_scale(_add(_scale(c.a7, 210.0), _scale(c.a6, 120.0)), u), _scale(c.a5, 60.0)), u),
-                    _scale(c.a4, 24.0),
-                ),
-                u,
-            ),
-            _scale(c.a3, 6.0),
+        return _horner(
+            [_scale(c.a3, 6.0), _scale(c.a4, 24.0), _scale(c.a5, 60.0), _scale(c.a6, 120.0), _scale(c.a7, 210.0)],
+            u,
         )
+
+    @staticmethod
+    def _horner_rows(rows: np.ndarray, u_values) -> np.ndarray:
+        u = np.clip(np.asarray(u_values, dtype=float).reshape(-1), 0.0, 1.0)
+        # Calcul en (3, N) : opérations contiguës sur chaque coordonnée.
+        result = np.repeat(rows[-1][:, None], u.shape[0], axis=1)
+        for row in rows[-2::-1]:
+            result *= u
+            result += row[:, None]
+        return result.T
+
+    def points(self, u_values) -> np.ndarray:
+        """Positions (N x 3) pour un tableau de paramètres u (bornés à [0, 1] comme point())."""
+        return self._horner_rows(self._coefficient_rows, u_values)
+
+    def first_derivatives(self, u_values) -> np.ndarray:
+        """Dérivées premières dB/du (N x 3) pour un tableau de paramètres u."""
+        return self._horner_rows(self._derivative_rows, u_values)
+
+    def speeds(self, u_values) -> np.ndarray:
+        """Normes |dB/du| (mm par unité de u), intégrande de l'abscisse curviligne."""
+        u = np.clip(np.asarray(u_values, dtype=float).reshape(-1), 0.0, 1.0)
+        coefficients = self._speed_squared_coefficients
+        squared = np.full_like(u, coefficients[-1])
+        for coefficient in coefficients[-2::-1]:
+            squared *= u
+            squared += coefficient
+        return np.sqrt(np.maximum(squared, 0.0))
@@ -28,6 +28,10 @@ from trajectory_engine.models.pipeline import (
 )
 from trajectory_engine.workers.full_trajectory_worker import FullTrajectoryWorker
 from trajectory_engine.workers.preview_worker import PreviewWorker
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 @dataclass
@@ -141,6 +145,9 @@ class TrajectoryBuildManager(QObject):
             cartesian_accel_limit_mm_s2=float(request.cartesian_accel_limit_mm_s2),
             cartesian_jerk_limit_mm_s3=float(request.cartesian_jerk_limit_mm_s3),
             trigger_mode=request.trigger_mode,
+            time_optimal_enabled=bool(request.time_optimal_enabled),
+            adaptive_sampling_enabled=bool(request.adaptive_sampling_enabled),
+            singularity_thresholds=request.singularity_thresholds,
         )
         self._cancel_previous_work(previous_revision_id)
 
@@ -316,6 +323,7 @@ class TrajectoryBuildManager(QObject):
         return
 
     def _on_full_completed(self, revision_id: int, payload: object) -> None:
+        _SPANS.async_end("full_result_delivery", revision_id, "signal")
         if revision_id != self._active_revision_id:
             return
         if not isinstance(payload, TrajectoryResult):
@@ -6,6 +6,10 @@ from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
 from trajectory_engine.models.pipeline import BuildCancelToken, ValidationResult, ValidationTask
 from trajectory_engine.workers.validity_worker import ValidityWorker
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 class _WorkerDispatchProxy(QObject):
@@ -58,6 +62,7 @@ class ValidityAnalyzerManager(QObject):
         self._task_to_revision[task.task_id] = task.revision_id
         worker_index = self._next_worker_index % len(self._dispatchers)
         self._next_worker_index += 1
+        _SPANS.async_begin("validity_task_queued", task.task_id, "signal", worker=worker_index)
         self._dispatchers[worker_index].dispatch.emit(task, token)
 
     def cancel_revision(self, revision_id: int) -> None:
@@ -93,6 +98,7 @@ class ValidityAnalyzerManager(QObject):
     def _on_worker_completed(self, revision_id: int, payload: object) -> None:
         if not isinstance(payload, ValidationResult):
             return
+        _SPANS.async_end("validity_result_delivery", payload.task_id, "signal")
         if not self._consume_task(revision_id, payload.task_id):
             return
         self.result_ready.emit(revision_id, payload)
@@ -1,3 +1,3 @@
-from trajectory_engine.runtime.evaluator import RuntimeEvaluator
+from trajectory_engine.runtime.evaluator import RuntimeEvaluator, evaluate_pose_at_distance, evaluate_poses_at_distances
 
-__all__ = ["RuntimeEvaluator"]
+__all__ = ["RuntimeEvaluator", "evaluate_pose_at_distance", "evaluate_poses_at_distances"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
+
 from models.types import Pose6, XYZ3
-from trajectory_engine.arc_length import parameter_at_distance
+from trajectory_engine.arc_length import parameter_at_distance, parameters_at_distances
 from trajectory_engine.dynamics import ScalarMotionProfile, normalized_s_curve
 from trajectory_engine.models.trajectory_primitives import RuntimeSegment
 
@@ -20,6 +22,62 @@ def _shortest_angle_delta_deg(from_deg: float, to_deg: float) -> float:
     return delta
 
 
+def evaluate_pose_at_distance(segment: RuntimeSegment, distance_mm: float) -> Pose6:
+    """Pose du segment à une abscisse curviligne donnée (position sur la courbe, orientation en S)."""
+    local_distance_mm = max(0.0, min(segment.speed_profile.length_mm, float(distance_mm)))
+    if segment.curve is not None and segment.arc_lut is not None:
+        u = parameter_at_distance(segment.arc_lut, local_distance_mm)
+        point: XYZ3 = segment.curve.point(u)
+    else:
+        length = max(1e-9, segment.speed_profile.length_mm)
+        u = max(0.0, min(1.0, local_distance_mm / length))
+        point = XYZ3(
+            segment.start_pose.x + (segment.end_pose.x - segment.start_pose.x) * u,
+            segment.start_pose.y + (segment.end_pose.y - segment.start_pose.y) * u,
+            segment.start_pose.z + (segment.end_pose.z - segment.start_pose.z) * u,
+        )
+
+    orientation_u = normalized_s_curve(
+        0.0 if segment.speed_profile.length_mm <= 1e-9 else local_distance_mm / segment.speed_profile.length_mm
+    )
+    d_a = _shortest_angle_delta_deg(segment.start_pose.a, segment.end_pose.a)
+    d_b = _shortest_angle_delta_deg(segment.start_pose.b, segment.end_pose.b)
+    d_c = _shortest_angle_delta_deg(segment.start_pose.c, segment.end_pose.c)
+    return Pose6(
+        point.x,
+        point.y,
+        point.z,
+        _wrap_angle_deg(segment.start_pose.a + d_a * orientation_u),
+        _wrap_angle_deg(segment.start_pose.b + d_b * orientation_u),
+        _wrap_angle_deg(segment.start_pose.c + d_c * orientation_u),
+    )
+
+
+def _wrap_angles_deg(angles_deg: np.ndarray) -> np.ndarray:
+    wrapped = (angles_deg + 180.0) % 360.0 - 180.0
+    return np.where((wrapped == -180.0) & (angles_deg > 0.0), 180.0, wrapped)
+
+
+def evaluate_poses_at_distances(segment: RuntimeSegment, distances_mm) -> np.ndarray:
+    """Poses (N x 6) pour un lot d'abscisses : inversion de la table et évaluation de la courbe vectorisées."""
+    length_mm = segment.speed_profile.length_mm
+    local = np.clip(np.asarray(distances_mm, dtype=float).reshape(-1), 0.0, max(0.0, length_mm))
+    start = np.array(segment.start_pose.to_list(), dtype=float)
+    end = np.array(segment.end_pose.to_list(), dtype=float)
+    if segment.curve is not None and segment.arc_lut is not None:
+        points = segment.curve.points(parameters_at_distances(segment.arc_lut, local))
+    else:
+        u = np.clip(local / max(1e-9, length_mm), 0.0, 1.0)
+        points = start[None, :3] + (end[:3] - start[:3])[None, :] * u[:, None]
+
+    ratio = np.zeros_like(local) if length_mm <= 1e-9 else np.clip(local / length_mm, 0.0, 1.0)
+    # normalized_s_curve appliquée au lot
+    orientation_u = ratio**4 * (35.0 - 84.0 * ratio + 70.0 * ratio**2 - 20.0 * ratio**3)
+    deltas = np.array([_shortest_angle_delta_deg(start[axis], end[axis]) for axis in range(3, 6)])
+    angles = _wrap_angles_deg(start[None, 3:] + deltas[None, :] * orientation_u[:, None])
+    return np.hstack((points, angles))
+
+
 class RuntimeEvaluator:
     def __init__(self, runtime_segment: RuntimeSegment, profile: ScalarMotionProfile) -> None:
         self.runtime_segment = runtime_segment
@@ -27,31 +85,4 @@ class RuntimeEvaluator:
 
     def evaluate_pose(self, time_s: float) -> Pose6:
         state = self.profile.evaluate(time_s)
-        segment = self.runtime_segment
-        local_distance_mm = max(0.0, min(segment.speed_profile.length_mm, state.position))
-        if segment.curve is not None and segment.arc_lut is not None:
-            u = parameter_at_distance(segment.arc_lut, local_distance_mm)
-            point: XYZ3 = segment.curve.point(u)
-        else:
-            length = max(1e-9, segment.speed_profile.length_mm)
-            u = max(0.0, min(1.0, local_distance_mm / length))
-            point = XYZ3(
-                segment.start_pose.x + (segment.end_pose.x - segment.start_pose.x) * u,
-                segment.start_pose.y + (segment.end_pose.y - segment.start_pose.y) * u,
-                segment.start_pose.z + (segment.end_pose.z - segment.start_pose.z) * u,
-            )
-
-        orientation_u = normalized_s_curve(
-            0.0 if segment.speed_profile.length_mm <= 1e-9 else local_distance_mm / segment.speed_profile.length_mm
-        )
-        d_a = _shortest_angle_delta_deg(segment.start_pose.a, segment.end_pose.a)
-        d_b = _shortest_angle_delta_deg(segment.start_pose.b, segment.end_pose.b)
-        d_c = _shortest_angle_delta_deg(segment.start_pose.c, segment.end_pose.c)
-        return Pose6(
-            point.x,
-            point.y,
-            point.z,
-            _wrap_angle_deg(segment.start_pose.a + d_a * orientation_u),
-            _wrap_angle_deg(segment.start_pose.b + d_b * orientation_u),
-            _wrap_angle_deg(segment.start_pose.c + d_c * orientation_u),
-        )
+        return evaluate_pose_at_distance(self.runtime_segment, state.position)
@@ -1,3 +1,9 @@
+from trajectory_engine.sampling.adaptive import (
+    AdaptiveSamplingPolicy,
+    is_fixed_dt,
+    joints_at_time,
+    resample_fixed_dt,
+)
 from trajectory_engine.sampling.differentiation import (
     update_articular_dynamics,
     update_cartesian_dynamics,
@@ -6,6 +12,10 @@ from trajectory_engine.sampling.differentiation import (
 )
 
 __all__ = [
+    "AdaptiveSamplingPolicy",
+    "is_fixed_dt",
+    "joints_at_time",
+    "resample_fixed_dt",
     "update_articular_dynamics",
     "update_cartesian_dynamics",
     "reset_articular_dynamics",
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+import copy
+from dataclasses import dataclass
+from typing import Callable
+
+from trajectory_engine.models.pipeline import TrajectorySample, TrajectorySampleErrorCode
+
+
+_DYNAMIC_FIELDS = (
+    "cartesian_velocity",
+    "cartesian_acceleration",
+    "cartesian_jerk",
+    "articular_velocity",
+    "articular_acceleration",
+    "articular_jerk",
+)
+_TIME_EPS_S = 1e-9
+
+
+@dataclass
+class AdaptiveSamplingPolicy:
+    """Critères de raffinement de l'échantillonnage adaptatif, en ticks de l'horloge du builder.
+
+    Un segment est d'abord échantillonné tous les max_stride_ticks (plus quelques ticks
+    denses à chaque extrémité), puis chaque intervalle est coupé en deux tant que son
+    milieu s'écarte de l'interpolation linéaire des articulaires, approche une
+    singularité poignet, change de configuration, porte une erreur ou, si une sonde est
+    fournie (ex. ValidityAnalyzer.analyze_sample), passe sous la garde de dégagement.
+    """
+    max_stride_ticks: int = 16
+    boundary_ticks: int = 3
+    joint_tolerance_deg: float = 0.02
+    wrist_singularity_deg: float = 10.0
+    clearance_refine_mm: float = 50.0
+    clearance_probe: Callable[[TrajectorySample], float | None] | None = None
+
+    def coarse_indices(self, tick_count: int) -> list[int]:
+        if tick_count <= 0:
+            return []
+        stride = max(1, int(self.max_stride_ticks))
+        boundary = max(1, int(self.boundary_ticks))
+        indices = set(range(0, tick_count, stride))
+        indices.update(range(min(tick_count, boundary)))
+        indices.update(range(max(0, tick_count - boundary), tick_count))
+        return sorted(indices)
+
+    def needs_refinement(
+        self,
+        left: TrajectorySample,
+        middle: TrajectorySample,
+        right: TrajectorySample,
+        ratio: float,
+    ) -> bool:
+        samples = (left, middle, right)
+        if any(not sample.reachable or sample.error_code != TrajectorySampleErrorCode.NONE for sample in samples):
+            return True
+        if len({sample.configuration for sample in samples}) > 1:
+            return True
+        for axis in range(6):
+            expected = left.joints[axis] + (right.joints[axis] - left.joints[axis]) * ratio
+            if abs(middle.joints[axis] - expected) > self.joint_tolerance_deg:
+                return True
+        if any(abs(float(sample.joints[4])) < self.wrist_singularity_deg for sample in samples):
+            return True
+        if self.clearance_probe is not None:
+            for sample in samples:
+                clearance_mm = self.clearance_probe(sample)
+                if clearance_mm is not None and clearance_mm < self.clearance_refine_mm:
+                    return True
+        return False
+
+
+def is_fixed_dt(samples: list, sample_dt_s: float) -> bool:
+    """Vrai si les échantillons se suivent au pas fixe (aucun tick sauté)."""
+    limit = 1.5 * float(sample_dt_s)
+    return all(samples[i + 1].time - samples[i].time <= limit for i in range(len(samples) - 1))
+
+
+def _interpolate_sample(left, right, time_s: float, pose_of: Callable[[list[float]], list[float] | None] | None):
+    ratio = (time_s - left.time) / max(_TIME_EPS_S, right.time - left.time)
+    sample = copy.copy(left)
+    sample.time = float(time_s)
+    sample.kinematics = None
+    sample.dynamic_violations = list(left.dynamic_violations)
+    sample.collisions = list(left.collisions)
+    sample.mgi_solutions = {}
+    interpolable = left.reachable and right.reachable and left.configuration == right.configuration
+    if not interpolable:
+        sample.joints = list(left.joints)
+        sample.pose = list(left.pose)
+        return sample
+    sample.joints = [a + (b - a) * ratio for a, b in zip(left.joints, right.joints)]
+    pose = pose_of(sample.joints) if pose_of is not None else None
+    sample.pose = list(pose) if pose is not None else [a + (b - a) * ratio for a, b in zip(left.pose, right.pose)]
+    for name in _DYNAMIC_FIELDS:
+        setattr(sample, name, [a + (b - a) * ratio for a, b in zip(getattr(left, name), getattr(right, name))])
+    sample.velocity = left.velocity + (right.velocity - left.velocity) * ratio
+    sample.acceleration = left.acceleration + (right.acceleration - left.acceleration) * ratio
+    return sample
+
+
+def resample_fixed_dt(
+    samples: list,
+    sample_dt_s: float,
+    pose_of: Callable[[list[float]], list[float] | None] | None = None,
+) -> list:
+    """Sortie au pas fixe (export) à partir d'échantillons adaptatifs.
+
+    Les ticks absents sont interpolés linéairement entre leurs voisins calculés (articulaires
+    et dynamiques) ; pose_of recalcule la pose par MGD. Les échantillons calculés sont
+    conservés tels quels, et une liste déjà au pas fixe est retournée inchangée.
+    """
+    if len(samples) < 2 or is_fixed_dt(samples, sample_dt_s):
+        return list(samples)
+    dt = float(sample_dt_s)
+    dense = [samples[0]]
+    for left, right in zip(samples, samples[1:]):
+        steps = int(round((right.time - left.time) / dt))
+        for step in range(1, steps):
+            dense.append(_interpolate_sample(left, right, left.time + step * dt, pose_of))
+        dense.append(right)
+    return dense
+
+
+def joints_at_time(samples: list, sample_times: list[float], time_s: float) -> list[float] | None:
+    """Articulaires interpolées à time_s pour l'affichage (échantillon voisin si non interpolable)."""
+    if not samples:
+        return None
+    index = bisect_right(sample_times, float(time_s))
+    if index <= 0:
+        return list(samples[0].joints)
+    if index >= len(samples):
+        return list(samples[-1].joints)
+    left, right = samples[index - 1], samples[index]
+    if not (left.reachable and right.reachable and left.configuration == right.configuration):
+        nearest = left if time_s - left.time <= right.time - time_s else right
+        return list(nearest.joints)
+    ratio = (float(time_s) - left.time) / max(_TIME_EPS_S, right.time - left.time)
+    return [a + (b - a) * ratio for a, b in zip(left.joints, right.joints)]
+
+
+__all__ = [
+    "AdaptiveSamplingPolicy",
+    "is_fixed_dt",
+    "joints_at_time",
+    "resample_fixed_dt",
+]
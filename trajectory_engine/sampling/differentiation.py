@@ -34,11 +34,24 @@ def reset_articular_dynamics(sample: TrajectorySample) -> None:
     sample.articular_jerk_valid = False
 
 
-def update_cartesian_dynamics(sample: TrajectorySample, previous_sample: TrajectorySample | None, dt_s: float) -> None:
+def _difference_span(dt: float, previous_dt_s: float | None) -> float:
+    # Pas non uniforme (échantillonnage adaptatif) : écart entre les milieux des deux intervalles.
+    if previous_dt_s is None:
+        return dt
+    return max(1e-9, 0.5 * (dt + float(previous_dt_s)))
+
+
+def update_cartesian_dynamics(
+    sample: TrajectorySample,
+    previous_sample: TrajectorySample | None,
+    dt_s: float,
+    previous_dt_s: float | None = None,
+) -> None:
     reset_cartesian_dynamics(sample)
     if previous_sample is None or not sample.reachable or not previous_sample.reachable:
         return
     dt = max(1e-9, float(dt_s))
+    span = _difference_span(dt, previous_dt_s)
     sample.cartesian_velocity[0] = (sample.pose[0] - previous_sample.pose[0]) / dt
     sample.cartesian_velocity[1] = (sample.pose[1] - previous_sample.pose[1]) / dt
     sample.cartesian_velocity[2] = (sample.pose[2] - previous_sample.pose[2]) / dt
@@ -53,7 +66,7 @@ def update_cartesian_dynamics(sample: TrajectorySample, previous_sample: Traject
     for axis in range(6):
         sample.cartesian_acceleration[axis] = (
             sample.cartesian_velocity[axis] - previous_sample.cartesian_velocity[axis]
-        ) / dt
+        ) / span
     sample.cartesian_acceleration_valid = True
     sample.acceleration = _norm3(
         sample.cartesian_acceleration[0],
@@ -66,15 +79,21 @@ def update_cartesian_dynamics(sample: TrajectorySample, previous_sample: Traject
     for axis in range(6):
         sample.cartesian_jerk[axis] = (
             sample.cartesian_acceleration[axis] - previous_sample.cartesian_acceleration[axis]
-        ) / dt
+        ) / span
     sample.cartesian_jerk_valid = True
 
 
-def update_articular_dynamics(sample: TrajectorySample, previous_sample: TrajectorySample | None, dt_s: float) -> None:
+def update_articular_dynamics(
+    sample: TrajectorySample,
+    previous_sample: TrajectorySample | None,
+    dt_s: float,
+    previous_dt_s: float | None = None,
+) -> None:
     reset_articular_dynamics(sample)
     if previous_sample is None or not sample.reachable or not previous_sample.reachable:
         return
     dt = max(1e-9, float(dt_s))
+    span = _difference_span(dt, previous_dt_s)
     for axis in range(6):
         sample.articular_velocity[axis] = (sample.joints[axis] - previous_sample.joints[axis]) / dt
     sample.articular_velocity_valid = True
@@ -84,7 +103,7 @@ def update_articular_dynamics(sample: TrajectorySample, previous_sample: Traject
     for axis in range(6):
         sample.articular_acceleration[axis] = (
             sample.articular_velocity[axis] - previous_sample.articular_velocity[axis]
-        ) / dt
+        ) / span
     sample.articular_acceleration_valid = True
 
     if not previous_sample.articular_acceleration_valid:
@@ -92,5 +111,5 @@ def update_articular_dynamics(sample: TrajectorySample, previous_sample: Traject
     for axis in range(6):
         sample.articular_jerk[axis] = (
             sample.articular_acceleration[axis] - previous_sample.articular_acceleration[axis]
-        ) / dt
+        ) / span
     sample.articular_jerk_valid = True
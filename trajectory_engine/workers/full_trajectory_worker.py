@@ -12,6 +12,10 @@ from trajectory_engine.models.pipeline import (
     TrajectoryResult,
     TrajectorySegment,
 )
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 class FullTrajectoryWorker(QObject):
@@ -33,6 +37,9 @@ class FullTrajectoryWorker(QObject):
         try:
             self._builder.set_cancel_token(cancel_token)
             self._builder.set_jerk_check_enabled(request.jerk_check_enabled)
+            self._builder.set_time_optimal_enabled(request.time_optimal_enabled)
+            self._builder.set_adaptive_sampling(request.adaptive_sampling_enabled)
+            self._builder.set_singularity_thresholds(request.singularity_thresholds)
             self._builder.set_cartesian_dynamic_limits(
                 request.cartesian_accel_limit_mm_s2,
                 request.cartesian_jerk_limit_mm_s3,
@@ -78,6 +85,7 @@ class FullTrajectoryWorker(QObject):
                 return
             status = "completed"
             self.benchmark_finished.emit(request.revision_id, status, time.perf_counter() - start_s)
+            _SPANS.async_begin("full_result_delivery", request.revision_id, "signal")
             self.completed.emit(request.revision_id, result)
         except Exception as exc:
             self.benchmark_finished.emit(request.revision_id, status, time.perf_counter() - start_s)
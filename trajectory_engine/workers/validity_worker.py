@@ -6,6 +6,10 @@ from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from trajectory_engine.core.validity_analyzer import ValidityAnalyzer
 from trajectory_engine.models.pipeline import BuildCancelToken, ValidationTask
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 class ValidityWorker(QObject):
@@ -23,6 +27,7 @@ class ValidityWorker(QObject):
     def process(self, task: object, cancel_token: object) -> None:
         if not isinstance(task, ValidationTask) or not isinstance(cancel_token, BuildCancelToken):
             return
+        _SPANS.async_end("validity_task_queued", task.task_id, "signal")
         start_s = time.perf_counter()
         self.task_started.emit(task.revision_id, task.task_id, self._worker_index, start_s)
         try:
@@ -49,6 +54,7 @@ class ValidityWorker(QObject):
                 finish_s - start_s,
                 finish_s,
             )
+            _SPANS.async_begin("validity_result_delivery", task.task_id, "signal")
             self.completed.emit(task.revision_id, result)
         except Exception as exc:
             finish_s = time.perf_counter()
@@ -109,3 +109,67 @@ def compute_cartesian_jog_target(
 
     abc = math_utils.rotation_matrix_to_euler_zyx(r_new)
     return Pose6(x, y, z, float(abc[0]), float(abc[1]), float(abc[2]))
+
+
+# ============================================================================
+# RÉGION: Jog différentiel (resolved-rate)
+# ============================================================================
+
+# Longueur caractéristique (mm/rad) pondérant les lignes d'orientation de la jacobienne :
+# rend homogènes translation et rotation dans le calcul de l'amortissement.
+JOG_ORIENTATION_SCALE_MM = 500.0
+# Sous cette valeur singulière (mm/deg pondérés), l'amortissement augmente progressivement.
+JOG_SINGULARITY_THRESHOLD = 1.0
+JOG_MAX_DAMPING = 0.5
+
+
+def compute_geometric_jacobian(dh_matrices: list[np.ndarray], axis_reversed: list[int]) -> np.ndarray:
+    """Jacobienne géométrique 6x6 au TCP, en repère base, à partir des repères du MGD.
+
+    `dh_matrices` est la liste produite par RobotModel.compute_fk (identité, repères 1..6,
+    puis TCP). Colonnes en mm/deg (lignes 0-2) et rad/deg (lignes 3-5) par degré
+    articulaire affiché (le sens d'axe inversé est pris en compte).
+    """
+    tcp = np.asarray(dh_matrices[-1], dtype=float)[:3, 3]
+    jacobian = np.zeros((6, 6), dtype=float)
+    deg = np.radians(1.0)
+    for joint_index in range(6):
+        # En DH modifié, l'articulation i tourne autour de z du repère i, dont l'origine
+        # est sur cet axe : repère i+1 de la liste.
+        frame = np.asarray(dh_matrices[joint_index + 1], dtype=float)
+        axis = frame[:3, 2] * float(axis_reversed[joint_index]) * deg
+        jacobian[:3, joint_index] = np.cross(axis, tcp - frame[:3, 3])
+        jacobian[3:, joint_index] = axis
+    return jacobian
+
+
+def compute_pose_twist(current_pose: Pose6, target_pose: Pose6) -> np.ndarray:
+    """Écart [dx, dy, dz (mm), rx, ry, rz (rad)] de `current_pose` vers `target_pose` (repère base)."""
+    r_current = math_utils.euler_to_rotation_matrix(current_pose.a, current_pose.b, current_pose.c, degrees=True)
+    r_target = math_utils.euler_to_rotation_matrix(target_pose.a, target_pose.b, target_pose.c, degrees=True)
+    twist = np.zeros(6, dtype=float)
+    twist[0] = target_pose.x - current_pose.x
+    twist[1] = target_pose.y - current_pose.y
+    twist[2] = target_pose.z - current_pose.z
+    twist[3:] = math_utils.rotation_matrix_to_rotation_vector(r_target @ r_current.T)
+    return twist
+
+
+def compute_damped_joint_increment(jacobian: np.ndarray, twist: np.ndarray) -> tuple[np.ndarray, float]:
+    """Incréments articulaires (deg) par moindres carrés amortis (Nakamura).
+
+    L'amortissement n'est actif qu'à l'approche d'une singularité : loin de celle-ci la
+    solution est exacte, près d'elle les vitesses articulaires restent bornées.
+    Retourne aussi la plus petite valeur singulière (indicateur de proximité).
+    """
+    weights = np.array([1.0, 1.0, 1.0] + [JOG_ORIENTATION_SCALE_MM] * 3, dtype=float)
+    weighted_jacobian = jacobian * weights[:, None]
+    weighted_twist = twist * weights
+    u, s, vt = np.linalg.svd(weighted_jacobian)
+    sigma_min = float(s[-1])
+    damping_sq = 0.0
+    if sigma_min < JOG_SINGULARITY_THRESHOLD:
+        damping_sq = (1.0 - (sigma_min / JOG_SINGULARITY_THRESHOLD) ** 2) * JOG_MAX_DAMPING ** 2
+    gains = s / (s * s + damping_sq)
+    increment = vt.T @ (gains * (u.T @ weighted_twist))
+    return increment, sigma_min
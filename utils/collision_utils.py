@@ -61,6 +61,14 @@ class CollisionShape:
     def center(self) -> np.ndarray:
         return self._local_to_world(self._local_center())
 
+    @property
+    def bounding_radius(self) -> float:
+        if self.shape == PrimitiveColliderShape.BOX:
+            return 0.5 * float(np.sqrt(self.size_x * self.size_x + self.size_y * self.size_y + self.size_z * self.size_z))
+        if self.shape == PrimitiveColliderShape.CYLINDER:
+            return float(np.sqrt(self.radius * self.radius + 0.25 * self.height * self.height))
+        return self.radius
+
     def support(self, direction_world: np.ndarray) -> np.ndarray:
         direction = np.asarray(direction_world, dtype=float)
         if direction.shape != (3,):
@@ -127,6 +135,52 @@ class CollisionPair:
         return self.shape_b.name
 
 
+@dataclass(frozen=True)
+class CollisionDistance:
+    """Signed separation between two shapes; negative values are penetration depths."""
+
+    distance: float
+    point_a: np.ndarray
+    point_b: np.ndarray
+
+    @property
+    def intersecting(self) -> bool:
+        return self.distance <= 0.0
+
+
+@dataclass(frozen=True)
+class CollisionClearance:
+    pair: CollisionPair
+    result: CollisionDistance
+
+    @property
+    def distance(self) -> float:
+        return self.result.distance
+
+
+class GjkWarmStart:
+    """Support directions of the last GJK simplex of a shape pair, replayed on the next query."""
+
+    def __init__(self) -> None:
+        self.directions: list[np.ndarray] = []
+
+
+class CollisionDistanceCache:
+    def __init__(self) -> None:
+        self._warm_starts: dict[tuple[tuple[str, str, int | None], tuple[str, str, int | None]], GjkWarmStart] = {}
+
+    def clear(self) -> None:
+        self._warm_starts.clear()
+
+    def compute_distance(self, shape_a: CollisionShape, shape_b: CollisionShape) -> CollisionDistance:
+        key = (_shape_cache_key(shape_a), _shape_cache_key(shape_b))
+        warm_start = self._warm_starts.get(key)
+        if warm_start is None:
+            warm_start = GjkWarmStart()
+            self._warm_starts[key] = warm_start
+        return compute_distance(shape_a, shape_b, warm_start=warm_start)
+
+
 @dataclass(frozen=True)
 class CollisionShapeTemplate:
     owner: str
@@ -180,6 +234,7 @@ class CollisionWorldCache:
         self.tool_shape_templates: list[CollisionShapeTemplate] = []
         self.robot_shapes_world: list[CollisionShape] = []
         self.tool_shapes_world: list[CollisionShape] = []
+        self.distance_cache = CollisionDistanceCache()
 
     def set_workspace_collision_zones(self, zones: list[PrimitiveColliderData]) -> None:
         self.workspace_shapes_world = build_workspace_collision_shapes(zones)
@@ -255,6 +310,20 @@ class CollisionWorldCache:
         )
         return find_collisions(robot_shapes, self.tool_shapes_world)
 
+    def find_workspace_clearance(self) -> CollisionClearance | None:
+        moving_shapes = [*self.robot_shapes_world, *self.tool_shapes_world]
+        return find_minimum_clearance(moving_shapes, self.workspace_shapes_world, self.distance_cache)
+
+    def find_robot_tool_clearance(
+        self,
+        evaluated_robot_axis_colliders: list[bool] | None = None,
+    ) -> CollisionClearance | None:
+        robot_shapes = filter_robot_shapes_by_evaluated_axes(
+            self.robot_shapes_world,
+            evaluated_robot_axis_colliders,
+        )
+        return find_minimum_clearance(robot_shapes, self.tool_shapes_world, self.distance_cache)
+
     def is_tcp_inside_workspace(self, tcp_world_xyz: np.ndarray) -> bool:
         if not self.workspace_tcp_shapes_world:
             return True
@@ -445,6 +514,37 @@ def intersects(shape_a: CollisionShape, shape_b: CollisionShape, max_iters: int
     return _gjk(shape_a, shape_b, max_iters=max_iters)
 
 
+def compute_distance(
+    shape_a: CollisionShape,
+    shape_b: CollisionShape,
+    warm_start: GjkWarmStart | None = None,
+    max_iters: int = 64,
+    tolerance_mm: float = 1e-3,
+) -> CollisionDistance:
+    return _gjk_distance(shape_a, shape_b, warm_start, max_iters=max_iters, tolerance_mm=tolerance_mm)
+
+
+def find_minimum_clearance(
+    shapes_a: list[CollisionShape],
+    shapes_b: list[CollisionShape],
+    distance_cache: CollisionDistanceCache | None = None,
+) -> CollisionClearance | None:
+    best: CollisionClearance | None = None
+    for shape_a in shapes_a:
+        for shape_b in shapes_b:
+            if shape_a is shape_b:
+                continue
+            if best is not None and _bounding_sphere_gap(shape_a, shape_b) >= best.distance:
+                continue
+            if distance_cache is None:
+                result = compute_distance(shape_a, shape_b)
+            else:
+                result = distance_cache.compute_distance(shape_a, shape_b)
+            if best is None or result.distance < best.distance:
+                best = CollisionClearance(CollisionPair(shape_a, shape_b), result)
+    return best
+
+
 def contains_point(shape: CollisionShape, point_world: np.ndarray) -> bool:
     point = np.asarray(point_world, dtype=float)
     if point.shape != (3,):
@@ -695,11 +795,317 @@ def _any_perpendicular(vector: np.ndarray) -> np.ndarray:
     return np.cross(vector, axis)
 
 
+class _SupportVertex:
+    __slots__ = ("direction", "point_a", "point_b", "w")
+
+    def __init__(self, direction: np.ndarray, point_a: np.ndarray, point_b: np.ndarray) -> None:
+        self.direction = direction
+        self.point_a = point_a
+        self.point_b = point_b
+        self.w = point_a - point_b
+
+
+def _support_vertex(shape_a: CollisionShape, shape_b: CollisionShape, direction: np.ndarray) -> _SupportVertex:
+    direction = np.array(direction, dtype=float)
+    return _SupportVertex(direction, shape_a.support(direction), shape_b.support(-direction))
+
+
+def _shape_cache_key(shape: CollisionShape) -> tuple[str, str, int | None]:
+    return (shape.owner, shape.name, shape.source_index)
+
+
+def _bounding_sphere_gap(shape_a: CollisionShape, shape_b: CollisionShape) -> float:
+    center_gap = float(np.linalg.norm(shape_a.center - shape_b.center))
+    return center_gap - shape_a.bounding_radius - shape_b.bounding_radius
+
+
+def _gjk_distance(
+    shape_a: CollisionShape,
+    shape_b: CollisionShape,
+    warm_start: GjkWarmStart | None,
+    max_iters: int,
+    tolerance_mm: float,
+) -> CollisionDistance:
+    simplex: list[_SupportVertex] = []
+    if warm_start is not None:
+        for direction in warm_start.directions:
+            vertex = _support_vertex(shape_a, shape_b, direction)
+            if all(np.dot(vertex.w - other.w, vertex.w - other.w) > EPSILON for other in simplex):
+                simplex.append(vertex)
+    if not simplex:
+        direction = shape_b.center - shape_a.center
+        if np.linalg.norm(direction) <= EPSILON:
+            direction = np.array([1.0, 0.0, 0.0], dtype=float)
+        simplex.append(_support_vertex(shape_a, shape_b, direction))
+
+    simplex, weights, closest = _closest_on_simplex(simplex)
+    intersecting = len(simplex) == 4
+    for _ in range(max_iters):
+        if intersecting:
+            break
+        closest_sq = float(np.dot(closest, closest))
+        if closest_sq <= EPSILON * EPSILON:
+            intersecting = True
+            break
+        vertex = _support_vertex(shape_a, shape_b, -closest)
+        # Upper bound |v| minus lower bound v.w/|v| of the distance: stop once the gap is within tolerance.
+        if closest_sq - float(np.dot(closest, vertex.w)) <= 2.0 * tolerance_mm * np.sqrt(closest_sq):
+            break
+        if any(np.dot(vertex.w - other.w, vertex.w - other.w) <= EPSILON for other in simplex):
+            break
+        simplex, weights, closest = _closest_on_simplex([*simplex, vertex])
+        intersecting = len(simplex) == 4
+
+    if warm_start is not None:
+        warm_start.directions = [vertex.direction for vertex in simplex]
+
+    if intersecting:
+        return _epa_penetration(shape_a, shape_b, simplex, max_iters=max_iters, tolerance_mm=tolerance_mm)
+
+    point_a = sum((weight * vertex.point_a for weight, vertex in zip(weights, simplex)), np.zeros(3, dtype=float))
+    point_b = sum((weight * vertex.point_b for weight, vertex in zip(weights, simplex)), np.zeros(3, dtype=float))
+    return CollisionDistance(float(np.linalg.norm(closest)), point_a, point_b)
+
+
+def _closest_on_simplex(
+    vertices: list[_SupportVertex],
+) -> tuple[list[_SupportVertex], list[float], np.ndarray]:
+    if len(vertices) == 1:
+        return vertices, [1.0], vertices[0].w
+    if len(vertices) == 2:
+        return _closest_on_segment(vertices[0], vertices[1])
+    if len(vertices) == 3:
+        return _closest_on_triangle(vertices[0], vertices[1], vertices[2])
+    return _closest_on_tetrahedron(vertices[0], vertices[1], vertices[2], vertices[3])
+
+
+def _closest_on_segment(
+    a: _SupportVertex,
+    b: _SupportVertex,
+) -> tuple[list[_SupportVertex], list[float], np.ndarray]:
+    ab = b.w - a.w
+    denom = float(np.dot(ab, ab))
+    if denom <= EPSILON * EPSILON:
+        return [a], [1.0], a.w
+    t = -float(np.dot(a.w, ab)) / denom
+    if t <= 0.0:
+        return [a], [1.0], a.w
+    if t >= 1.0:
+        return [b], [1.0], b.w
+    return [a, b], [1.0 - t, t], a.w + t * ab
+
+
+def _closest_on_triangle(
+    a: _SupportVertex,
+    b: _SupportVertex,
+    c: _SupportVertex,
+) -> tuple[list[_SupportVertex], list[float], np.ndarray]:
+    # Voronoi region walk from Ericson, Real-Time Collision Detection 5.1.5, with the query point at the origin.
+    ab = b.w - a.w
+    ac = c.w - a.w
+    d1 = -float(np.dot(ab, a.w))
+    d2 = -float(np.dot(ac, a.w))
+    if d1 <= 0.0 and d2 <= 0.0:
+        return [a], [1.0], a.w
+
+    d3 = -float(np.dot(ab, b.w))
+    d4 = -float(np.dot(ac, b.w))
+    if d3 >= 0.0 and d4 <= d3:
+        return [b], [1.0], b.w
+
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+        t = d1 / (d1 - d3)
+        return [a, b], [1.0 - t, t], a.w + t * ab
+
+    d5 = -float(np.dot(ab, c.w))
+    d6 = -float(np.dot(ac, c.w))
+    if d6 >= 0.0 and d5 <= d6:
+        return [c], [1.0], c.w
+
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+        t = d2 / (d2 - d6)
+        return [a, c], [1.0 - t, t], a.w + t * ac
+
+    va = d3 * d6 - d5 * d4
+    if va <= 0.0 and (d4 - d3) >= 0.0 and (d5 - d6) >= 0.0:
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        return [b, c], [1.0 - t, t], b.w + t * (c.w - b.w)
+
+    total = va + vb + vc
+    if abs(total) <= EPSILON * EPSILON:
+        candidates = [_closest_on_segment(a, b), _closest_on_segment(a, c), _closest_on_segment(b, c)]
+        return min(candidates, key=lambda candidate: float(np.dot(candidate[2], candidate[2])))
+    v = vb / total
+    w = vc / total
+    return [a, b, c], [1.0 - v - w, v, w], a.w + v * ab + w * ac
+
+
+def _closest_on_tetrahedron(
+    a: _SupportVertex,
+    b: _SupportVertex,
+    c: _SupportVertex,
+    d: _SupportVertex,
+) -> tuple[list[_SupportVertex], list[float], np.ndarray]:
+    best: tuple[list[_SupportVertex], list[float], np.ndarray] | None = None
+    best_sq = float("inf")
+    for face, opposite in (((a, b, c), d), ((a, c, d), b), ((a, d, b), c), ((b, d, c), a)):
+        if not _origin_outside_face(face[0].w, face[1].w, face[2].w, opposite.w):
+            continue
+        candidate = _closest_on_triangle(*face)
+        candidate_sq = float(np.dot(candidate[2], candidate[2]))
+        if candidate_sq < best_sq:
+            best = candidate
+            best_sq = candidate_sq
+    if best is None:
+        return [a, b, c, d], [0.25, 0.25, 0.25, 0.25], np.zeros(3, dtype=float)
+    return best
+
+
+def _origin_outside_face(a: np.ndarray, b: np.ndarray, c: np.ndarray, opposite: np.ndarray) -> bool:
+    normal = np.cross(b - a, c - a)
+    sign_origin = -float(np.dot(a, normal))
+    sign_opposite = float(np.dot(opposite - a, normal))
+    if abs(sign_opposite) <= EPSILON:
+        return True
+    return sign_origin * sign_opposite < 0.0
+
+
+def _epa_penetration(
+    shape_a: CollisionShape,
+    shape_b: CollisionShape,
+    simplex: list[_SupportVertex],
+    max_iters: int,
+    tolerance_mm: float,
+) -> CollisionDistance:
+    vertices = _expand_to_tetrahedron(shape_a, shape_b, simplex)
+    if vertices is None:
+        point_a = np.mean([vertex.point_a for vertex in simplex], axis=0)
+        point_b = np.mean([vertex.point_b for vertex in simplex], axis=0)
+        return CollisionDistance(0.0, point_a, point_b)
+
+    interior = np.mean([vertex.w for vertex in vertices], axis=0)
+    faces: list[tuple[int, int, int]] = []
+    for i, j, k in ((0, 1, 2), (0, 3, 1), (0, 2, 3), (1, 3, 2)):
+        normal = np.cross(vertices[j].w - vertices[i].w, vertices[k].w - vertices[i].w)
+        faces.append((i, j, k) if np.dot(normal, vertices[i].w - interior) >= 0.0 else (i, k, j))
+
+    best_face = faces[0]
+    best_normal = np.zeros(3, dtype=float)
+    best_distance = 0.0
+    for _ in range(max_iters * 2):
+        best_distance = float("inf")
+        for face in faces:
+            normal, face_distance = _epa_face_plane(vertices, face)
+            if normal is not None and face_distance < best_distance:
+                best_face, best_normal, best_distance = face, normal, face_distance
+        if not np.isfinite(best_distance):
+            best_distance = 0.0
+            break
+
+        vertex = _support_vertex(shape_a, shape_b, best_normal)
+        if float(np.dot(vertex.w, best_normal)) - best_distance <= tolerance_mm:
+            break
+
+        vertices.append(vertex)
+        new_index = len(vertices) - 1
+        edge_counts: dict[tuple[int, int], int] = {}
+        kept_faces: list[tuple[int, int, int]] = []
+        for face in faces:
+            if float(np.dot(vertices[face[0]].w - vertex.w, np.cross(vertices[face[1]].w - vertices[face[0]].w, vertices[face[2]].w - vertices[face[0]].w))) < 0.0:
+                for edge in ((face[0], face[1]), (face[1], face[2]), (face[2], face[0])):
+                    edge_counts[edge] = edge_counts.get(edge, 0) + 1
+            else:
+                kept_faces.append(face)
+        horizon = [edge for edge in edge_counts if (edge[1], edge[0]) not in edge_counts]
+        if not horizon:
+            break
+        faces = kept_faces + [(edge[0], edge[1], new_index) for edge in horizon]
+
+    weights = _barycentric_on_triangle(
+        best_normal * best_distance,
+        vertices[best_face[0]].w,
+        vertices[best_face[1]].w,
+        vertices[best_face[2]].w,
+    )
+    point_a = sum((weight * vertices[index].point_a for weight, index in zip(weights, best_face)), np.zeros(3, dtype=float))
+    point_b = sum((weight * vertices[index].point_b for weight, index in zip(weights, best_face)), np.zeros(3, dtype=float))
+    return CollisionDistance(-best_distance, point_a, point_b)
+
+
+def _expand_to_tetrahedron(
+    shape_a: CollisionShape,
+    shape_b: CollisionShape,
+    simplex: list[_SupportVertex],
+) -> list[_SupportVertex] | None:
+    vertices = list(simplex)
+    axes = [np.array(axis, dtype=float) for axis in np.eye(3)]
+    if len(vertices) == 1:
+        for axis in [*axes, *(-axis for axis in axes)]:
+            vertex = _support_vertex(shape_a, shape_b, axis)
+            if np.linalg.norm(vertex.w - vertices[0].w) > EPSILON:
+                vertices.append(vertex)
+                break
+    if len(vertices) == 2:
+        edge = vertices[1].w - vertices[0].w
+        perpendicular = _any_perpendicular(edge)
+        for direction in (perpendicular, -perpendicular, np.cross(edge, perpendicular), -np.cross(edge, perpendicular)):
+            vertex = _support_vertex(shape_a, shape_b, direction)
+            if np.linalg.norm(np.cross(edge, vertex.w - vertices[0].w)) > EPSILON:
+                vertices.append(vertex)
+                break
+    if len(vertices) == 3:
+        normal = np.cross(vertices[1].w - vertices[0].w, vertices[2].w - vertices[0].w)
+        for direction in (normal, -normal):
+            vertex = _support_vertex(shape_a, shape_b, direction)
+            if abs(float(np.dot(normal, vertex.w - vertices[0].w))) > EPSILON:
+                vertices.append(vertex)
+                break
+    if len(vertices) != 4:
+        return None
+    return vertices
+
+
+def _epa_face_plane(
+    vertices: list[_SupportVertex],
+    face: tuple[int, int, int],
+) -> tuple[np.ndarray | None, float]:
+    a = vertices[face[0]].w
+    normal = np.cross(vertices[face[1]].w - a, vertices[face[2]].w - a)
+    norm = float(np.linalg.norm(normal))
+    if norm <= EPSILON:
+        return None, float("inf")
+    normal = normal / norm
+    return normal, float(np.dot(normal, a))
+
+
+def _barycentric_on_triangle(point: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> list[float]:
+    v0 = b - a
+    v1 = c - a
+    v2 = point - a
+    d00 = float(np.dot(v0, v0))
+    d01 = float(np.dot(v0, v1))
+    d11 = float(np.dot(v1, v1))
+    d20 = float(np.dot(v2, v0))
+    d21 = float(np.dot(v2, v1))
+    denom = d00 * d11 - d01 * d01
+    if abs(denom) <= EPSILON * EPSILON:
+        return [1.0, 0.0, 0.0]
+    v = (d11 * d20 - d01 * d21) / denom
+    w = (d00 * d21 - d01 * d20) / denom
+    return [1.0 - v - w, v, w]
+
+
 __all__ = [
+    "CollisionClearance",
+    "CollisionDistance",
+    "CollisionDistanceCache",
     "CollisionPair",
     "CollisionShape",
     "CollisionShapeTemplate",
     "CollisionWorldCache",
+    "GjkWarmStart",
     "build_robot_axis_collision_shape_templates",
     "build_robot_axis_collision_shapes",
     "build_tool_collision_shape_templates",
@@ -707,9 +1113,11 @@ __all__ = [
     "build_workspace_collision_shapes",
     "build_workspace_tcp_shapes",
     "build_world_frame_transforms",
+    "compute_distance",
     "contains_point",
     "filter_robot_shapes_by_evaluated_axes",
     "find_collisions",
+    "find_minimum_clearance",
     "instantiate_collision_shapes_from_templates",
     "intersects",
     "primitive_extrusion_orientation",
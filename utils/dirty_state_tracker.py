@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, Iterable
+
+
+def _freeze(value: Any) -> Any:
+    """Forme comparable d'une valeur de section (listes -> tuples, flottants arrondis à 1e-9)."""
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class _Section:
+    def __init__(self, reader: Callable[[], Any], revision: Callable[[], int] | None) -> None:
+        self.reader = reader
+        self.revision = revision
+        self.seen_revision: int | None = None
+        self.stale = True
+        self.reference: Any = None
+
+
+class _ItemSection:
+    def __init__(
+        self,
+        items: Callable[[], Iterable[tuple[Hashable, int]]],
+        item_reader: Callable[[Hashable], Any],
+    ) -> None:
+        self.items = items
+        self.item_reader = item_reader
+        self.cache: dict[Hashable, tuple[int, Any]] = {}
+        self.reference: Any = None
+
+    def read(self) -> tuple:
+        """Valeur figée de la section : seuls les éléments dont la révision a changé sont relus."""
+        value = []
+        cache: dict[Hashable, tuple[int, Any]] = {}
+        for key, revision in self.items():
+            cached = self.cache.get(key)
+            if cached is None or cached[0] != revision:
+                cached = (revision, _freeze(self.item_reader(key)))
+            cache[key] = cached
+            value.append((key, cached[1]))
+        self.cache = cache
+        return tuple(value)
+
+
+class DirtyStateTracker:
+    """Détection des modifications non enregistrées, section par section.
+
+    Chaque section (table DH, limites, éléments CAO...) est lue par un callable et
+    figée en valeur comparable. Une section n'est relue que si elle a été invalidée
+    (signal du modèle, action de l'utilisateur) ou si son compteur de révision a changé ;
+    is_dirty() ne coûte donc que les sections réellement touchées depuis le dernier appel.
+    Les collections (axes externes...) s'enregistrent en section par élément : seule la liste
+    (clé, révision) est relue à chaque appel, chaque élément n'est relu que si sa révision a changé.
+    La lecture complète de toutes les sections n'a lieu qu'à set_reference() (chargement,
+    enregistrement). Revenir à la valeur de référence rend la section de nouveau propre.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[str, _Section] = {}
+        self._item_sections: dict[str, _ItemSection] = {}
+        self._modified: set[str] = set()
+        self._has_reference = False
+
+    def add_section(self, name: str, reader: Callable[[], Any], revision: Callable[[], int] | None = None) -> None:
+        self._sections[name] = _Section(reader, revision)
+
+    def add_item_section(
+        self,
+        name: str,
+        items: Callable[[], Iterable[tuple[Hashable, int]]],
+        item_reader: Callable[[Hashable], Any],
+    ) -> None:
+        """Section découpée par élément : items() donne les (clé, révision) dans l'ordre enregistré."""
+        self._item_sections[name] = _ItemSection(items, item_reader)
+
+    def bind(self, signal, *names: str) -> None:
+        """Invalide les sections nommées (toutes si aucune) à chaque émission du signal.
+
+        À connecter avant les slots qui lisent is_dirty(), Qt appelant les slots dans l'ordre de connexion.
+        """
+        signal.connect(lambda *_args: self.invalidate(*names))
+
+    def invalidate(self, *names: str) -> None:
+        for name in names or self._sections:
+            self._sections[name].stale = True
+
+    def set_reference(self) -> None:
+        """Prend l'état courant comme état enregistré (lecture de toutes les sections)."""
+        for section in self._sections.values():
+            section.reference = self._read(section)
+        for item_section in self._item_sections.values():
+            item_section.reference = item_section.read()
+        self._modified.clear()
+        self._has_reference = True
+
+    def clear_reference(self) -> None:
+        """Plus d'état enregistré : tout est considéré comme modifié."""
+        self._has_reference = False
+        self._modified.clear()
+
+    def has_reference(self) -> bool:
+        return self._has_reference
+
+    def is_dirty(self) -> bool:
+        if not self._has_reference:
+            return True
+        for name, section in self._sections.items():
+            if not section.stale and (section.revision is None or section.revision() == section.seen_revision):
+                continue
+            if self._read(section) == section.reference:
+                self._modified.discard(name)
+            else:
+                self._modified.add(name)
+        for name, item_section in self._item_sections.items():
+            if item_section.read() == item_section.reference:
+                self._modified.discard(name)
+            else:
+                self._modified.add(name)
+        return bool(self._modified)
+
+    @staticmethod
+    def _read(section: _Section) -> Any:
+        if section.revision is not None:
+            section.seen_revision = section.revision()
+        section.stale = False
+        return _freeze(section.reader())
+
+
+__all__ = [
+    "DirtyStateTracker",
+]
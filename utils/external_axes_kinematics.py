@@ -5,11 +5,16 @@ Les longueurs sont en mm, les angles en degrés (stockage) / radians (calcul int
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 
 from models.external_axes_model import ExternalAxesModel
+from models.external_axis_joint import ExternalAxisJoint
 from models.tooling_element import ToolingElement
+from models.tooling_model import ToolingModel
 from models.types.pose6 import Pose6
+from models.workpiece_model import WorkpieceModel
 from models.workspace_model import WorkspaceModel
 from utils.math_utils import invert_homogeneous_transform, pose_zyx_to_matrix
 
@@ -163,3 +168,182 @@ def compute_target_in_robot_base(
     T_target_world = pose_zyx_to_matrix(target_world_pose)
     T_target_in_base = T_robotBase_world @ T_target_world
     return matrix_to_pose_zyx(T_target_in_base)
+
+
+# ----------------------------------------------------------------------
+# Évaluation par lots (simulation de programme)
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _AxisChainStep:
+    """Chaîne d'un axe externe figée : parent résolu, repères statiques et colonnes de valeurs."""
+    axis_id: str
+    parent_id: str | None
+    prefix: np.ndarray                  # base_pose_in_parent · axis_frame_in_base
+    link_matrices: list[np.ndarray]     # link_pose_matrix de chaque joint
+    joints: list[ExternalAxisJoint]
+    columns: list[int]                  # colonne de chaque joint dans le tableau de valeurs
+
+
+class ExternalAxesChainPlan:
+    """Topologie de montage et repères statiques résolus une fois, évalués pour N états d'axes.
+
+    Les valeurs articulaires sont un tableau (N, n) dans l'ordre de joint_value_keys() (même
+    ordre que les snapshots ext_axis_values des échantillons). Les transformées sont empilées
+    (N, 4, 4) : une passe de simulation évalue toutes ses positions d'axes en un appel, au lieu
+    d'un compute_world_transforms_for (parcours du graphe, dicts, repères workspace) par échantillon.
+    """
+
+    def __init__(
+        self,
+        external_axes_model: ExternalAxesModel | None,
+        workspace_model: WorkspaceModel | None = None,
+        workpiece_model: WorkpieceModel | None = None,
+        tooling_model: ToolingModel | None = None,
+    ) -> None:
+        self.value_keys: list[tuple[str, int]] = []
+        self.live_values = np.zeros(0, dtype=float)
+        self.robot_mount_parent_id: str | None = None
+        self._steps: list[_AxisChainStep] = []
+        if external_axes_model is not None:
+            self.value_keys = external_axes_model.joint_value_keys()
+            column_by_key = {key: column for column, key in enumerate(self.value_keys)}
+            live: list[float] = [0.0] * len(self.value_keys)
+            for axis, parent_id in external_axes_model.resolve_mount_order():
+                columns = [column_by_key[(axis.id, i)] for i in range(len(axis.joints))]
+                for column, joint in zip(columns, axis.joints):
+                    live[column] = float(joint.value)
+                self._steps.append(
+                    _AxisChainStep(
+                        axis_id=axis.id,
+                        parent_id=parent_id,
+                        prefix=pose_zyx_to_matrix(axis.base_pose_in_parent) @ pose_zyx_to_matrix(axis.axis_frame_in_base),
+                        link_matrices=[joint.link_pose_matrix() for joint in axis.joints],
+                        joints=[joint.copy() for joint in axis.joints],
+                        columns=columns,
+                    )
+                )
+            self.live_values = np.asarray(live, dtype=float)
+            self.robot_mount_parent_id = external_axes_model.get_robot_mount_parent_id()
+
+        self.workspace_robot_base: np.ndarray | None = None
+        workspace_frames: dict[str, np.ndarray] = {}
+        if workspace_model is not None:
+            self.workspace_robot_base = np.array(workspace_model.get_robot_base_transform_world().matrix, dtype=float)
+            workspace_frames = {
+                elem.name: pose_zyx_to_matrix(elem.pose)
+                for elem in workspace_model.get_workspace_cad_elements()
+                if elem.name
+            }
+
+        # Pièce : T_parent · T_pose · T_frame, seul T_parent dépend des axes.
+        self.piece_parent_id: str | None = None
+        self._piece_in_parent: np.ndarray | None = None
+        self._tooling_parent_id: str | None = None
+        self._tooling_chain: np.ndarray | None = None
+        self._tooling_static_parent: np.ndarray | None = None
+        if workpiece_model is not None and workspace_model is not None:
+            self.piece_parent_id = workpiece_model.get_parent_frame_id()
+            self._piece_in_parent = (
+                pose_zyx_to_matrix(workpiece_model.get_pose_in_parent())
+                @ pose_zyx_to_matrix(workpiece_model.get_workpiece_frame_pose())
+            )
+            if tooling_model is not None and self.piece_parent_id == FRAME_TOOLING:
+                self._tooling_parent_id = tooling_model.get_parent_frame_id()
+                # Chaîne d'outillage sous un parent identité : seul le parent varie avec les axes.
+                self._tooling_chain = tooling_frame_world(
+                    tooling_parent_id="",
+                    elements=tooling_model.get_elements(),
+                    world_transforms={},
+                    world_robot_base_matrix=np.eye(4, dtype=float),
+                )
+                if self._tooling_parent_id and self._tooling_parent_id.startswith(PREFIX_WS):
+                    elem_name = self._tooling_parent_id[len(PREFIX_WS):]
+                    self._tooling_static_parent = workspace_frames.get(elem_name, np.eye(4, dtype=float))
+
+    def values_from_dict(self, values: dict[tuple[str, int], float]) -> np.ndarray:
+        """Vecteur (n,) d'un état d'axes ; les joints absents gardent leur valeur live."""
+        return np.array(
+            [values.get(key, live) for key, live in zip(self.value_keys, self.live_values)],
+            dtype=float,
+        )
+
+    def _values_matrix(self, values: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(values, dtype=float)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        count = len(self.value_keys)
+        if matrix.shape[1] < count:
+            # Snapshots tronqués : les colonnes manquantes gardent la valeur live.
+            padded = np.broadcast_to(self.live_values, (matrix.shape[0], count)).copy()
+            padded[:, :matrix.shape[1]] = matrix
+            matrix = padded
+        return matrix
+
+    def world_end_transforms(self, values: np.ndarray) -> dict[str, np.ndarray]:
+        """T_world de l'extrémité de chaque axe : axis_id -> (N, 4, 4)."""
+        matrix = self._values_matrix(values)
+        count = matrix.shape[0]
+        identity = np.broadcast_to(np.eye(4, dtype=float), (count, 4, 4))
+        ends: dict[str, np.ndarray] = {}
+        for step in self._steps:
+            parent = identity if step.parent_id is None else ends[step.parent_id]
+            T = parent @ step.prefix
+            for joint, link, column in zip(step.joints, step.link_matrices, step.columns):
+                T = T @ link @ joint.joint_transforms_for_values(matrix[:, column])
+            ends[step.axis_id] = T
+        return ends
+
+    def robot_base_world(self, values: np.ndarray, ends: dict[str, np.ndarray] | None = None) -> np.ndarray:
+        """T_world_robotBase (N, 4, 4) : extrémité de l'axe porteur, sinon pose workspace."""
+        matrix = self._values_matrix(values)
+        if self.robot_mount_parent_id is not None:
+            ends = ends if ends is not None else self.world_end_transforms(matrix)
+            carrier = ends.get(self.robot_mount_parent_id)
+            if carrier is not None:
+                return carrier
+        static = self.workspace_robot_base if self.workspace_robot_base is not None else np.eye(4, dtype=float)
+        return np.broadcast_to(static, (matrix.shape[0], 4, 4)).copy()
+
+    def axis_end_world(self, values: np.ndarray, axis_id: str | None) -> np.ndarray:
+        """T_world de l'extrémité d'un axe (N, 4, 4), identité si l'axe est inconnu."""
+        matrix = self._values_matrix(values)
+        end = self.world_end_transforms(matrix).get(axis_id) if axis_id is not None else None
+        if end is None:
+            return np.broadcast_to(np.eye(4, dtype=float), (matrix.shape[0], 4, 4)).copy()
+        return end
+
+    def piece_frame_world(self, values: np.ndarray) -> np.ndarray | None:
+        """T_world_pieceFrame (N, 4, 4), mêmes règles de parent que piece_frame_world(). None sans pièce."""
+        if self._piece_in_parent is None:
+            return None
+        matrix = self._values_matrix(values)
+        count = matrix.shape[0]
+        ends = self.world_end_transforms(matrix)
+        parent = self._frame_parent_world(self.piece_parent_id, ends, matrix, count)
+        return parent @ self._piece_in_parent
+
+    def _frame_parent_world(
+        self,
+        parent_id: str | None,
+        ends: dict[str, np.ndarray],
+        matrix: np.ndarray,
+        count: int,
+    ) -> np.ndarray:
+        identity = np.broadcast_to(np.eye(4, dtype=float), (count, 4, 4))
+        if parent_id == FRAME_ROBOT:
+            return self.robot_base_world(matrix, ends)
+        if parent_id == FRAME_TOOLING:
+            return self._tooling_frame_world(ends, matrix, count)
+        if parent_id and parent_id.startswith(PREFIX_EXT):
+            return ends.get(parent_id[len(PREFIX_EXT):], identity)
+        # Monde, repère workspace (non résolu pour la pièce, cf. piece_frame_world) ou inconnu.
+        return identity
+
+    def _tooling_frame_world(self, ends: dict[str, np.ndarray], matrix: np.ndarray, count: int) -> np.ndarray:
+        chain = self._tooling_chain if self._tooling_chain is not None else np.eye(4, dtype=float)
+        parent_id = self._tooling_parent_id
+        if parent_id and parent_id.startswith(PREFIX_WS):
+            return np.broadcast_to(self._tooling_static_parent @ chain, (count, 4, 4)).copy()
+        return self._frame_parent_world(parent_id, ends, matrix, count) @ chain
@@ -0,0 +1,567 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+# Chaîne identifiée (mesure laser tracker -> TCP) :
+#   T = Base(6) . prod_i [ DH_i(alpha, d, theta + q_i, r) . Corr_i(tx, ty, tz, rx, ry, rz) ] . Tool(6)
+# Base, Corr_i et Tool : translation puis Rz.Ry.Rx, comme math_utils.correction_6d. Cette dernière
+# convertit deux fois les angles en radians ; les rotations Corr_i reproduisent ce comportement pour
+# rester cohérentes avec RobotModel.compute_fk, Base et Tool sont de vrais angles en degrés.
+# Chaque paramètre est une transformation élémentaire (rotation ou translation selon un axe
+# local) : la jacobienne s'obtient analytiquement à partir des repères intermédiaires.
+CORRECTION_PARAMETER_NAMES = ("tx", "ty", "tz", "rx", "ry", "rz")
+DH_PARAMETER_NAMES = ("alpha", "d", "theta", "r")
+PARAMETERS_PER_JOINT = len(DH_PARAMETER_NAMES) + len(CORRECTION_PARAMETER_NAMES)
+JOINT_COUNT = 6
+PARAMETER_COUNT = 6 + JOINT_COUNT * PARAMETERS_PER_JOINT + 6
+
+PARAMETER_GROUPS = ("base", "dh", "corrections", "tool")
+DEFAULT_IDENTIFIED_GROUPS = ("base", "dh", "tool")
+DEFAULT_ORIENTATION_WEIGHT_MM_PER_RAD = 1000.0
+
+_ROTATION = 0
+_TRANSLATION = 1
+# (type, axe, rang du paramètre) des transformations élémentaires de correction_6d, dans
+# l'ordre de composition : Tx . Ty . Tz . Rz(rz) . Ry(ry) . Rx(rx).
+_CORRECTION_ELEMENTS = (
+    (_TRANSLATION, 0, 0),
+    (_TRANSLATION, 1, 1),
+    (_TRANSLATION, 2, 2),
+    (_ROTATION, 2, 5),
+    (_ROTATION, 1, 4),
+    (_ROTATION, 0, 3),
+)
+# Ordre de composition de dh_modified : Rx(alpha) . Tx(d) . Rz(theta) . Tz(r).
+_DH_ELEMENTS = (
+    (_ROTATION, 0, 0),
+    (_TRANSLATION, 0, 1),
+    (_ROTATION, 2, 2),
+    (_TRANSLATION, 2, 3),
+)
+_THETA_OFFSET = 2
+
+
+def _correction_slot_names(prefix: str) -> list[str]:
+    return [f"{prefix}.{name}" for name in CORRECTION_PARAMETER_NAMES]
+
+
+def _build_chain_layout() -> tuple[list[str], list[str], list[tuple[int, int, int]], dict[int, int]]:
+    names: list[str] = []
+    groups: list[str] = []
+    elements: list[tuple[int, int, int]] = []
+    joint_of_element: dict[int, int] = {}
+
+    def add_block(block_names: list[str], group: str, block_elements: tuple[tuple[int, int, int], ...]) -> None:
+        start = len(names)
+        names.extend(block_names)
+        groups.extend([group] * len(block_names))
+        elements.extend((kind, axis, start + offset) for kind, axis, offset in block_elements)
+
+    add_block(_correction_slot_names("base"), "base", _CORRECTION_ELEMENTS)
+    for joint_index in range(JOINT_COUNT):
+        prefix = f"a{joint_index + 1}"
+        joint_of_element[len(elements) + _THETA_OFFSET] = joint_index
+        add_block([f"{prefix}.{name}" for name in DH_PARAMETER_NAMES], "dh", _DH_ELEMENTS)
+        add_block(_correction_slot_names(f"{prefix}.corr"), "corrections", _CORRECTION_ELEMENTS)
+    add_block(_correction_slot_names("tool"), "tool", _CORRECTION_ELEMENTS)
+    return names, groups, elements, joint_of_element
+
+
+PARAMETER_NAMES, _PARAMETER_GROUP_OF, _CHAIN_ELEMENTS, _THETA_JOINT_OF_ELEMENT = _build_chain_layout()
+_ELEMENT_PARAMETER = np.array([parameter for _, _, parameter in _CHAIN_ELEMENTS], dtype=int)
+_IS_ROTATION = np.array([kind == _ROTATION for kind, _, _ in _CHAIN_ELEMENTS], dtype=bool)
+# Radians par unité de paramètre pour les rotations (voir l'en-tête pour les corrections).
+_ANGLE_SCALE = np.where(
+    np.array([_PARAMETER_GROUP_OF[p] == "corrections" for p in _ELEMENT_PARAMETER], dtype=bool),
+    np.radians(1.0) ** 2,
+    np.radians(1.0),
+)
+
+
+def _dh_slice(joint_index: int) -> slice:
+    start = 6 + joint_index * PARAMETERS_PER_JOINT
+    return slice(start, start + len(DH_PARAMETER_NAMES))
+
+
+def _correction_slice(joint_index: int) -> slice:
+    start = 6 + joint_index * PARAMETERS_PER_JOINT + len(DH_PARAMETER_NAMES)
+    return slice(start, start + 6)
+
+
+_BASE_SLICE = slice(0, 6)
+_TOOL_SLICE = slice(PARAMETER_COUNT - 6, PARAMETER_COUNT)
+
+
+def pack_parameters(
+    dh_params: list[list[float]],
+    corrections: list[list[float]] | None = None,
+    base_pose: list[float] | None = None,
+    tool_pose: list[float] | None = None,
+) -> np.ndarray:
+    """Vecteur de paramètres (degrés / mm) dans l'ordre de PARAMETER_NAMES."""
+    params = np.zeros(PARAMETER_COUNT, dtype=float)
+    if base_pose is not None:
+        params[_BASE_SLICE] = np.asarray(base_pose, dtype=float)[:6]
+    for joint_index in range(JOINT_COUNT):
+        if joint_index < len(dh_params):
+            params[_dh_slice(joint_index)] = np.asarray(dh_params[joint_index], dtype=float)[:4]
+        if corrections is not None and joint_index < len(corrections):
+            params[_correction_slice(joint_index)] = np.asarray(corrections[joint_index], dtype=float)[:6]
+    if tool_pose is not None:
+        params[_TOOL_SLICE] = np.asarray(tool_pose, dtype=float)[:6]
+    return params
+
+
+def correction_pose_from_transform(transform: np.ndarray) -> list[float]:
+    """Pose [tx, ty, tz, rx, ry, rz] (mm, degrés) d'un repère Base/Tool : T = Trans . Rz.Ry.Rx."""
+    matrix = np.asarray(transform, dtype=float)
+    rotation = matrix[:3, :3]
+    ry = np.arcsin(np.clip(-rotation[2, 0], -1.0, 1.0))
+    rz = np.arctan2(rotation[1, 0], rotation[0, 0])
+    rx = np.arctan2(rotation[2, 1], rotation[2, 2])
+    return [
+        float(matrix[0, 3]),
+        float(matrix[1, 3]),
+        float(matrix[2, 3]),
+        float(np.degrees(rx)),
+        float(np.degrees(ry)),
+        float(np.degrees(rz)),
+    ]
+
+
+def project_pose_from_correction_pose(pose: list[float]) -> list[float]:
+    """[tx, ty, tz, rx, ry, rz] -> [X, Y, Z, A, B, C] : même repère Trans . Rz.Ry.Rx, angles réordonnés."""
+    tx, ty, tz, rx, ry, rz = (float(value) for value in pose[:6])
+    return [tx, ty, tz, rz, ry, rx]
+
+
+def _rotations_zyx_deg(a_deg: np.ndarray, b_deg: np.ndarray, c_deg: np.ndarray) -> np.ndarray:
+    """Rz(A).Ry(B).Rx(C) pour un lot d'angles (N,) -> (N, 3, 3)."""
+    ca, sa = np.cos(np.radians(a_deg)), np.sin(np.radians(a_deg))
+    cb, sb = np.cos(np.radians(b_deg)), np.sin(np.radians(b_deg))
+    cc, sc = np.cos(np.radians(c_deg)), np.sin(np.radians(c_deg))
+    return np.stack(
+        [
+            np.stack([ca * cb, ca * sb * sc - sa * cc, ca * sb * cc + sa * sc], axis=-1),
+            np.stack([sa * cb, sa * sb * sc + ca * cc, sa * sb * cc - ca * sc], axis=-1),
+            np.stack([-sb, cb * sc, cb * cc], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def load_calibration_poses(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Lit un fichier de poses de calibration : une ligne par pose.
+
+    Colonnes `A1..A6;X;Y;Z` (TCP mesuré) ou `A1..A6;X;Y;Z;A;B;C` (repère mesuré, angles
+    Rz.Ry.Rx en degrés), séparateur `;` ou `,`. Les lignes non numériques (en-tête,
+    commentaires) sont ignorées. Retourne (articulaires (N, 6), mesures (N, 3) ou (N, 4, 4)).
+    """
+    rows: list[list[float]] = []
+    with open(path, "r", encoding="utf-8-sig") as file:
+        for line in file:
+            text = line.strip()
+            if not text:
+                continue
+            fields = [field.strip() for field in text.split(";" if ";" in text else ",")]
+            try:
+                rows.append([float(field) for field in fields if field])
+            except ValueError:
+                continue
+    if not rows:
+        raise ValueError("Aucune pose numérique trouvée dans le fichier")
+    column_count = len(rows[0])
+    if column_count not in (9, 12) or any(len(row) != column_count for row in rows):
+        raise ValueError("Chaque pose doit contenir 9 valeurs (A1..A6, X, Y, Z) ou 12 (… , A, B, C)")
+    data = np.asarray(rows, dtype=float)
+    joints = data[:, :6]
+    if column_count == 9:
+        return joints, data[:, 6:9]
+    measurements = np.tile(np.eye(4), (len(data), 1, 1))
+    measurements[:, :3, :3] = _rotations_zyx_deg(data[:, 9], data[:, 10], data[:, 11])
+    measurements[:, :3, 3] = data[:, 6:9]
+    return joints, measurements
+
+
+def _elementary_transforms(kind: int, axis: int, values: np.ndarray, angle_scale: float) -> np.ndarray:
+    count = len(values)
+    transforms = np.zeros((count, 4, 4), dtype=float)
+    transforms[:, 3, 3] = 1.0
+    if kind == _TRANSLATION:
+        transforms[:, 0, 0] = transforms[:, 1, 1] = transforms[:, 2, 2] = 1.0
+        transforms[:, axis, 3] = values
+        return transforms
+    angles = values * angle_scale
+    c = np.cos(angles)
+    s = np.sin(angles)
+    i, j = (axis + 1) % 3, (axis + 2) % 3
+    transforms[:, axis, axis] = 1.0
+    transforms[:, i, i] = c
+    transforms[:, j, j] = c
+    transforms[:, i, j] = -s
+    transforms[:, j, i] = s
+    return transforms
+
+
+def _chain_values(params: np.ndarray, joints_effective_deg: np.ndarray) -> np.ndarray:
+    """Valeur de chaque transformation élémentaire pour chaque pose : (E, N)."""
+    values = np.repeat(params[_ELEMENT_PARAMETER, None], len(joints_effective_deg), axis=1)
+    for element_index, joint_index in _THETA_JOINT_OF_ELEMENT.items():
+        values[element_index] += joints_effective_deg[:, joint_index]
+    return values
+
+
+def forward_kinematics_batch(
+    params: np.ndarray,
+    joints_deg: np.ndarray,
+    axis_reversed: list[int] | None = None,
+) -> np.ndarray:
+    """MGD corrigé pour N poses articulaires : (N, 4, 4)."""
+    transforms, _, _ = _forward_with_frames(params, _effective_joints(joints_deg, axis_reversed), need_frames=False)
+    return transforms
+
+
+def _effective_joints(joints_deg: np.ndarray, axis_reversed: list[int] | None) -> np.ndarray:
+    joints = np.atleast_2d(np.asarray(joints_deg, dtype=float))[:, :JOINT_COUNT]
+    if axis_reversed is None:
+        return joints
+    return joints * np.asarray(axis_reversed, dtype=float)[:JOINT_COUNT]
+
+
+def _forward_with_frames(
+    params: np.ndarray,
+    joints_effective_deg: np.ndarray,
+    need_frames: bool = True,
+) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+    count = len(joints_effective_deg)
+    values = _chain_values(np.asarray(params, dtype=float), joints_effective_deg)
+    current = np.repeat(np.eye(4)[None, :, :], count, axis=0)
+    axes = np.empty((PARAMETER_COUNT, count, 3), dtype=float) if need_frames else None
+    origins = np.empty((PARAMETER_COUNT, count, 3), dtype=float) if need_frames else None
+    for element_index, (kind, axis, _) in enumerate(_CHAIN_ELEMENTS):
+        if need_frames:
+            # Axe et origine du mouvement élémentaire, exprimés dans le repère de mesure.
+            axes[element_index] = current[:, :3, axis]
+            origins[element_index] = current[:, :3, 3]
+        current = current @ _elementary_transforms(kind, axis, values[element_index], _ANGLE_SCALE[element_index])
+    return current, axes, origins
+
+
+def _rotation_vectors(rotations: np.ndarray) -> np.ndarray:
+    """Vecteurs rotation (radians) d'un lot de matrices (N, 3, 3), petits angles compris."""
+    skew = np.stack(
+        [
+            rotations[:, 2, 1] - rotations[:, 1, 2],
+            rotations[:, 0, 2] - rotations[:, 2, 0],
+            rotations[:, 1, 0] - rotations[:, 0, 1],
+        ],
+        axis=1,
+    )
+    cos_theta = np.clip((np.trace(rotations, axis1=1, axis2=2) - 1.0) * 0.5, -1.0, 1.0)
+    theta = np.arccos(cos_theta)
+    sin_theta = np.sin(theta)
+    scale = np.full_like(theta, 0.5)
+    large = sin_theta > 1e-9
+    scale[large] = theta[large] / (2.0 * sin_theta[large])
+    return skew * scale[:, None]
+
+
+@dataclass
+class KinematicCalibrationResult:
+    parameters: np.ndarray
+    identified_parameters: list[str]
+    unidentifiable_parameters: list[str]
+    parameter_std: dict[str, float]
+    position_residuals_mm: np.ndarray
+    orientation_residuals_deg: np.ndarray | None
+    initial_rms_mm: float
+    iterations: int
+    converged: bool
+    outlier_indices: list[int] = field(default_factory=list)
+    # Arrêt sans convergence : aucun pas amorti ne réduisait plus le coût
+    stalled: bool = False
+    # Groupes ajustés (PARAMETER_GROUPS) : base, dh, corrections, tool
+    groups: tuple[str, ...] = DEFAULT_IDENTIFIED_GROUPS
+
+    @property
+    def dh_params(self) -> list[list[float]]:
+        return [self.parameters[_dh_slice(j)].tolist() for j in range(JOINT_COUNT)]
+
+    @property
+    def corrections(self) -> list[list[float]]:
+        return [self.parameters[_correction_slice(j)].tolist() for j in range(JOINT_COUNT)]
+
+    @property
+    def base_pose(self) -> list[float]:
+        return self.parameters[_BASE_SLICE].tolist()
+
+    @property
+    def tool_pose(self) -> list[float]:
+        return self.parameters[_TOOL_SLICE].tolist()
+
+    @property
+    def base_pose_abc(self) -> list[float]:
+        """Repère de base en convention projet [X, Y, Z, A, B, C] (A=Rz, B=Ry, C=Rx)."""
+        return project_pose_from_correction_pose(self.base_pose)
+
+    @property
+    def tool_pose_abc(self) -> list[float]:
+        """Outil identifié en convention projet [X, Y, Z, A, B, C], comme RobotTool."""
+        return project_pose_from_correction_pose(self.tool_pose)
+
+    @property
+    def rms_mm(self) -> float:
+        residuals = self.position_residuals_mm
+        return float(np.sqrt(np.mean(residuals * residuals))) if residuals.size else 0.0
+
+    @property
+    def max_mm(self) -> float:
+        return float(np.max(self.position_residuals_mm)) if self.position_residuals_mm.size else 0.0
+
+    @property
+    def mean_mm(self) -> float:
+        return float(np.mean(self.position_residuals_mm)) if self.position_residuals_mm.size else 0.0
+
+    def dh_params_as_dicts(self) -> list[dict[str, float]]:
+        return [dict(zip(DH_PARAMETER_NAMES, row)) for row in self.dh_params]
+
+
+class KinematicCalibrator:
+    """Identification moindres carrés (Levenberg-Marquardt) sur un lot de poses mesurées.
+
+    `measurements` contient soit les positions TCP mesurées (N, 3), soit les repères
+    complets (N, 4, 4) ; dans ce second cas l'orientation est pondérée par
+    `orientation_weight_mm_per_rad` pour être homogène aux résidus en mm.
+    """
+
+    def __init__(
+        self,
+        joints_deg: np.ndarray,
+        measurements: np.ndarray,
+        axis_reversed: list[int] | None = None,
+        orientation_weight_mm_per_rad: float = DEFAULT_ORIENTATION_WEIGHT_MM_PER_RAD,
+    ) -> None:
+        self._joints = _effective_joints(joints_deg, axis_reversed)
+        measured = np.asarray(measurements, dtype=float)
+        if measured.ndim == 2 and measured.shape[1] == 3:
+            self._measured_positions = measured
+            self._measured_rotations = None
+        elif measured.ndim == 3 and measured.shape[1:] == (4, 4):
+            self._measured_positions = measured[:, :3, 3]
+            self._measured_rotations = measured[:, :3, :3]
+        else:
+            raise ValueError("Les mesures doivent être de forme (N, 3) ou (N, 4, 4)")
+        if len(self._measured_positions) != len(self._joints):
+            raise ValueError("Le nombre de mesures doit correspondre au nombre de poses articulaires")
+        self._orientation_weight = float(orientation_weight_mm_per_rad)
+
+    @property
+    def pose_count(self) -> int:
+        return len(self._joints)
+
+    def uses_orientation(self) -> bool:
+        return self._measured_rotations is not None
+
+    def residuals(self, params: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        """Résidus position (N, 3) en mm et orientation (N, 3) en radians (mesure - modèle)."""
+        transforms, _, _ = _forward_with_frames(params, self._joints, need_frames=False)
+        return self._residuals_from_transforms(transforms)
+
+    def _residuals_from_transforms(self, transforms: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        position_residuals = self._measured_positions - transforms[:, :3, 3]
+        if self._measured_rotations is None:
+            return position_residuals, None
+        rotation_error = self._measured_rotations @ np.transpose(transforms[:, :3, :3], (0, 2, 1))
+        return position_residuals, _rotation_vectors(rotation_error)
+
+    def jacobian(self, params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Jacobienne analytique d(TCP)/d(paramètres) : (N, 6, P) et transformations (N, 4, 4)."""
+        transforms, axes, origins = _forward_with_frames(params, self._joints, need_frames=True)
+        tcp = transforms[:, :3, 3]
+        jac = np.zeros((self.pose_count, 6, PARAMETER_COUNT), dtype=float)
+        axes_npk = np.transpose(axes, (1, 2, 0))
+        lever = tcp[:, :, None] - np.transpose(origins, (1, 2, 0))
+        angle_scale = _ANGLE_SCALE[None, None, :]
+        rotation_columns = np.cross(axes_npk, lever, axisa=1, axisb=1, axisc=1) * angle_scale
+        jac[:, :3, _ELEMENT_PARAMETER] = np.where(_IS_ROTATION[None, None, :], rotation_columns, axes_npk)
+        jac[:, 3:, _ELEMENT_PARAMETER] = np.where(_IS_ROTATION[None, None, :], axes_npk * angle_scale, 0.0)
+        return jac, transforms
+
+    def solve(
+        self,
+        initial_params: np.ndarray,
+        groups: tuple[str, ...] = DEFAULT_IDENTIFIED_GROUPS,
+        fixed_parameters: set[str] | None = None,
+        max_iterations: int = 50,
+        tolerance_mm: float = 1e-6,
+        rank_tolerance: float = 1e-8,
+        huber_threshold_mm: float | None = None,
+    ) -> KinematicCalibrationResult:
+        params = np.array(initial_params, dtype=float)
+        fixed = set(fixed_parameters or ())
+        unknown_groups = set(groups) - set(PARAMETER_GROUPS)
+        if unknown_groups:
+            raise ValueError(f"Groupes de paramètres inconnus : {sorted(unknown_groups)}")
+        free = np.array(
+            [
+                group in groups and name not in fixed
+                for name, group in zip(PARAMETER_NAMES, _PARAMETER_GROUP_OF)
+            ],
+            dtype=bool,
+        )
+        if not self.uses_orientation():
+            # Sans mesure d'orientation, l'orientation de l'outil n'agit pas sur la position du TCP.
+            for name in ("tool.rx", "tool.ry", "tool.rz"):
+                free[PARAMETER_NAMES.index(name)] = False
+        free_indices = np.flatnonzero(free)
+        row_count = 6 if self.uses_orientation() else 3
+
+        position_residuals, orientation_residuals = self.residuals(params)
+        initial_rms = float(np.sqrt(np.mean(np.sum(position_residuals**2, axis=1))))
+        damping = 1e-3
+        iterations = 0
+        converged = False
+        stalled = False
+        rank_mask = np.ones(len(free_indices), dtype=bool)
+        weights = np.ones(self.pose_count, dtype=float)
+
+        for iterations in range(1, max_iterations + 1):
+            jac, transforms = self.jacobian(params)
+            position_residuals, orientation_residuals = self._residuals_from_transforms(transforms)
+            weights = self._robust_weights(position_residuals, huber_threshold_mm)
+            residual_vector = self._stack_residuals(position_residuals, orientation_residuals, weights)
+            cost = float(residual_vector @ residual_vector)
+
+            jac_free = jac[:, :row_count, free_indices]
+            if row_count == 6:
+                jac_free = jac_free.copy()
+                jac_free[:, 3:, :] *= self._orientation_weight
+            jac_free = (jac_free * np.sqrt(weights)[:, None, None]).reshape(-1, len(free_indices))
+
+            # Mise à l'échelle des colonnes (degrés vs mm) puis SVD tronquée : les paramètres
+            # redondants (ex. d/r colinéaires avec la base) sont écartés au lieu de diverger.
+            column_norms = np.linalg.norm(jac_free, axis=0)
+            column_scale = np.where(column_norms > 1e-12, 1.0 / np.maximum(column_norms, 1e-12), 0.0)
+            u, s, vt = np.linalg.svd(jac_free * column_scale[None, :], full_matrices=False)
+            valid = s > rank_tolerance * (s[0] if s.size else 0.0)
+            rank_mask = self._identifiable_columns(vt[valid], len(free_indices))
+            projected = u[:, valid].T @ residual_vector
+
+            improved = False
+            for _ in range(10):
+                gain = s[valid] / (s[valid] ** 2 + damping)
+                step_scaled = vt[valid].T @ (gain * projected)
+                step = np.zeros(PARAMETER_COUNT, dtype=float)
+                step[free_indices] = step_scaled * column_scale
+                candidate = params + step
+                cand_pos, cand_ori = self.residuals(candidate)
+                cand_vector = self._stack_residuals(cand_pos, cand_ori, weights)
+                candidate_cost = float(cand_vector @ cand_vector)
+                if candidate_cost <= cost:
+                    params = candidate
+                    damping = max(damping * 0.3, 1e-12)
+                    improved = True
+                    break
+                damping *= 10.0
+            if not improved:
+                stalled = True
+                break
+            if np.sqrt(max(cost - candidate_cost, 0.0) / self.pose_count) < tolerance_mm:
+                converged = True
+                break
+            if float(np.max(np.abs(step))) < 1e-10:
+                converged = True
+                break
+
+        position_residuals, orientation_residuals = self.residuals(params)
+        identified = [PARAMETER_NAMES[i] for i, ok in zip(free_indices, rank_mask) if ok]
+        unidentifiable = [PARAMETER_NAMES[i] for i, ok in zip(free_indices, rank_mask) if not ok]
+        parameter_std = self._parameter_std(params, free_indices[rank_mask], weights)
+        norms = np.linalg.norm(position_residuals, axis=1)
+        outliers = []
+        if huber_threshold_mm is not None:
+            outliers = np.flatnonzero(norms > float(huber_threshold_mm)).tolist()
+        return KinematicCalibrationResult(
+            parameters=params,
+            identified_parameters=identified,
+            unidentifiable_parameters=unidentifiable,
+            parameter_std=parameter_std,
+            position_residuals_mm=norms,
+            orientation_residuals_deg=(
+                None
+                if orientation_residuals is None
+                else np.degrees(np.linalg.norm(orientation_residuals, axis=1))
+            ),
+            initial_rms_mm=initial_rms,
+            iterations=iterations,
+            converged=converged,
+            outlier_indices=outliers,
+            stalled=stalled,
+            groups=tuple(groups),
+        )
+
+    def _stack_residuals(
+        self,
+        position_residuals: np.ndarray,
+        orientation_residuals: np.ndarray | None,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        sqrt_weights = np.sqrt(weights)[:, None]
+        if orientation_residuals is None:
+            return (position_residuals * sqrt_weights).ravel()
+        stacked = np.hstack([position_residuals, orientation_residuals * self._orientation_weight])
+        return (stacked * sqrt_weights).ravel()
+
+    @staticmethod
+    def _robust_weights(position_residuals: np.ndarray, huber_threshold_mm: float | None) -> np.ndarray:
+        count = len(position_residuals)
+        if huber_threshold_mm is None or huber_threshold_mm <= 0.0:
+            return np.ones(count, dtype=float)
+        norms = np.linalg.norm(position_residuals, axis=1)
+        weights = np.ones(count, dtype=float)
+        large = norms > huber_threshold_mm
+        weights[large] = huber_threshold_mm / norms[large]
+        return weights
+
+    @staticmethod
+    def _identifiable_columns(vt_valid: np.ndarray, column_count: int) -> np.ndarray:
+        """Une colonne est identifiable si son vecteur unitaire n'a (presque) aucune composante
+        dans le noyau de la jacobienne ; deux paramètres redondants sont tous deux écartés."""
+        if vt_valid.size == 0:
+            return np.zeros(column_count, dtype=bool)
+        return np.sum(vt_valid * vt_valid, axis=0) > 1.0 - 1e-3
+
+    def _parameter_std(self, params: np.ndarray, indices: np.ndarray, weights: np.ndarray) -> dict[str, float]:
+        if len(indices) == 0:
+            return {}
+        jac, transforms = self.jacobian(params)
+        row_count = 6 if self.uses_orientation() else 3
+        jac_sel = jac[:, :row_count, indices].copy()
+        if row_count == 6:
+            jac_sel[:, 3:, :] *= self._orientation_weight
+        jac_sel = (jac_sel * np.sqrt(weights)[:, None, None]).reshape(-1, len(indices))
+        position_residuals, orientation_residuals = self._residuals_from_transforms(transforms)
+        residual_vector = self._stack_residuals(position_residuals, orientation_residuals, weights)
+        dof = max(1, len(residual_vector) - len(indices))
+        sigma2 = float(residual_vector @ residual_vector) / dof
+        covariance = np.linalg.pinv(jac_sel.T @ jac_sel)
+        std = np.sqrt(np.maximum(np.diag(covariance) * sigma2, 0.0))
+        return {PARAMETER_NAMES[i]: float(value) for i, value in zip(indices, std)}
+
+
+__all__ = [
+    "DEFAULT_IDENTIFIED_GROUPS",
+    "KinematicCalibrationResult",
+    "KinematicCalibrator",
+    "PARAMETER_COUNT",
+    "PARAMETER_GROUPS",
+    "PARAMETER_NAMES",
+    "correction_pose_from_transform",
+    "forward_kinematics_batch",
+    "load_calibration_poses",
+    "pack_parameters",
+    "project_pose_from_correction_pose",
+]
@@ -0,0 +1,228 @@
+"""
+Instantané numérique MGD / MGI d'un robot, pour valider une optimisation de la cinématique.
+
+Un instantané rejoue des jeux articulaires fixes (positions remarquables puis tirages
+random.Random(seed) dans les butées) : pour chacun, la matrice TCP du MGD nominal et corrigé,
+les solutions MGI brutes de chaque configuration (statut + articulations) et les solutions
+étendues (±360°) du MGI relancé sur la pose nominale. Le MGI est évalué sur un RobotModel
+fraîchement chargé (MGD et MGI ne modifient pas ses articulations courantes, dont dépendent
+les valeurs de repli en singularité).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import random
+from typing import Any
+
+import numpy as np
+
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from utils.mgi import MgiConfigKey, MgiResultStatus
+
+
+DEFAULT_SNAPSHOT_PATH = os.path.join("tools", "_regression_snapshot.json")
+DEFAULT_CONFIGURATIONS_DIR = os.path.join("default_data", "configurations")
+DEFAULT_SNAPSHOT_COUNT = 300
+DEFAULT_SNAPSHOT_SEED = 12345
+# Les articulations MGI sont arrondies à l'enregistrement ; les matrices MGD sont gardées telles quelles.
+IK_ROUND_DIGITS = 9
+
+# Positions remarquables rejouées avant les tirages aléatoires (zéro, singularités poignet/épaule).
+SNAPSHOT_FIXED_JOINTS: list[list[float]] = [
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, -90.0, 90.0, 0.0, 90.0, 0.0],
+    [0.0, -90.0, 90.0, 0.0, 0.0, 0.0],
+    [0.0, -105.0, 156.0, 0.0, 120.0, 0.0],
+]
+
+
+def load_snapshot_robot(config_path: str) -> RobotModel:
+    robot_model = RobotModel()
+    with open(config_path, "r", encoding="utf-8") as file:
+        robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(json.load(file)), config_path)
+    return robot_model
+
+
+def snapshot_joint_samples(
+    axis_limits: list[list[float]] | list[tuple[float, float]],
+    count: int = DEFAULT_SNAPSHOT_COUNT,
+    seed: int = DEFAULT_SNAPSHOT_SEED,
+) -> list[list[float]]:
+    """Jeux articulaires de l'instantané : positions fixes puis `count` tirages uniformes dans les butées."""
+    rng = random.Random(seed)
+    limits = [(float(q_min), float(q_max)) for q_min, q_max in list(axis_limits)[:6]]
+    drawn = [[rng.uniform(q_min, q_max) for q_min, q_max in limits] for _ in range(int(count))]
+    return [list(joints) for joints in SNAPSHOT_FIXED_JOINTS] + drawn
+
+
+def _rounded(joints) -> list[float]:
+    return [round(float(value), IK_ROUND_DIGITS) for value in list(joints)[:6]]
+
+
+def compute_snapshot_record(robot_model: RobotModel, joints: list[float]) -> dict[str, Any]:
+    fk = robot_model.compute_fk(*joints)
+    mgi_result = robot_model.compute_ik_target(fk.dh_pose)
+    configurations = {}
+    for key, solution in mgi_result.solutions.items():
+        entry: dict[str, Any] = {"status": solution.status.name}
+        # Articulations d'une configuration inatteignable : valeurs de travail sans signification.
+        if solution.status != MgiResultStatus.UNREACHABLE:
+            entry["joints"] = _rounded(solution.joints)
+        configurations[key.name] = entry
+    expanded = sorted((_rounded(solution.joints), solution.config_key.name) for solution in mgi_result.expanded_solutions)
+    return {
+        "joints": [float(value) for value in joints],
+        "dh_matrix": [float(value) for value in fk.dh_matrices[-1].ravel()],
+        "corrected_matrix": [float(value) for value in fk.corrected_matrices[-1].ravel()],
+        "ik_solutions": [solution for solution, _key in expanded],
+        "ik_solution_configs": [key for _solution, key in expanded],
+        "ik_configurations": configurations,
+    }
+
+
+def record_kinematics_snapshot(
+    config_path: str,
+    count: int = DEFAULT_SNAPSHOT_COUNT,
+    seed: int = DEFAULT_SNAPSHOT_SEED,
+) -> dict[str, Any]:
+    """Calcule l'instantané d'une configuration robot."""
+    robot_model = load_snapshot_robot(config_path)
+    records = [
+        compute_snapshot_record(robot_model, joints)
+        for joints in snapshot_joint_samples(robot_model.get_axis_limits(), count, seed)
+    ]
+    return {
+        "meta": {"config": os.path.basename(config_path), "count": int(count), "seed": int(seed)},
+        "records": records,
+    }
+
+
+def extend_kinematics_snapshot(snapshot: dict[str, Any], config_path: str) -> dict[str, Any]:
+    """Complète un instantané existant avec les champs absents de ses enregistrements.
+
+    Les valeurs déjà enregistrées (matrices MGD, solutions MGI) sont conservées telles quelles :
+    la référence ne dérive pas avec le code rejoué, seuls les nouveaux champs sont calculés.
+    """
+    robot_model = load_snapshot_robot(config_path)
+    records = []
+    for recorded in snapshot["records"]:
+        replayed = compute_snapshot_record(robot_model, recorded["joints"])
+        records.append({**recorded, **{name: value for name, value in replayed.items() if name not in recorded}})
+    return {"meta": dict(snapshot["meta"]), "records": records}
+
+
+def write_kinematics_snapshot(path: str | Path, snapshot: dict[str, Any]) -> None:
+    with Path(path).open("w", encoding="utf-8") as file:
+        json.dump(snapshot, file)
+
+
+def load_kinematics_snapshot(path: str | Path = DEFAULT_SNAPSHOT_PATH) -> dict[str, Any]:
+    with Path(path).open("r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def snapshot_config_path(snapshot: dict[str, Any], configurations_dir: str = DEFAULT_CONFIGURATIONS_DIR) -> str:
+    return os.path.join(configurations_dir, str(snapshot["meta"]["config"]))
+
+
+def _wrapped_difference_deg(a: list[float], b: list[float]) -> float:
+    difference = (np.asarray(a, dtype=float) - np.asarray(b, dtype=float) + 180.0) % 360.0 - 180.0
+    return float(np.max(np.abs(difference))) if difference.size else 0.0
+
+
+@dataclass
+class SnapshotRecordComparison:
+    """Écarts d'un enregistrement rejoué ; `mismatches` liste les écarts hors tolérance."""
+
+    fk_error: float = 0.0
+    ik_error_deg: float = 0.0
+    mismatches: list[str] = field(default_factory=list)
+
+
+def compare_snapshot_record(
+    recorded: dict[str, Any],
+    replayed: dict[str, Any],
+    fk_tolerance: float = 1e-9,
+    ik_tolerance_deg: float = 1e-6,
+) -> SnapshotRecordComparison:
+    """Compare un enregistrement de référence à son recalcul (compute_snapshot_record).
+
+    Les matrices sont comparées à `fk_tolerance` près (mm et termes de rotation), les articulations
+    MGI à `ik_tolerance_deg` près ; les configurations brutes sont comparées modulo 360°.
+    Les champs de configuration absents d'un ancien instantané ne sont pas contrôlés.
+    """
+    comparison = SnapshotRecordComparison()
+    for name in ("dh_matrix", "corrected_matrix"):
+        error = float(np.max(np.abs(np.asarray(recorded[name]) - np.asarray(replayed[name]))))
+        comparison.fk_error = max(comparison.fk_error, error)
+        if error > fk_tolerance:
+            comparison.mismatches.append(f"{name}: écart {error:.3e}")
+
+    recorded_solutions = recorded.get("ik_solutions", [])
+    replayed_solutions = replayed["ik_solutions"]
+    if len(recorded_solutions) != len(replayed_solutions):
+        comparison.mismatches.append(f"ik_solutions: {len(replayed_solutions)} solutions au lieu de {len(recorded_solutions)}")
+    elif recorded_solutions:
+        error = float(np.max(np.abs(np.asarray(recorded_solutions) - np.asarray(replayed_solutions))))
+        comparison.ik_error_deg = max(comparison.ik_error_deg, error)
+        if error > ik_tolerance_deg:
+            comparison.mismatches.append(f"ik_solutions: écart {error:.3e}°")
+    if "ik_solution_configs" in recorded and recorded["ik_solution_configs"] != replayed["ik_solution_configs"]:
+        comparison.mismatches.append("ik_solution_configs: configurations des solutions étendues différentes")
+
+    for key, entry in recorded.get("ik_configurations", {}).items():
+        replayed_entry = replayed["ik_configurations"].get(key, {})
+        if entry["status"] != replayed_entry.get("status"):
+            comparison.mismatches.append(f"{key}: statut {replayed_entry.get('status')} au lieu de {entry['status']}")
+            continue
+        if "joints" not in entry:
+            continue
+        error = _wrapped_difference_deg(entry["joints"], replayed_entry["joints"])
+        comparison.ik_error_deg = max(comparison.ik_error_deg, error)
+        if error > ik_tolerance_deg:
+            comparison.mismatches.append(f"{key}: écart {error:.3e}°")
+    return comparison
+
+
+def replay_kinematics_snapshot(
+    snapshot: dict[str, Any],
+    config_path: str,
+    fk_tolerance: float = 1e-9,
+    ik_tolerance_deg: float = 1e-6,
+) -> list[tuple[int, SnapshotRecordComparison]]:
+    """Rejoue tous les enregistrements ; retourne (index, comparaison) pour chacun."""
+    robot_model = load_snapshot_robot(config_path)
+    return [
+        (index, compare_snapshot_record(recorded, compute_snapshot_record(robot_model, recorded["joints"]), fk_tolerance, ik_tolerance_deg))
+        for index, recorded in enumerate(snapshot["records"])
+    ]
+
+
+MGI_CONFIG_KEY_NAMES = [key.name for key in MgiConfigKey]
+
+
+__all__ = [
+    "DEFAULT_CONFIGURATIONS_DIR",
+    "DEFAULT_SNAPSHOT_COUNT",
+    "DEFAULT_SNAPSHOT_PATH",
+    "DEFAULT_SNAPSHOT_SEED",
+    "IK_ROUND_DIGITS",
+    "MGI_CONFIG_KEY_NAMES",
+    "SNAPSHOT_FIXED_JOINTS",
+    "SnapshotRecordComparison",
+    "compare_snapshot_record",
+    "compute_snapshot_record",
+    "extend_kinematics_snapshot",
+    "load_kinematics_snapshot",
+    "load_snapshot_robot",
+    "record_kinematics_snapshot",
+    "replay_kinematics_snapshot",
+    "snapshot_config_path",
+    "snapshot_joint_samples",
+    "write_kinematics_snapshot",
+]
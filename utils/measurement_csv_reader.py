@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator, TextIO
+
+import numpy as np
+
+
+DEFAULT_BLOCK_ROWS = 200_000
+MAX_REPORTED_ERRORS = 20
+# Sous cette taille, un bloc en erreur est relu ligne par ligne pour isoler les lignes invalides.
+_LINE_BY_LINE_ROWS = 64
+
+
+@dataclass
+class MeasurementParseReport:
+    """Bilan d'un import : les lignes invalides sont comptées et résumées en un seul message."""
+
+    rows_read: int = 0
+    rows_kept: int = 0
+    rows_decimated: int = 0
+    error_count: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    def add_error(self, line_number: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((int(line_number), str(message)))
+
+    def has_errors(self) -> bool:
+        return self.error_count > 0
+
+    def summary(self) -> str:
+        lines = [f"{self.error_count} ligne(s) ignorée(s) sur {self.rows_read} lue(s)."]
+        lines.extend(f"Ligne {line_number} : {message}" for line_number, message in self.errors)
+        if self.error_count > len(self.errors):
+            lines.append(f"... et {self.error_count - len(self.errors)} autre(s).")
+        return "\n".join(lines)
+
+
+@dataclass
+class MeasurementFrameBlock:
+    names: list[str]
+    transforms: np.ndarray
+    line_numbers: np.ndarray
+
+
+def _read_line_blocks(file: TextIO, block_rows: int) -> Iterator[list[str]]:
+    while True:
+        lines = file.readlines(max(1, int(block_rows)) * 48)
+        if not lines:
+            return
+        yield lines
+
+
+def _parse_numeric_lines(
+    lines: list[str],
+    line_numbers: np.ndarray,
+    usecols: tuple[int, ...],
+    report: MeasurementParseReport,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parse vectorisé (np.loadtxt) de lignes non vides.
+
+    Retourne les valeurs et la position (dans `lines`) de chaque ligne retenue. Un bloc
+    invalide est coupé en deux jusqu'à isoler les lignes fautives, relues une à une.
+    """
+    if not lines:
+        return np.empty((0, len(usecols)), dtype=float), np.empty(0, dtype=int)
+    try:
+        values = np.loadtxt(
+            [line.replace("\t", ",") for line in lines],
+            delimiter=",",
+            usecols=usecols,
+            comments=None,
+            dtype=float,
+            ndmin=2,
+        )
+        if len(values) == len(lines):
+            return values, np.arange(len(lines))
+    except ValueError:
+        pass
+    if len(lines) <= _LINE_BY_LINE_ROWS:
+        return _parse_lines_one_by_one(lines, line_numbers, usecols, report)
+    middle = len(lines) // 2
+    head_values, head_positions = _parse_numeric_lines(lines[:middle], line_numbers[:middle], usecols, report)
+    tail_values, tail_positions = _parse_numeric_lines(lines[middle:], line_numbers[middle:], usecols, report)
+    return np.vstack([head_values, tail_values]), np.concatenate([head_positions, tail_positions + middle])
+
+
+def _parse_lines_one_by_one(
+    lines: list[str],
+    line_numbers: np.ndarray,
+    usecols: tuple[int, ...],
+    report: MeasurementParseReport,
+) -> tuple[np.ndarray, np.ndarray]:
+    rows: list[list[float]] = []
+    positions: list[int] = []
+    for position, line in enumerate(lines):
+        parts = line.replace("\t", ",").split(",")
+        try:
+            rows.append([float(parts[column]) for column in usecols])
+            positions.append(position)
+        except (ValueError, IndexError):
+            report.add_error(int(line_numbers[position]), f"valeurs invalides ({line.strip()[:60]})")
+    values = np.array(rows, dtype=float).reshape(-1, len(usecols))
+    return values, np.array(positions, dtype=int)
+
+
+def _nonblank_lines(lines: list[str], first_line_number: int) -> tuple[list[str], np.ndarray]:
+    stripped = [line.strip() for line in lines]
+    positions = [index for index, line in enumerate(stripped) if line]
+    return [stripped[index] for index in positions], np.array(positions, dtype=int) + first_line_number
+
+
+def _is_header_line(line: str) -> bool:
+    """Ligne d'en-tête (ex. `X;Y;Z`, `X\tY\tZ`) : aucune des colonnes n'est numérique."""
+    for part in line.replace("\t", ",").replace(";", ",").split(","):
+        try:
+            float(part)
+            return False
+        except ValueError:
+            continue
+    return True
+
+
+def iter_xyz_blocks(
+    file_path: str,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    decimate: int = 1,
+    report: MeasurementParseReport | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Points X, Y, Z (3 premières colonnes, séparateur virgule ou tabulation) par blocs.
+
+    Produit des couples (points (n, 3), numéros de ligne (n,)). Une première ligne sans
+    valeur numérique est un en-tête, ignorée sans erreur. `decimate` ne conserve
+    qu'un point valide sur `decimate`.
+    """
+    report = report if report is not None else MeasurementParseReport()
+    step = max(1, int(decimate))
+    parsed_so_far = 0
+    first_line_number = 1
+    header_pending = True
+    with open(file_path, "r", encoding="utf-8-sig") as file:
+        for raw_lines in _read_line_blocks(file, block_rows):
+            lines, line_numbers = _nonblank_lines(raw_lines, first_line_number)
+            first_line_number += len(raw_lines)
+            if header_pending and lines:
+                header_pending = False
+                if _is_header_line(lines[0]):
+                    lines, line_numbers = lines[1:], line_numbers[1:]
+            report.rows_read += len(lines)
+            values, positions = _parse_numeric_lines(lines, line_numbers, (0, 1, 2), report)
+            numbers = line_numbers[positions]
+            if step > 1 and len(values):
+                selected = (np.arange(parsed_so_far, parsed_so_far + len(values)) % step) == 0
+                parsed_so_far += len(values)
+                report.rows_decimated += int(len(values) - np.count_nonzero(selected))
+                values = values[selected]
+                numbers = numbers[selected]
+            report.rows_kept += len(values)
+            if len(values):
+                yield values, numbers
+
+
+def read_xyz_measurements(
+    file_path: str,
+    decimate: int = 1,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> tuple[np.ndarray, np.ndarray, MeasurementParseReport]:
+    report = MeasurementParseReport()
+    blocks = list(iter_xyz_blocks(file_path, block_rows=block_rows, decimate=decimate, report=report))
+    if not blocks:
+        return np.empty((0, 3), dtype=float), np.empty(0, dtype=int), report
+    points = np.vstack([values for values, _ in blocks])
+    line_numbers = np.concatenate([numbers for _, numbers in blocks])
+    return points, line_numbers, report
+
+
+def _frame_name(label_line: str) -> str:
+    label = label_line.split(",", 1)[0].strip()
+    name = label.split("::")[-1] if "::" in label else label
+    return name.replace("'", "").strip()
+
+
+def iter_frame_blocks(
+    file_path: str,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    decimate: int = 1,
+    report: MeasurementParseReport | None = None,
+) -> Iterator[MeasurementFrameBlock]:
+    """Repères 4x4 du format tracker par blocs :
+
+        // Col::Object,T c0,T c1,T c2,T c3,[Timestamp]
+        Mesure::World_Frame,r00,r01,r02,tx
+        ,r10,r11,r12,ty
+        ,r20,r21,r22,tz
+        ,0,0,0,1
+
+    Une ligne étiquetée suivie de trois lignes de continuation forme un repère. `decimate`
+    conserve une occurrence sur `decimate` de chaque repère (suivi continu à haute fréquence).
+    """
+    report = report if report is not None else MeasurementParseReport()
+    step = max(1, int(decimate))
+    occurrences: dict[str, int] = {}
+    pending_lines: list[str] = []
+    pending_numbers = np.empty(0, dtype=int)
+    first_line_number = 2
+    with open(file_path, "r", encoding="utf-8-sig") as file:
+        file.readline()  # en-tête
+        for raw_lines in _read_line_blocks(file, block_rows):
+            lines, line_numbers = _nonblank_lines(raw_lines, first_line_number)
+            first_line_number += len(raw_lines)
+            lines = pending_lines + lines
+            line_numbers = np.concatenate([pending_numbers, line_numbers])
+            block, consumed = _parse_frame_lines(lines, line_numbers, report, final=False)
+            # Repère incomplet en fin de bloc : reporté sur le bloc suivant.
+            pending_lines = lines[consumed:]
+            pending_numbers = line_numbers[consumed:]
+            block = _decimate_frames(block, occurrences, step, report)
+            if block is not None:
+                yield block
+        if pending_lines:
+            block, _ = _parse_frame_lines(pending_lines, pending_numbers, report, final=True)
+            block = _decimate_frames(block, occurrences, step, report)
+            if block is not None:
+                yield block
+
+
+def _parse_frame_lines(
+    lines: list[str],
+    line_numbers: np.ndarray,
+    report: MeasurementParseReport,
+    final: bool,
+) -> tuple[MeasurementFrameBlock, int]:
+    continuation = np.fromiter((line.startswith(",") for line in lines), dtype=bool, count=len(lines))
+    labels = np.flatnonzero(~continuation)
+    consumed = len(lines)
+    if not final and len(labels) and consumed - labels[-1] < 4:
+        consumed = int(labels[-1])
+        labels = labels[:-1]
+    report.rows_read += consumed
+
+    values, positions = _parse_numeric_lines(lines[:consumed], line_numbers[:consumed], (1, 2, 3, 4), report)
+    row_of_line = np.full(consumed, -1, dtype=int)
+    row_of_line[positions] = np.arange(len(positions))
+
+    complete = np.zeros(len(labels), dtype=bool)
+    in_range = labels + 3 < consumed
+    if np.any(in_range):
+        rows = labels[in_range, None] + np.arange(4)[None, :]
+        complete[in_range] = continuation[rows[:, 1:]].all(axis=1) & (row_of_line[rows] >= 0).all(axis=1)
+    for label in labels[~complete]:
+        report.add_error(
+            int(line_numbers[label]),
+            f"matrice incomplète pour le repère '{_frame_name(lines[label])}' (16 valeurs attendues)",
+        )
+
+    # Lignes de continuation qui ne suivent aucune étiquette (étiquette illisible ou absente).
+    attached = np.zeros(consumed, dtype=bool)
+    following = labels.copy()
+    for _ in range(3):
+        following = following + 1
+        following = following[following < consumed]
+        following = following[continuation[following]]
+        attached[following] = True
+    for orphan in np.flatnonzero(continuation[:consumed] & ~attached):
+        report.add_error(int(line_numbers[orphan]), "ligne de continuation sans repère")
+
+    kept = labels[complete]
+    rows = row_of_line[kept[:, None] + np.arange(4)[None, :]]
+    transforms = values[rows.reshape(-1)].reshape(-1, 4, 4)
+    block = MeasurementFrameBlock([_frame_name(lines[label]) for label in kept], transforms, line_numbers[kept])
+    return block, consumed
+
+
+def _decimate_frames(
+    block: MeasurementFrameBlock,
+    occurrences: dict[str, int],
+    step: int,
+    report: MeasurementParseReport,
+) -> MeasurementFrameBlock | None:
+    if step > 1 and block.names:
+        selected = np.zeros(len(block.names), dtype=bool)
+        for index, name in enumerate(block.names):
+            occurrence = occurrences.get(name, 0)
+            occurrences[name] = occurrence + 1
+            selected[index] = occurrence % step == 0
+        report.rows_decimated += int(len(selected) - np.count_nonzero(selected))
+        block = MeasurementFrameBlock(
+            [name for name, keep in zip(block.names, selected) if keep],
+            block.transforms[selected],
+            block.line_numbers[selected],
+        )
+    report.rows_kept += len(block.names)
+    return block if block.names else None
+
+
+__all__ = [
+    "DEFAULT_BLOCK_ROWS",
+    "MeasurementFrameBlock",
+    "MeasurementParseReport",
+    "iter_frame_blocks",
+    "iter_xyz_blocks",
+    "read_xyz_measurements",
+]
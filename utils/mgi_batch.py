@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import pi
+
+import numpy as np
+
+from utils.mgi import (
+    EPSILON,
+    Q3_SINGULARITY_EPS,
+    MgiConfigKey,
+    MgiParams,
+    RobotTool,
+)
+
+
+CONFIG_COUNT = len(MgiConfigKey)
+_TWO_PI = 2.0 * pi
+
+
+@dataclass
+class MgiBatchResult:
+    """Résultat MGI vectorisé pour N poses, indexé [pose, MgiConfigKey.value, axe].
+
+    joints_deg: solutions brutes (table d'inversion appliquée, sans expansion 2π), en degrés.
+    reachable: la configuration admet une solution géométrique.
+    within_limits: au moins une expansion 2π de la solution respecte les limites d'axes
+        (équivalent à get_solutions_expanded(key, only_valid=True) non vide).
+    j1_singularity / j3_singularity / j5_singularity: drapeaux de singularité du MGI scalaire.
+    """
+    joints_deg: np.ndarray
+    reachable: np.ndarray
+    within_limits: np.ndarray
+    j1_singularity: np.ndarray
+    j3_singularity: np.ndarray
+    j5_singularity: np.ndarray
+
+    @property
+    def pose_count(self) -> int:
+        return int(self.reachable.shape[0])
+
+    def valid_mask(self, allowed_configs: set[MgiConfigKey] | None = None) -> np.ndarray:
+        """Masque (N, 8) des configurations valides et autorisées."""
+        mask = self.reachable & self.within_limits
+        if allowed_configs is None:
+            return mask
+        allowed = np.zeros(CONFIG_COUNT, dtype=bool)
+        for key in allowed_configs:
+            allowed[key.value] = True
+        return mask & allowed[None, :]
+
+    def config_bitmask(self, allowed_configs: set[MgiConfigKey] | None = None) -> np.ndarray:
+        """Bit k (uint8) à 1 si la configuration MgiConfigKey(k) est valide."""
+        weights = (1 << np.arange(CONFIG_COUNT)).astype(np.uint8)
+        return (self.valid_mask(allowed_configs).astype(np.uint8) * weights[None, :]).sum(axis=1).astype(np.uint8)
+
+    def joints_within_limits_deg(self, axis_limits_deg: np.ndarray) -> np.ndarray:
+        """Solutions ramenées (expansion 2π) au plus près du milieu de la plage de chaque axe."""
+        return _shift_into_limits(np.radians(self.joints_deg), np.radians(axis_limits_deg), to_degrees=True)
+
+
+def poses_to_matrices(poses: np.ndarray) -> np.ndarray:
+    """Poses (N, 6) [X, Y, Z, A, B, C] (degrés, ZYX Kuka) vers matrices homogènes (N, 4, 4)."""
+    poses = np.asarray(poses, dtype=float).reshape(-1, 6)
+    a, b, c = (np.radians(poses[:, i]) for i in (3, 4, 5))
+    ca, sa = np.cos(a), np.sin(a)
+    cb, sb = np.cos(b), np.sin(b)
+    cc, sc = np.cos(c), np.sin(c)
+
+    matrices = np.zeros((poses.shape[0], 4, 4), dtype=float)
+    # R = Rz(A) @ Ry(B) @ Rx(C)
+    matrices[:, 0, 0] = ca * cb
+    matrices[:, 0, 1] = ca * sb * sc - sa * cc
+    matrices[:, 0, 2] = ca * sb * cc + sa * sc
+    matrices[:, 1, 0] = sa * cb
+    matrices[:, 1, 1] = sa * sb * sc + ca * cc
+    matrices[:, 1, 2] = sa * sb * cc - ca * sc
+    matrices[:, 2, 0] = -sb
+    matrices[:, 2, 1] = cb * sc
+    matrices[:, 2, 2] = cb * cc
+    matrices[:, :3, 3] = poses[:, :3]
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def matrices_to_poses(matrices: np.ndarray) -> np.ndarray:
+    """Matrices homogènes (N, 4, 4) vers poses (N, 6) [X, Y, Z, A, B, C] (degrés, ZYX Kuka)."""
+    matrices = np.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+    rotations = matrices[:, :3, :3]
+    b = np.arctan2(-rotations[:, 2, 0], np.hypot(rotations[:, 0, 0], rotations[:, 1, 0]))
+    a = np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0])
+    c = np.arctan2(rotations[:, 2, 1], rotations[:, 2, 2])
+    return np.column_stack([matrices[:, :3, 3], np.degrees(np.column_stack([a, b, c]))])
+
+
+def _tool_inverse_matrix(tool: RobotTool | None) -> np.ndarray | None:
+    if tool is None or tool.is_identity():
+        return None
+    tool_matrix = poses_to_matrices(np.array([[tool.x, tool.y, tool.z, tool.a, tool.b, tool.c]]))[0]
+    inverse = np.eye(4)
+    inverse[:3, :3] = tool_matrix[:3, :3].T
+    inverse[:3, 3] = -tool_matrix[:3, :3].T @ tool_matrix[:3, 3]
+    return inverse
+
+
+def _add_pi(angle: np.ndarray) -> np.ndarray:
+    return np.where(angle <= 0.0, angle + pi, angle - pi)
+
+
+def _solve_eq_type2(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Version vectorisée de MGI._solve_eq_type2 : x sin(q) + y cos(q) = z.
+
+    Returns:
+        (solvable, q_a, q_b), mêmes branches et même ordre de solutions que la version scalaire.
+    """
+    x, y, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float))
+    x_zero = np.abs(x) < EPSILON
+    y_zero = np.abs(y) < EPSILON
+    # Branches exclusives, dans l'ordre des tests du MGI scalaire
+    case_both_zero = x_zero & y_zero
+    case_x_zero = x_zero & ~y_zero
+    case_y_zero = ~x_zero & y_zero
+    remaining = ~x_zero & ~y_zero
+    case_z_zero = remaining & (np.abs(z) < EPSILON)
+    case_general = remaining & ~case_z_zero
+
+    solvable = np.zeros(x.shape, dtype=bool)
+    q_a = np.zeros(x.shape, dtype=float)
+    q_b = np.zeros(x.shape, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # x = 0, y != 0 => y cos(q) = z
+        cosq = np.where(case_x_zero, z / np.where(y_zero, 1.0, y), 0.0)
+        ok = case_x_zero & (np.abs(cosq) <= 1.0 + EPSILON)
+        cosq = np.clip(cosq, -1.0, 1.0)
+        sinq = np.sqrt(np.maximum(0.0, 1.0 - cosq ** 2))
+        q_a = np.where(ok, np.arctan2(sinq, cosq), q_a)
+        q_b = np.where(ok, np.arctan2(-sinq, cosq), q_b)
+        solvable |= ok
+
+        # x != 0, y = 0 => x sin(q) = z
+        sinq = np.where(case_y_zero, z / np.where(x_zero, 1.0, x), 0.0)
+        ok = case_y_zero & (np.abs(sinq) <= 1.0 + EPSILON)
+        sinq = np.clip(sinq, -1.0, 1.0)
+        cosq = np.sqrt(np.maximum(0.0, 1.0 - sinq ** 2))
+        q_a = np.where(ok, np.arctan2(sinq, cosq), q_a)
+        q_b = np.where(ok, np.arctan2(sinq, -cosq), q_b)
+        solvable |= ok
+
+        # x != 0, y != 0, z = 0
+        q_z = np.arctan2(-y, x)
+        q_a = np.where(case_z_zero, q_z, q_a)
+        q_b = np.where(case_z_zero, _add_pi(q_z), q_b)
+        solvable |= case_z_zero
+
+        # Cas général
+        x2y2 = x * x + y * y
+        ok = case_general & (x2y2 >= z * z - EPSILON)
+        sqrt_term = np.sqrt(np.maximum(0.0, x2y2 - z * z))
+        denominator = np.where(ok, x2y2, 1.0)
+        q_a = np.where(ok, np.arctan2((x * z + y * sqrt_term) / denominator, (y * z - x * sqrt_term) / denominator), q_a)
+        q_b = np.where(ok, np.arctan2((x * z - y * sqrt_term) / denominator, (y * z + x * sqrt_term) / denominator), q_b)
+        solvable |= ok
+
+    # x = 0 et y = 0 : le MGI scalaire considère le cas sans solution (solve_case < 0)
+    q_b = np.where(case_both_zero, pi, q_b)
+    return solvable, q_a, q_b
+
+
+def _shift_into_limits(joints_rad: np.ndarray, axis_limits_rad: np.ndarray, to_degrees: bool = False) -> np.ndarray:
+    """Expansion 2π vectorisée : choisit, par axe, le décalage admissible le plus proche du milieu de la plage."""
+    q_min = axis_limits_rad[:, 0]
+    q_max = axis_limits_rad[:, 1]
+    k_min = np.ceil((q_min - joints_rad) / _TWO_PI - EPSILON)
+    k_max = np.floor((q_max - joints_rad) / _TWO_PI + EPSILON)
+    k_mid = np.round(((q_min + q_max) * 0.5 - joints_rad) / _TWO_PI)
+    shifted = joints_rad + _TWO_PI * np.clip(k_mid, k_min, np.maximum(k_min, k_max))
+    return np.degrees(shifted) if to_degrees else shifted
+
+
+def _within_limits(joints_rad: np.ndarray, axis_limits_rad: np.ndarray) -> np.ndarray:
+    q_min = axis_limits_rad[:, 0]
+    q_max = axis_limits_rad[:, 1]
+    k_min = np.ceil((q_min - joints_rad) / _TWO_PI - EPSILON)
+    k_max = np.floor((q_max - joints_rad) / _TWO_PI + EPSILON)
+    return np.all(k_min <= k_max, axis=-1)
+
+
+def compute_mgi_batch(
+    params: MgiParams,
+    poses: np.ndarray,
+    tool: RobotTool | None = None,
+    default_q1_rad: float = 0.0,
+    default_q4_rad: float = 0.0,
+    default_q6_rad: float = 0.0,
+) -> MgiBatchResult:
+    """MGI analytique vectorisé pour N poses TCP (N, 6) en repère robot.
+
+    Reproduit MGI.compute_mgi avec le comportement CONTINUE sur les singularités :
+    mêmes branches Front/Back, Up/Down, Flip/No Flip, même table d'inversion et même
+    expansion 2π des limites d'axes, mais sans objet MgiResult par pose.
+    """
+    geometric = params.geometric_params
+    identifier = params.configuration_identifier
+
+    matrices = poses_to_matrices(poses)
+    tool_inverse = _tool_inverse_matrix(tool)
+    if tool_inverse is not None:
+        matrices = matrices @ tool_inverse
+    rotations = matrices[:, :3, :3]
+
+    # Centre poignet : -R6 le long de Z flange, -R1 sur Z base
+    x = matrices[:, 0, 3] - geometric.R6 * rotations[:, 0, 2]
+    y = matrices[:, 1, 3] - geometric.R6 * rotations[:, 1, 2]
+    z = matrices[:, 2, 3] - geometric.R1 - geometric.R6 * rotations[:, 2, 2]
+    count = x.shape[0]
+
+    joints = np.zeros((count, CONFIG_COUNT, 6), dtype=float)
+    reachable = np.ones((count, CONFIG_COUNT), dtype=bool)
+    j3_singularity = np.zeros((count, CONFIG_COUNT), dtype=bool)
+    j5_singularity = np.zeros((count, CONFIG_COUNT), dtype=bool)
+
+    # Q1
+    j1_singular = (np.abs(x) < EPSILON) & (np.abs(y) < EPSILON)
+    q1_front = np.where(j1_singular, default_q1_rad, np.arctan2(y, x))
+    q1_back = _add_pi(q1_front)
+    swap = ~np.asarray(identifier.is_front(q1_front), dtype=bool)
+    q1_front, q1_back = np.where(swap, q1_back, q1_front), np.where(swap, q1_front, q1_back)
+    j1_singularity = np.repeat(j1_singular[:, None], CONFIG_COUNT, axis=1)
+
+    branches = (
+        (q1_front, MgiConfigKey.FUN, MgiConfigKey.FUF, MgiConfigKey.FDN, MgiConfigKey.FDF),
+        (q1_back, MgiConfigKey.BUN, MgiConfigKey.BUF, MgiConfigKey.BDN, MgiConfigKey.BDF),
+    )
+    for q1, up_no_flip, up_flip, down_no_flip, down_flip in branches:
+        # Q2, Q3
+        k1 = x * np.cos(q1) + y * np.sin(q1) - geometric.D2
+        ok_2, q2_a, q2_b = _solve_eq_type2(
+            z,
+            -k1,
+            (geometric.R4 ** 2 + geometric.D4 ** 2 - k1 ** 2 - z ** 2 - geometric.D3 ** 2) / (2 * geometric.D3),
+        )
+        ok_3, q3_a, q3_b = _solve_eq_type2(
+            np.full(count, geometric.D4),
+            np.full(count, geometric.R4),
+            (k1 ** 2 + z ** 2 - geometric.D3 ** 2 - geometric.R4 ** 2 - geometric.D4 ** 2) / (2 * geometric.D3),
+        )
+        solvable = ok_2 & ok_3
+        q3_singular = np.abs(np.arctan2(np.sin(q3_a - q3_b), np.cos(q3_a - q3_b))) <= Q3_SINGULARITY_EPS
+        a_is_up = np.asarray(identifier.is_up(q3_a), dtype=bool)
+        q2_up, q2_down = np.where(a_is_up, q2_a, q2_b), np.where(a_is_up, q2_b, q2_a)
+        q3_up, q3_down = np.where(a_is_up, q3_a, q3_b), np.where(a_is_up, q3_b, q3_a)
+
+        # Rotation flange exprimée dans le repère tourné de -q1
+        cq1, sq1 = np.cos(q1), np.sin(q1)
+        r0 = cq1[:, None] * rotations[:, 0, :] + sq1[:, None] * rotations[:, 1, :]
+        r1 = -sq1[:, None] * rotations[:, 0, :] + cq1[:, None] * rotations[:, 1, :]
+        r2 = rotations[:, 2, :]
+
+        for q2, q3, no_flip_key, flip_key in ((q2_up, q3_up, up_no_flip, up_flip), (q2_down, q3_down, down_no_flip, down_flip)):
+            s23, c23 = np.sin(q2 + q3), np.cos(q2 + q3)
+            s5s4 = r1[:, 2]
+            s5c4 = -r0[:, 2] * s23 - r2[:, 2] * c23
+            q5_singular = (np.abs(s5s4) < EPSILON) & (np.abs(s5c4) < EPSILON)
+
+            q4_no_flip = np.where(q5_singular, default_q4_rad, np.arctan2(s5s4, s5c4))
+            q4_flip = _add_pi(q4_no_flip)
+            swap = np.asarray(identifier.is_flipped(q4_no_flip), dtype=bool)
+            q4_no_flip, q4_flip = np.where(swap, q4_flip, q4_no_flip), np.where(swap, q4_no_flip, q4_flip)
+
+            for key, q4, q6_default in ((no_flip_key, q4_no_flip, default_q6_rad), (flip_key, q4_flip, _add_pi(default_q6_rad))):
+                s4, c4 = np.sin(q4), np.cos(q4)
+                s5 = r1[:, 2] * s4 - (r0[:, 2] * s23 + r2[:, 2] * c23) * c4
+                c5 = r0[:, 2] * c23 - r2[:, 2] * s23
+                s6 = (r2[:, 0] * c23 + r0[:, 0] * s23) * s4 + r1[:, 0] * c4
+                c6 = r1[:, 1] * c4 + (r0[:, 1] * s23 + r2[:, 1] * c23) * s4
+                q5 = np.where(q5_singular, 0.0, np.arctan2(s5, c5))
+                q6 = np.where(q5_singular, q6_default, np.arctan2(s6, c6))
+
+                index = key.value
+                joints[:, index, 0] = q1
+                joints[:, index, 1] = np.where(solvable, q2, 0.0)
+                joints[:, index, 2] = np.where(solvable, q3, 0.0)
+                joints[:, index, 3] = np.where(solvable, q4, 0.0)
+                joints[:, index, 4] = np.where(solvable, q5, 0.0)
+                joints[:, index, 5] = np.where(solvable, q6, 0.0)
+                reachable[:, index] = solvable
+                j3_singularity[:, index] = solvable & q3_singular
+                j5_singularity[:, index] = solvable & q5_singular
+
+    invert = np.array([-1.0 if inverted else 1.0 for inverted in params.invert_table[:6]], dtype=float)
+    joints *= invert[None, None, :]
+
+    axis_limits = np.asarray(params.axis_limits.axis_limits[:6], dtype=float)
+    axis_limits_rad = axis_limits if params.axis_limits.radians else np.radians(axis_limits)
+    within_limits = reachable & _within_limits(joints, axis_limits_rad)
+
+    return MgiBatchResult(
+        joints_deg=np.degrees(joints),
+        reachable=reachable,
+        within_limits=within_limits,
+        j1_singularity=j1_singularity,
+        j3_singularity=j3_singularity,
+        j5_singularity=j5_singularity,
+    )
+
+
+__all__ = [
+    "CONFIG_COUNT",
+    "MgiBatchResult",
+    "compute_mgi_batch",
+    "matrices_to_poses",
+    "poses_to_matrices",
+]
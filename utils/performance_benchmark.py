@@ -0,0 +1,530 @@
+"""
+Banc de performance sans interface : cinématique, construction de trajectoire, validité,
+simulation de programme et parsers de programmes.
+
+Tout est synthétique et déterministe (robot 6 axes type KR10, outil, zone de collision,
+jeux articulaires tirés d'une graine fixe, keypoints et programmes générés) : deux exécutions
+sur la même machine mesurent exactement le même travail. Chaque cas est chronométré sur
+plusieurs répétitions (médiane retenue) puis rejoué une fois sous tracemalloc pour relever
+le pic mémoire Python. Le rapport JSON peut servir de référence à une exécution suivante ;
+compare_with_baseline signale les cas dont le débit a baissé au-delà d'un seuil.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+
+from models.external_axes_model import ExternalAxesModel
+from models.primitive_collider_models import PrimitiveColliderData
+from models.program_generation_settings import ProgramGenerationSettings
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.tool_model import ToolModel
+from models.tooling_model import ToolingModel
+from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
+from models.types import Pose6
+from models.workpiece_model import WorkpieceModel
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.full_builder import TrajectoryBuilder
+from trajectory_engine.core.validity_analyzer import ValidityAnalyzer, build_validity_context_snapshot
+from trajectory_engine.models.pipeline import BuildCancelToken, TrajectorySegment
+from utils.aptsource_parser import load_aptsource_program
+from utils.catnc_parser import load_catnc_program
+from utils.mgi import RobotTool
+from utils.mgi_jacobien import MgiJacobienParams, mgi_jacobien
+from utils.program_batch_runner import BatchCell, prepare_batch_program
+from utils.robot_program_kuka import load_kuka_src_program
+
+
+BENCHMARK_FORMAT_VERSION = 1
+DEFAULT_REPEAT = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+DEFAULT_SEED = 20240611
+
+# Géométrie de type KUKA KR10 R1100 : valeurs fixes, indépendantes des fichiers utilisateur.
+SYNTHETIC_ROBOT_CONFIGURATION: dict[str, Any] = {
+    "name": "Robot synthétique benchmark",
+    "dh": [
+        [0.0, 0.0, 0.0, 400.0],
+        [-90.0, 25.0, 0.0, 0.0],
+        [0.0, 560.0, -90.0, 0.0],
+        [-90.0, 35.0, 0.0, 515.0],
+        [90.0, 0.0, 0.0, 0.0],
+        [-90.0, 0.0, 180.0, 80.0],
+    ],
+    "dh_measured": [[0.0, 0.0, 0.0, 0.0] for _ in range(6)],
+    "dh_measured_enabled": False,
+    "corr": [[0.0] * 6 for _ in range(6)],
+    "axis_limits": [[-170.0, 170.0], [-190.0, 45.0], [-120.0, 156.0], [-185.0, 185.0], [-120.0, 120.0], [-350.0, 350.0]],
+    "cartesian_slider_limits_xyz": [[-1100.0, 1100.0], [-1100.0, 1100.0], [-1100.0, 1100.0]],
+    "axis_speed_limits": [300.0, 225.0, 255.0, 381.0, 311.0, 492.0],
+    "axis_accel_limits": [1340.0, 1060.0, 1130.0, 1690.0, 1420.0, 2104.0],
+    "axis_jerk_limits": [6000.0, 5000.0, 5000.0, 7500.0, 6500.0, 9000.0],
+    "axis_colliders": [
+        {"axis": 0, "enabled": True, "radius": 140.0, "height": -480.0, "direction_axis": "z", "offset_xyz": [0.0, 0.0, 80.0]},
+        {"axis": 1, "enabled": True, "radius": 80.0, "height": 655.0, "direction_axis": "x", "offset_xyz": [0.0, 0.0, 0.0]},
+        {"axis": 2, "enabled": True, "radius": 60.0, "height": 555.0, "direction_axis": "y", "offset_xyz": [35.0, 0.0, 0.0]},
+        {"axis": 3, "enabled": False, "radius": 70.0, "height": 0.0, "direction_axis": "z", "offset_xyz": [0.0, 0.0, 0.0]},
+        {"axis": 4, "enabled": True, "radius": 40.0, "height": 80.0, "direction_axis": "y", "offset_xyz": [0.0, 0.0, 0.0]},
+        {"axis": 5, "enabled": False, "radius": 40.0, "height": 0.0, "direction_axis": "z", "offset_xyz": [0.0, 0.0, 0.0]},
+    ],
+    "axis_reversed": [-1, 1, 1, -1, 1, -1],
+    "joint_weights": [1.0] * 6,
+    "allowed_configs": ["FUN", "FUF", "FDN", "FDF", "BUN", "BUF", "BDN", "BDF"],
+    "home_position": [0.0, -90.0, 90.0, 0.0, 45.0, 0.0],
+    "position_zero": [0.0, -90.0, 90.0, 0.0, 0.0, 0.0],
+    "position_calibration": [0.0, -105.0, 156.0, 0.0, 120.0, 0.0],
+    "robot_cad_models": [],
+}
+SYNTHETIC_TOOL_POSE = Pose6(0.0, 0.0, 150.0, 0.0, 0.0, 0.0)
+# Centre des trajectoires et programmes synthétiques, dans le repère robot, outil vers le bas.
+SYNTHETIC_WORK_CENTER = Pose6(650.0, 0.0, 350.0, 0.0, 180.0, 0.0)
+
+
+@dataclass
+class BenchmarkCell:
+    robot_model: RobotModel
+    tool_model: ToolModel
+    workspace_model: WorkspaceModel
+
+    def robot_tool(self) -> RobotTool:
+        pose = self.tool_model.get_tool_pose()
+        return RobotTool(pose.x, pose.y, pose.z, pose.a, pose.b, pose.c)
+
+    def batch_cell(self) -> BatchCell:
+        return BatchCell(
+            robot_model=self.robot_model,
+            tool_model=self.tool_model,
+            workspace_model=self.workspace_model,
+            external_axes_model=ExternalAxesModel(),
+            workpiece_model=WorkpieceModel(),
+            tooling_model=ToolingModel(),
+        )
+
+
+@dataclass(frozen=True)
+class BenchmarkSizes:
+    """Volume de travail de chaque cas ; scaled() l'ajuste (smoke test rapide ou passe longue)."""
+
+    fk_poses: int = 2000
+    mgi_poses: int = 1000
+    jacobian_poses: int = 100
+    trajectory_keypoints: int = 12
+    program_motions: int = 60
+    parser_lines: int = 20000
+
+    def scaled(self, scale: float) -> "BenchmarkSizes":
+        values = {key: max(2, int(round(value * float(scale)))) for key, value in asdict(self).items()}
+        return BenchmarkSizes(**values)
+
+
+@dataclass
+class BenchmarkCaseResult:
+    name: str
+    unit: str
+    items: int
+    repeat: int
+    median_s: float
+    min_s: float
+    items_per_s: float
+    peak_memory_kib: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkReport:
+    cases: list[BenchmarkCaseResult] = field(default_factory=list)
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def case(self, name: str) -> BenchmarkCaseResult | None:
+        return next((case for case in self.cases if case.name == name), None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format_version": BENCHMARK_FORMAT_VERSION,
+            "meta": dict(self.meta),
+            "cases": [case.to_dict() for case in self.cases],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkReport":
+        if int(data.get("format_version", 0)) != BENCHMARK_FORMAT_VERSION:
+            raise ValueError(f"Version de rapport benchmark non supportée : {data.get('format_version')}")
+        return cls(
+            cases=[BenchmarkCaseResult(**case) for case in data.get("cases", [])],
+            meta=dict(data.get("meta", {})),
+        )
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BenchmarkReport":
+        with Path(path).open("r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    name: str
+    baseline_items_per_s: float
+    current_items_per_s: float
+    ratio: float
+    regression: bool
+
+
+def build_synthetic_cell() -> BenchmarkCell:
+    """Robot, outil et scène synthétiques (une zone de collision hors de la zone de travail)."""
+    robot_model = RobotModel()
+    robot_model.load_from_configuration_file(RobotConfigurationFile.from_dict(SYNTHETIC_ROBOT_CONFIGURATION), "")
+    tool_model = ToolModel()
+    tool_model.set_tool(RobotTool(*SYNTHETIC_TOOL_POSE.to_list()))
+    workspace_model = WorkspaceModel()
+    workspace_model.set_workspace_collision_zones(
+        [PrimitiveColliderData("Table", pose=Pose6(0.0, -900.0, -150.0, 0.0, 0.0, 0.0), size_x=600.0, size_y=400.0, size_z=300.0)]
+    )
+    return BenchmarkCell(robot_model, tool_model, workspace_model)
+
+
+def synthetic_joint_samples(cell: BenchmarkCell, count: int, seed: int = DEFAULT_SEED) -> np.ndarray:
+    """Jeux articulaires (deg) tirés uniformément dans 80 % des butées, graine fixe."""
+    limits = np.array(cell.robot_model.get_axis_limits(), dtype=float)[:6]
+    center = limits.mean(axis=1)
+    half_span = 0.4 * (limits[:, 1] - limits[:, 0])
+    rng = np.random.default_rng(seed)
+    return center + rng.uniform(-1.0, 1.0, size=(int(count), 6)) * half_span
+
+
+def synthetic_work_poses(count: int, seed: int = DEFAULT_SEED) -> list[Pose6]:
+    """Poses TCP atteignables autour de SYNTHETIC_WORK_CENTER (±150 mm, ±15°)."""
+    rng = np.random.default_rng(seed)
+    center = np.array(SYNTHETIC_WORK_CENTER.to_list())
+    spread = np.array([150.0, 150.0, 150.0, 15.0, 15.0, 15.0])
+    return [Pose6(*(center + rng.uniform(-1.0, 1.0, size=6) * spread)) for _ in range(int(count))]
+
+
+def synthetic_keypoints(count: int) -> list[TrajectoryKeypoint]:
+    """Départ articulaire puis alternance PTP / LIN sur un carré parcouru en zigzag."""
+    keypoints = [
+        TrajectoryKeypoint(
+            target_type=KeypointTargetType.JOINT,
+            joint_target=SYNTHETIC_ROBOT_CONFIGURATION["home_position"],
+            mode=KeypointMotionMode.PTP,
+        )
+    ]
+    center = SYNTHETIC_WORK_CENTER
+    for index in range(max(1, int(count) - 1)):
+        x = center.x + (150.0 if index % 4 in (1, 2) else -150.0)
+        y = center.y + (150.0 if index % 4 >= 2 else -150.0)
+        z = center.z + 20.0 * (index % 3)
+        keypoints.append(
+            TrajectoryKeypoint(
+                cartesian_target=Pose6(x, y, z, center.a, center.b, center.c),
+                mode=KeypointMotionMode.PTP if index % 2 == 0 else KeypointMotionMode.LINEAR,
+            )
+        )
+    return keypoints
+
+
+def _zigzag_xyz(count: int) -> list[tuple[float, float, float]]:
+    points = []
+    for index in range(int(count)):
+        row, column = divmod(index, 20)
+        x = -100.0 + 10.0 * (column if row % 2 == 0 else 19 - column)
+        points.append((x, -100.0 + 5.0 * (row % 40), 5.0 * (index % 3)))
+    return points
+
+
+def synthetic_krl_text(motion_count: int) -> str:
+    center = SYNTHETIC_WORK_CENTER
+    lines = [
+        "DEF benchmark()",
+        f"$BASE = {{X {center.x:.1f}, Y {center.y:.1f}, Z {center.z:.1f}, A 0, B 0, C 0}}",
+        f"$TOOL = {{X {SYNTHETIC_TOOL_POSE.x:.1f}, Y {SYNTHETIC_TOOL_POSE.y:.1f}, Z {SYNTHETIC_TOOL_POSE.z:.1f}, A 0, B 0, C 0}}",
+        "$VEL.CP = 0.25",
+        "PTP {A1 0, A2 -90, A3 90, A4 0, A5 45, A6 0}",
+    ]
+    for x, y, z in _zigzag_xyz(motion_count):
+        lines.append(f"LIN {{X {x:.3f}, Y {y:.3f}, Z {z:.3f}, A 0, B 180, C 0}}")
+    lines.append("END")
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_apt_text(line_count: int) -> str:
+    lines = ["PARTNO/BENCHMARK", "FEDRAT/3000.0", "FROM/0.0,0.0,100.0"]
+    for index, (x, y, z) in enumerate(_zigzag_xyz(line_count)):
+        if index % 50 == 0:
+            lines.append("RAPID")
+        lines.append(f"GOTO/{x:.4f},{y:.4f},{z:.4f},0.000000,0.000000,1.000000")
+    lines.append("FINI")
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_nc_text(line_count: int) -> str:
+    lines = ["G90 G21 G17", "G00 X0 Y0 Z100", "G01 F3000"]
+    for index, (x, y, z) in enumerate(_zigzag_xyz(line_count)):
+        if index % 25 == 24:
+            lines.append(f"G02 X{x:.4f} Y{y:.4f} Z{z:.4f} I5.0 J0.0")
+        else:
+            lines.append(f"G01 X{x:.4f} Y{y:.4f} Z{z:.4f}")
+    lines.append("M30")
+    return "\n".join(lines) + "\n"
+
+
+# Un cas = (nom, unité des éléments comptés, fabrique du callable mesuré).
+# La fabrique prépare les données hors chronométrage ; le callable retourne le nombre d'éléments traités.
+BenchmarkCase = tuple[str, str, Callable[[BenchmarkCell, BenchmarkSizes, str], Callable[[], int]]]
+
+
+def _fk_case(cell: BenchmarkCell, sizes: BenchmarkSizes, _work_dir: str) -> Callable[[], int]:
+    joints = synthetic_joint_samples(cell, sizes.fk_poses).tolist()
+    tool = cell.robot_tool()
+
+    def run() -> int:
+        for values in joints:
+            cell.robot_model.compute_fk(*values, tool=tool)
+        return len(joints)
+
+    return run
+
+
+def _mgi_case(cell: BenchmarkCell, sizes: BenchmarkSizes, _work_dir: str) -> Callable[[], int]:
+    poses = synthetic_work_poses(sizes.mgi_poses)
+    tool = cell.robot_tool()
+
+    def run() -> int:
+        for pose in poses:
+            cell.robot_model.compute_ik_target(pose, tool=tool)
+        return len(poses)
+
+    return run
+
+
+def _mgi_jacobian_case(cell: BenchmarkCell, sizes: BenchmarkSizes, _work_dir: str) -> Callable[[], int]:
+    # Cibles = MGD d'un jeu articulaire ; départ perturbé de 2° pour forcer quelques itérations.
+    tool = cell.robot_tool()
+    joints = synthetic_joint_samples(cell, sizes.jacobian_poses)
+    targets = [cell.robot_model.compute_fk(*values, tool=tool).corrected_pose.to_list() for values in joints.tolist()]
+    initial = (joints + np.random.default_rng(DEFAULT_SEED + 1).uniform(-2.0, 2.0, size=joints.shape)).tolist()
+    params = MgiJacobienParams()
+
+    def run() -> int:
+        for target, q_initial in zip(targets, initial):
+            mgi_jacobien(target, cell.robot_model, q_initial, params, tool=tool)
+        return len(targets)
+
+    return run
+
+
+def _build_trajectory(cell: BenchmarkCell, sizes: BenchmarkSizes):
+    keypoints = synthetic_keypoints(sizes.trajectory_keypoints)
+    segments = [TrajectorySegment(keypoints[i], keypoints[i + 1]) for i in range(len(keypoints) - 1)]
+    builder = TrajectoryBuilder(cell.robot_model, cell.tool_model, cell.workspace_model)
+    home = list(SYNTHETIC_ROBOT_CONFIGURATION["home_position"])
+    return builder.compute_trajectory(home, segments)
+
+
+def _trajectory_case(cell: BenchmarkCell, sizes: BenchmarkSizes, _work_dir: str) -> Callable[[], int]:
+    def run() -> int:
+        result = _build_trajectory(cell, sizes)
+        return sum(len(segment.samples) for segment in result.segments)
+
+    return run
+
+
+def _validity_case(cell: BenchmarkCell, sizes: BenchmarkSizes, _work_dir: str) -> Callable[[], int]:
+    result = _build_trajectory(cell, sizes)
+    entries = [
+        (sample, segment_index, sample_index)
+        for segment_index, segment in enumerate(result.segments)
+        for sample_index, sample in enumerate(segment.samples)
+    ]
+    context = build_validity_context_snapshot(cell.robot_model, cell.tool_model, cell.workspace_model)
+
+    def run() -> int:
+        analyzer = ValidityAnalyzer(context)
+        cancel_token = BuildCancelToken()
+        for global_index, (sample, segment_index, sample_index) in enumerate(entries):
+            analyzer.analyze_sample(sample, segment_index, sample_index, global_index, cancel_token)
+        return len(entries)
+
+    return run
+
+
+def _program_simulation_case(cell: BenchmarkCell, sizes: BenchmarkSizes, work_dir: str) -> Callable[[], int]:
+    path = os.path.join(work_dir, "benchmark.src")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(synthetic_krl_text(sizes.program_motions))
+    batch_cell = cell.batch_cell()
+    program = load_kuka_src_program(path)
+    settings = ProgramGenerationSettings.from_dict(None)
+
+    def run() -> int:
+        simulator = batch_cell.create_simulator()
+        prepared, _tool_pose = prepare_batch_program(batch_cell, simulator, program, settings)
+        return len(simulator.simulate_program(prepared, include_compensation=False).nominal_samples)
+
+    return run
+
+
+def _parser_case(extension: str, text_factory: Callable[[int], str], loader: Callable[[str], Any]):
+    def factory(_cell: BenchmarkCell, sizes: BenchmarkSizes, work_dir: str) -> Callable[[], int]:
+        path = os.path.join(work_dir, f"benchmark{extension}")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text_factory(sizes.parser_lines))
+
+        def run() -> int:
+            return len(loader(path).motions)
+
+        return run
+
+    return factory
+
+
+BENCHMARK_CASES: list[BenchmarkCase] = [
+    ("robot_fk", "poses", _fk_case),
+    ("mgi_analytic", "poses", _mgi_case),
+    ("mgi_jacobian", "poses", _mgi_jacobian_case),
+    ("trajectory_build", "samples", _trajectory_case),
+    ("validity_pass", "samples", _validity_case),
+    ("program_simulation", "samples", _program_simulation_case),
+    ("parse_krl", "motions", _parser_case(".src", synthetic_krl_text, load_kuka_src_program)),
+    ("parse_apt", "motions", _parser_case(".apt", synthetic_apt_text, load_aptsource_program)),
+    ("parse_nc", "motions", _parser_case(".nc", synthetic_nc_text, load_catnc_program)),
+]
+BENCHMARK_CASE_NAMES = [name for name, _unit, _factory in BENCHMARK_CASES]
+
+
+def measure_case(name: str, unit: str, run: Callable[[], int], repeat: int = DEFAULT_REPEAT) -> BenchmarkCaseResult:
+    """Chronomètre run() `repeat` fois (médiane) puis le rejoue sous tracemalloc pour le pic mémoire."""
+    durations: list[float] = []
+    items = 0
+    for _ in range(max(1, int(repeat))):
+        start = time.perf_counter()
+        items = int(run())
+        durations.append(time.perf_counter() - start)
+
+    # Passe séparée : tracemalloc ralentit l'exécution et fausserait les durées.
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    run()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    if not was_tracing:
+        tracemalloc.stop()
+
+    median_s = statistics.median(durations)
+    return BenchmarkCaseResult(
+        name=name,
+        unit=unit,
+        items=items,
+        repeat=len(durations),
+        median_s=median_s,
+        min_s=min(durations),
+        items_per_s=items / median_s if median_s > 0.0 else 0.0,
+        peak_memory_kib=max(0, peak_bytes - baseline_bytes) / 1024.0,
+    )
+
+
+def run_benchmarks(
+    scale: float = 1.0,
+    repeat: int = DEFAULT_REPEAT,
+    selected: list[str] | None = None,
+    progress: Callable[[BenchmarkCaseResult], None] | None = None,
+) -> BenchmarkReport:
+    """Exécute les cas demandés (tous par défaut) sur la cellule synthétique."""
+    unknown = sorted(set(selected or []) - set(BENCHMARK_CASE_NAMES))
+    if unknown:
+        raise ValueError(f"Cas de benchmark inconnus : {', '.join(unknown)}")
+    sizes = BenchmarkSizes().scaled(scale)
+    cell = build_synthetic_cell()
+    report = BenchmarkReport(
+        meta={
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "scale": float(scale),
+            "repeat": int(repeat),
+            "sizes": asdict(sizes),
+        }
+    )
+    with tempfile.TemporaryDirectory(prefix="calibrax_benchmark_") as work_dir:
+        for name, unit, factory in BENCHMARK_CASES:
+            if selected and name not in selected:
+                continue
+            result = measure_case(name, unit, factory(cell, sizes, work_dir), repeat)
+            report.cases.append(result)
+            if progress is not None:
+                progress(result)
+    return report
+
+
+def compare_with_baseline(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[BenchmarkComparison]:
+    """Compare les débits (éléments/s) des cas communs ; régression si le débit baisse de plus de `threshold`.
+
+    Le débit, et non la durée, est comparé pour rester valable entre deux échelles différentes.
+    """
+    comparisons: list[BenchmarkComparison] = []
+    for case in report.cases:
+        reference = baseline.case(case.name)
+        if reference is None or reference.items_per_s <= 0.0:
+            continue
+        ratio = case.items_per_s / reference.items_per_s
+        comparisons.append(
+            BenchmarkComparison(
+                name=case.name,
+                baseline_items_per_s=reference.items_per_s,
+                current_items_per_s=case.items_per_s,
+                ratio=ratio,
+                regression=ratio < 1.0 - float(threshold),
+            )
+        )
+    return comparisons
+
+
+__all__ = [
+    "BENCHMARK_CASE_NAMES",
+    "BENCHMARK_CASES",
+    "BenchmarkCaseResult",
+    "BenchmarkCell",
+    "BenchmarkComparison",
+    "BenchmarkReport",
+    "BenchmarkSizes",
+    "DEFAULT_REGRESSION_THRESHOLD",
+    "DEFAULT_REPEAT",
+    "SYNTHETIC_ROBOT_CONFIGURATION",
+    "build_synthetic_cell",
+    "compare_with_baseline",
+    "measure_case",
+    "run_benchmarks",
+    "synthetic_apt_text",
+    "synthetic_joint_samples",
+    "synthetic_keypoints",
+    "synthetic_krl_text",
+    "synthetic_nc_text",
+    "synthetic_work_poses",
+]
@@ -0,0 +1,512 @@
+"""
+Optimisation du placement de la base robot et/ou de la pièce pour un programme.
+
+Les candidats sont une grille de décalages (X, Y, Z, lacet) autour du placement courant.
+Les cibles du programme restent attachées à la pièce : déplacer le robot ou la pièce
+revient à re-exprimer toutes les cibles en repère base robot par une même transformation.
+
+1. Criblage vectorisé : MGI en lot sur toutes les cibles cartésiennes de tous les candidats
+   (atteignabilité, nombre minimal de changements de configuration, marge articulaire,
+   manipulabilité). Un candidat avec une cible inatteignable est rejeté sans simulation.
+2. Simulation : les meilleurs survivants sont simulés en parallèle (processus), avec contrôle
+   des collisions et zones TCP, et le temps de cycle entre dans le score final.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
+import itertools
+import multiprocessing
+import os
+from typing import Any, Callable
+
+import numpy as np
+
+from models.program_generation_settings import ProgramGenerationSettings
+from models.robot_model import RobotModel
+from models.robot_program import ProgramBaseSource, RobotProgram, RobotProgramTargetType
+from models.types import Pose6
+from utils.math_utils import invert_homogeneous_transform
+from utils.mgi_batch import CONFIG_COUNT, compute_mgi_batch, matrices_to_poses
+from utils.program_batch_runner import (
+    BatchCell,
+    BatchCellPaths,
+    check_program_validity,
+    load_batch_cell,
+    prepare_batch_program,
+    unreached_motion_lines,
+)
+from utils.program_preparation import load_robot_program, program_with_base_pose
+from utils.program_simulator import ProgramSimulator
+from utils.reachability_map import (
+    ReachabilityKinematics,
+    compute_fk_frames_batch,
+    compute_joint_margin_batch,
+    compute_manipulability_batch,
+)
+from utils.reference_frame_utils import matrix_to_pose, pose_to_matrix
+
+
+PLACEMENT_OK = "OK"
+PLACEMENT_INVALID = "INVALID"
+PLACEMENT_SCREENED = "SCREENED"
+PLACEMENT_REJECTED = "REJECTED"
+PLACEMENT_ERROR = "ERROR"
+
+# Ordre de classement : simulés valides, criblés non simulés, puis invalides et rejetés.
+_STATUS_RANK = {
+    PLACEMENT_OK: 0,
+    PLACEMENT_SCREENED: 1,
+    PLACEMENT_INVALID: 2,
+    PLACEMENT_REJECTED: 3,
+    PLACEMENT_ERROR: 4,
+}
+
+_BATCH_POSE_COUNT = 20000
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+@dataclass(frozen=True)
+class PlacementAxisRange:
+    """Plage d'un décalage : `steps` valeurs régulières de `minimum` à `maximum`."""
+    minimum: float = 0.0
+    maximum: float = 0.0
+    steps: int = 1
+
+    def values(self) -> np.ndarray:
+        steps = max(1, int(self.steps))
+        if steps == 1:
+            return np.array([(self.minimum + self.maximum) * 0.5], dtype=float)
+        return np.linspace(self.minimum, self.maximum, steps)
+
+
+@dataclass(frozen=True)
+class PlacementSearchRegion:
+    """Décalages autour de la pose courante : translations (mm) et lacet autour de Z (deg).
+
+    Base robot : repère monde. Pièce : repère parent de la pièce.
+    """
+    x_mm: PlacementAxisRange = field(default_factory=PlacementAxisRange)
+    y_mm: PlacementAxisRange = field(default_factory=PlacementAxisRange)
+    z_mm: PlacementAxisRange = field(default_factory=PlacementAxisRange)
+    yaw_deg: PlacementAxisRange = field(default_factory=PlacementAxisRange)
+
+    def offsets(self) -> np.ndarray:
+        """Décalages (M, 4) [dx, dy, dz, dyaw] de la grille."""
+        axes = [self.x_mm.values(), self.y_mm.values(), self.z_mm.values(), self.yaw_deg.values()]
+        return np.array(list(itertools.product(*axes)), dtype=float).reshape(-1, 4)
+
+
+@dataclass(frozen=True)
+class PlacementSearchSpace:
+    robot_base: PlacementSearchRegion | None = None
+    workpiece: PlacementSearchRegion | None = None
+
+    def candidate_offsets(self) -> tuple[np.ndarray, np.ndarray]:
+        """Produit des grilles base × pièce : deux tableaux (C, 4) de décalages."""
+        base = self.robot_base.offsets() if self.robot_base is not None else np.zeros((1, 4))
+        piece = self.workpiece.offsets() if self.workpiece is not None else np.zeros((1, 4))
+        base_index, piece_index = np.meshgrid(np.arange(len(base)), np.arange(len(piece)), indexing="ij")
+        return base[base_index.reshape(-1)], piece[piece_index.reshape(-1)]
+
+
+@dataclass(frozen=True)
+class PlacementWeights:
+    """Pondérations du score (plus grand = meilleur)."""
+    joint_margin: float = 2.0
+    manipulability: float = 2.0
+    config_change: float = 1.0
+    cycle_time_per_s: float = 0.1
+
+
+@dataclass(frozen=True)
+class PlacementOptions:
+    weights: PlacementWeights = field(default_factory=PlacementWeights)
+    simulate_top: int = 8
+    check_validity: bool = True
+    generation_settings: dict[str, Any] | None = None
+
+
+@dataclass
+class PlacementCandidate:
+    index: int
+    base_offset: list[float]
+    workpiece_offset: list[float]
+    robot_base_pose_world: list[float]
+    workpiece_pose_in_parent: list[float]
+    status: str = PLACEMENT_SCREENED
+    target_count: int = 0
+    unreachable_target_count: int = 0
+    config_changes: int = 0
+    min_joint_margin: float = 0.0
+    min_manipulability: float = 0.0
+    cycle_time_s: float | None = None
+    unreached_motion_lines: list[int] = field(default_factory=list)
+    collision_sample_count: int = 0
+    tcp_zone_exit_count: int = 0
+    score: float = float("-inf")
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _PlacementReference:
+    """Placement courant de la cellule et repère pièce correspondant en base robot."""
+    robot_base_pose_world: Pose6
+    workpiece_pose_in_parent: Pose6
+    piece_in_robot: np.ndarray
+
+
+@dataclass(frozen=True)
+class _ProgramTargets:
+    """Cibles cartésiennes (K, 4, 4) en base robot au placement courant, dans l'ordre du programme."""
+    matrices: np.ndarray
+    tool_index: np.ndarray
+    tools: list[Pose6]
+
+
+def offset_pose(pose: Pose6, offset: np.ndarray | list[float]) -> Pose6:
+    """Décale XYZ et ajoute le lacet à A (rotation ZYX : Rz(A) appliquée en dernier, autour de Z parent)."""
+    dx, dy, dz, dyaw = (float(value) for value in offset)
+    return Pose6(pose.x + dx, pose.y + dy, pose.z + dz, pose.a + dyaw, pose.b, pose.c)
+
+
+def apply_placement(cell: BatchCell, robot_base_pose_world: Pose6, workpiece_pose_in_parent: Pose6) -> None:
+    cell.workspace_model.set_robot_base_pose_world(robot_base_pose_world, emit=False)
+    if cell.workpiece_model.get_pose_in_parent() != workpiece_pose_in_parent:
+        cell.workpiece_model.set_pose_in_parent(workpiece_pose_in_parent)
+
+
+def _piece_in_robot(cell: BatchCell) -> np.ndarray:
+    frame = cell.create_simulator().workpiece_frame_in_robot()
+    if frame is not None:
+        return frame
+    return invert_homogeneous_transform(np.array(cell.workspace_model.get_robot_base_transform_world().matrix, dtype=float))
+
+
+def _capture_reference(cell: BatchCell) -> _PlacementReference:
+    return _PlacementReference(
+        robot_base_pose_world=cell.workspace_model.get_robot_base_pose_world(),
+        workpiece_pose_in_parent=cell.workpiece_model.get_pose_in_parent(),
+        piece_in_robot=_piece_in_robot(cell),
+    )
+
+
+def _placement_poses(reference: _PlacementReference, base_offset: np.ndarray, workpiece_offset: np.ndarray) -> tuple[Pose6, Pose6]:
+    return (
+        offset_pose(reference.robot_base_pose_world, base_offset),
+        offset_pose(reference.workpiece_pose_in_parent, workpiece_offset),
+    )
+
+
+def _placement_delta(cell: BatchCell, reference: _PlacementReference, base_pose: Pose6, workpiece_pose: Pose6) -> np.ndarray:
+    """Transformation (repère robot) qui amène les cibles du placement courant au candidat."""
+    apply_placement(cell, base_pose, workpiece_pose)
+    try:
+        return _piece_in_robot(cell) @ invert_homogeneous_transform(reference.piece_in_robot)
+    finally:
+        apply_placement(cell, reference.robot_base_pose_world, reference.workpiece_pose_in_parent)
+
+
+def _program_targets(program: RobotProgram) -> _ProgramTargets:
+    matrices: list[np.ndarray] = []
+    tool_index: list[int] = []
+    tools: list[Pose6] = []
+    for motion in program.motions:
+        T_robot_base = pose_to_matrix(motion.base_pose)
+        for target in (motion.via_target, motion.target):
+            if target is None or target.target_type != RobotProgramTargetType.CARTESIAN:
+                continue
+            if motion.tool_pose not in tools:
+                tools.append(motion.tool_pose.copy())
+            matrices.append(T_robot_base @ pose_to_matrix(target.cartesian_pose))
+            tool_index.append(tools.index(motion.tool_pose))
+    return _ProgramTargets(
+        matrices=np.array(matrices, dtype=float).reshape(-1, 4, 4),
+        tool_index=np.array(tool_index, dtype=int),
+        tools=tools,
+    )
+
+
+def minimal_config_changes(valid: np.ndarray) -> np.ndarray:
+    """Nombre minimal de changements de configuration le long des cibles.
+
+    valid: (C, K, 8) configurations valides par candidat et par cible (ordre du programme).
+    Programmation dynamique sur les 8 états ; -1 si une cible n'a aucune configuration valide.
+    """
+    candidate_count, target_count = valid.shape[:2]
+    if target_count == 0:
+        return np.zeros(candidate_count, dtype=int)
+    cost = np.where(valid[:, 0], 0.0, np.inf)
+    for k in range(1, target_count):
+        switch = cost.min(axis=1, keepdims=True) + 1.0
+        cost = np.where(valid[:, k], np.minimum(cost, switch), np.inf)
+    best = cost.min(axis=1)
+    return np.where(np.isfinite(best), best, -1).astype(int)
+
+
+def _screen_candidates(
+    cell: BatchCell,
+    targets: _ProgramTargets,
+    deltas: np.ndarray,
+    candidates: list[PlacementCandidate],
+    weights: PlacementWeights,
+) -> None:
+    """Criblage MGI vectorisé de tous les candidats (complète les candidats sur place)."""
+    candidate_count = len(candidates)
+    target_count = len(targets.matrices)
+    robot_model = cell.robot_model
+    allowed = robot_model.get_allowed_configurations()
+    valid = np.zeros((candidate_count, target_count, CONFIG_COUNT), dtype=bool)
+    margin = np.zeros((candidate_count, target_count), dtype=float)
+    manipulability = np.zeros((candidate_count, target_count), dtype=float)
+
+    for tool_id, tool_pose in enumerate(targets.tools):
+        columns = np.nonzero(targets.tool_index == tool_id)[0]
+        kinematics = ReachabilityKinematics.from_robot_model(robot_model, ProgramSimulator.tool_from_pose(tool_pose))
+        tool_matrix = RobotModel.build_tool_transform(kinematics.tool)
+        flat_count = candidate_count * len(columns)
+        for start in range(0, flat_count, _BATCH_POSE_COUNT):
+            flat = np.arange(start, min(flat_count, start + _BATCH_POSE_COUNT))
+            rows, cols = flat // len(columns), columns[flat % len(columns)]
+            poses = matrices_to_poses(deltas[rows] @ targets.matrices[cols])
+            result = compute_mgi_batch(kinematics.mgi_params, poses, kinematics.tool)
+            chunk_valid = result.valid_mask(allowed)
+            valid[rows, cols] = chunk_valid
+
+            joints = result.joints_within_limits_deg(kinematics.axis_limits_deg)
+            margins = np.where(chunk_valid, compute_joint_margin_batch(joints, kinematics.axis_limits_deg), -1.0)
+            best_config = np.argmax(margins, axis=1)
+            reached = np.nonzero(chunk_valid.any(axis=1))[0]
+            if not len(reached):
+                continue
+            margin[rows[reached], cols[reached]] = margins[reached, best_config[reached]]
+            frames = compute_fk_frames_batch(
+                kinematics.dh_rows,
+                kinematics.axis_reversed,
+                joints[reached, best_config[reached]],
+                tool_matrix,
+            )
+            manipulability[rows[reached], cols[reached]] = compute_manipulability_batch(frames, kinematics.axis_reversed)
+
+    reached = valid.any(axis=2)
+    changes = minimal_config_changes(valid)
+    for index, candidate in enumerate(candidates):
+        candidate.target_count = target_count
+        candidate.unreachable_target_count = int(target_count - reached[index].sum())
+        if candidate.unreachable_target_count:
+            candidate.status = PLACEMENT_REJECTED
+            continue
+        candidate.config_changes = int(changes[index])
+        candidate.min_joint_margin = float(margin[index].min()) if target_count else 1.0
+        candidate.min_manipulability = float(manipulability[index].min()) if target_count else 1.0
+        candidate.score = (
+            weights.joint_margin * candidate.min_joint_margin
+            + weights.manipulability * candidate.min_manipulability
+            - weights.config_change * candidate.config_changes
+        )
+
+
+def evaluate_placement(
+    cell: BatchCell,
+    program: RobotProgram,
+    base_pose: Pose6,
+    workpiece_pose: Pose6,
+    options: PlacementOptions,
+) -> dict[str, Any]:
+    """Simule le programme au placement donné, puis restaure le placement de la cellule.
+
+    Programmes FAO : la base suit le repère pièce. Programmes KRL : la base du fichier est
+    re-exprimée pour que les cibles restent fixes par rapport à la pièce.
+    """
+    reference = _capture_reference(cell)
+    evaluation: dict[str, Any] = {}
+    try:
+        delta = _placement_delta(cell, reference, base_pose, workpiece_pose)
+        apply_placement(cell, base_pose, workpiece_pose)
+        settings = ProgramGenerationSettings.from_dict(options.generation_settings)
+        simulator = cell.create_simulator()
+        prepared, tool_pose = prepare_batch_program(cell, simulator, program, settings)
+        base_spec = simulator.get_base_spec()
+        if base_spec is not None and base_spec.source == ProgramBaseSource.PROGRAM_FILE:
+            moved_base = matrix_to_pose(delta @ pose_to_matrix(prepared.program_base_pose))
+            prepared = program_with_base_pose(prepared, moved_base)
+            simulator.set_base_spec(replace(base_spec, file_pose=moved_base.copy()))
+
+        result = simulator.simulate_program(prepared, include_compensation=False)
+        samples = result.nominal_samples
+        evaluation["cycle_time_s"] = float(samples[-1].time_s) if samples else 0.0
+        evaluation["unreached_motion_lines"] = unreached_motion_lines(prepared, result)
+        if options.check_validity and samples:
+            # Rejet anticipé : le premier défaut suffit à invalider le placement.
+            validity, _ = check_program_validity(cell, simulator, result, tool_pose, stop_at_first_issue=True)
+            evaluation["collision_sample_count"] = validity.collision_sample_count
+            evaluation["tcp_zone_exit_count"] = validity.tcp_zone_exit_count
+        evaluation["sampled"] = bool(samples)
+    except Exception as exc:
+        evaluation["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        apply_placement(cell, reference.robot_base_pose_world, reference.workpiece_pose_in_parent)
+    return evaluation
+
+
+def _apply_evaluation(candidate: PlacementCandidate, evaluation: dict[str, Any], weights: PlacementWeights) -> None:
+    if evaluation.get("error"):
+        candidate.status = PLACEMENT_ERROR
+        candidate.error = str(evaluation["error"])
+        return
+    candidate.cycle_time_s = float(evaluation.get("cycle_time_s", 0.0))
+    candidate.unreached_motion_lines = list(evaluation.get("unreached_motion_lines", []))
+    candidate.collision_sample_count = int(evaluation.get("collision_sample_count", 0))
+    candidate.tcp_zone_exit_count = int(evaluation.get("tcp_zone_exit_count", 0))
+    invalid = (
+        not evaluation.get("sampled", False)
+        or candidate.unreached_motion_lines
+        or candidate.collision_sample_count
+        or candidate.tcp_zone_exit_count
+    )
+    candidate.status = PLACEMENT_INVALID if invalid else PLACEMENT_OK
+    candidate.score -= weights.cycle_time_per_s * candidate.cycle_time_s
+
+
+# Cellule et programme chargés une fois par processus du pool (initializer).
+_worker_cell: BatchCell | None = None
+_worker_program: RobotProgram | None = None
+_worker_error = ""
+
+
+def _init_worker(paths: BatchCellPaths, program_path: str) -> None:
+    global _worker_cell, _worker_program, _worker_error
+    try:
+        _worker_cell = load_batch_cell(paths)
+        _worker_program = load_robot_program(program_path)
+    except Exception as exc:
+        _worker_cell = None
+        _worker_program = None
+        _worker_error = f"{type(exc).__name__}: {exc}"
+
+
+def _evaluate_in_worker(base_pose: list[float], workpiece_pose: list[float], options: PlacementOptions) -> dict[str, Any]:
+    if _worker_cell is None or _worker_program is None:
+        return {"error": _worker_error}
+    return evaluate_placement(_worker_cell, _worker_program, Pose6(*base_pose), Pose6(*workpiece_pose), options)
+
+
+def rank_placements(candidates: list[PlacementCandidate]) -> list[PlacementCandidate]:
+    return sorted(candidates, key=lambda candidate: (_STATUS_RANK[candidate.status], -candidate.score, candidate.index))
+
+
+def optimize_placement(
+    paths: BatchCellPaths,
+    program_path: str,
+    search: PlacementSearchSpace,
+    options: PlacementOptions | None = None,
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> list[PlacementCandidate]:
+    """Crible tous les candidats, simule les `simulate_top` meilleurs et retourne le classement.
+
+    `workers` = 1 simule dans le processus courant (débogage, tests).
+    `progress(étape, fait, total)` avec étape "screening" puis "simulation".
+    """
+    options = options or PlacementOptions()
+    cell = load_batch_cell(paths)
+    program = load_robot_program(program_path)
+    reference = _capture_reference(cell)
+
+    # Cibles au placement courant, préparées comme pour la simulation (base, outil, motions dérivées).
+    prepared, _ = prepare_batch_program(
+        cell,
+        cell.create_simulator(),
+        program,
+        ProgramGenerationSettings.from_dict(options.generation_settings),
+    )
+    targets = _program_targets(prepared)
+
+    base_offsets, workpiece_offsets = search.candidate_offsets()
+    candidates: list[PlacementCandidate] = []
+    deltas = np.empty((len(base_offsets), 4, 4), dtype=float)
+    for index, (base_offset, workpiece_offset) in enumerate(zip(base_offsets, workpiece_offsets)):
+        base_pose, workpiece_pose = _placement_poses(reference, base_offset, workpiece_offset)
+        deltas[index] = _placement_delta(cell, reference, base_pose, workpiece_pose)
+        candidates.append(
+            PlacementCandidate(
+                index=index,
+                base_offset=base_offset.tolist(),
+                workpiece_offset=workpiece_offset.tolist(),
+                robot_base_pose_world=base_pose.to_list(),
+                workpiece_pose_in_parent=workpiece_pose.to_list(),
+            )
+        )
+    _screen_candidates(cell, targets, deltas, candidates, options.weights)
+    if progress is not None:
+        progress("screening", len(candidates), len(candidates))
+
+    survivors = [candidate for candidate in rank_placements(candidates) if candidate.status == PLACEMENT_SCREENED]
+    selected = survivors[: max(0, int(options.simulate_top))]
+    total = len(selected)
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+    workers = max(1, min(int(workers), total or 1))
+
+    if total and workers == 1:
+        for done, candidate in enumerate(selected, start=1):
+            evaluation = evaluate_placement(
+                cell,
+                program,
+                Pose6(*candidate.robot_base_pose_world),
+                Pose6(*candidate.workpiece_pose_in_parent),
+                options,
+            )
+            _apply_evaluation(candidate, evaluation, options.weights)
+            if progress is not None:
+                progress("simulation", done, total)
+    elif total:
+        # "spawn" : pas d'état Qt hérité du parent, comportement identique sous Windows.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(paths, program_path)) as pool:
+            futures = {
+                pool.submit(
+                    _evaluate_in_worker,
+                    candidate.robot_base_pose_world,
+                    candidate.workpiece_pose_in_parent,
+                    options,
+                ): candidate
+                for candidate in selected
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                candidate = futures[future]
+                try:
+                    evaluation = future.result()
+                except Exception as exc:
+                    evaluation = {"error": f"{type(exc).__name__}: {exc}"}
+                _apply_evaluation(candidate, evaluation, options.weights)
+                if progress is not None:
+                    progress("simulation", done, total)
+
+    return rank_placements(candidates)
+
+
+__all__ = [
+    "PLACEMENT_ERROR",
+    "PLACEMENT_INVALID",
+    "PLACEMENT_OK",
+    "PLACEMENT_REJECTED",
+    "PLACEMENT_SCREENED",
+    "PlacementAxisRange",
+    "PlacementCandidate",
+    "PlacementOptions",
+    "PlacementSearchRegion",
+    "PlacementSearchSpace",
+    "PlacementWeights",
+    "apply_placement",
+    "evaluate_placement",
+    "minimal_config_changes",
+    "offset_pose",
+    "optimize_placement",
+    "rank_placements",
+]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+# Nombre de points tracés par courbe au plus, quel que soit le zoom.
+DEFAULT_MAX_POINTS = 4000
+
+
+def visible_index_range(x: np.ndarray, x_min: float, x_max: float) -> tuple[int, int]:
+    """Plage [start, stop) des échantillons visibles pour x croissant, élargie d'un point de chaque côté.
+
+    Le point juste hors champ est gardé pour que la courbe rejoigne le bord de la vue.
+    """
+    count = len(x)
+    if count == 0:
+        return 0, 0
+    start = int(np.searchsorted(x, x_min, side="left")) - 1
+    stop = int(np.searchsorted(x, x_max, side="right")) + 1
+    return max(0, start), min(count, stop)
+
+
+def minmax_decimation_indices(
+    values: np.ndarray,
+    start: int = 0,
+    stop: int | None = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> np.ndarray:
+    """Indices (triés) de l'enveloppe min/max de values[start:stop], au plus max_points.
+
+    La plage est découpée en max_points / 2 paquets ; chaque paquet garde son minimum et son
+    maximum dans l'ordre d'apparition, si bien qu'un pic isolé (jerk, dépassement de limite)
+    reste toujours tracé. Les NaN ne sont jamais retenus comme extremum s'il existe une valeur
+    finie dans le paquet.
+    """
+    values = np.asarray(values, dtype=float)
+    stop = len(values) if stop is None else min(int(stop), len(values))
+    start = max(0, int(start))
+    count = stop - start
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if count <= max(2, int(max_points)):
+        return np.arange(start, stop, dtype=np.int64)
+
+    # Deux points par paquet plus les deux bords de la plage.
+    bin_count = max(1, (int(max_points) - 2) // 2)
+    bin_size = -(-count // bin_count)
+    bin_count = -(-count // bin_size)
+    padded = np.full(bin_count * bin_size, np.nan)
+    padded[:count] = values[start:stop]
+    bins = padded.reshape(bin_count, bin_size)
+    finite = np.isfinite(bins)
+    low = np.argmin(np.where(finite, bins, np.inf), axis=1)
+    high = np.argmax(np.where(finite, bins, -np.inf), axis=1)
+
+    offsets = np.arange(bin_count) * bin_size + start
+    first = np.minimum(low, high) + offsets
+    second = np.maximum(low, high) + offsets
+    indices = np.column_stack([first, second]).ravel()
+    indices = np.minimum(indices, stop - 1)
+    # Paquet plat (min = max) : un seul point suffit.
+    keep = np.ones(len(indices), dtype=bool)
+    keep[1::2] = indices[1::2] != indices[0::2]
+    indices = indices[keep]
+    # Les bords de la plage restent tracés pour ne pas raccourcir la courbe.
+    return np.unique(np.concatenate([[start], indices, [stop - 1]])).astype(np.int64)
+
+
+__all__ = [
+    "DEFAULT_MAX_POINTS",
+    "minmax_decimation_indices",
+    "visible_index_range",
+]
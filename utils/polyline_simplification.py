@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def simplify_polyline_indices(
+    points: np.ndarray,
+    tolerance: float,
+    keep_mask: np.ndarray | None = None,
+    anchor_spacing: int = 1024,
+) -> np.ndarray:
+    """Douglas–Peucker 3D : indices (triés) des points à conserver.
+
+    Un point est supprimé lorsque sa distance à la corde qui le couvre reste sous
+    `tolerance`. Les extrémités et les points marqués dans `keep_mask` (ex. changement
+    de couleur) sont toujours conservés : ils découpent la polyligne en tronçons
+    simplifiés indépendamment.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    count = len(pts)
+    if count <= 2 or tolerance <= 0.0:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = True
+    keep[-1] = True
+    if keep_mask is not None:
+        keep |= np.asarray(keep_mask, dtype=bool)[:count]
+
+    # Ancres régulières : bornent la profondeur de récursion (spirales, hélices) sans
+    # dégrader la précision, chaque tronçon restant simplifié sous la tolérance.
+    keep[::max(2, int(anchor_spacing))] = True
+
+    tolerance_sq = float(tolerance) * float(tolerance)
+    anchors = np.flatnonzero(keep)
+    starts = anchors[:-1]
+    stops = anchors[1:]
+    # Tous les tronçons d'une même profondeur de récursion sont traités en un seul
+    # passage vectorisé : le nombre d'itérations suit la profondeur, pas le nombre de points gardés.
+    while True:
+        open_ranges = (stops - starts) > 1
+        starts = starts[open_ranges]
+        stops = stops[open_ranges]
+        if len(starts) == 0:
+            break
+        inner_counts = stops - starts - 1
+        range_ids = np.repeat(np.arange(len(starts)), inner_counts)
+        first_inner = np.cumsum(inner_counts) - inner_counts
+        inner_index = np.arange(int(inner_counts.sum())) - first_inner[range_ids] + starts[range_ids] + 1
+
+        origins = pts[starts][range_ids]
+        chords = pts[stops][range_ids] - origins
+        offsets = pts[inner_index] - origins
+        chord_len_sq = np.einsum("ij,ij->i", chords, chords)
+        # Distance au SEGMENT (projection bornée) : un aller-retour sur une même
+        # droite (approche/dégagement) ne doit pas être écrasé sur la corde.
+        t = np.einsum("ij,ij->i", offsets, chords)
+        np.divide(t, chord_len_sq, out=t, where=chord_len_sq > 1e-18)
+        t[chord_len_sq <= 1e-18] = 0.0
+        np.clip(t, 0.0, 1.0, out=t)
+        offsets -= t[:, None] * chords
+        dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+
+        max_dist_sq = np.maximum.reduceat(dist_sq, first_inner)
+        candidates = np.flatnonzero(dist_sq == max_dist_sq[range_ids])
+        _, first_candidate = np.unique(range_ids[candidates], return_index=True)
+        splits = inner_index[candidates[first_candidate]]
+
+        refine = max_dist_sq > tolerance_sq
+        splits = splits[refine]
+        keep[splits] = True
+        starts, stops = (
+            np.concatenate([starts[refine], splits]),
+            np.concatenate([splits, stops[refine]]),
+        )
+
+    return np.flatnonzero(keep)
+
+
+def split_crossing_pairs(start_keys: np.ndarray, end_keys: np.ndarray, split: float) -> np.ndarray:
+    """Indices des paires (début, fin) que le split coupe : clé de début <= split < clé de fin.
+
+    Une paire simplifiée peut couvrir beaucoup de samples ; la portion "réalisée" s'y
+    termine en un point intermédiaire (voir point_at_key), sans imposer de sommet au chemin.
+    """
+    starts = np.asarray(start_keys, dtype=np.float64)
+    ends = np.asarray(end_keys, dtype=np.float64)
+    return np.flatnonzero((starts <= float(split)) & (ends > float(split)))
+
+
+def point_at_key(points: np.ndarray, keys: np.ndarray, key: float) -> np.ndarray:
+    """Point de la polyligne complète à la clé donnée (interpolation entre les deux samples encadrants)."""
+    pts = np.asarray(points, dtype=np.float64)
+    values = np.asarray(keys, dtype=np.float64)[: len(pts)]
+    index = int(np.searchsorted(values, float(key), side="right"))
+    if index <= 0:
+        return pts[0].copy()
+    if index >= len(pts):
+        return pts[-1].copy()
+    span = values[index] - values[index - 1]
+    t = (float(key) - values[index - 1]) / span if span > 0.0 else 1.0
+    return pts[index - 1] + min(max(t, 0.0), 1.0) * (pts[index] - pts[index - 1])
+
+
+def tolerance_level(tolerance: float) -> int:
+    """Palier (puissance de 2) d'une tolérance : ne change qu'à un facteur 2 de zoom près."""
+    return int(np.floor(np.log2(max(float(tolerance), 1e-9))))
+
+
+def tolerance_for_level(level: int) -> float:
+    return float(2.0 ** int(level))
+
+
+__all__ = [
+    "point_at_key",
+    "simplify_polyline_indices",
+    "split_crossing_pairs",
+    "tolerance_for_level",
+    "tolerance_level",
+]
@@ -0,0 +1,674 @@
+"""
+Exécution sans interface de la simulation de programmes robot sur un lot de fichiers.
+
+Charge une cellule (robot, outil, scène, pièce, axes externes) comme le ferait un projet,
+puis simule chaque programme (.src / APT / NC), relève les passages près des singularités,
+contrôle collisions et zones TCP et,
+sur demande, l'usinage. Les programmes sont répartis sur un pool de processus ; chaque
+processus charge la cellule une seule fois. Un rapport JSON et un CSV d'échantillons sont
+écrits par programme, plus un récapitulatif du lot.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import csv
+from dataclasses import asdict, dataclass, field, replace
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from models.external_axes_model import ExternalAxesModel
+from models.program_generation_settings import ProgramGenerationSettings
+from models.project_file import ProjectFile
+from models.robot_configuration_file import RobotConfigurationFile
+from models.robot_model import RobotModel
+from models.robot_program import (
+    ProgramBaseSource,
+    ProgramBaseSpec,
+    ProgramOrigin,
+    ProgramSimulationResult,
+    RobotProgram,
+    RobotProgramMotionMode,
+)
+from models.tool_config_file import ToolConfigFile
+from models.tool_model import ToolModel
+from models.tooling_model import ToolingModel
+from models.types import Pose6
+from models.types.machining_params import MachiningSimulationParams
+from models.workpiece_model import WorkpieceModel
+from models.workspace_file import WorkspaceFile
+from models.workspace_model import WorkspaceModel
+from trajectory_engine.core.validity_analyzer import ValidityAnalyzer, build_validity_context_snapshot
+from trajectory_engine.models.pipeline import BuildCancelToken, TrajectorySample, TrajectorySampleErrorCode
+from utils.machining_simulator import simulate_machining
+from utils.program_preparation import (
+    PROGRAM_SUFFIXES,
+    load_robot_program,
+    program_with_base_pose,
+    program_with_simulation_overrides,
+    rebuild_derived_motions,
+)
+from utils.program_simulator import ProgramSimulator
+from utils.reachability_map import ReachabilityKinematics
+from utils.reference_frame_utils import matrix_to_pose
+from utils.singularity_analysis import (
+    SingularitySeverity,
+    SingularityThresholds,
+    compute_singularity_metrics,
+    find_singularity_intervals,
+)
+
+
+STATUS_OK = "OK"
+STATUS_INVALID = "INVALID"
+STATUS_ERROR = "ERROR"
+
+SUMMARY_JSON_NAME = "summary.json"
+SUMMARY_CSV_NAME = "summary.csv"
+
+_IMPORTED_ORIGINS = {ProgramOrigin.IMPORTED_APT, ProgramOrigin.IMPORTED_CATNC}
+
+
+@dataclass(frozen=True)
+class BatchCellPaths:
+    """Fichiers de configuration de la cellule (mêmes clés que le projet CalibraX)."""
+
+    robot: str = ""
+    tool: str = ""
+    scene: str = ""
+    piece: str = ""
+    external_axes: str = ""
+
+    @classmethod
+    def from_project_file(cls, project_path: str) -> "BatchCellPaths":
+        project = ProjectFile.load(project_path)
+        base_dir = os.path.dirname(os.path.abspath(project_path))
+
+        def resolve(key: str) -> str:
+            raw_path = str(project.configurations.get(key, "") or "").strip()
+            if not raw_path:
+                return ""
+            candidates = [raw_path] if os.path.isabs(raw_path) else [os.path.join(base_dir, raw_path), raw_path]
+            for candidate in candidates:
+                if os.path.exists(candidate):
+                    return os.path.abspath(candidate)
+            raise FileNotFoundError(f"Fichier projet introuvable pour {key}: {raw_path}")
+
+        return cls(
+            robot=resolve("robot"),
+            tool=resolve("tool"),
+            scene=resolve("scene"),
+            piece=resolve("piece"),
+            external_axes=resolve("external_axes"),
+        )
+
+    def with_overrides(self, **paths: str | None) -> "BatchCellPaths":
+        """Remplace les chemins fournis (non vides), ex. options de ligne de commande."""
+        updates = {key: os.path.abspath(value) for key, value in paths.items() if value}
+        return replace(self, **updates)
+
+
+@dataclass(frozen=True)
+class BatchRunOptions:
+    check_validity: bool = True
+    run_machining: bool = False
+    include_compensation: bool = False
+    write_samples_csv: bool = True
+    generation_settings: dict[str, Any] | None = None
+
+
+@dataclass
+class BatchCell:
+    robot_model: RobotModel
+    tool_model: ToolModel
+    workspace_model: WorkspaceModel
+    external_axes_model: ExternalAxesModel
+    workpiece_model: WorkpieceModel
+    tooling_model: ToolingModel
+
+    def create_simulator(self) -> ProgramSimulator:
+        return ProgramSimulator(
+            self.robot_model,
+            self.tool_model,
+            external_axes_model=self.external_axes_model,
+            workspace_model=self.workspace_model,
+            workpiece_model=self.workpiece_model,
+            tooling_model=self.tooling_model,
+        )
+
+
+@dataclass
+class ProgramValidityReport:
+    checked: bool = False
+    collision_sample_count: int = 0
+    tcp_zone_exit_count: int = 0
+    min_clearance_mm: float | None = None
+    min_clearance_pair: str = ""
+    first_issue_time_s: float | None = None
+    first_issue_line: int | None = None
+    first_issue: str = ""
+
+
+@dataclass
+class ProgramSingularityReport:
+    checked: bool = False
+    min_index: float | None = None
+    min_index_line: int | None = None
+    min_index_kind: str = ""
+    warning_interval_count: int = 0
+    singular_interval_count: int = 0
+    first_singular_time_s: float | None = None
+    first_singular_line: int | None = None
+
+
+@dataclass
+class ProgramMachiningReport:
+    computed: bool = False
+    overload_count: int = 0
+    max_tcp_deviation_mm: float = 0.0
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ProgramBatchReport:
+    program: str
+    status: str = STATUS_OK
+    error: str = ""
+    origin: str = ""
+    motion_count: int = 0
+    sample_count: int = 0
+    cycle_time_s: float = 0.0
+    unreached_motion_lines: list[int] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    validity: ProgramValidityReport = field(default_factory=ProgramValidityReport)
+    singularity: ProgramSingularityReport = field(default_factory=ProgramSingularityReport)
+    machining: ProgramMachiningReport = field(default_factory=ProgramMachiningReport)
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def summary_row(self) -> dict[str, Any]:
+        return {
+            "program": self.program,
+            "status": self.status,
+            "cycle_time_s": round(self.cycle_time_s, 4),
+            "samples": self.sample_count,
+            "unreached_motions": len(self.unreached_motion_lines),
+            "collision_samples": self.validity.collision_sample_count,
+            "tcp_zone_exits": self.validity.tcp_zone_exit_count,
+            "min_clearance_mm": "" if self.validity.min_clearance_mm is None else round(self.validity.min_clearance_mm, 3),
+            "min_singularity_index": "" if self.singularity.min_index is None else round(self.singularity.min_index, 4),
+            "singular_passes": self.singularity.singular_interval_count,
+            "torque_overloads": self.machining.overload_count,
+            "max_tcp_deviation_mm": round(self.machining.max_tcp_deviation_mm, 4),
+            "warnings": len(self.warnings),
+            "elapsed_s": round(self.elapsed_s, 3),
+            "error": self.error,
+        }
+
+
+SUMMARY_COLUMNS = list(ProgramBatchReport(program="").summary_row().keys())
+
+
+def load_batch_cell(paths: BatchCellPaths) -> BatchCell:
+    """Charge les modèles de la cellule sans contrôleurs ni widgets."""
+    cell = BatchCell(
+        robot_model=RobotModel(),
+        tool_model=ToolModel(),
+        workspace_model=WorkspaceModel(),
+        external_axes_model=ExternalAxesModel(),
+        workpiece_model=WorkpieceModel(),
+        tooling_model=ToolingModel(),
+    )
+    # Même ordre que le chargement d'un projet : axes externes, robot, outil, pièce, scène.
+    if paths.external_axes:
+        with open(paths.external_axes, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        # Les axes externes démarrent à zéro, comme à l'ouverture du projet.
+        for axis_data in data.get("axes", []):
+            for joint_data in axis_data.get("joints", []):
+                joint_data["value"] = 0.0
+        cell.external_axes_model.from_dict(data)
+
+    if not paths.robot:
+        raise ValueError("Une configuration robot est requise pour simuler des programmes.")
+    with open(paths.robot, "r", encoding="utf-8") as file:
+        robot_config = RobotConfigurationFile.from_dict(json.load(file))
+    cell.robot_model.load_from_configuration_file(robot_config, paths.robot)
+
+    tool_path = paths.tool
+    if not tool_path and robot_config.default_tool_auto_load_on_startup:
+        tool_path = robot_config.default_tool_profile
+    if tool_path:
+        _apply_tool_profile(cell.tool_model, ToolConfigFile.load(tool_path), tool_path)
+
+    if paths.piece:
+        with open(paths.piece, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("tooling"):
+            cell.tooling_model.from_dict(data["tooling"])
+        if data.get("workpiece"):
+            cell.workpiece_model.from_dict(data["workpiece"])
+
+    if paths.scene:
+        WorkspaceFile.load(paths.scene).apply_to_workspace_model(cell.workspace_model, file_path=paths.scene)
+    return cell
+
+
+def _apply_tool_profile(tool_model: ToolModel, profile: ToolConfigFile, file_path: str) -> None:
+    tool_model.set_selected_tool_profile(file_path)
+    tool_model.set_tool(profile.to_robot_tool())
+    tool_model.set_tool_colliders(profile.tool_colliders)
+    tool_model.set_evaluated_robot_axis_colliders(profile.evaluated_robot_axis_colliders)
+
+
+def discover_programs(directory: str, recursive: bool = True) -> list[str]:
+    """Programmes KRL / APT / NC du répertoire, triés par chemin."""
+    root = Path(directory)
+    candidates = root.rglob("*") if recursive else root.glob("*")
+    return sorted(
+        str(path) for path in candidates
+        if path.is_file() and path.suffix.lower() in PROGRAM_SUFFIXES
+    )
+
+
+def report_stem(program_path: str, programs_root: str | None = None) -> str:
+    """Nom de fichier de rapport unique : chemin relatif aplati, extension conservée."""
+    path = Path(program_path)
+    if programs_root:
+        try:
+            path = path.resolve().relative_to(Path(programs_root).resolve())
+        except ValueError:
+            path = Path(path.name)
+    else:
+        path = Path(path.name)
+    return "__".join(path.parts).replace(".", "_")
+
+
+def prepare_batch_program(
+    cell: BatchCell,
+    simulator: ProgramSimulator,
+    program: RobotProgram,
+    settings: ProgramGenerationSettings,
+) -> tuple[RobotProgram, Pose6]:
+    """Reproduit la préparation de l'onglet Programme à l'import d'un fichier.
+
+    Programmes FAO : base = repère pièce, outil courant, motions dérivées (HOME, approche,
+    dégagement) reconstruites. Programmes KRL : base et outil lus dans le fichier.
+    Retourne le programme prêt à simuler et la pose outil retenue pour les contrôles.
+    """
+    if program.origin in _IMPORTED_ORIGINS:
+        piece_frame = simulator.workpiece_frame_in_robot()
+        base_pose = matrix_to_pose(piece_frame) if piece_frame is not None else Pose6.zeros()
+        simulator.set_base_spec(ProgramBaseSpec(source=ProgramBaseSource.WORKPIECE, file_pose=program.program_base_pose.copy()))
+        tool_pose = cell.tool_model.get_tool_pose()
+        prepared = rebuild_derived_motions(
+            program_with_base_pose(program, base_pose),
+            settings,
+            cell.robot_model.get_home_position(),
+            base_pose,
+        )
+        override_tool = tool_pose
+    else:
+        base_pose = program.program_base_pose.copy()
+        simulator.set_base_spec(ProgramBaseSpec(source=ProgramBaseSource.PROGRAM_FILE, file_pose=base_pose.copy()))
+        prepared = program_with_base_pose(program, base_pose)
+        tool_pose = next((motion.tool_pose for motion in prepared.motions if motion.tool_pose is not None), None)
+        if tool_pose is None:
+            tool_pose = cell.tool_model.get_tool_pose()
+        override_tool = None
+
+    prepared = program_with_simulation_overrides(
+        prepared,
+        tool_pose=override_tool,
+        constant_speed_mmps=settings.constant_speed_mmps,
+    )
+    return prepared, tool_pose
+
+
+def unreached_motion_lines(program: RobotProgram, result: ProgramSimulationResult) -> list[int]:
+    sampled_lines = {sample.source_line for sample in result.nominal_samples}
+    return [
+        motion.line_number
+        for motion in program.motions
+        if motion.line_number > 0
+        and motion.mode != RobotProgramMotionMode.EXTERNAL_AXIS
+        and motion.line_number not in sampled_lines
+    ]
+
+
+def check_program_singularities(
+    cell: BatchCell,
+    result: ProgramSimulationResult,
+    tool_pose: Pose6,
+    thresholds: SingularityThresholds | None = None,
+) -> tuple[ProgramSingularityReport, np.ndarray]:
+    """Indice de singularité de tous les échantillons nominaux en un lot (avant le contrôle de validité).
+
+    Retourne le bilan et l'indice par échantillon (colonne CSV).
+    """
+    samples = result.nominal_samples
+    kinematics = ReachabilityKinematics.from_robot_model(cell.robot_model, ProgramSimulator.tool_from_pose(tool_pose))
+    metrics = compute_singularity_metrics(kinematics, np.array([sample.joints_deg.to_list() for sample in samples]))
+    report = ProgramSingularityReport(checked=True)
+    if not samples:
+        return report, metrics.index
+    kinds = metrics.kinds()
+    closest = int(np.argmin(metrics.index))
+    report.min_index = float(metrics.index[closest])
+    report.min_index_line = int(samples[closest].source_line)
+    report.min_index_kind = kinds[closest].value
+    intervals = find_singularity_intervals(
+        np.array([sample.time_s for sample in samples]),
+        metrics.index,
+        kinds,
+        thresholds,
+    )
+    for interval in intervals:
+        if interval.severity != SingularitySeverity.ERROR:
+            report.warning_interval_count += 1
+            continue
+        report.singular_interval_count += 1
+        if report.first_singular_time_s is None:
+            report.first_singular_time_s = interval.min_time_s
+            report.first_singular_line = int(samples[interval.start_sample_index].source_line)
+    return report, metrics.index
+
+
+def check_program_validity(
+    cell: BatchCell,
+    simulator: ProgramSimulator,
+    result: ProgramSimulationResult,
+    tool_pose: Pose6,
+    stop_at_first_issue: bool = False,
+) -> tuple[ProgramValidityReport, list[str]]:
+    """Collisions et sorties de zone TCP sur les échantillons nominaux.
+
+    Retourne le bilan et le code de validité de chaque échantillon (colonne CSV).
+    `stop_at_first_issue` arrête le contrôle au premier défaut (codes tronqués).
+    """
+    context = build_validity_context_snapshot(cell.robot_model, cell.tool_model, cell.workspace_model)
+    analyzer = ValidityAnalyzer(replace(context, tool_pose=tool_pose.copy()))
+    cancel_token = BuildCancelToken()
+    report = ProgramValidityReport(checked=True)
+    codes: list[str] = []
+    robot_bases_world = simulator.robot_base_world_for_samples(result.nominal_samples)
+    for index, program_sample in enumerate(result.nominal_samples):
+        sample = TrajectorySample()
+        sample.time = program_sample.time_s
+        sample.joints = program_sample.joints_deg.to_list()
+        validation = analyzer.analyze_sample(
+            sample,
+            0,
+            index,
+            index,
+            cancel_token,
+            robot_base_transform_world=robot_bases_world[index],
+        )
+        if validation is None:
+            codes.append(TrajectorySampleErrorCode.NONE.value)
+            continue
+        codes.append(validation.error_code.value)
+        clearance = validation.clearance
+        if clearance is not None and (report.min_clearance_mm is None or clearance.distance_mm < report.min_clearance_mm):
+            report.min_clearance_mm = float(clearance.distance_mm)
+            report.min_clearance_pair = f"{clearance.name_a} / {clearance.name_b}"
+        if validation.error_code == TrajectorySampleErrorCode.NONE:
+            continue
+        if validation.error_code == TrajectorySampleErrorCode.COLLISION_DETECTED:
+            report.collision_sample_count += 1
+            detail = ", ".join(f"{c.name_a} / {c.name_b}" for c in validation.collisions)
+        else:
+            report.tcp_zone_exit_count += 1
+            detail = "TCP hors zone de travail"
+        if report.first_issue_time_s is None:
+            report.first_issue_time_s = float(program_sample.time_s)
+            report.first_issue_line = int(program_sample.source_line)
+            report.first_issue = f"{validation.error_code.value}: {detail}"
+        if stop_at_first_issue:
+            break
+    return report, codes
+
+
+def run_program(cell: BatchCell, program_path: str, options: BatchRunOptions) -> tuple[ProgramBatchReport, list[list[Any]]]:
+    """Simule et contrôle un programme. Retourne le rapport et les lignes CSV d'échantillons."""
+    start = time.perf_counter()
+    report = ProgramBatchReport(program=str(program_path))
+    rows: list[list[Any]] = []
+    try:
+        program = load_robot_program(program_path)
+        report.origin = program.origin.value
+        settings = ProgramGenerationSettings.from_dict(options.generation_settings)
+        simulator = cell.create_simulator()
+        prepared, tool_pose = prepare_batch_program(cell, simulator, program, settings)
+        report.motion_count = len(prepared.motions)
+
+        result = simulator.simulate_program(prepared, include_compensation=options.include_compensation)
+        samples = result.nominal_samples
+        report.sample_count = len(samples)
+        report.cycle_time_s = float(samples[-1].time_s) if samples else 0.0
+        report.warnings = list(result.warnings)
+        report.unreached_motion_lines = unreached_motion_lines(prepared, result)
+
+        singularity_index: list[Any] = [""] * len(samples)
+        if samples:
+            report.singularity, indices = check_program_singularities(cell, result, tool_pose)
+            singularity_index = [round(float(value), 4) for value in indices]
+
+        validity_codes = [""] * len(samples)
+        if options.check_validity and samples:
+            report.validity, validity_codes = check_program_validity(cell, simulator, result, tool_pose)
+
+        tcp_deviation = [""] * len(samples)
+        overloads = [""] * len(samples)
+        if options.run_machining and samples:
+            machining = simulate_machining(
+                result,
+                MachiningSimulationParams(),
+                cell.robot_model,
+                ProgramSimulator.tool_from_pose(tool_pose),
+            )
+            report.machining = ProgramMachiningReport(
+                computed=True,
+                overload_count=machining.overload_count,
+                max_tcp_deviation_mm=max((point.delta_tcp_mm for point in machining.samples), default=0.0),
+                warnings=list(machining.warnings),
+            )
+            by_time = {point.time_s: point for point in machining.samples}
+            for index, sample in enumerate(samples):
+                point = by_time.get(sample.time_s)
+                if point is not None:
+                    tcp_deviation[index] = round(point.delta_tcp_mm, 4)
+                    overloads[index] = int(point.overload)
+
+        if options.write_samples_csv:
+            for index, sample in enumerate(samples):
+                pose = sample.nominal_pose_base
+                rows.append(
+                    [round(sample.time_s, 4), sample.source_line, sample.motion_mode.value]
+                    + [round(value, 4) for value in sample.joints_deg.to_list()]
+                    + [round(value, 4) for value in pose.to_list()]
+                    + [singularity_index[index], validity_codes[index], tcp_deviation[index], overloads[index]]
+                )
+
+        invalid = (
+            report.unreached_motion_lines
+            or report.validity.collision_sample_count
+            or report.validity.tcp_zone_exit_count
+            or report.machining.overload_count
+        )
+        report.status = STATUS_INVALID if invalid or not samples else STATUS_OK
+    except Exception as exc:
+        report.status = STATUS_ERROR
+        report.error = f"{type(exc).__name__}: {exc}"
+    report.elapsed_s = time.perf_counter() - start
+    return report, rows
+
+
+SAMPLE_CSV_HEADER = (
+    ["time_s", "source_line", "motion_mode"]
+    + [f"a{i}_deg" for i in range(1, 7)]
+    + ["x_mm", "y_mm", "z_mm", "a_deg", "b_deg", "c_deg"]
+    + ["singularity_index", "validity", "tcp_deviation_mm", "torque_overload"]
+)
+
+
+def write_program_report(
+    report: ProgramBatchReport,
+    rows: list[list[Any]],
+    output_dir: str,
+    stem: str,
+) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, f"{stem}.json"), "w", encoding="utf-8") as file:
+        json.dump(report.to_dict(), file, indent=4, ensure_ascii=False)
+    if rows:
+        with open(os.path.join(output_dir, f"{stem}_samples.csv"), "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(SAMPLE_CSV_HEADER)
+            writer.writerows(rows)
+
+
+def write_batch_summary(reports: list[ProgramBatchReport], output_dir: str) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, SUMMARY_CSV_NAME), "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        writer.writerows(report.summary_row() for report in reports)
+    counts = {status: sum(1 for report in reports if report.status == status) for status in (STATUS_OK, STATUS_INVALID, STATUS_ERROR)}
+    with open(os.path.join(output_dir, SUMMARY_JSON_NAME), "w", encoding="utf-8") as file:
+        json.dump(
+            {"program_count": len(reports), "status_counts": counts, "programs": [report.summary_row() for report in reports]},
+            file,
+            indent=4,
+            ensure_ascii=False,
+        )
+
+
+# Cellule chargée une fois par processus du pool (initializer).
+_worker_cell: BatchCell | None = None
+_worker_cell_error = ""
+
+
+def _init_worker(paths: BatchCellPaths) -> None:
+    global _worker_cell, _worker_cell_error
+    try:
+        _worker_cell = load_batch_cell(paths)
+    except Exception as exc:
+        _worker_cell = None
+        _worker_cell_error = f"{type(exc).__name__}: {exc}"
+
+
+def _run_and_write(
+    cell: BatchCell | None,
+    program_path: str,
+    output_dir: str,
+    stem: str,
+    options: BatchRunOptions,
+) -> ProgramBatchReport:
+    if cell is None:
+        report = ProgramBatchReport(program=program_path, status=STATUS_ERROR, error=_worker_cell_error)
+        rows: list[list[Any]] = []
+    else:
+        report, rows = run_program(cell, program_path, options)
+    write_program_report(report, rows, output_dir, stem)
+    return report
+
+
+def _run_in_worker(program_path: str, output_dir: str, stem: str, options: BatchRunOptions) -> dict[str, Any]:
+    # Seul le bilan remonte au processus parent : les échantillons restent sur disque.
+    return _run_and_write(_worker_cell, program_path, output_dir, stem, options).to_dict()
+
+
+def _report_from_dict(data: dict[str, Any]) -> ProgramBatchReport:
+    return ProgramBatchReport(
+        **{
+            **data,
+            "validity": ProgramValidityReport(**data["validity"]),
+            "singularity": ProgramSingularityReport(**data["singularity"]),
+            "machining": ProgramMachiningReport(**data["machining"]),
+        }
+    )
+
+
+def run_batch(
+    paths: BatchCellPaths,
+    program_paths: list[str],
+    output_dir: str,
+    options: BatchRunOptions | None = None,
+    workers: int | None = None,
+    programs_root: str | None = None,
+    progress: Callable[[ProgramBatchReport, int, int], None] | None = None,
+) -> list[ProgramBatchReport]:
+    """Simule tous les programmes et écrit les rapports ; retourne les bilans dans l'ordre d'entrée.
+
+    `workers` = 1 exécute le lot dans le processus courant (débogage, tests).
+    """
+    options = options or BatchRunOptions()
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) - 1)
+    workers = max(1, min(int(workers), len(program_paths) or 1))
+    stems = [report_stem(path, programs_root) for path in program_paths]
+    reports: list[ProgramBatchReport | None] = [None] * len(program_paths)
+    total = len(program_paths)
+
+    if workers == 1:
+        cell = load_batch_cell(paths)
+        for index, path in enumerate(program_paths):
+            reports[index] = _run_and_write(cell, path, output_dir, stems[index], options)
+            if progress is not None:
+                progress(reports[index], index + 1, total)
+    else:
+        # "spawn" : pas d'état Qt hérité du parent, comportement identique sous Windows.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(paths,)) as pool:
+            futures = {
+                pool.submit(_run_in_worker, path, output_dir, stems[index], options): index
+                for index, path in enumerate(program_paths)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    reports[index] = _report_from_dict(future.result())
+                except Exception as exc:
+                    reports[index] = ProgramBatchReport(
+                        program=program_paths[index],
+                        status=STATUS_ERROR,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                if progress is not None:
+                    progress(reports[index], done, total)
+
+    finished = [report for report in reports if report is not None]
+    write_batch_summary(finished, output_dir)
+    return finished
+
+
+__all__ = [
+    "BatchCell",
+    "BatchCellPaths",
+    "BatchRunOptions",
+    "ProgramBatchReport",
+    "ProgramMachiningReport",
+    "ProgramValidityReport",
+    "STATUS_ERROR",
+    "STATUS_INVALID",
+    "STATUS_OK",
+    "check_program_validity",
+    "discover_programs",
+    "load_batch_cell",
+    "prepare_batch_program",
+    "report_stem",
+    "run_batch",
+    "run_program",
+    "unreached_motion_lines",
+    "write_batch_summary",
+    "write_program_report",
+]
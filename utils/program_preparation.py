@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+import utils.math_utils as math_utils
+from models.program_generation_settings import ProgramGenerationSettings
+from models.robot_program import (
+    MotionRole,
+    RobotProgram,
+    RobotProgramMotion,
+    RobotProgramMotionMode,
+    RobotProgramTarget,
+    RobotProgramTargetType,
+)
+from models.types import JointAngles6, Pose6
+from models.types.approach_retract import ApproachAxisRef
+from utils.aptsource_parser import load_aptsource_program
+from utils.catnc_parser import load_catnc_program
+from utils.robot_program_kuka import load_kuka_src_program
+
+
+APT_PROGRAM_SUFFIXES = frozenset({".apt", ".aptsource", ".cls", ".cl"})
+CATNC_PROGRAM_SUFFIXES = frozenset({".nc", ".cnc", ".mpf", ".gcode", ".catnccode"})
+KUKA_PROGRAM_SUFFIXES = frozenset({".src"})
+PROGRAM_SUFFIXES = APT_PROGRAM_SUFFIXES | CATNC_PROGRAM_SUFFIXES | KUKA_PROGRAM_SUFFIXES
+
+
+def load_robot_program(path: str | Path) -> RobotProgram:
+    """Charge un programme KRL, APT ou CATNC selon l'extension (KRL par défaut)."""
+    suffix = Path(path).suffix.lower()
+    if suffix in APT_PROGRAM_SUFFIXES:
+        return load_aptsource_program(path)
+    if suffix in CATNC_PROGRAM_SUFFIXES:
+        return load_catnc_program(path)
+    return load_kuka_src_program(path)
+
+
+def program_with_base_pose(program: RobotProgram | None, base_pose: Pose6) -> RobotProgram | None:
+    if program is None:
+        return None
+    updated_motions = [replace(motion, base_pose=base_pose.copy()) for motion in program.motions]
+    return replace(program, program_base_pose=base_pose.copy(), motions=updated_motions)
+
+
+def program_with_simulation_overrides(
+    program: RobotProgram,
+    tool_pose: Pose6 | None = None,
+    constant_speed_mmps: float | None = None,
+    orientation_override: Pose6 | None = None,
+) -> RobotProgram:
+    """Programme prêt pour la simulation : outil effectif, vitesse constante, orientation imposée."""
+    if tool_pose is None and constant_speed_mmps is None and orientation_override is None:
+        return program
+
+    updated_motions: list[RobotProgramMotion] = []
+    for motion in program.motions:
+        updated_motion = motion
+        if tool_pose is not None:
+            updated_motion = replace(updated_motion, tool_pose=tool_pose.copy())
+        if (
+            constant_speed_mmps is not None
+            and motion.role == MotionRole.NORMAL
+            and motion.mode in {RobotProgramMotionMode.LINEAR, RobotProgramMotionMode.CIRCULAR}
+        ):
+            updated_motion = replace(updated_motion, cp_speed_mps=float(constant_speed_mmps) / 1000.0)
+        if (
+            orientation_override is not None
+            and motion.target.target_type == RobotProgramTargetType.CARTESIAN
+        ):
+            cp = motion.target.cartesian_pose
+            overridden_pose = Pose6(
+                x=cp.x, y=cp.y, z=cp.z,
+                a=orientation_override.a, b=orientation_override.b, c=orientation_override.c,
+            )
+            updated_motion = replace(updated_motion, target=replace(motion.target, cartesian_pose=overridden_pose))
+        updated_motions.append(updated_motion)
+    return replace(program, motions=updated_motions)
+
+
+def rebuild_derived_motions(
+    program: RobotProgram,
+    settings: ProgramGenerationSettings,
+    home_joints_deg: list[float],
+    effective_base: Pose6,
+) -> RobotProgram:
+    """Retire les motions dérivées (rôle ≠ NORMAL) et reconstruit HOME/APPROACH/RETRACT."""
+    # Garder uniquement les NORMAL
+    normal_motions = [m for m in program.motions if m.role == MotionRole.NORMAL]
+
+    derived_prefix: list[RobotProgramMotion] = []
+    derived_suffix: list[RobotProgramMotion] = []
+
+    if settings.home_enabled:
+        home_values = list(home_joints_deg)
+        home_joints = JointAngles6.from_values(home_values)
+
+        # Retirer les PTP JOINT home en début/fin du programme source pour éviter les doublons
+        def _is_home_motion(m: RobotProgramMotion) -> bool:
+            if m.target.target_type != RobotProgramTargetType.JOINT:
+                return False
+            if m.target.joint_angles is None:
+                return False
+            return all(
+                abs(a - b) < 0.5
+                for a, b in zip(m.target.joint_angles.to_list(), home_values)
+            )
+
+        while normal_motions and _is_home_motion(normal_motions[0]):
+            normal_motions = normal_motions[1:]
+        while normal_motions and _is_home_motion(normal_motions[-1]):
+            normal_motions = normal_motions[:-1]
+
+        home_target = RobotProgramTarget(
+            target_type=RobotProgramTargetType.JOINT,
+            joint_angles=home_joints,
+        )
+        home_start = RobotProgramMotion(
+            mode=RobotProgramMotionMode.PTP,
+            target=home_target,
+            line_number=0,
+            source="; HOME",
+            base_pose=effective_base,
+            role=MotionRole.HOME_START,
+        )
+        home_end = replace(home_start, role=MotionRole.HOME_END)
+        derived_prefix.append(home_start)
+        derived_suffix.append(home_end)
+
+    first_cartesian = next(
+        (m for m in normal_motions if m.target.target_type == RobotProgramTargetType.CARTESIAN),
+        None,
+    )
+    last_cartesian = next(
+        (m for m in reversed(normal_motions) if m.target.target_type == RobotProgramTargetType.CARTESIAN),
+        None,
+    )
+
+    if settings.approach.enabled and first_cartesian is not None:
+        for step in settings.approach.steps:
+            signed_dist = step.distance_mm * (-1 if step.inverted else 1)
+            approach_pose = compute_offset_pose(
+                first_cartesian.target.cartesian_pose,
+                first_cartesian.base_pose,
+                step.axis_ref,
+                signed_dist,
+            )
+            approach_target = RobotProgramTarget(
+                target_type=RobotProgramTargetType.CARTESIAN,
+                cartesian_pose=approach_pose,
+            )
+            approach_motion = replace(
+                first_cartesian,
+                mode=RobotProgramMotionMode.LINEAR,
+                target=approach_target,
+                cp_speed_mps=step.speed_mps,
+                role=MotionRole.APPROACH,
+                line_number=0,
+                source="; APPROACH",
+            )
+            derived_prefix.append(approach_motion)
+
+    retract_motions: list[RobotProgramMotion] = []
+    if settings.retract.enabled and last_cartesian is not None:
+        for step in settings.retract.steps:
+            signed_dist = step.distance_mm * (-1 if step.inverted else 1)
+            retract_pose = compute_offset_pose(
+                last_cartesian.target.cartesian_pose,
+                last_cartesian.base_pose,
+                step.axis_ref,
+                signed_dist,
+            )
+            retract_target = RobotProgramTarget(
+                target_type=RobotProgramTargetType.CARTESIAN,
+                cartesian_pose=retract_pose,
+            )
+            retract_motion = replace(
+                last_cartesian,
+                mode=RobotProgramMotionMode.LINEAR,
+                target=retract_target,
+                cp_speed_mps=step.speed_mps,
+                role=MotionRole.RETRACT,
+                line_number=0,
+                source="; RETRACT",
+            )
+            retract_motions.append(retract_motion)
+
+    # Retrait avant HOME_END
+    all_motions = derived_prefix + normal_motions + retract_motions + derived_suffix
+    return replace(program, motions=all_motions)
+
+
+def compute_offset_pose(
+    target_pose: Pose6,
+    base_pose: Pose6,
+    axis_ref: ApproachAxisRef,
+    distance_mm: float,
+) -> Pose6:
+    """Calcule une pose décalée de distance_mm dans la direction axis_ref."""
+    T_base = math_utils.pose_zyx_to_matrix(base_pose)
+
+    # Axe de décalage en repère robot
+    if axis_ref == ApproachAxisRef.TOOL_Z:
+        # -Z outil : l'approche vient de devant l'outil (Z sortant = direction pièce)
+        T_target_in_robot = T_base @ math_utils.pose_zyx_to_matrix(target_pose)
+        direction = -T_target_in_robot[:3, 2]
+    elif axis_ref == ApproachAxisRef.PIECE_X:
+        direction = T_base[:3, 0]
+    elif axis_ref == ApproachAxisRef.PIECE_Y:
+        direction = T_base[:3, 1]
+    else:  # PIECE_Z
+        direction = T_base[:3, 2]
+
+    norm = float(np.linalg.norm(direction))
+    if norm < 1e-9:
+        return target_pose
+
+    direction = direction / norm
+
+    # Décalage en repère programme
+    T_base_inv = math_utils.invert_homogeneous_transform(T_base)
+    offset_prog = T_base_inv[:3, :3] @ (direction * distance_mm)
+
+    return Pose6(
+        target_pose.x + offset_prog[0],
+        target_pose.y + offset_prog[1],
+        target_pose.z + offset_prog[2],
+        target_pose.a,
+        target_pose.b,
+        target_pose.c,
+    )
+
+
+__all__ = [
+    "APT_PROGRAM_SUFFIXES",
+    "CATNC_PROGRAM_SUFFIXES",
+    "KUKA_PROGRAM_SUFFIXES",
+    "PROGRAM_SUFFIXES",
+    "compute_offset_pose",
+    "load_robot_program",
+    "program_with_base_pose",
+    "program_with_simulation_overrides",
+    "rebuild_derived_motions",
+]
@@ -30,10 +30,14 @@ from models.tooling_model import ToolingModel
 from models.types import JointAngles6, Pose6
 from models.workpiece_model import WorkpieceModel
 from models.workspace_model import WorkspaceModel
-from utils.external_axes_kinematics import piece_frame_world, tooling_frame_world
-from utils.math_utils import invert_homogeneous_transform, pose_zyx_to_matrix
+from utils.external_axes_kinematics import ExternalAxesChainPlan
+from utils.math_utils import invert_homogeneous_transform
 from utils.mgi import MGI, MgiAxisLimits, MgiConfigurationFilter, MgiGeometricParams, MgiParams, RobotTool
 from utils.reference_frame_utils import pose_to_matrix, matrix_to_pose
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 @dataclass(frozen=True)
@@ -126,6 +130,17 @@ class ProgramSimulator:
         self._initial_ext_axis_values: dict[tuple[str, int], float] = {}
         # Descripteur du repère base programme (None = base bakée seulement, pas de suivi live)
         self._base_spec: ProgramBaseSpec | None = None
+        # Topologie de montage et repères statiques des axes externes, figés pour la passe
+        self._ext_chain_plan: ExternalAxesChainPlan | None = None
+        self._robot_base_cache_key: bytes | None = None
+        self._robot_base_cache_value: np.ndarray = np.eye(4, dtype=float)
+
+    def get_base_spec(self) -> ProgramBaseSpec | None:
+        return self._base_spec
+
+    def set_base_spec(self, base_spec: ProgramBaseSpec | None) -> None:
+        """Repère base programme suivi pendant la simulation (None = base bakée seulement)."""
+        self._base_spec = base_spec
 
     def simulate_program(self, program: RobotProgram, include_compensation: bool = True) -> ProgramSimulationResult:
         if program.brand != RobotProgramBrand.KUKA:
@@ -145,7 +160,8 @@ class ProgramSimulator:
             total_length_mm / max(1, self.MAX_TRAJECTORY_SAMPLES),
         )
         try:
-            nominal_samples = self._simulate_motion_list(program.motions, build_cache=True)
+            with _SPANS.span("nominal_pass", "program", motions=len(program.motions)):
+                nominal_samples = self._simulate_motion_list(program.motions, build_cache=True)
             warnings = list(program.warnings)
             cartesian_program: RobotProgram | None = None
             articular_program: RobotProgram | None = None
@@ -154,12 +170,13 @@ class ProgramSimulator:
 
             measured_dh = self._cached_measured_dh
             if measured_dh is not None and include_compensation:
-                cartesian_program = self._build_compensated_program(program, ProgramCompensationOutputMode.CARTESIAN, measured_dh)
-                articular_program = self._build_compensated_program(program, ProgramCompensationOutputMode.ARTICULAR, measured_dh)
-                if cartesian_program is not None:
-                    cartesian_samples = self._simulate_motion_list(cartesian_program.motions)
-                if articular_program is not None:
-                    articular_samples = self._simulate_motion_list(articular_program.motions)
+                with _SPANS.span("compensation_pass", "program"):
+                    cartesian_program = self._build_compensated_program(program, ProgramCompensationOutputMode.CARTESIAN, measured_dh)
+                    articular_program = self._build_compensated_program(program, ProgramCompensationOutputMode.ARTICULAR, measured_dh)
+                    if cartesian_program is not None:
+                        cartesian_samples = self._simulate_motion_list(cartesian_program.motions)
+                    if articular_program is not None:
+                        articular_samples = self._simulate_motion_list(articular_program.motions)
 
             return ProgramSimulationResult(
                 nominal_samples=nominal_samples,
@@ -199,7 +216,8 @@ class ProgramSimulator:
         )
 
         try:
-            nominal_samples = self._simulate_incremental(program.motions, set(dirty_indices))
+            with _SPANS.span("incremental_pass", "program", motions=len(program.motions), dirty=len(dirty_indices)):
+                nominal_samples = self._simulate_incremental(program.motions, set(dirty_indices))
         finally:
             self._cached_measured_dh = None
             self._cached_measured_dh_arrays = None
@@ -584,41 +602,42 @@ class ProgramSimulator:
         current_time_s: float,
         motion_tool: RobotTool,
     ) -> list[ProgramSimulationSample]:
-        if motion.mode == RobotProgramMotionMode.PTP:
-            return self._simulate_ptp(motion, current_pose_base, current_joints_deg, current_time_s, motion_tool)
-        if motion.mode == RobotProgramMotionMode.LINEAR:
-            target_pose_base = self._target_pose_base(motion, motion.target, motion_tool)
-            distance_mm = self._distance_xyz_mm(current_pose_base, target_pose_base)
-            duration_s = max(self.DEFAULT_DT_S, distance_mm / max(1e-6, self._motion_linear_speed_mps(motion)) / 1000.0)
-            intervals = self._cartesian_intervals_for_distance(distance_mm)
-            step_time_s = duration_s / max(1, intervals)
-            orientation_deltas_deg = [
-                self._shortest_angle_delta_deg(current_pose_base.to_list()[3 + axis], target_pose_base.to_list()[3 + axis])
-                for axis in range(3)
-            ]
-            path = [
-                self._interpolate_linear_pose(current_pose_base, target_pose_base, index / intervals, orientation_deltas_deg)
-                for index in range(intervals + 1)
-            ]
-            return self._simulate_cartesian_path(motion, path, current_joints_deg, current_time_s, motion_tool, step_time_s)
-        if motion.mode == RobotProgramMotionMode.CIRCULAR and motion.via_target is not None:
-            via_pose_base = self._target_pose_base(motion, motion.via_target, motion_tool)
-            target_pose_base = self._target_pose_base(motion, motion.target, motion_tool)
-            approximate_length_mm = (
-                self._distance_xyz_mm(current_pose_base, via_pose_base)
-                + self._distance_xyz_mm(via_pose_base, target_pose_base)
-            )
-            duration_s = max(
-                self.DEFAULT_DT_S,
-                approximate_length_mm / max(1e-6, self._motion_linear_speed_mps(motion)) / 1000.0,
-            )
-            intervals = self._cartesian_intervals_for_distance(approximate_length_mm)
-            step_time_s = duration_s / max(1, intervals)
-            path = self._circle_pose_points(current_pose_base, via_pose_base, target_pose_base, intervals)
-            return self._simulate_cartesian_path(motion, path, current_joints_deg, current_time_s, motion_tool, step_time_s)
-        if motion.mode == RobotProgramMotionMode.EXTERNAL_AXIS:
-            return self._simulate_external_axis(motion, current_joints_deg, current_time_s, motion_tool)
-        return []
+        with _SPANS.span("motion", "program", lazy_args=lambda: {"line": motion.line_number, "mode": motion.mode.name}):
+            if motion.mode == RobotProgramMotionMode.PTP:
+                return self._simulate_ptp(motion, current_pose_base, current_joints_deg, current_time_s, motion_tool)
+            if motion.mode == RobotProgramMotionMode.LINEAR:
+                target_pose_base = self._target_pose_base(motion, motion.target, motion_tool)
+                distance_mm = self._distance_xyz_mm(current_pose_base, target_pose_base)
+                duration_s = max(self.DEFAULT_DT_S, distance_mm / max(1e-6, self._motion_linear_speed_mps(motion)) / 1000.0)
+                intervals = self._cartesian_intervals_for_distance(distance_mm)
+                step_time_s = duration_s / max(1, intervals)
+                orientation_deltas_deg = [
+                    self._shortest_angle_delta_deg(current_pose_base.to_list()[3 + axis], target_pose_base.to_list()[3 + axis])
+                    for axis in range(3)
+                ]
+                path = [
+                    self._interpolate_linear_pose(current_pose_base, target_pose_base, index / intervals, orientation_deltas_deg)
+                    for index in range(intervals + 1)
+                ]
+                return self._simulate_cartesian_path(motion, path, current_joints_deg, current_time_s, motion_tool, step_time_s)
+            if motion.mode == RobotProgramMotionMode.CIRCULAR and motion.via_target is not None:
+                via_pose_base = self._target_pose_base(motion, motion.via_target, motion_tool)
+                target_pose_base = self._target_pose_base(motion, motion.target, motion_tool)
+                approximate_length_mm = (
+                    self._distance_xyz_mm(current_pose_base, via_pose_base)
+                    + self._distance_xyz_mm(via_pose_base, target_pose_base)
+                )
+                duration_s = max(
+                    self.DEFAULT_DT_S,
+                    approximate_length_mm / max(1e-6, self._motion_linear_speed_mps(motion)) / 1000.0,
+                )
+                intervals = self._cartesian_intervals_for_distance(approximate_length_mm)
+                step_time_s = duration_s / max(1, intervals)
+                path = self._circle_pose_points(current_pose_base, via_pose_base, target_pose_base, intervals)
+                return self._simulate_cartesian_path(motion, path, current_joints_deg, current_time_s, motion_tool, step_time_s)
+            if motion.mode == RobotProgramMotionMode.EXTERNAL_AXIS:
+                return self._simulate_external_axis(motion, current_joints_deg, current_time_s, motion_tool)
+            return []
 
     # =========================================================================
     # Lot C : PTP en une seule passe (sonde légère pour estimer, puis sonde fine)
@@ -801,54 +820,70 @@ class ProgramSimulator:
             return 1
         return max(1, int(math.ceil(float(distance_mm) / step_mm)))
 
+    def _chain_plan(self) -> ExternalAxesChainPlan:
+        """Chaînes d'axes externes figées pour la passe (reconstruites par _init_ext_axis_state)."""
+        if self._ext_chain_plan is None:
+            self._ext_chain_plan = ExternalAxesChainPlan(
+                self.external_axes_model,
+                self.workspace_model,
+                self.workpiece_model,
+                self.tooling_model,
+            )
+        return self._ext_chain_plan
+
     def _world_robot_base_for(self, ext_values: dict[tuple[str, int], float]) -> np.ndarray:
         """T_world_robotBase pour l'état d'axes simulé donné."""
         if self.workspace_model is None:
             return np.eye(4, dtype=float)
-        workspace_base = np.array(self.workspace_model.get_robot_base_transform_world().matrix, dtype=float)
-        if self.external_axes_model is None:
-            return workspace_base
-        override = self.external_axes_model.get_robot_world_base_matrix_for(ext_values)
-        return override if override is not None else workspace_base
+        plan = self._chain_plan()
+        values = plan.values_from_dict(ext_values)
+        # Les mouvements robot gardent les axes fixes : un seul calcul de chaîne par état.
+        key = values.tobytes()
+        if self._robot_base_cache_key != key:
+            self._robot_base_cache_key = key
+            self._robot_base_cache_value = plan.robot_base_world(values)[0]
+        return self._robot_base_cache_value.copy()
 
     def _piece_frame_world_for(self, ext_values: dict[tuple[str, int], float]) -> np.ndarray | None:
         """T_world_pieceFrame pour l'état d'axes simulé donné. None si aucun modèle pièce."""
         if self.workpiece_model is None or self.workspace_model is None:
             return None
-        workspace_base = np.array(self.workspace_model.get_robot_base_transform_world().matrix, dtype=float)
-        world_base = self._world_robot_base_for(ext_values)
-        world_transforms: dict[str, dict] = {}
-        if self.external_axes_model is not None:
-            world_transforms = self.external_axes_model.compute_world_transforms_for(ext_values)
-
-        workspace_frames: dict[str, np.ndarray] = {
-            elem.name: pose_zyx_to_matrix(elem.pose)
-            for elem in self.workspace_model.get_workspace_cad_elements()
-            if elem.name
-        }
+        plan = self._chain_plan()
+        frames = plan.piece_frame_world(plan.values_from_dict(ext_values))
+        return None if frames is None else frames[0]
 
-        tooling_matrix: np.ndarray | None = None
-        if (
-            self.tooling_model is not None
-            and self.workpiece_model.get_parent_frame_id() == WorkpieceModel.FRAME_TOOLING
-        ):
-            tooling_matrix = tooling_frame_world(
-                tooling_parent_id=self.tooling_model.get_parent_frame_id(),
-                elements=self.tooling_model.get_elements(),
-                world_transforms=world_transforms,
-                world_robot_base_matrix=world_base,
-                workspace_frames=workspace_frames,
-            )
+    def workpiece_frame_in_robot(self) -> np.ndarray | None:
+        """Repère pièce dans le repère base robot, axes externes à leur position courante."""
+        self._init_ext_axis_state()
+        ext_values = dict(self._current_ext_axis_values)
+        T_world_pieceFrame = self._piece_frame_world_for(ext_values)
+        if T_world_pieceFrame is None:
+            return None
+        return invert_homogeneous_transform(self._world_robot_base_for(ext_values)) @ T_world_pieceFrame
 
-        return piece_frame_world(
-            piece_parent_id=self.workpiece_model.get_parent_frame_id(),
-            world_transforms=world_transforms,
-            piece_pose_in_parent=self.workpiece_model.get_pose_in_parent(),
-            piece_frame_pose=self.workpiece_model.get_workpiece_frame_pose(),
-            workspace_robot_base_matrix=workspace_base,
-            world_robot_base_matrix=world_base,
-            tooling_frame_matrix=tooling_matrix,
-        )
+    def robot_base_world_for_sample(self, sample: ProgramSimulationSample) -> np.ndarray:
+        """T_world_robotBase à l'état d'axes externes d'un échantillon simulé (rail porteur inclus)."""
+        return self.robot_base_world_for_samples([sample])[0]
+
+    def robot_base_world_for_samples(self, samples: list[ProgramSimulationSample]) -> np.ndarray:
+        """T_world_robotBase (N, 4, 4) pour des échantillons simulés, chaînes évaluées en un lot."""
+        return self._world_robot_bases_for_values(self._ext_values_matrix(self._chain_plan(), samples))
+
+    def _world_robot_bases_for_values(self, values: np.ndarray) -> np.ndarray:
+        """T_world_robotBase (N, 4, 4) pour un tableau d'états d'axes (N, n)."""
+        if self.workspace_model is None:
+            return np.broadcast_to(np.eye(4, dtype=float), (len(values), 4, 4)).copy()
+        return self._chain_plan().robot_base_world(values)
+
+    @staticmethod
+    def _ext_values_matrix(plan: ExternalAxesChainPlan, samples: list[ProgramSimulationSample]) -> np.ndarray:
+        """Snapshots ext_axis_values en tableau (N, n) ; valeurs manquantes = valeur live."""
+        count = len(plan.value_keys)
+        values = np.broadcast_to(plan.live_values, (len(samples), count)).copy()
+        for row, sample in enumerate(samples):
+            snapshot = sample.ext_axis_values[:count]
+            values[row, :len(snapshot)] = snapshot
+        return values
 
     def _build_sample(
         self,
@@ -856,11 +891,16 @@ class ProgramSimulator:
         motion: RobotProgramMotion,
         joints_deg: list[float],
         motion_tool: RobotTool,
+        world_robot_base: np.ndarray | None = None,
     ) -> ProgramSimulationSample:
         nominal_pose_base = self._fk_nominal_pose_base(joints_deg, motion_tool)
         measured_pose_base = self._fk_measured_pose_base(joints_deg, motion_tool)
         # Pose monde : T_world_robotBase · T_base_tcp
-        T_world_robotBase = self._world_robot_base_for(self._current_ext_axis_values)
+        T_world_robotBase = (
+            world_robot_base
+            if world_robot_base is not None
+            else self._world_robot_base_for(self._current_ext_axis_values)
+        )
         T_base_tcp = pose_to_matrix(nominal_pose_base)
         nominal_pose_world = matrix_to_pose(T_world_robotBase @ T_base_tcp)
         measured_pose_world: Pose6 | None = None
@@ -880,6 +920,8 @@ class ProgramSimulator:
 
     def _init_ext_axis_state(self) -> None:
         self._current_ext_axis_values = {}
+        self._ext_chain_plan = None
+        self._robot_base_cache_key = None
         if self.external_axes_model is None:
             self._initial_ext_snapshot = ()
             self._initial_ext_axis_values = {}
@@ -954,6 +996,18 @@ class ProgramSimulator:
             for jv in motion.external_axis_target.values
         }
 
+        # Tous les états d'axes du mouvement en un tableau (n_steps, n) : une seule évaluation des chaînes.
+        plan = self._chain_plan()
+        alphas = np.arange(1, n_steps + 1, dtype=float) / n_steps
+        step_values = np.broadcast_to(plan.values_from_dict(self._current_ext_axis_values), (n_steps, len(plan.value_keys))).copy()
+        column_by_key = {key: column for column, key in enumerate(plan.value_keys)}
+        for jv in motion.external_axis_target.values:
+            column = column_by_key.get((jv.axis_id, jv.joint_index))
+            if column is not None:
+                start = start_values[(jv.axis_id, jv.joint_index)]
+                step_values[:, column] = start + (jv.value - start) * alphas
+        world_bases = self._world_robot_bases_for_values(step_values)
+
         samples: list[ProgramSimulationSample] = []
         for step in range(1, n_steps + 1):
             alpha = step / n_steps
@@ -961,7 +1015,15 @@ class ProgramSimulator:
                 start = start_values[(jv.axis_id, jv.joint_index)]
                 self._current_ext_axis_values[(jv.axis_id, jv.joint_index)] = start + (jv.value - start) * alpha
             t = current_time_s + max_duration_s * alpha
-            samples.append(self._build_sample(t, motion, current_joints_deg, motion_tool))
+            samples.append(
+                self._build_sample(
+                    t,
+                    motion,
+                    current_joints_deg,
+                    motion_tool,
+                    world_robot_base=world_bases[step - 1],
+                )
+            )
 
         # Fixer les valeurs finales exactes
         for jv in motion.external_axis_target.values:
@@ -1313,11 +1375,8 @@ class ProgramSimulator:
         """T_world de l'extrémité d'un axe externe à un état d'axes simulé."""
         if axis_id is None or self.external_axes_model is None:
             return np.eye(4, dtype=float)
-        transforms = self.external_axes_model.compute_world_transforms_for(ext_values)
-        entry = transforms.get(axis_id)
-        if entry is None:
-            return np.eye(4, dtype=float)
-        return np.array(entry["end"], dtype=float)
+        plan = self._chain_plan()
+        return plan.axis_end_world(plan.values_from_dict(ext_values), axis_id)[0]
 
     @staticmethod
     def _pose_from_program_base_to_robot_base(pose_program_base: Pose6, base_pose: Pose6) -> Pose6:
@@ -1330,9 +1389,12 @@ class ProgramSimulator:
         return matrix_to_pose(transform)
 
     @staticmethod
-    def _tool_from_pose(tool_pose: Pose6) -> RobotTool:
+    def tool_from_pose(tool_pose: Pose6) -> RobotTool:
+        """Outil équivalent à la pose TCP d'un mouvement (x, y, z en mm, a, b, c en degrés)."""
         return RobotTool(tool_pose.x, tool_pose.y, tool_pose.z, tool_pose.a, tool_pose.b, tool_pose.c)
 
+    _tool_from_pose = tool_from_pose
+
     @staticmethod
     def _tool_to_pose(tool: RobotTool) -> Pose6:
         return Pose6(tool.x, tool.y, tool.z, tool.a, tool.b, tool.c)
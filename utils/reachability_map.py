@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from models.robot_model import RobotModel
+from models.types import Pose6
+from utils.cartesian_jog import JOG_ORIENTATION_SCALE_MM
+from utils.mgi import MgiConfigKey, MgiParams, RobotTool
+from utils.mgi_batch import CONFIG_COUNT, compute_mgi_batch, poses_to_matrices
+
+
+REACHABILITY_MAP_DIRECTORY = Path("user_data") / "reachability"
+REACHABILITY_MAP_FORMAT_VERSION = 1
+DEFAULT_VOXEL_SIZE_MM = 100.0
+DEFAULT_DIRECTION_COUNT = 32
+DEFAULT_ROLL_COUNT = 1
+# Nombre de poses résolues par lot : borne la mémoire des tableaux (N, 8, 6) et des MGD.
+_BATCH_POSE_COUNT = 20000
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class ReachabilityGridSpec:
+    """Échantillonnage de la carte : pas de voxel et jeu d'orientations outil."""
+    voxel_size_mm: float = DEFAULT_VOXEL_SIZE_MM
+    direction_count: int = DEFAULT_DIRECTION_COUNT
+    roll_count: int = DEFAULT_ROLL_COUNT
+
+    def to_dict(self) -> dict:
+        return {
+            "voxel_size_mm": float(self.voxel_size_mm),
+            "direction_count": int(self.direction_count),
+            "roll_count": int(self.roll_count),
+        }
+
+
+@dataclass
+class ReachabilityQueryResult:
+    """Réponse de la carte pour une pose : configurations, manipulabilité, marge articulaire."""
+    inside_grid: bool
+    config_mask: int = 0
+    manipulability: float = 0.0
+    joint_margin: float = 0.0
+    cell_reachability_ratio: float = 0.0
+    configurations: list[MgiConfigKey] = field(default_factory=list)
+
+    @property
+    def is_reachable(self) -> bool:
+        return self.config_mask != 0
+
+
+def robot_configuration_hash(robot_model: RobotModel, tool: RobotTool | None = None) -> str:
+    """Empreinte de la cinématique (DH, limites, sens d'axes, outil) servant de clé de cache."""
+    tool = tool if tool is not None else robot_model.current_tool
+    payload = {
+        "dh": [[round(float(v), 6) for v in robot_model.get_dh_row(i)[:4]] for i in range(6)],
+        "axis_limits": [[round(float(v), 6) for v in limits] for limits in robot_model.get_axis_limits()[:6]],
+        "axis_reversed": [int(v) for v in robot_model.get_axis_reversed()[:6]],
+        "tool": [round(float(v), 6) for v in (tool.x, tool.y, tool.z, tool.a, tool.b, tool.c)],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+@dataclass
+class ReachabilityKinematics:
+    """Copie figée de la cinématique nécessaire au calcul (utilisable hors thread GUI)."""
+    robot_hash: str
+    mgi_params: MgiParams
+    tool: RobotTool
+    dh_rows: np.ndarray
+    axis_limits_deg: np.ndarray
+    axis_reversed: np.ndarray
+
+    @staticmethod
+    def from_robot_model(robot_model: RobotModel, tool: RobotTool | None = None) -> "ReachabilityKinematics":
+        tool = tool if tool is not None else robot_model.current_tool
+        return ReachabilityKinematics(
+            robot_hash=robot_configuration_hash(robot_model, tool),
+            mgi_params=copy.deepcopy(robot_model.mgi_params),
+            tool=RobotTool(tool.x, tool.y, tool.z, tool.a, tool.b, tool.c),
+            dh_rows=np.asarray([robot_model.get_dh_row(i)[:4] for i in range(6)], dtype=float),
+            axis_limits_deg=np.asarray(robot_model.get_axis_limits()[:6], dtype=float),
+            axis_reversed=np.asarray(robot_model.get_axis_reversed()[:6], dtype=float),
+        )
+
+
+def build_orientation_set(direction_count: int = DEFAULT_DIRECTION_COUNT, roll_count: int = DEFAULT_ROLL_COUNT) -> np.ndarray:
+    """Rotations (M, 3, 3) : axes Z outil répartis sur la sphère (Fibonacci) × rotations propres."""
+    direction_count = max(1, int(direction_count))
+    roll_count = max(1, int(roll_count))
+    indices = np.arange(direction_count, dtype=float) + 0.5
+    polar = np.arccos(1.0 - 2.0 * indices / direction_count)
+    azimuth = math.pi * (1.0 + math.sqrt(5.0)) * indices
+    directions = np.column_stack([
+        np.cos(azimuth) * np.sin(polar),
+        np.sin(azimuth) * np.sin(polar),
+        np.cos(polar),
+    ])
+
+    rotations: list[np.ndarray] = []
+    for z_axis in directions:
+        reference = np.array([1.0, 0.0, 0.0]) if abs(z_axis[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+        x_axis = reference - np.dot(reference, z_axis) * z_axis
+        x_axis /= np.linalg.norm(x_axis)
+        y_axis = np.cross(z_axis, x_axis)
+        for roll_index in range(roll_count):
+            roll = 2.0 * math.pi * roll_index / roll_count
+            x_rolled = math.cos(roll) * x_axis + math.sin(roll) * y_axis
+            rotations.append(np.column_stack([x_rolled, np.cross(z_axis, x_rolled), z_axis]))
+    return np.asarray(rotations, dtype=float)
+
+
+def _rotations_to_abc(rotations: np.ndarray) -> np.ndarray:
+    """Angles Kuka ZYX [A, B, C] (degrés) de rotations (M, 3, 3)."""
+    b = np.arctan2(-rotations[:, 2, 0], np.hypot(rotations[:, 0, 0], rotations[:, 1, 0]))
+    a = np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0])
+    c = np.arctan2(rotations[:, 2, 1], rotations[:, 2, 2])
+    return np.degrees(np.column_stack([a, b, c]))
+
+
+def compute_fk_frames_batch(
+    dh_rows: np.ndarray,
+    axis_reversed: np.ndarray,
+    joints_deg: np.ndarray,
+    tool_matrix: np.ndarray,
+) -> np.ndarray:
+    """MGD vectorisé (DH modifié) : repères (K, 8, 4, 4) [identité, 1..6, TCP] comme RobotModel.compute_fk."""
+    joints_deg = np.asarray(joints_deg, dtype=float).reshape(-1, 6)
+    count = joints_deg.shape[0]
+    frames = np.zeros((count, 8, 4, 4), dtype=float)
+    frames[:, 0] = np.eye(4)
+    current = np.broadcast_to(np.eye(4), (count, 4, 4)).copy()
+    for axis in range(6):
+        alpha_deg, d, theta_offset_deg, r = (float(v) for v in dh_rows[axis][:4])
+        alpha = math.radians(alpha_deg)
+        theta = math.radians(theta_offset_deg) + np.radians(joints_deg[:, axis] * axis_reversed[axis])
+        ca, sa = math.cos(alpha), math.sin(alpha)
+        ct, st = np.cos(theta), np.sin(theta)
+        step = np.zeros((count, 4, 4), dtype=float)
+        step[:, 0, 0] = ct
+        step[:, 0, 1] = -st
+        step[:, 0, 3] = d
+        step[:, 1, 0] = st * ca
+        step[:, 1, 1] = ct * ca
+        step[:, 1, 2] = -sa
+        step[:, 1, 3] = -r * sa
+        step[:, 2, 0] = st * sa
+        step[:, 2, 1] = ct * sa
+        step[:, 2, 2] = ca
+        step[:, 2, 3] = r * ca
+        step[:, 3, 3] = 1.0
+        current = current @ step
+        frames[:, axis + 1] = current
+    frames[:, 7] = current @ tool_matrix
+    return frames
+
+
+def compute_manipulability_batch(frames: np.ndarray, axis_reversed: np.ndarray) -> np.ndarray:
+    """Inverse du conditionnement (0 = singulier, 1 = isotrope) de la jacobienne pondérée au TCP.
+
+    Les lignes d'orientation sont pondérées par JOG_ORIENTATION_SCALE_MM comme pour le jog
+    cartésien, ce qui rend l'indice sans dimension et sensible aux singularités poignet.
+    """
+    tcp = frames[:, 7, :3, 3]
+    axes = frames[:, 1:7, :3, 2] * np.asarray(axis_reversed, dtype=float)[None, :, None]
+    origins = frames[:, 1:7, :3, 3]
+    jacobian = np.empty((frames.shape[0], 6, 6), dtype=float)
+    jacobian[:, :3, :] = np.cross(axes, tcp[:, None, :] - origins).transpose(0, 2, 1)
+    jacobian[:, 3:, :] = axes.transpose(0, 2, 1) * JOG_ORIENTATION_SCALE_MM
+    singular_values = np.linalg.svd(jacobian, compute_uv=False)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = singular_values[:, -1] / singular_values[:, 0]
+    return np.nan_to_num(ratio, nan=0.0)
+
+
+def compute_joint_margin_batch(joints_deg: np.ndarray, axis_limits_deg: np.ndarray) -> np.ndarray:
+    """Marge normalisée à la butée la plus proche : 1 au milieu de toutes les plages, 0 en butée."""
+    q_min = axis_limits_deg[:, 0]
+    q_max = axis_limits_deg[:, 1]
+    half_range = np.maximum((q_max - q_min) * 0.5, 1e-9)
+    margin = np.minimum(joints_deg - q_min, q_max - joints_deg) / half_range
+    return np.clip(margin.min(axis=-1), 0.0, 1.0)
+
+
+class ReachabilityMap:
+    """Carte d'atteignabilité précalculée autour de la base robot.
+
+    Pour chaque voxel (centre en repère base robot) et chaque orientation du jeu d'échantillons :
+    masque des configurations MGI valides (uint8, bit = MgiConfigKey.value), manipulabilité et
+    marge articulaire de la meilleure configuration. Les requêtes sont en temps constant.
+    """
+
+    def __init__(
+        self,
+        robot_hash: str,
+        spec: ReachabilityGridSpec,
+        origin_mm: np.ndarray,
+        shape: tuple[int, int, int],
+        orientations: np.ndarray,
+        config_masks: np.ndarray,
+        manipulability: np.ndarray,
+        joint_margin: np.ndarray,
+    ):
+        self.robot_hash = robot_hash
+        self.spec = spec
+        self.origin_mm = np.asarray(origin_mm, dtype=float)
+        self.shape = tuple(int(v) for v in shape)
+        self.orientations = np.asarray(orientations, dtype=float)
+        self.config_masks = np.asarray(config_masks, dtype=np.uint8)
+        self.manipulability = np.asarray(manipulability, dtype=np.float16)
+        self.joint_margin = np.asarray(joint_margin, dtype=np.float16)
+        self._orientation_rows = self.orientations.reshape(len(self.orientations), 9)
+
+    @property
+    def cell_count(self) -> int:
+        return int(np.prod(self.shape))
+
+    def cell_centers(self) -> np.ndarray:
+        """Centres des voxels (cellules, 3) en repère base robot, ordre des index de cellule."""
+        grid = np.indices(self.shape).reshape(3, -1).T.astype(float)
+        return self.origin_mm + (grid + 0.5) * self.spec.voxel_size_mm
+
+    def cell_index(self, x: float, y: float, z: float) -> int | None:
+        ijk = np.floor((np.array([x, y, z], dtype=float) - self.origin_mm) / self.spec.voxel_size_mm).astype(int)
+        if np.any(ijk < 0) or np.any(ijk >= np.array(self.shape)):
+            return None
+        return int(np.ravel_multi_index(tuple(ijk), self.shape))
+
+    def orientation_index(self, rotation: np.ndarray) -> int:
+        """Orientation échantillonnée la plus proche (trace maximale de R_iᵀ R)."""
+        return int(np.argmax(self._orientation_rows @ np.asarray(rotation, dtype=float).reshape(9)))
+
+    def reachability_ratio(self, allowed_configs: set[MgiConfigKey] | None = None) -> np.ndarray:
+        """Part des orientations atteignables par voxel (cellules,) : valeur de la carte de chaleur."""
+        masks = self.config_masks & np.uint8(_allowed_bits(allowed_configs))
+        return (masks != 0).mean(axis=1)
+
+    def query(self, pose: Pose6, allowed_configs: set[MgiConfigKey] | None = None) -> ReachabilityQueryResult:
+        """Atteignabilité d'une pose TCP (repère base robot) d'après l'échantillon le plus proche."""
+        cell = self.cell_index(pose.x, pose.y, pose.z)
+        if cell is None:
+            return ReachabilityQueryResult(inside_grid=False)
+        rotation = poses_to_matrices(np.array([pose.to_list()], dtype=float))[0, :3, :3]
+        orientation = self.orientation_index(rotation)
+        allowed_bits = np.uint8(_allowed_bits(allowed_configs))
+        cell_masks = self.config_masks[cell] & allowed_bits
+        mask = int(cell_masks[orientation])
+        reachable = mask != 0
+        return ReachabilityQueryResult(
+            inside_grid=True,
+            config_mask=mask,
+            manipulability=float(self.manipulability[cell, orientation]) if reachable else 0.0,
+            joint_margin=float(self.joint_margin[cell, orientation]) if reachable else 0.0,
+            cell_reachability_ratio=float(np.count_nonzero(cell_masks) / len(cell_masks)),
+            configurations=[key for key in MgiConfigKey if mask & (1 << key.value)],
+        )
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            format_version=np.int32(REACHABILITY_MAP_FORMAT_VERSION),
+            robot_hash=np.array(self.robot_hash),
+            spec=np.array(json.dumps(self.spec.to_dict())),
+            origin_mm=self.origin_mm,
+            shape=np.array(self.shape, dtype=np.int32),
+            orientations=self.orientations,
+            config_masks=self.config_masks,
+            manipulability=self.manipulability,
+            joint_margin=self.joint_margin,
+        )
+
+    @staticmethod
+    def load(path: str | Path) -> "ReachabilityMap":
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != REACHABILITY_MAP_FORMAT_VERSION:
+                raise ValueError(f"Version de carte d'atteignabilité non supportée : {version}")
+            return ReachabilityMap(
+                robot_hash=str(data["robot_hash"]),
+                spec=ReachabilityGridSpec(**json.loads(str(data["spec"]))),
+                origin_mm=data["origin_mm"],
+                shape=tuple(data["shape"]),
+                orientations=data["orientations"],
+                config_masks=data["config_masks"],
+                manipulability=data["manipulability"],
+                joint_margin=data["joint_margin"],
+            )
+
+
+def _allowed_bits(allowed_configs: set[MgiConfigKey] | None) -> int:
+    if allowed_configs is None:
+        return (1 << CONFIG_COUNT) - 1
+    return sum(1 << key.value for key in allowed_configs)
+
+
+def _workspace_bounds(kinematics: ReachabilityKinematics, voxel_size_mm: float) -> tuple[np.ndarray, tuple[int, int, int]]:
+    """Cube englobant la portée maximale (bras + poignet + outil), aligné sur le pas de voxel."""
+    geometric = kinematics.mgi_params.geometric_params
+    tool = kinematics.tool
+    reach = (
+        abs(geometric.D2)
+        + abs(geometric.D3)
+        + math.hypot(geometric.R4, geometric.D4)
+        + abs(geometric.R6)
+        + math.sqrt(tool.x ** 2 + tool.y ** 2 + tool.z ** 2)
+    )
+    cells_per_side = max(1, int(math.ceil(2.0 * reach / voxel_size_mm)))
+    half_extent = 0.5 * cells_per_side * voxel_size_mm
+    origin = np.array([-half_extent, -half_extent, geometric.R1 - half_extent], dtype=float)
+    return origin, (cells_per_side, cells_per_side, cells_per_side)
+
+
+def build_reachability_map(
+    kinematics: ReachabilityKinematics,
+    spec: ReachabilityGridSpec | None = None,
+    progress: ProgressCallback | None = None,
+) -> ReachabilityMap:
+    """Échantillonne voxels × orientations avec le MGI vectorisé et calcule les indicateurs."""
+    spec = spec if spec is not None else ReachabilityGridSpec()
+    tool = kinematics.tool
+    origin, shape = _workspace_bounds(kinematics, spec.voxel_size_mm)
+    orientations = build_orientation_set(spec.direction_count, spec.roll_count)
+    orientation_abc = _rotations_to_abc(orientations)
+
+    table_shape = (int(np.prod(shape)), len(orientations))
+    grid_map = ReachabilityMap(
+        kinematics.robot_hash,
+        spec,
+        origin,
+        shape,
+        orientations,
+        np.zeros(table_shape, dtype=np.uint8),
+        np.zeros(table_shape, dtype=np.float16),
+        np.zeros(table_shape, dtype=np.float16),
+    )
+    centers = grid_map.cell_centers()
+    orientation_count = len(orientations)
+    total = grid_map.cell_count * orientation_count
+
+    mgi_params = kinematics.mgi_params
+    axis_limits_deg = kinematics.axis_limits_deg
+    axis_reversed = kinematics.axis_reversed
+    dh_rows = kinematics.dh_rows
+    tool_matrix = RobotModel.build_tool_transform(tool)
+
+    config_masks = grid_map.config_masks.reshape(-1)
+    manipulability = grid_map.manipulability.reshape(-1)
+    joint_margin = grid_map.joint_margin.reshape(-1)
+
+    for start in range(0, total, _BATCH_POSE_COUNT):
+        stop = min(total, start + _BATCH_POSE_COUNT)
+        flat = np.arange(start, stop)
+        poses = np.hstack([centers[flat // orientation_count], orientation_abc[flat % orientation_count]])
+
+        result = compute_mgi_batch(mgi_params, poses, tool)
+        valid = result.valid_mask()
+        config_masks[start:stop] = result.config_bitmask()
+
+        # Meilleure configuration = plus grande marge articulaire parmi les solutions valides
+        joints_in_limits = result.joints_within_limits_deg(axis_limits_deg)
+        margins = np.where(valid, compute_joint_margin_batch(joints_in_limits, axis_limits_deg), -1.0)
+        best_config = np.argmax(margins, axis=1)
+        any_valid = valid.any(axis=1)
+        rows = np.nonzero(any_valid)[0]
+        joint_margin[start + rows] = margins[rows, best_config[rows]]
+        if len(rows):
+            best_joints = joints_in_limits[rows, best_config[rows]]
+            frames = compute_fk_frames_batch(dh_rows, axis_reversed, best_joints, tool_matrix)
+            manipulability[start + rows] = compute_manipulability_batch(frames, axis_reversed)
+
+        if progress is not None:
+            progress(stop, total)
+
+    return grid_map
+
+
+def reachability_map_path(robot_hash: str, spec: ReachabilityGridSpec, directory: str | Path = REACHABILITY_MAP_DIRECTORY) -> Path:
+    voxel = f"{spec.voxel_size_mm:g}".replace(".", "p")
+    return Path(directory) / f"{robot_hash}_v{voxel}_o{spec.direction_count}x{spec.roll_count}.npz"
+
+
+def load_cached_reachability_map(
+    robot_hash: str,
+    spec: ReachabilityGridSpec | None = None,
+    directory: str | Path = REACHABILITY_MAP_DIRECTORY,
+) -> ReachabilityMap | None:
+    """Carte déjà calculée pour cette empreinte de cinématique, ou None."""
+    spec = spec if spec is not None else ReachabilityGridSpec()
+    path = reachability_map_path(robot_hash, spec, directory)
+    if not path.exists():
+        return None
+    try:
+        return ReachabilityMap.load(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_or_build_reachability_map(
+    kinematics: ReachabilityKinematics,
+    spec: ReachabilityGridSpec | None = None,
+    directory: str | Path = REACHABILITY_MAP_DIRECTORY,
+    progress: ProgressCallback | None = None,
+) -> ReachabilityMap:
+    spec = spec if spec is not None else ReachabilityGridSpec()
+    cached = load_cached_reachability_map(kinematics.robot_hash, spec, directory)
+    if cached is not None:
+        return cached
+    grid_map = build_reachability_map(kinematics, spec, progress)
+    grid_map.save(reachability_map_path(grid_map.robot_hash, spec, directory))
+    return grid_map
+
+
+__all__ = [
+    "DEFAULT_DIRECTION_COUNT",
+    "DEFAULT_ROLL_COUNT",
+    "DEFAULT_VOXEL_SIZE_MM",
+    "REACHABILITY_MAP_DIRECTORY",
+    "ReachabilityGridSpec",
+    "ReachabilityKinematics",
+    "ReachabilityMap",
+    "ReachabilityQueryResult",
+    "build_orientation_set",
+    "build_reachability_map",
+    "compute_fk_frames_batch",
+    "compute_joint_margin_batch",
+    "compute_manipulability_batch",
+    "load_cached_reachability_map",
+    "load_or_build_reachability_map",
+    "reachability_map_path",
+    "robot_configuration_hash",
+]
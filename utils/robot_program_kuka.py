@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from models.robot_program import (
     MotionRole,
@@ -328,74 +328,271 @@ def generate_kuka_src_text(
     base_pose : pose $BASE effective (repère choisi dans la table). Sinon base programme.
     Le nom du DEF reprend le nom du programme (obligatoire côté KUKA).
     """
-    program_name = Path(program.source_path).stem if program.source_path else "PROG"
-    effective_base = base_pose if base_pose is not None else program.program_base_pose
-    effective_tool = tool_pose if tool_pose is not None else Pose6.zeros()
-    n_normal = sum(1 for m in program.motions if m.role == MotionRole.NORMAL)
-
-    constant_speed_mmps = settings.constant_speed_mmps if settings is not None else None
-    if constant_speed_mmps is not None:
-        vel_cp = float(constant_speed_mmps) / 1000.0
-    else:
-        vel_cp = 0.2
-        for m in program.motions:
-            if m.cp_speed_mps is not None:
-                vel_cp = m.cp_speed_mps
-                break
+    context = _KrlGenerationContext.from_program(program, header_text, settings, tool_pose, base_pose)
+    return "\n".join(context.iter_module_lines(context.program_name, program.motions, context.n_normal))
+
+
+@dataclass(frozen=True)
+class KrlSplitLimits:
+    """Bornes d'un fichier .src généré ; None = pas de borne sur ce critère."""
+    max_motions: int | None = None
+    max_bytes: int | None = None
+
+    @classmethod
+    def from_settings(cls, settings: ProgramGenerationSettings | None) -> KrlSplitLimits:
+        if settings is None:
+            return cls()
+        return cls(max_motions=settings.split_max_motions, max_bytes=settings.split_max_bytes)
+
+    def is_enabled(self) -> bool:
+        return bool(self.max_motions) or bool(self.max_bytes)
+
+
+@dataclass(frozen=True)
+class _KrlGenerationContext:
+    """Réglages résolus une fois pour tout le programme (communs au programme principal et aux parties)."""
+    program_name: str
+    header_text: str
+    base_pose: Pose6
+    tool_pose: Pose6
+    vel_cp: float
+    default_approx: MotionApproximation
+    n_normal: int
+    date_text: str
+
+    @classmethod
+    def from_program(
+        cls,
+        program: RobotProgram,
+        header_text: str,
+        settings: ProgramGenerationSettings | None,
+        tool_pose: Pose6 | None,
+        base_pose: Pose6 | None,
+    ) -> _KrlGenerationContext:
+        constant_speed_mmps = settings.constant_speed_mmps if settings is not None else None
+        if constant_speed_mmps is not None:
+            vel_cp = float(constant_speed_mmps) / 1000.0
+        else:
+            vel_cp = 0.2
+            for m in program.motions:
+                if m.cp_speed_mps is not None:
+                    vel_cp = m.cp_speed_mps
+                    break
+        return cls(
+            program_name=Path(program.source_path).stem if program.source_path else "PROG",
+            header_text=header_text,
+            base_pose=base_pose if base_pose is not None else program.program_base_pose,
+            tool_pose=tool_pose if tool_pose is not None else Pose6.zeros(),
+            vel_cp=vel_cp,
+            default_approx=settings.default_approximation if settings is not None else MotionApproximation.none(),
+            n_normal=sum(1 for m in program.motions if m.role == MotionRole.NORMAL),
+            date_text=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        )
 
-    # Substitution tokens dans le header
-    resolved_header = (
-        header_text
-        .replace("{PROGRAM_NAME}", program_name)
-        .replace("{DATE}", datetime.now().strftime("%Y-%m-%d %H:%M"))
-        .replace("{BASE}", _format_kuka_pose(effective_base))
-        .replace("{TOOL}", _format_kuka_pose(effective_tool))
-        .replace("{VEL_CP}", f"{vel_cp:.3f}")
-        .replace("{N_MOTIONS}", str(n_normal))
-    )
+    def iter_header_lines(self, module_name: str, n_motions: int) -> Iterator[str]:
+        """Header substitué, DEF si le header n'en définit pas, puis $APO/$VEL/$BASE/$TOOL."""
+        # Substitution tokens dans le header
+        resolved_header = (
+            self.header_text
+            .replace("{PROGRAM_NAME}", module_name)
+            .replace("{DATE}", self.date_text)
+            .replace("{BASE}", _format_kuka_pose(self.base_pose))
+            .replace("{TOOL}", _format_kuka_pose(self.tool_pose))
+            .replace("{VEL_CP}", f"{self.vel_cp:.3f}")
+            .replace("{N_MOTIONS}", str(n_motions))
+        )
+        if resolved_header.strip():
+            yield resolved_header.rstrip("\n")
+            yield ""
+
+        # Le header par défaut contient déjà le DEF (avec l'init KUKA à l'intérieur) ;
+        # n'émettre un DEF que si le header personnalisé n'en définit pas.
+        header_has_def = any(
+            line.strip().upper().startswith("DEF ") for line in resolved_header.splitlines()
+        )
+        if not header_has_def:
+            yield f"DEF {module_name}()"
+            yield ""
+
+        # Répété dans chaque module : l'init du header (BAS #INITMOV, #TOOL, #BASE) les réinitialise.
+        apo_line = _format_apo_line(self.default_approx)
+        if apo_line is not None:
+            yield apo_line
+        yield f"$VEL.CP = {self.vel_cp:.5f}"
+        yield "; ---- Setting reference (Base) ----"
+        yield f"$BASE = {_format_kuka_pose(self.base_pose)}"
+        yield "; ---- Setting tool (TCP) ----"
+        yield f"$TOOL = {_format_kuka_pose(self.tool_pose)}"
+        yield ""
+
+    def motion_line(self, motion: RobotProgramMotion) -> str:
+        if motion.mode == RobotProgramMotionMode.EXTERNAL_AXIS and motion.external_axis_target is not None:
+            return _format_external_axis_motion_line(motion.external_axis_target)
+        if motion.role in {MotionRole.HOME_START, MotionRole.HOME_END}:
+            return f"PTP {_format_kuka_target(motion.target)}  ; HOME"
+        effective_approx = (
+            motion.approximation
+            if motion.approximation.mode != ApproximationMode.NONE
+            else self.default_approx
+        )
+        return _format_kuka_motion_line(motion, emit_approximation=True, approx_override=effective_approx)
+
+    def iter_module_lines(self, module_name: str, motions: Iterable[RobotProgramMotion], n_motions: int) -> Iterator[str]:
+        yield from self.iter_header_lines(module_name, n_motions)
+        for motion in motions:
+            yield self.motion_line(motion)
+        yield from _KRL_FOOTER_LINES
+
+
+_KRL_FOOTER_LINES = ("", "END", "")
+
+
+def _write_krl_lines(path: Path, lines: Iterable[str]) -> None:
+    """Écrit les lignes au fil de l'eau, même texte que "\n".join(lines)."""
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        first = True
+        for line in lines:
+            if not first:
+                handle.write("\n")
+            handle.write(line)
+            first = False
+
+
+def _krl_utf8_size(lines: Iterable[str]) -> int:
+    return sum(len(line.encode("utf-8")) + 1 for line in lines)
 
-    lines: list[str] = []
-    if resolved_header.strip():
-        lines.append(resolved_header.rstrip("\n"))
-        lines.append("")
 
-    # Le header par défaut contient déjà le DEF (avec l'init KUKA à l'intérieur) ;
-    # n'émettre un DEF que si le header personnalisé n'en définit pas.
-    header_has_def = any(
-        line.strip().upper().startswith("DEF ") for line in resolved_header.splitlines()
+def _split_motion_ranges(
+    context: _KrlGenerationContext,
+    motions: list[RobotProgramMotion],
+    limits: KrlSplitLimits,
+    part_name: str,
+) -> list[tuple[int, int]]:
+    """Plages [start, stop) de mouvements par sous-programme, sous les bornes de taille et de nombre.
+
+    Premier passage sans rien garder en mémoire que les bornes : chaque ligne est formatée pour
+    mesurer sa taille puis oubliée. L'en-tête est compté avec le plus grand nombre de mouvements
+    possible, la taille réelle d'une partie reste donc sous max_bytes. Un mouvement seul plus
+    gros que la borne forme sa propre partie.
+    """
+    max_motions = int(limits.max_motions) if limits.max_motions else len(motions)
+    overhead = _krl_utf8_size(context.iter_header_lines(part_name, len(motions))) + _krl_utf8_size(_KRL_FOOTER_LINES)
+    budget = int(limits.max_bytes) - overhead if limits.max_bytes else None
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    used = 0
+    for index, motion in enumerate(motions):
+        size = _krl_utf8_size((context.motion_line(motion),)) if budget is not None else 0
+        count = index - start
+        if count > 0 and (count >= max_motions or (budget is not None and used + size > budget)):
+            ranges.append((start, index))
+            start = index
+            used = 0
+        used += size
+    if start < len(motions):
+        ranges.append((start, len(motions)))
+    return ranges
+
+
+def krl_part_name(program_name: str, index: int) -> str:
+    """Nom du module (et du DEF) de la partie index (1-based) d'un programme découpé."""
+    return f"{program_name}_{index:03d}"
+
+
+def write_kuka_src_program(
+    path: str | Path,
+    program: RobotProgram,
+    header_text: str,
+    settings: ProgramGenerationSettings | None,
+    tool_pose: Pose6 | None = None,
+    base_pose: Pose6 | None = None,
+    limits: KrlSplitLimits | None = None,
+) -> list[Path]:
+    """Écrit le .src en flux, découpé en sous-programmes si le programme dépasse les bornes.
+
+    Sans découpage : un seul fichier identique à generate_kuka_src_text. Avec découpage :
+    `<nom>_001.src`, `<nom>_002.src`… (même header, mêmes $BASE/$TOOL/$VEL) à côté du
+    programme principal `<nom>.src` qui les appelle dans l'ordre. Le nom du programme suit
+    le nom du fichier (DEF = nom de module côté KUKA). Les sous-programmes appelés par le
+    `<nom>.src` précédemment généré et qui ne sont pas réécrits sont supprimés, pour ne pas
+    laisser d'orphelins dans le dossier ; un `<nom>_NNN.src` qu'il n'appelait pas n'est jamais
+    touché. Retourne les fichiers écrits, programme principal en premier.
+    """
+    target = Path(path)
+    source_program = replace(program, source_path=str(target))
+    context = _KrlGenerationContext.from_program(source_program, header_text, settings, tool_pose, base_pose)
+    motions = program.motions
+    limits = limits if limits is not None else KrlSplitLimits()
+    previous_parts = _previous_krl_parts(target, context.program_name)
+
+    ranges = (
+        _split_motion_ranges(context, motions, limits, krl_part_name(context.program_name, 1))
+        if limits.is_enabled()
+        else []
     )
-    if not header_has_def:
-        lines.append(f"DEF {program_name}()")
-        lines.append("")
-
-    default_approx = settings.default_approximation if settings is not None else MotionApproximation.none()
-    apo_line = _format_apo_line(default_approx)
-    if apo_line is not None:
-        lines.append(apo_line)
-    lines.append(f"$VEL.CP = {vel_cp:.5f}")
-    lines.append("; ---- Setting reference (Base) ----")
-    lines.append(f"$BASE = {_format_kuka_pose(effective_base)}")
-    lines.append("; ---- Setting tool (TCP) ----")
-    lines.append(f"$TOOL = {_format_kuka_pose(effective_tool)}")
-    lines.append("")
-
-    for motion in program.motions:
-        if motion.mode == RobotProgramMotionMode.EXTERNAL_AXIS and motion.external_axis_target is not None:
-            lines.append(_format_external_axis_motion_line(motion.external_axis_target))
-        elif motion.role in {MotionRole.HOME_START, MotionRole.HOME_END}:
-            lines.append(f"PTP {_format_kuka_target(motion.target)}  ; HOME")
-        else:
-            effective_approx = (
-                motion.approximation
-                if motion.approximation.mode != ApproximationMode.NONE
-                else default_approx
-            )
-            lines.append(_format_kuka_motion_line(motion, emit_approximation=True, approx_override=effective_approx))
+    if len(ranges) <= 1:
+        _write_krl_lines(target, context.iter_module_lines(context.program_name, motions, context.n_normal))
+        _remove_stale_krl_parts(previous_parts, [target])
+        return [target]
+
+    written = [target]
+    part_names: list[str] = []
+    for part_index, (start, stop) in enumerate(ranges, start=1):
+        part_name = krl_part_name(context.program_name, part_index)
+        part_motions = motions[start:stop]
+        n_part = sum(1 for m in part_motions if m.role == MotionRole.NORMAL)
+        part_path = target.with_name(f"{part_name}{target.suffix or '.src'}")
+        _write_krl_lines(part_path, context.iter_module_lines(part_name, part_motions, n_part))
+        part_names.append(part_name)
+        written.append(part_path)
+
+    def _main_lines() -> Iterator[str]:
+        yield from context.iter_header_lines(context.program_name, context.n_normal)
+        yield f"; ---- {len(part_names)} sous-programmes ----"
+        for part_name in part_names:
+            yield f"{part_name}()"
+        yield from _KRL_FOOTER_LINES
+
+    _write_krl_lines(target, _main_lines())
+    _remove_stale_krl_parts(previous_parts, written)
+    return written
+
+
+_KRL_PARTS_MARKER_RE = re.compile(r"^; ---- \d+ sous-programmes ----$")
+
+
+def _previous_krl_parts(target: Path, program_name: str) -> list[Path]:
+    """Sous-programmes appelés par le programme principal découpé déjà présent à target.
+
+    Seul le bloc d'appels écrit par write_kuka_src_program (marqueur `; ---- N sous-programmes ----`
+    suivi des `<nom>_NNN()`) est pris en compte : un fichier écrit à la main n'en a pas et ne
+    désigne donc aucune partie à supprimer.
+    """
+    if not target.is_file():
+        return []
+    call_re = re.compile(rf"^({re.escape(program_name)}_\d{{3}})\(\)$", re.IGNORECASE)
+    suffix = target.suffix or ".src"
+    parts: list[Path] = []
+    in_calls = False
+    with target.open("r", encoding="utf-8", errors="replace") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not in_calls:
+                in_calls = _KRL_PARTS_MARKER_RE.match(line) is not None
+                continue
+            match = call_re.match(line)
+            if match is None:
+                break
+            parts.append(target.with_name(f"{match.group(1)}{suffix}"))
+    return parts
 
-    lines.append("")
-    lines.append("END")
-    lines.append("")
-    return "\n".join(lines)
+
+def _remove_stale_krl_parts(previous_parts: list[Path], written: list[Path]) -> None:
+    """Supprime les parties de l'export précédent qui ne font pas partie de l'export courant."""
+    kept = {p.name.lower() for p in written}
+    for candidate in previous_parts:
+        if candidate.name.lower() not in kept and candidate.is_file():
+            candidate.unlink()
 
 
 def generate_program_to_path(
@@ -405,11 +602,12 @@ def generate_program_to_path(
     external_axes_order: list[str] | None = None,
     tool_pose: Pose6 | None = None,
     base_pose: Pose6 | None = None,
-) -> None:
-    """Point d'entrée unique d'export KRL.
+) -> list[Path]:
+    """Point d'entrée unique d'export KRL, retourne les fichiers écrits.
 
     - Programme LOADED_KRL : patch du source original (export_kuka_src_program).
-    - Programme importé/généré : génération from-scratch (generate_kuka_src_text).
+    - Programme importé/généré : génération from-scratch écrite en flux
+      (write_kuka_src_program), découpée selon les bornes des réglages.
     """
     if program.origin == ProgramOrigin.LOADED_KRL:
         export_kuka_src_program(
@@ -418,14 +616,18 @@ def generate_program_to_path(
             program.motions,
             base_pose if base_pose is not None else program.program_base_pose,
         )
-        return
+        return [Path(path)]
 
     header_text = ""
     if settings is not None:
         header_text = settings.header_text
 
-    src_text = generate_kuka_src_text(
-        program, header_text, settings, external_axes_order,
-        tool_pose=tool_pose, base_pose=base_pose,
+    return write_kuka_src_program(
+        path,
+        program,
+        header_text,
+        settings,
+        tool_pose=tool_pose,
+        base_pose=base_pose,
+        limits=KrlSplitLimits.from_settings(settings),
     )
-    Path(path).write_text(src_text, encoding="utf-8")
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from models.robot_model import RobotModel
+from models.singularity import (
+    DEFAULT_ERROR_INDEX,
+    DEFAULT_WARNING_INDEX,
+    SingularityInterval,
+    SingularityKind,
+    SingularitySeverity,
+    SingularityThresholds,
+)
+from utils.reachability_map import ReachabilityKinematics, compute_fk_frames_batch, compute_manipulability_batch
+
+
+@dataclass
+class SingularityMetrics:
+    """Indicateurs par échantillon : indice global et proximité de chaque type de singularité.
+
+    Les proximités sont des sinus ou distances normalisées (0 = singulier) : poignet = axes 4 et 6
+    alignés, épaule = centre poignet sur l'axe 1, coude = bras tendu dans le plan des axes 2/3.
+    """
+    index: np.ndarray
+    wrist: np.ndarray
+    shoulder: np.ndarray
+    elbow: np.ndarray
+
+    def kinds(self) -> list[SingularityKind]:
+        """Type de singularité le plus proche pour chaque échantillon."""
+        order = (SingularityKind.WRIST, SingularityKind.SHOULDER, SingularityKind.ELBOW)
+        closest = np.argmin(np.column_stack([self.wrist, self.shoulder, self.elbow]), axis=1)
+        return [order[value] for value in closest]
+
+
+def _unit_normal(vectors: np.ndarray, axis: np.ndarray) -> np.ndarray:
+    """Composante de vectors (N, 3) orthogonale à axis (N, 3), normalisée."""
+    projected = vectors - np.sum(vectors * axis, axis=1)[:, None] * axis
+    norms = np.linalg.norm(projected, axis=1)
+    return projected / np.maximum(norms, 1e-12)[:, None]
+
+
+def compute_singularity_metrics(kinematics: ReachabilityKinematics, joints_deg: np.ndarray) -> SingularityMetrics:
+    """Indice de singularité vectorisé pour des articulaires (N, 6), par la jacobienne géométrique au TCP.
+
+    Le MGD nominal (DH sans corrections de calibration) suffit pour la proximité de singularité ;
+    tout un parcours se traite en un appel (SVD 6×6 par lot).
+    """
+    joints_deg = np.asarray(joints_deg, dtype=float).reshape(-1, 6)
+    if joints_deg.shape[0] == 0:
+        empty = np.zeros(0, dtype=float)
+        return SingularityMetrics(empty, empty, empty, empty)
+    tool_matrix = RobotModel.build_tool_transform(kinematics.tool)
+    frames = compute_fk_frames_batch(kinematics.dh_rows, kinematics.axis_reversed, joints_deg, tool_matrix)
+    index = compute_manipulability_batch(frames, kinematics.axis_reversed)
+
+    # Poignet sphérique : centre poignet à l'origine du repère 5 (axes 4, 5 et 6 concourants).
+    axis_1 = frames[:, 1, :3, 2]
+    axis_2 = frames[:, 2, :3, 2]
+    axis_4 = frames[:, 4, :3, 2]
+    axis_6 = frames[:, 6, :3, 2]
+    origin_1 = frames[:, 1, :3, 3]
+    origin_2 = frames[:, 2, :3, 3]
+    origin_3 = frames[:, 3, :3, 3]
+    wrist_center = frames[:, 5, :3, 3]
+
+    wrist = np.linalg.norm(np.cross(axis_4, axis_6), axis=1)
+
+    upper_arm = np.linalg.norm(origin_3 - origin_2, axis=1)
+    forearm = np.linalg.norm(wrist_center - origin_3, axis=1)
+    reach = np.maximum(upper_arm + forearm, 1e-9)
+    radial = np.linalg.norm(np.cross(axis_1, wrist_center - origin_1), axis=1)
+    shoulder = np.clip(radial / reach, 0.0, 1.0)
+
+    from_shoulder = _unit_normal(wrist_center - origin_2, axis_2)
+    from_elbow = _unit_normal(wrist_center - origin_3, axis_2)
+    elbow = np.linalg.norm(np.cross(from_shoulder, from_elbow), axis=1)
+
+    return SingularityMetrics(index=index, wrist=wrist, shoulder=shoulder, elbow=elbow)
+
+
+def find_singularity_intervals(
+    times_s: np.ndarray,
+    index: np.ndarray,
+    kinds: list[SingularityKind],
+    thresholds: SingularityThresholds | None = None,
+) -> list[SingularityInterval]:
+    """Regroupe les échantillons consécutifs sous le seuil d'alerte (NaN = échantillon non évalué)."""
+    thresholds = thresholds if thresholds is not None else SingularityThresholds()
+    times_s = np.asarray(times_s, dtype=float)
+    index = np.asarray(index, dtype=float)
+    below = np.nan_to_num(index, nan=np.inf) < float(thresholds.warning_index)
+    if not below.any():
+        return []
+    edges = np.diff(np.concatenate([[0], below.astype(np.int8), [0]]))
+    starts = np.nonzero(edges == 1)[0]
+    stops = np.nonzero(edges == -1)[0]
+
+    intervals: list[SingularityInterval] = []
+    for start, stop in zip(starts, stops):
+        closest = int(start + np.argmin(index[start:stop]))
+        min_index = float(index[closest])
+        singular = min_index < float(thresholds.error_index)
+        intervals.append(
+            SingularityInterval(
+                kind=kinds[closest],
+                severity=SingularitySeverity.ERROR if singular else SingularitySeverity.WARNING,
+                start_time_s=float(times_s[start]),
+                end_time_s=float(times_s[stop - 1]),
+                min_index=min_index,
+                min_time_s=float(times_s[closest]),
+                limit=float(thresholds.error_index if singular else thresholds.warning_index),
+                start_sample_index=int(start),
+                end_sample_index=int(stop - 1),
+            )
+        )
+    return intervals
+
+
+def singularity_kind_label(kind: SingularityKind) -> str:
+    if kind == SingularityKind.WRIST:
+        return "poignet"
+    if kind == SingularityKind.SHOULDER:
+        return "épaule"
+    if kind == SingularityKind.ELBOW:
+        return "coude"
+    return kind.value
+
+
+__all__ = [
+    "DEFAULT_ERROR_INDEX",
+    "DEFAULT_WARNING_INDEX",
+    "SingularityInterval",
+    "SingularityKind",
+    "SingularityMetrics",
+    "SingularitySeverity",
+    "SingularityThresholds",
+    "compute_singularity_metrics",
+    "find_singularity_intervals",
+    "singularity_kind_label",
+]
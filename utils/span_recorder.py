@@ -0,0 +1,184 @@
+"""
+Enregistreur de spans de chronométrage par étape, exportable en trace Chrome / Perfetto.
+
+Un seul enregistreur par processus (get_span_recorder()), désactivé par défaut : span()
+retourne alors un contexte partagé sans effet, le coût se limite à un test de booléen.
+Les arguments qui demandent un calcul (nom de fichier, nom d'enum...) se passent par
+`lazy_args`, appelé seulement à la fermeture d'un span enregistré.
+Activé (main.py --trace, tools/performance_benchmark.py --trace), chaque span devient un
+événement complet « X » horodaté en µs sur le thread qui l'exécute ; les événements
+asynchrones « b »/« e » relient deux threads (émission d'un signal puis réception dans
+le slot). Les événements sont gardés dans un tampon circulaire borné.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+
+DEFAULT_MAX_EVENTS = 200_000
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_recorder", "_name", "_category", "_args", "_lazy_args", "_start_ns")
+
+    def __init__(
+        self,
+        recorder: "SpanRecorder",
+        name: str,
+        category: str,
+        args: dict[str, Any],
+        lazy_args: Callable[[], dict[str, Any]] | None,
+    ) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._category = category
+        self._args = args
+        self._lazy_args = lazy_args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        end_ns = time.perf_counter_ns()
+        if self._lazy_args is not None:
+            self._args.update(self._lazy_args())
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._recorder._append_complete(self._name, self._category, self._start_ns, end_ns, self._args)
+
+
+class SpanRecorder:
+    def __init__(self) -> None:
+        self.enabled = False
+        self._events: deque[dict[str, Any]] = deque(maxlen=DEFAULT_MAX_EVENTS)
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        """Active l'enregistrement ; les événements les plus anciens sont écartés au-delà de `max_events`."""
+        with self._lock:
+            if self._events.maxlen != max(1, int(max_events)):
+                self._events = deque(self._events, maxlen=max(1, int(max_events)))
+            self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._thread_names.clear()
+            self._origin_ns = time.perf_counter_ns()
+
+    def event_count(self) -> int:
+        return len(self._events)
+
+    def span(
+        self,
+        name: str,
+        category: str = "calibrax",
+        lazy_args: Callable[[], dict[str, Any]] | None = None,
+        **args: Any,
+    ) -> _Span | _NullSpan:
+        """Contexte chronométrant son bloc ; `args` (et `lazy_args()`) sont affichés dans le détail de l'événement."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args, lazy_args)
+
+    def instant(self, name: str, category: str = "calibrax", **args: Any) -> None:
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": category, "ph": "i", "s": "t", "ts": self._now_us(), "args": args})
+
+    def async_begin(self, name: str, event_id: object, category: str = "calibrax", **args: Any) -> None:
+        """Début d'un intervalle asynchrone clos par async_end (même nom, même id), éventuellement sur un autre thread."""
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": category, "ph": "b", "id": str(event_id), "ts": self._now_us(), "args": args})
+
+    def async_end(self, name: str, event_id: object, category: str = "calibrax", **args: Any) -> None:
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": category, "ph": "e", "id": str(event_id), "ts": self._now_us(), "args": args})
+
+    def events(self) -> list[dict[str, Any]]:
+        return list(self._events)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Trace au format JSON Chrome (chrome://tracing, ui.perfetto.dev)."""
+        with self._lock:
+            thread_names = dict(self._thread_names)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in sorted(thread_names.items())
+        ]
+        return {"traceEvents": metadata + self.events(), "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str | Path) -> None:
+        path = Path(path)
+        if path.parent != Path(""):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000.0
+
+    def _append_complete(self, name: str, category: str, start_ns: int, end_ns: int, args: dict[str, Any]) -> None:
+        self._append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000.0,
+                "dur": (end_ns - start_ns) / 1000.0,
+                "args": args,
+            }
+        )
+
+    def _append(self, event: dict[str, Any]) -> None:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            with self._lock:
+                self._thread_names[tid] = threading.current_thread().name
+        event["pid"] = self._pid
+        event["tid"] = tid
+        self._events.append(event)
+
+
+_SPAN_RECORDER = SpanRecorder()
+
+
+def get_span_recorder() -> SpanRecorder:
+    return _SPAN_RECORDER
+
+
+__all__ = [
+    "DEFAULT_MAX_EVENTS",
+    "SpanRecorder",
+    "get_span_recorder",
+]
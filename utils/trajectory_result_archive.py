@@ -0,0 +1,542 @@
+from __future__ import annotations
+
+from enum import Enum
+from pathlib import Path
+from typing import Iterable, Sequence, Type
+
+import numpy as np
+
+from models.robot_program import ProgramSimulationResult, ProgramSimulationSample, RobotProgramMotionMode
+from models.singularity import SingularityInterval, SingularityKind, SingularitySeverity
+from models.trajectory_keypoint import KeypointMotionMode
+from models.trajectory_result import (
+    JointDynamicStats,
+    SegmentResult,
+    TrajectoryClearanceDiagnostic,
+    TrajectoryCollisionDomain,
+    TrajectoryComputationStatus,
+    TrajectoryDynamicViolation,
+    TrajectoryDynamicViolationKind,
+    TrajectoryDynamicViolationSeverity,
+    TrajectoryResult,
+    TrajectorySample,
+    TrajectorySampleErrorCode,
+)
+from models.types import JointAngles6, Pose6, XYZ3
+from utils.mgi import MgiConfigKey
+
+
+# Archive .npz non compressée : une colonne numpy par grandeur, relue sans recalcul.
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = ".npz"
+TRAJECTORY_ARCHIVE_KIND = "trajectory_result"
+PROGRAM_ARCHIVE_KIND = "program_simulation"
+
+# Ordre des colonnes de validity_flags (N, 6).
+VALIDITY_FLAG_NAMES = (
+    "articular_velocity_valid",
+    "articular_acceleration_valid",
+    "articular_jerk_valid",
+    "cartesian_velocity_valid",
+    "cartesian_acceleration_valid",
+    "cartesian_jerk_valid",
+)
+_SAMPLE_VECTOR_FIELDS = (
+    "joints",
+    "articular_velocity",
+    "articular_acceleration",
+    "articular_jerk",
+    "pose",
+    "cartesian_velocity",
+    "cartesian_acceleration",
+    "cartesian_jerk",
+)
+_PROGRAM_SAMPLE_SETS = ("nominal", "cartesian_compensated", "articular_compensated")
+_PROGRAM_POSE_FIELDS = ("nominal_pose_base", "measured_pose_base", "nominal_pose_world", "measured_pose_world")
+
+
+class TrajectoryArchiveError(ValueError):
+    """Archive illisible, d'une autre nature ou d'une version inconnue."""
+
+
+# ----------------------------------------------------------------------
+# Énumérations : codes entiers + table des noms stockée dans l'archive
+# ----------------------------------------------------------------------
+
+def _enum_names(enum_cls: Type[Enum]) -> np.ndarray:
+    return np.array([member.name for member in enum_cls])
+
+
+def _enum_codes(values: Iterable[Enum | None], enum_cls: Type[Enum]) -> np.ndarray:
+    """Index de chaque membre (par nom) dans l'énumération, -1 pour None."""
+    position = {member.name: index for index, member in enumerate(enum_cls)}
+    return np.array([-1 if value is None else position[value.name] for value in values], dtype=np.int16)
+
+
+def _enum_decoder(archive, key: str, enum_cls: Type[Enum]) -> list[Enum | None]:
+    """Table code -> membre, à partir des noms archivés (robuste à un réordonnancement de l'énumération)."""
+    names = archive[f"{key}_names"]
+    return [enum_cls[str(name)] if str(name) in enum_cls.__members__ else None for name in names]
+
+
+def _decode(codes: np.ndarray, table: list[Enum | None]) -> list[Enum | None]:
+    return [None if code < 0 or code >= len(table) else table[code] for code in codes.tolist()]
+
+
+def _optional_int(value: int) -> int | None:
+    return None if value < 0 else int(value)
+
+
+def _string_array(values: Sequence[str]) -> np.ndarray:
+    # Chaînes unicode à largeur fixe : relisibles sans pickle.
+    return np.array([str(value) for value in values], dtype=str) if values else np.zeros(0, dtype="<U1")
+
+
+def _with_extension(path: str | Path) -> Path:
+    path = Path(path)
+    return path if path.suffix.lower() == ARCHIVE_EXTENSION else path.with_name(path.name + ARCHIVE_EXTENSION)
+
+
+def _open_archive(path: str | Path, expected_kind: str | None = None):
+    archive = np.load(Path(path), allow_pickle=False)
+    kind = str(archive["kind"]) if "kind" in archive.files else ""
+    version = int(archive["version"]) if "version" in archive.files else -1
+    if version < 1 or version > ARCHIVE_VERSION:
+        archive.close()
+        raise TrajectoryArchiveError(f"Version d'archive non prise en charge : {version}")
+    if expected_kind is not None and kind != expected_kind:
+        archive.close()
+        raise TrajectoryArchiveError(f"Archive de type '{kind}', '{expected_kind}' attendu")
+    return archive
+
+
+def read_archive_kind(path: str | Path) -> str:
+    """Nature de l'archive (TRAJECTORY_ARCHIVE_KIND ou PROGRAM_ARCHIVE_KIND)."""
+    with _open_archive(path) as archive:
+        return str(archive["kind"])
+
+
+# ----------------------------------------------------------------------
+# TrajectoryResult
+# ----------------------------------------------------------------------
+
+def save_trajectory_result_npz(path: str | Path, result: TrajectoryResult) -> Path:
+    """Écrit un TrajectoryResult en colonnes (.npz non compressé) et renvoie le chemin écrit.
+
+    Les collisions détaillées et les solutions MGI par échantillon ne sont pas archivées.
+    """
+    path = _with_extension(path)
+    samples = [sample for segment in result.segments for sample in segment.samples]
+    count = len(samples)
+    offsets = np.cumsum([0] + [len(segment.samples) for segment in result.segments]).astype(np.int64)
+
+    columns: dict[str, np.ndarray] = {
+        "kind": np.array(TRAJECTORY_ARCHIVE_KIND),
+        "version": np.array(ARCHIVE_VERSION),
+        "result_status": _enum_codes([result.status], TrajectoryComputationStatus),
+        "result_status_names": _enum_names(TrajectoryComputationStatus),
+        "first_error_segment_index": np.array(
+            -1 if result.first_error_segment_index is None else int(result.first_error_segment_index)
+        ),
+        "segment_sample_offsets": offsets,
+        "time": np.array([sample.time for sample in samples], dtype=float),
+        "velocity": np.array([sample.velocity for sample in samples], dtype=float),
+        "acceleration": np.array([sample.acceleration for sample in samples], dtype=float),
+        "reachable": np.array([sample.reachable for sample in samples], dtype=bool),
+        "validity_flags": np.array(
+            [[getattr(sample, name) for name in VALIDITY_FLAG_NAMES] for sample in samples], dtype=bool
+        ).reshape(count, len(VALIDITY_FLAG_NAMES)),
+        "validity_flag_names": np.array(VALIDITY_FLAG_NAMES),
+        "configuration": _enum_codes([sample.configuration for sample in samples], MgiConfigKey),
+        "configuration_names": _enum_names(MgiConfigKey),
+        "error_code": _enum_codes([sample.error_code for sample in samples], TrajectorySampleErrorCode),
+        "error_code_names": _enum_names(TrajectorySampleErrorCode),
+        "error_axis": np.array([-1 if sample.error_axis is None else sample.error_axis for sample in samples], dtype=np.int16),
+        "singularity_index": np.array(
+            [np.nan if sample.singularity_index is None else sample.singularity_index for sample in samples], dtype=float
+        ),
+        "singularity_kind": _enum_codes([sample.singularity_kind for sample in samples], SingularityKind),
+        "singularity_kind_names": _enum_names(SingularityKind),
+    }
+    for name in _SAMPLE_VECTOR_FIELDS:
+        columns[name] = np.array([getattr(sample, name)[:6] for sample in samples], dtype=float).reshape(count, 6)
+
+    columns.update(_clearance_columns(samples))
+    columns.update(_violation_columns(samples))
+    columns.update(_segment_columns(result.segments))
+    np.savez(path, **columns)
+    return path
+
+
+def _clearance_columns(samples: list[TrajectorySample]) -> dict[str, np.ndarray]:
+    clearances = [sample.clearance for sample in samples]
+    return {
+        "clearance_distance_mm": np.array(
+            [np.nan if item is None else item.distance_mm for item in clearances], dtype=float
+        ),
+        "clearance_domain": _enum_codes([None if item is None else item.domain for item in clearances], TrajectoryCollisionDomain),
+        "clearance_domain_names": _enum_names(TrajectoryCollisionDomain),
+        "clearance_points_world": np.array(
+            [
+                [[np.nan] * 3, [np.nan] * 3] if item is None else [item.point_a_world.to_list(), item.point_b_world.to_list()]
+                for item in clearances
+            ],
+            dtype=float,
+        ).reshape(len(samples), 2, 3),
+        # owner_a, name_a, owner_b, name_b
+        "clearance_labels": np.array(
+            [
+                ["", "", "", ""] if item is None else [item.owner_a, item.name_a, item.owner_b, item.name_b]
+                for item in clearances
+            ],
+            dtype=str,
+        ).reshape(len(samples), 4),
+    }
+
+
+def _violation_columns(samples: list[TrajectorySample]) -> dict[str, np.ndarray]:
+    rows = [
+        (sample_index, violation)
+        for sample_index, sample in enumerate(samples)
+        for violation in sample.dynamic_violations
+    ]
+    return {
+        "violation_sample": np.array([index for index, _ in rows], dtype=np.int64),
+        "violation_kind": _enum_codes([item.kind for _, item in rows], TrajectoryDynamicViolationKind),
+        "violation_kind_names": _enum_names(TrajectoryDynamicViolationKind),
+        "violation_severity": _enum_codes([item.severity for _, item in rows], TrajectoryDynamicViolationSeverity),
+        "violation_severity_names": _enum_names(TrajectoryDynamicViolationSeverity),
+        "violation_axis": np.array([item.axis for _, item in rows], dtype=np.int16),
+        "violation_value": np.array([item.value for _, item in rows], dtype=float),
+        "violation_limit": np.array([item.limit for _, item in rows], dtype=float),
+    }
+
+
+def _segment_columns(segments: list[SegmentResult]) -> dict[str, np.ndarray]:
+    count = len(segments)
+    intervals = [
+        (segment_index, interval)
+        for segment_index, segment in enumerate(segments)
+        for interval in segment.singularity_intervals
+    ]
+    return {
+        "segment_status": _enum_codes([segment.status for segment in segments], TrajectoryComputationStatus),
+        "segment_status_names": _enum_names(TrajectoryComputationStatus),
+        "segment_mode": _enum_codes([segment.mode for segment in segments], KeypointMotionMode),
+        "segment_mode_names": _enum_names(KeypointMotionMode),
+        "segment_duration": np.array([segment.duration for segment in segments], dtype=float),
+        "segment_last_time": np.array([segment.last_time for segment in segments], dtype=float),
+        "segment_in_direction": np.array([segment.in_direction[:3] for segment in segments], dtype=float).reshape(count, 3),
+        "segment_out_direction": np.array([segment.out_direction[:3] for segment in segments], dtype=float).reshape(count, 3),
+        "segment_first_error_sample": np.array(
+            [-1 if segment.first_error_sample_index is None else segment.first_error_sample_index for segment in segments],
+            dtype=np.int64,
+        ),
+        "segment_first_error_axis": np.array(
+            [-1 if segment.first_error_axis is None else segment.first_error_axis for segment in segments], dtype=np.int16
+        ),
+        # max_positive_velocity, max_negative_velocity, max_acceleration, max_deceleration
+        "segment_joint_stats": np.array(
+            [
+                [
+                    [stats.max_positive_velocity, stats.max_negative_velocity, stats.max_acceleration, stats.max_deceleration]
+                    for stats in segment.joints_stats
+                ]
+                for segment in segments
+            ],
+            dtype=float,
+        ).reshape(count, 6, 4),
+        "interval_segment": np.array([index for index, _ in intervals], dtype=np.int64),
+        "interval_kind": _enum_codes([item.kind for _, item in intervals], SingularityKind),
+        "interval_severity": _enum_codes([item.severity for _, item in intervals], SingularitySeverity),
+        "interval_severity_names": _enum_names(SingularitySeverity),
+        # start_time_s, end_time_s, min_index, min_time_s, limit
+        "interval_values": np.array(
+            [[item.start_time_s, item.end_time_s, item.min_index, item.min_time_s, item.limit] for _, item in intervals],
+            dtype=float,
+        ).reshape(len(intervals), 5),
+        "interval_sample_range": np.array(
+            [[item.start_sample_index, item.end_sample_index] for _, item in intervals], dtype=np.int64
+        ).reshape(len(intervals), 2),
+    }
+
+
+def load_trajectory_result_npz(path: str | Path) -> TrajectoryResult:
+    """Reconstruit le TrajectoryResult archivé par save_trajectory_result_npz."""
+    with _open_archive(path, TRAJECTORY_ARCHIVE_KIND) as archive:
+        samples = _load_samples(archive)
+        segments = _load_segments(archive, samples)
+        status = _decode(archive["result_status"], _enum_decoder(archive, "result_status", TrajectoryComputationStatus))[0]
+        return TrajectoryResult(
+            status=status or TrajectoryComputationStatus.SUCCESS,
+            segments=segments,
+            first_error_segment_index=_optional_int(int(archive["first_error_segment_index"])),
+        )
+
+
+def _load_samples(archive) -> list[TrajectorySample]:
+    times = archive["time"]
+    count = len(times)
+    vectors = {name: archive[name].tolist() for name in _SAMPLE_VECTOR_FIELDS}
+    flag_names = [str(name) for name in archive["validity_flag_names"]]
+    flags = archive["validity_flags"].tolist()
+    velocity = archive["velocity"].tolist()
+    acceleration = archive["acceleration"].tolist()
+    reachable = archive["reachable"].tolist()
+    configurations = _decode(archive["configuration"], _enum_decoder(archive, "configuration", MgiConfigKey))
+    error_codes = _decode(archive["error_code"], _enum_decoder(archive, "error_code", TrajectorySampleErrorCode))
+    error_axes = archive["error_axis"].tolist()
+    singularity_index = archive["singularity_index"].tolist()
+    singularity_kinds = _decode(archive["singularity_kind"], _enum_decoder(archive, "singularity_kind", SingularityKind))
+    clearance_distance = archive["clearance_distance_mm"].tolist()
+    clearance_domains = _decode(archive["clearance_domain"], _enum_decoder(archive, "clearance_domain", TrajectoryCollisionDomain))
+    clearance_points = archive["clearance_points_world"]
+    clearance_labels = archive["clearance_labels"].tolist()
+
+    samples: list[TrajectorySample] = []
+    for index in range(count):
+        sample = TrajectorySample()
+        sample.time = float(times[index])
+        for name in _SAMPLE_VECTOR_FIELDS:
+            setattr(sample, name, vectors[name][index])
+        for flag_name, value in zip(flag_names, flags[index]):
+            setattr(sample, flag_name, bool(value))
+        sample.velocity = velocity[index]
+        sample.acceleration = acceleration[index]
+        sample.reachable = bool(reachable[index])
+        sample.configuration = configurations[index]
+        sample.error_code = error_codes[index] or TrajectorySampleErrorCode.NONE
+        sample.error_axis = _optional_int(error_axes[index])
+        if not np.isnan(singularity_index[index]):
+            sample.singularity_index = singularity_index[index]
+            sample.singularity_kind = singularity_kinds[index]
+        if not np.isnan(clearance_distance[index]) and clearance_domains[index] is not None:
+            owner_a, name_a, owner_b, name_b = clearance_labels[index]
+            sample.clearance = TrajectoryClearanceDiagnostic(
+                clearance_domains[index],
+                owner_a,
+                name_a,
+                owner_b,
+                name_b,
+                clearance_distance[index],
+                XYZ3.from_values(clearance_points[index, 0]),
+                XYZ3.from_values(clearance_points[index, 1]),
+            )
+        samples.append(sample)
+
+    kinds = _decode(archive["violation_kind"], _enum_decoder(archive, "violation_kind", TrajectoryDynamicViolationKind))
+    severities = _decode(
+        archive["violation_severity"], _enum_decoder(archive, "violation_severity", TrajectoryDynamicViolationSeverity)
+    )
+    for sample_index, kind, severity, axis, value, limit in zip(
+        archive["violation_sample"].tolist(),
+        kinds,
+        severities,
+        archive["violation_axis"].tolist(),
+        archive["violation_value"].tolist(),
+        archive["violation_limit"].tolist(),
+    ):
+        if kind is None or severity is None:
+            continue
+        samples[sample_index].dynamic_violations.append(TrajectoryDynamicViolation(kind, axis, value, limit, severity))
+    return samples
+
+
+def _load_segments(archive, samples: list[TrajectorySample]) -> list[SegmentResult]:
+    offsets = archive["segment_sample_offsets"].tolist()
+    statuses = _decode(archive["segment_status"], _enum_decoder(archive, "segment_status", TrajectoryComputationStatus))
+    modes = _decode(archive["segment_mode"], _enum_decoder(archive, "segment_mode", KeypointMotionMode))
+    durations = archive["segment_duration"].tolist()
+    last_times = archive["segment_last_time"].tolist()
+    in_directions = archive["segment_in_direction"].tolist()
+    out_directions = archive["segment_out_direction"].tolist()
+    first_error_samples = archive["segment_first_error_sample"].tolist()
+    first_error_axes = archive["segment_first_error_axis"].tolist()
+    joint_stats = archive["segment_joint_stats"].tolist()
+
+    segments: list[SegmentResult] = []
+    for index in range(len(offsets) - 1):
+        segment = SegmentResult()
+        segment.status = statuses[index] or TrajectoryComputationStatus.SUCCESS
+        segment.samples = samples[offsets[index]:offsets[index + 1]]
+        segment.mode = modes[index] or KeypointMotionMode.PTP
+        segment.duration = durations[index]
+        segment.last_time = last_times[index]
+        segment.in_direction = in_directions[index]
+        segment.out_direction = out_directions[index]
+        segment.first_error_sample_index = _optional_int(first_error_samples[index])
+        segment.first_error_axis = _optional_int(first_error_axes[index])
+        segment.joints_stats = [JointDynamicStats(*values) for values in joint_stats[index]]
+        segments.append(segment)
+
+    kinds = _decode(archive["interval_kind"], _enum_decoder(archive, "singularity_kind", SingularityKind))
+    severities = _decode(archive["interval_severity"], _enum_decoder(archive, "interval_severity", SingularitySeverity))
+    for segment_index, kind, severity, values, sample_range in zip(
+        archive["interval_segment"].tolist(),
+        kinds,
+        severities,
+        archive["interval_values"].tolist(),
+        archive["interval_sample_range"].tolist(),
+    ):
+        if kind is None or severity is None:
+            continue
+        segments[segment_index].singularity_intervals.append(SingularityInterval(kind, severity, *values, *sample_range))
+    return segments
+
+
+# ----------------------------------------------------------------------
+# Résultat de simulation programme
+# ----------------------------------------------------------------------
+
+def save_program_simulation_npz(path: str | Path, result: ProgramSimulationResult) -> Path:
+    """Écrit les échantillons nominaux et compensés d'une simulation programme (.npz non compressé).
+
+    Les programmes compensés (RobotProgram) ne sont pas archivés : ils se régénèrent à l'export KRL.
+    """
+    path = _with_extension(path)
+    columns: dict[str, np.ndarray] = {
+        "kind": np.array(PROGRAM_ARCHIVE_KIND),
+        "version": np.array(ARCHIVE_VERSION),
+        "warnings": _string_array(result.warnings),
+        "compensation_computed": np.array(bool(result.compensation_computed)),
+        "motion_mode_names": _enum_names(RobotProgramMotionMode),
+    }
+    for prefix, samples in zip(
+        _PROGRAM_SAMPLE_SETS,
+        (result.nominal_samples, result.cartesian_compensated_samples, result.articular_compensated_samples),
+    ):
+        columns.update(_program_sample_columns(prefix, samples))
+    np.savez(path, **columns)
+    return path
+
+
+def _program_sample_columns(prefix: str, samples: list[ProgramSimulationSample]) -> dict[str, np.ndarray]:
+    count = len(samples)
+    ext_width = max((len(sample.ext_axis_values) for sample in samples), default=0)
+    ext_values = np.full((count, ext_width), np.nan)
+    for index, sample in enumerate(samples):
+        ext_values[index, : len(sample.ext_axis_values)] = sample.ext_axis_values
+    columns = {
+        f"{prefix}_time_s": np.array([sample.time_s for sample in samples], dtype=float),
+        f"{prefix}_motion_mode": _enum_codes([sample.motion_mode for sample in samples], RobotProgramMotionMode),
+        f"{prefix}_source_line": np.array([sample.source_line for sample in samples], dtype=np.int64),
+        f"{prefix}_joints_deg": np.array([sample.joints_deg.to_list() for sample in samples], dtype=float).reshape(count, 6),
+        f"{prefix}_ext_axis_values": ext_values,
+        f"{prefix}_ext_axis_count": np.array([len(sample.ext_axis_values) for sample in samples], dtype=np.int16),
+    }
+    for field_name in _PROGRAM_POSE_FIELDS:
+        poses = [getattr(sample, field_name) for sample in samples]
+        columns[f"{prefix}_{field_name}"] = np.array(
+            [[np.nan] * 6 if pose is None else pose.to_list() for pose in poses], dtype=float
+        ).reshape(count, 6)
+        columns[f"{prefix}_{field_name}_valid"] = np.array([pose is not None for pose in poses], dtype=bool)
+    # Vitesse TCP (mm/s) en repère robot, pour l'analyse hors ligne ; non relue.
+    columns[f"{prefix}_tcp_speed_mm_s"] = _tcp_speed(columns[f"{prefix}_time_s"], columns[f"{prefix}_nominal_pose_base"])
+    return columns
+
+
+def _tcp_speed(times: np.ndarray, poses: np.ndarray) -> np.ndarray:
+    if len(times) < 2:
+        return np.zeros(len(times))
+    distances = np.linalg.norm(np.diff(poses[:, :3], axis=0), axis=1)
+    durations = np.diff(times)
+    step_speed = np.divide(distances, durations, out=np.zeros_like(distances), where=durations > 1e-12)
+    return np.concatenate([[0.0], step_speed])
+
+
+def load_program_simulation_npz(path: str | Path) -> ProgramSimulationResult:
+    """Reconstruit les échantillons d'une simulation programme archivée par save_program_simulation_npz."""
+    with _open_archive(path, PROGRAM_ARCHIVE_KIND) as archive:
+        mode_table = _enum_decoder(archive, "motion_mode", RobotProgramMotionMode)
+        sample_sets = [_load_program_samples(archive, prefix, mode_table) for prefix in _PROGRAM_SAMPLE_SETS]
+        return ProgramSimulationResult(
+            nominal_samples=sample_sets[0],
+            cartesian_compensated_samples=sample_sets[1],
+            articular_compensated_samples=sample_sets[2],
+            warnings=[str(warning) for warning in archive["warnings"]],
+            compensation_computed=bool(archive["compensation_computed"]),
+        )
+
+
+def _load_program_samples(archive, prefix: str, mode_table: list[Enum | None]) -> list[ProgramSimulationSample]:
+    times = archive[f"{prefix}_time_s"].tolist()
+    modes = _decode(archive[f"{prefix}_motion_mode"], mode_table)
+    lines = archive[f"{prefix}_source_line"].tolist()
+    joints = archive[f"{prefix}_joints_deg"].tolist()
+    ext_values = archive[f"{prefix}_ext_axis_values"].tolist()
+    ext_counts = archive[f"{prefix}_ext_axis_count"].tolist()
+    poses = {
+        field_name: (archive[f"{prefix}_{field_name}"].tolist(), archive[f"{prefix}_{field_name}_valid"].tolist())
+        for field_name in _PROGRAM_POSE_FIELDS
+    }
+    samples: list[ProgramSimulationSample] = []
+    for index in range(len(times)):
+        pose_values = {
+            field_name: Pose6.from_values(values[index]) if valid[index] else None
+            for field_name, (values, valid) in poses.items()
+        }
+        samples.append(
+            ProgramSimulationSample(
+                time_s=times[index],
+                motion_mode=modes[index] or RobotProgramMotionMode.PTP,
+                source_line=lines[index],
+                joints_deg=JointAngles6.from_values(joints[index]),
+                nominal_pose_base=pose_values["nominal_pose_base"] or Pose6.zeros(),
+                measured_pose_base=pose_values["measured_pose_base"],
+                ext_axis_values=tuple(ext_values[index][: ext_counts[index]]),
+                nominal_pose_world=pose_values["nominal_pose_world"],
+                measured_pose_world=pose_values["measured_pose_world"],
+            )
+        )
+    return samples
+
+
+_PROGRAM_TO_KEYPOINT_MODE = {
+    RobotProgramMotionMode.PTP: KeypointMotionMode.PTP,
+    RobotProgramMotionMode.LINEAR: KeypointMotionMode.LINEAR,
+    RobotProgramMotionMode.CIRCULAR: KeypointMotionMode.LINEAR,
+    RobotProgramMotionMode.EXTERNAL_AXIS: KeypointMotionMode.PTP,
+}
+
+
+def trajectory_result_from_program_samples(samples: list[ProgramSimulationSample]) -> TrajectoryResult:
+    """Vue TrajectoryResult d'échantillons programme (un segment par ligne source consécutive).
+
+    Seuls temps, articulations et pose TCP en repère robot sont repris : les vitesses
+    ne sont pas archivées côté programme et restent marquées invalides.
+    """
+    segments: list[SegmentResult] = []
+    current_line: int | None = None
+    for program_sample in samples:
+        if current_line != program_sample.source_line or not segments:
+            segment = SegmentResult()
+            segment.mode = _PROGRAM_TO_KEYPOINT_MODE.get(program_sample.motion_mode, KeypointMotionMode.PTP)
+            segments.append(segment)
+            current_line = program_sample.source_line
+        sample = TrajectorySample()
+        sample.time = float(program_sample.time_s)
+        sample.joints = program_sample.joints_deg.to_list()
+        sample.pose = program_sample.nominal_pose_base.to_list()
+        segments[-1].samples.append(sample)
+    start_time = 0.0
+    for segment in segments:
+        segment.last_time = segment.samples[-1].time
+        segment.duration = max(0.0, segment.last_time - start_time)
+        start_time = segment.last_time
+    return TrajectoryResult(segments=segments)
+
+
+__all__ = [
+    "ARCHIVE_EXTENSION",
+    "ARCHIVE_VERSION",
+    "PROGRAM_ARCHIVE_KIND",
+    "TRAJECTORY_ARCHIVE_KIND",
+    "TrajectoryArchiveError",
+    "VALIDITY_FLAG_NAMES",
+    "load_program_simulation_npz",
+    "load_trajectory_result_npz",
+    "read_archive_kind",
+    "save_program_simulation_npz",
+    "save_trajectory_result_npz",
+    "trajectory_result_from_program_samples",
+]
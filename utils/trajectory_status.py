@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
+
 from models.trajectory_result import (
     SegmentResult,
     TrajectoryComputationStatus,
@@ -8,6 +12,14 @@ from models.trajectory_result import (
     TrajectoryResult,
     TrajectorySampleErrorCode,
 )
+from utils.singularity_analysis import (
+    SingularityInterval,
+    SingularityKind,
+    SingularitySeverity,
+    SingularityThresholds,
+    find_singularity_intervals,
+    singularity_kind_label,
+)
 
 
 def _axis_label(axis: int | None) -> str:
@@ -198,6 +210,92 @@ def build_trajectory_warning_messages(trajectory: TrajectoryResult | None) -> li
     return messages
 
 
+def build_segment_clearance_warning_messages(
+    segment: SegmentResult,
+    segment_index: int,
+    safety_margin_mm: float,
+) -> list[str]:
+    min_clearance = None
+    for sample in segment.samples:
+        clearance = sample.clearance
+        if clearance is None or clearance.distance_mm <= 0.0:
+            continue
+        if min_clearance is None or clearance.distance_mm < min_clearance.distance_mm:
+            min_clearance = clearance
+    if min_clearance is None or min_clearance.distance_mm >= float(safety_margin_mm):
+        return []
+    return [
+        f"Segment {max(0, segment_index) + 1}: marge de securite non respectee "
+        f"({min_clearance.name_a} / {min_clearance.name_b} : "
+        f"{min_clearance.distance_mm:.1f} mm < {float(safety_margin_mm):.1f} mm)"
+    ]
+
+
+def build_trajectory_clearance_warning_messages(
+    trajectory: TrajectoryResult | None,
+    safety_margin_mm: float,
+) -> list[str]:
+    if trajectory is None or safety_margin_mm <= 0.0:
+        return []
+    messages: list[str] = []
+    for index, segment in enumerate(trajectory.segments):
+        messages.extend(build_segment_clearance_warning_messages(segment, index, safety_margin_mm))
+    return messages
+
+
+def segment_singularity_intervals(
+    segment: SegmentResult,
+    thresholds: SingularityThresholds,
+) -> list[SingularityInterval]:
+    """Intervalles recalculés depuis l'indice des échantillons (seuils de l'affichage)."""
+    if not segment.samples:
+        return []
+    index = [math.nan if sample.singularity_index is None else sample.singularity_index for sample in segment.samples]
+    return find_singularity_intervals(
+        np.array([sample.time for sample in segment.samples]),
+        np.array(index, dtype=float),
+        [sample.singularity_kind for sample in segment.samples],
+        thresholds,
+    )
+
+
+def build_segment_singularity_warning_messages(
+    segment: SegmentResult,
+    segment_index: int,
+    thresholds: SingularityThresholds,
+) -> list[str]:
+    prefix = f"Segment {max(0, segment_index) + 1}"
+    worst: dict[tuple[SingularitySeverity, SingularityKind], SingularityInterval] = {}
+    for interval in segment_singularity_intervals(segment, thresholds):
+        key = (interval.severity, interval.kind)
+        if key not in worst or interval.min_index < worst[key].min_index:
+            worst[key] = interval
+
+    messages: list[str] = []
+    for severity in (SingularitySeverity.ERROR, SingularitySeverity.WARNING):
+        for (interval_severity, _kind), interval in worst.items():
+            if interval_severity != severity:
+                continue
+            label = "passage singulier" if severity == SingularitySeverity.ERROR else "proche singularite"
+            messages.append(
+                f"{prefix}: {label} {singularity_kind_label(interval.kind)} "
+                f"(indice {interval.min_index:.3f} < {interval.limit:.3f} a t={interval.min_time_s:.2f} s)"
+            )
+    return messages
+
+
+def build_trajectory_singularity_warning_messages(
+    trajectory: TrajectoryResult | None,
+    thresholds: SingularityThresholds,
+) -> list[str]:
+    if trajectory is None:
+        return []
+    messages: list[str] = []
+    for index, segment in enumerate(trajectory.segments):
+        messages.extend(build_segment_singularity_warning_messages(segment, index, thresholds))
+    return messages
+
+
 def join_issue_messages(messages: list[str], separator: str = " | ") -> str:
     if not messages:
         return ""
@@ -24,6 +24,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from utils.measurement_csv_reader import MeasurementParseReport, read_xyz_measurements
+
 
 class ExternalAxisWidget(QWidget):
     """Widget pour l'axe externe : import de mesures et visualisation des ecarts."""
@@ -40,6 +42,7 @@ class ExternalAxisWidget(QWidget):
         self.tolerance_min_line: Optional[pg.InfiniteLine] = None
         self.tolerance_max_line: Optional[pg.InfiniteLine] = None
         self.point_names: List[str] = []
+        self.last_import_report: Optional[MeasurementParseReport] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -555,7 +558,7 @@ class ExternalAxisWidget(QWidget):
             self.scale_limit_overridden = False
 
             data = self._read_measurements_file(file_path)
-            if not data:
+            if len(data) == 0:
                 QMessageBox.warning(self, "Erreur", "Aucun point valide trouve dans le fichier.")
                 return
             if len(data) % 2 != 0:
@@ -577,7 +580,10 @@ class ExternalAxisWidget(QWidget):
                     "La plage Min/Max/Step ne correspond pas au nombre de points Aller du fichier.",
                 )
             self._update_plot()
-            QMessageBox.information(self, "Succes", f"{len(data)} points importes avec succes.")
+            message = f"{len(data)} points importes avec succes."
+            if self.last_import_report is not None and self.last_import_report.has_errors():
+                message += "\n\n" + self.last_import_report.summary()
+            QMessageBox.information(self, "Succes", message)
         except Exception as error:
             QMessageBox.critical(self, "Erreur", f"Erreur lors de l'import : {error}")
 
@@ -589,6 +595,7 @@ class ExternalAxisWidget(QWidget):
         self.current_backlash_delta = None
         self.current_precision_peak = None
         self.point_names = []
+        self.last_import_report = None
 
         self.file_label.setText("Aucun fichier chargé")
         self.plot_widget.clear()
@@ -631,29 +638,11 @@ class ExternalAxisWidget(QWidget):
         self._update_lever_arm_error_display()
         self._update_unit_context()
 
-    def _read_measurements_file(self, file_path: str) -> list[list[float]]:
-        data: list[list[float]] = []
-        self.point_names = []
-        with open(file_path, "r", encoding="utf-8-sig") as file:
-            for line_index, line in enumerate(file):
-                line = line.strip()
-                if not line:
-                    continue
-
-                if "\t" in line:
-                    parts = [part.strip() for part in line.split("\t")]
-                else:
-                    parts = [part.strip() for part in line.split(",")]
-
-                if len(parts) < 3:
-                    continue
-                try:
-                    values = [float(part) for part in parts[:3]]
-                except ValueError:
-                    continue
-                data.append(values)
-                self.point_names.append(f"Point {line_index + 1}")
-        return data
+    def _read_measurements_file(self, file_path: str, decimate: int = 1) -> np.ndarray:
+        points, line_numbers, report = read_xyz_measurements(file_path, decimate=decimate)
+        self.point_names = [f"Point {line_number}" for line_number in line_numbers.tolist()]
+        self.last_import_report = report
+        return points
 
     def _apply_detected_measurement_context(self) -> None:
         if self.measurements is None or len(self.measurements) == 0:
@@ -91,6 +91,7 @@ class MeasurementWidget(QWidget):
     """Widget pour l'importation et la gestion des mesures"""
 
     import_measurements_requested = pyqtSignal()
+    identify_poses_requested = pyqtSignal()
     clear_measurements_requested = pyqtSignal()
     set_as_reference_requested = pyqtSignal()
     apply_measured_dh_requested = pyqtSignal()
@@ -174,6 +175,13 @@ class MeasurementWidget(QWidget):
         self.btn_clear.setEnabled(False)
         buttons_layout.addWidget(self.btn_clear)
 
+        self.btn_identify_poses = QPushButton("Identifier (poses .csv)")
+        self.btn_identify_poses.setToolTip(
+            "Identification moindres carrés du modèle (DH, base, outil) sur N poses articulaires + mesures"
+        )
+        self.btn_identify_poses.clicked.connect(self.identify_poses_requested.emit)
+        buttons_layout.addWidget(self.btn_identify_poses)
+
         import_layout.addLayout(buttons_layout)
         self._freeze_measurements_table_height()
         import_group.setMinimumHeight(self.table_me.height() + 150)
@@ -251,6 +259,26 @@ class MeasurementWidget(QWidget):
         self._initialize_tcp_offsets_table()
         main_layout.addWidget(dh_group)
 
+        identification_group = QGroupBox("Identification multi-poses")
+        identification_layout = QVBoxLayout(identification_group)
+        self.table_identified_frames = QTableWidget(2, 6)
+        self.table_identified_frames.setHorizontalHeaderLabels(["X (mm)", "Y (mm)", "Z (mm)", "A (°)", "B (°)", "C (°)"])
+        self.table_identified_frames.setVerticalHeaderLabels(["Base (repère de mesure)", "Outil"])
+        self.table_identified_frames.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.table_identified_frames.verticalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.table_identified_frames.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_identified_frames.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table_identified_frames.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table_identified_frames.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_identified_frames.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table_identified_frames.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.identification_summary_label = QLabel()
+        self.identification_summary_label.setWordWrap(True)
+        identification_layout.addWidget(self.table_identified_frames)
+        identification_layout.addWidget(self.identification_summary_label)
+        self.clear_identification()
+        main_layout.addWidget(identification_group)
+
         correction_group = QGroupBox("Table de corrections 6x6D")
         correction_layout = QVBoxLayout(correction_group)
         self.table_corr = QTableWidget(6, 6)
@@ -661,6 +689,23 @@ class MeasurementWidget(QWidget):
         self.table_tcp_offsets.blockSignals(False)
         self._update_tcp_offsets_table_geometry()
 
+    def clear_identification(self) -> None:
+        self.display_identification([0.0] * 6, [0.0] * 6, "Aucune identification multi-poses")
+
+    def display_identification(self, base_pose: List[float], tool_pose: List[float], summary: str) -> None:
+        """Affiche les repères base / outil identifiés ([X, Y, Z, A, B, C]) et le bilan des résidus."""
+        self.table_identified_frames.blockSignals(True)
+        for row, pose in enumerate((base_pose, tool_pose)):
+            for col in range(6):
+                value = float(pose[col]) if col < len(pose) else 0.0
+                self.table_identified_frames.setItem(row, col, self._make_centered_item(self._format_value(value, 3)))
+        self.table_identified_frames.blockSignals(False)
+        self.table_identified_frames.resizeRowsToContents()
+        header_height = self.table_identified_frames.horizontalHeader().height()
+        rows_height = sum(self.table_identified_frames.rowHeight(row) for row in range(2))
+        self.table_identified_frames.setFixedHeight(header_height + rows_height + 2 * self.table_identified_frames.frameWidth())
+        self.identification_summary_label.setText(summary)
+
     def set_tcp_offsets_values(
         self,
         offsets_xyz: List[float],
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import QCheckBox, QHBoxLayout, QLabel, QPushButton, QVBoxLa
 class ProgramActionsWidget(QWidget):
     recompute_requested = pyqtSignal()
     export_requested = pyqtSignal()
+    export_simulation_requested = pyqtSignal()
     display_options_changed = pyqtSignal()
     compute_compensation_requested = pyqtSignal()
     clear_requested = pyqtSignal()
@@ -15,6 +16,9 @@ class ProgramActionsWidget(QWidget):
         self.btn_recompute = QPushButton("Simuler")
         self.btn_export = QPushButton("Exporter programme compense")
         self.btn_compute_compensation = QPushButton("Calculer compensation")
+        self.btn_export_simulation = QPushButton("Exporter simulation NPZ")
+        self.btn_export_simulation.setToolTip("Echantillons simules (nominaux et compenses), reimportables dans la vue trajectoire")
+        self.btn_export_simulation.setEnabled(False)
         self.cb_show_theoretical = QCheckBox("Afficher theorique")
         self.cb_show_measured = QCheckBox("Afficher reelle")
         self.cb_show_compensated = QCheckBox("Afficher compensee")
@@ -33,6 +37,7 @@ class ProgramActionsWidget(QWidget):
         row_buttons.addWidget(self.btn_recompute, 1)
         row_buttons.addWidget(self.btn_compute_compensation, 1)
         row_buttons.addWidget(self.btn_export, 1)
+        row_buttons.addWidget(self.btn_export_simulation, 1)
         layout.addLayout(row_buttons)
 
         row_visibility = QHBoxLayout()
@@ -48,6 +53,7 @@ class ProgramActionsWidget(QWidget):
     def _setup_connections(self) -> None:
         self.btn_recompute.clicked.connect(self.recompute_requested.emit)
         self.btn_export.clicked.connect(self.export_requested.emit)
+        self.btn_export_simulation.clicked.connect(self.export_simulation_requested.emit)
         self.btn_compute_compensation.clicked.connect(self.compute_compensation_requested.emit)
         self.cb_show_theoretical.stateChanged.connect(lambda _: self.trajectory_visibility_changed.emit())
         self.cb_show_measured.stateChanged.connect(lambda _: self.trajectory_visibility_changed.emit())
@@ -59,6 +65,9 @@ class ProgramActionsWidget(QWidget):
     def set_export_enabled(self, enabled: bool) -> None:
         self.btn_export.setEnabled(enabled)
 
+    def set_simulation_export_enabled(self, enabled: bool) -> None:
+        self.btn_export_simulation.setEnabled(enabled)
+
     def set_compensation_enabled(self, enabled: bool) -> None:
         self.btn_compute_compensation.setEnabled(enabled)
 
@@ -14,6 +14,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPlainTextEdit,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
@@ -240,6 +241,28 @@ class ProgramGenerationWidget(QWidget):
         approx_form.addRow("Valeur :", self._spin_approx_value)
         group_layout.addWidget(approx_box)
 
+        split_box = QGroupBox("Découpage export KRL")
+        split_form = QFormLayout(split_box)
+        split_form.setContentsMargins(6, 4, 6, 4)
+        self._spin_split_motions = QSpinBox()
+        self._spin_split_motions.setRange(0, 10_000_000)
+        self._spin_split_motions.setSingleStep(1000)
+        self._spin_split_motions.setSpecialValueText("Sans limite")
+        self._spin_split_motions.setKeyboardTracking(False)
+        self._spin_split_kbytes = QSpinBox()
+        self._spin_split_kbytes.setRange(0, 1_000_000)
+        self._spin_split_kbytes.setSingleStep(100)
+        self._spin_split_kbytes.setSuffix(" Ko")
+        self._spin_split_kbytes.setSpecialValueText("Sans limite")
+        self._spin_split_kbytes.setKeyboardTracking(False)
+        split_box.setToolTip(
+            "Au-delà de ces bornes, le programme est enregistré en sous-programmes <nom>_001.src, "
+            "<nom>_002.src… appelés par le programme principal."
+        )
+        split_form.addRow("Mouvements max / fichier :", self._spin_split_motions)
+        split_form.addRow("Taille max / fichier :", self._spin_split_kbytes)
+        group_layout.addWidget(split_box)
+
         layout.addWidget(self._group_settings)
 
         # Zone header KRL
@@ -294,6 +317,8 @@ class ProgramGenerationWidget(QWidget):
         self._retract_section.changed.connect(self._emit_settings_changed)
         self._cb_constant_speed.toggled.connect(self._on_constant_speed_toggled)
         self._spin_constant_speed.valueChanged.connect(self._emit_settings_changed)
+        self._spin_split_motions.valueChanged.connect(self._emit_settings_changed)
+        self._spin_split_kbytes.valueChanged.connect(self._emit_settings_changed)
 
     def _on_constant_speed_toggled(self, checked: bool) -> None:
         self._spin_constant_speed.setEnabled(checked)
@@ -336,6 +361,8 @@ class ProgramGenerationWidget(QWidget):
                 if self._cb_constant_speed.isChecked()
                 else None
             ),
+            split_max_motions=self._spin_split_motions.value() or None,
+            split_max_bytes=self._spin_split_kbytes.value() * 1024 or None,
         )
 
     def set_settings(self, settings: ProgramGenerationSettings) -> None:
@@ -350,6 +377,8 @@ class ProgramGenerationWidget(QWidget):
             if settings.constant_speed_mmps is not None:
                 self._spin_constant_speed.setValue(float(settings.constant_speed_mmps))
             self._spin_constant_speed.setEnabled(settings.constant_speed_mmps is not None)
+            self._spin_split_motions.setValue(int(settings.split_max_motions or 0))
+            self._spin_split_kbytes.setValue(int(settings.split_max_bytes or 0) // 1024)
         finally:
             self._updating = False
 
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor
+
+from models.trajectory_keypoint import KeypointMotionMode, KeypointTargetType, TrajectoryKeypoint
+
+
+BASE_COLUMN_LABELS = [
+    "Cible",
+    "Mode",
+    "Vitesse",
+    "J1 / X",
+    "J2 / Y",
+    "J3 / Z",
+    "J4 / A",
+    "J5 / B",
+    "J6 / C",
+    "Approx",
+]
+APPROX_COLUMN = 9
+LOCKED_ROLES = frozenset({"HOME_START", "HOME_END", "APPROACH", "RETRACT", "EXTERNAL_SETUP"})
+
+
+def _changed_range(old: Sequence[Any], new: Sequence[Any], key: Callable[[Any], Any] | None = None) -> tuple[int, int] | None:
+    """Première et dernière ligne qui diffèrent entre deux listes de même longueur (None si identiques)."""
+    key = key if key is not None else (lambda value: value)
+    count = len(new)
+    first = 0
+    while first < count and key(old[first]) == key(new[first]):
+        first += 1
+    if first == count:
+        return None
+    last = count - 1
+    while last > first and key(old[last]) == key(new[last]):
+        last -= 1
+    return first, last
+
+
+def _keypoint_signature(keypoint: TrajectoryKeypoint) -> tuple:
+    target = keypoint.cartesian_target if keypoint.target_type == KeypointTargetType.CARTESIAN else keypoint.joint_target
+    return (keypoint.target_type, keypoint.mode, keypoint.speed, tuple(target.to_list()))
+
+
+class ProgramKeypointsTableModel(QAbstractTableModel):
+    """Lignes de la table des points clés, formatées à la demande pour les seules lignes affichées.
+
+    Les listes (keypoints issus de RobotProgram.motions et métadonnées de ligne) sont tenues
+    telles quelles ; un rafraîchissement à nombre de lignes constant ne signale que la plage
+    modifiée (dataChanged), la vue ne repeint alors que ce qui est visible.
+    """
+
+    LOCKED_FOREGROUND = QBrush(QColor(180, 180, 180))
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._keypoints: list[TrajectoryKeypoint] = []
+        self._roles: list[str] = []
+        self._approx_texts: list[str] = []
+        self._cible_overrides: list[str | None] = []
+        self._ext_axis_values: list[tuple[float, ...]] = []
+        self._ext_axis_headers: list[str] = []
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keypoints)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(BASE_COLUMN_LABELS) + len(self._ext_axis_headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Vertical:
+            return str(section + 1)
+        labels = BASE_COLUMN_LABELS + self._ext_axis_headers
+        return labels[section] if 0 <= section < len(labels) else None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cell_text(row, index.column())
+        if role == Qt.ItemDataRole.ForegroundRole and self.is_row_locked(row):
+            return self.LOCKED_FOREGROUND
+        return None
+
+    # ------------------------------------------------------------------
+    # Contenu
+    # ------------------------------------------------------------------
+
+    def keypoints(self) -> list[TrajectoryKeypoint]:
+        return self._keypoints
+
+    def is_row_locked(self, row: int) -> bool:
+        return 0 <= row < len(self._roles) and self._roles[row] in LOCKED_ROLES
+
+    def set_keypoints(self, keypoints: list[TrajectoryKeypoint]) -> None:
+        keypoints = list(keypoints)
+        if len(keypoints) != len(self._keypoints):
+            self.beginResetModel()
+            self._keypoints = keypoints
+            self.endResetModel()
+            return
+        changed = _changed_range(self._keypoints, keypoints, _keypoint_signature)
+        self._keypoints = keypoints
+        if changed is not None:
+            self._emit_rows_changed(*changed)
+
+    def set_row_metadata(
+        self,
+        roles: list[str],
+        approx_texts: list[str],
+        cible_overrides: list[str | None],
+        ext_axis_values_per_row: list[tuple[float, ...]],
+    ) -> None:
+        old_rows = self._metadata_rows()
+        self._roles = list(roles)
+        self._approx_texts = list(approx_texts)
+        self._cible_overrides = list(cible_overrides)
+        self._ext_axis_values = list(ext_axis_values_per_row)
+        changed = _changed_range(old_rows, self._metadata_rows())
+        if changed is not None:
+            self._emit_rows_changed(*changed)
+
+    def set_external_axis_headers(self, headers: list[str]) -> None:
+        self.beginResetModel()
+        self._ext_axis_headers = list(headers)
+        self.endResetModel()
+
+    def _metadata_rows(self) -> list[tuple]:
+        count = len(self._keypoints)
+        return [
+            (
+                self._roles[row] if row < len(self._roles) else None,
+                self._approx_texts[row] if row < len(self._approx_texts) else "",
+                self._cible_overrides[row] if row < len(self._cible_overrides) else None,
+                self._ext_axis_values[row] if row < len(self._ext_axis_values) else (),
+            )
+            for row in range(count)
+        ]
+
+    def _emit_rows_changed(self, first_row: int, last_row: int) -> None:
+        last_row = min(last_row, len(self._keypoints) - 1)
+        if last_row < first_row:
+            return
+        self.dataChanged.emit(
+            self.index(first_row, 0),
+            self.index(last_row, self.columnCount() - 1),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+        )
+
+    # ------------------------------------------------------------------
+    # Formatage d'une cellule
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _speed_text(keypoint: TrajectoryKeypoint) -> str:
+        if keypoint.mode == KeypointMotionMode.PTP:
+            return f"{keypoint.speed:.1f} %"
+        return f"{keypoint.speed:.3f} m/s"
+
+    @staticmethod
+    def _mode_text(keypoint: TrajectoryKeypoint) -> str:
+        if keypoint.mode == KeypointMotionMode.BEZIER:
+            return "Bézier"
+        if keypoint.mode == KeypointMotionMode.LINEAR:
+            return "LIN"
+        return keypoint.mode.value
+
+    def _cell_text(self, row: int, column: int) -> str:
+        if row < 0 or row >= len(self._keypoints):
+            return ""
+        keypoint = self._keypoints[row]
+        if column == 0:
+            override = self._cible_overrides[row] if row < len(self._cible_overrides) else None
+            if override is not None:
+                return override
+            return "CARTESIAN" if keypoint.target_type == KeypointTargetType.CARTESIAN else "JOINT"
+        if column == 1:
+            return self._mode_text(keypoint)
+        if column == 2:
+            return self._speed_text(keypoint)
+        if 3 <= column < APPROX_COLUMN:
+            target = keypoint.cartesian_target if keypoint.target_type == KeypointTargetType.CARTESIAN else keypoint.joint_target
+            return f"{target.to_list()[column - 3]:.3f}"
+        if column == APPROX_COLUMN:
+            return self._approx_texts[row] if row < len(self._approx_texts) else ""
+        ext_index = column - len(BASE_COLUMN_LABELS)
+        values = self._ext_axis_values[row] if row < len(self._ext_axis_values) else ()
+        if 0 <= ext_index < len(values):
+            value = values[ext_index]
+            return "" if value != value else f"{value:.3f}"  # nan check
+        return ""
+
+
+__all__ = [
+    "ProgramKeypointsTableModel",
+]
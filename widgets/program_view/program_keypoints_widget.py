@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtCore import QModelIndex, pyqtSignal
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -13,8 +12,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -22,17 +20,16 @@ from PyQt6.QtWidgets import (
 from models.reference_frame import ReferenceFrame
 from models.robot_model import RobotModel
 from models.tool_model import ToolModel
-from models.trajectory_keypoint import (
-    KeypointMotionMode,
-    KeypointTargetType,
-    TrajectoryKeypoint,
-)
+from models.trajectory_keypoint import TrajectoryKeypoint
 from models.workspace_model import WorkspaceModel
+from widgets.program_view.program_keypoints_table_model import ProgramKeypointsTableModel
 
 
 class ProgramKeypointsWidget(QWidget):
     """Widget pour afficher et gerer les points cles d'un programme robot."""
 
+    RESIZE_PRECISION_ROWS = 200
+
     goToRequested = pyqtSignal(int)
     keypointSelectionChanged = pyqtSignal(object)
     keypoints_changed = pyqtSignal(list)
@@ -56,7 +53,9 @@ class ProgramKeypointsWidget(QWidget):
         self.tool_model = tool_model
         self.workspace_model = workspace_model
 
-        self.keypoints_table = QTableWidget(0, 10)
+        self.keypoints_model = ProgramKeypointsTableModel(self)
+        self.keypoints_table = QTableView()
+        self.keypoints_table.setModel(self.keypoints_model)
         self.btn_add = QPushButton("Ajouter")
         self.btn_edit = QPushButton("Editer")
         self.btn_go_to = QPushButton("Aller a")
@@ -66,13 +65,7 @@ class ProgramKeypointsWidget(QWidget):
         self.motion_mode_combo = QComboBox()
         self.btn_program_settings = QPushButton("Paramètres")
 
-        self._keypoints: list[TrajectoryKeypoint] = []
         self._has_program = False
-        self._row_roles: list[str] = []
-        self._row_approx_texts: list[str] = []
-        self._row_cible_overrides: list[str | None] = []
-        self._ext_axis_col_headers: list[str] = []
-        self._ext_axis_values_per_row: list[tuple[float, ...]] = []
 
         self._setup_ui()
         self._setup_connections()
@@ -132,26 +125,12 @@ class ProgramKeypointsWidget(QWidget):
         base_actions_row.addStretch(3)
         layout.addLayout(base_actions_row)
 
-        self.keypoints_table.setHorizontalHeaderLabels(
-            [
-                "Cible",
-                "Mode",
-                "Vitesse",
-                "J1 / X",
-                "J2 / Y",
-                "J3 / Z",
-                "J4 / A",
-                "J5 / B",
-                "J6 / C",
-                "Approx",
-            ]
-        )
-
         header = self.keypoints_table.horizontalHeader()
         header.setMinimumSectionSize(60)
-
-        for col in range(0, 10):
-            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        # La largeur n'est mesurée que sur un échantillon de lignes (programmes de 50k lignes).
+        header.setResizeContentsPrecision(self.RESIZE_PRECISION_ROWS)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.keypoints_table.verticalHeader().setDefaultSectionSize(22)
 
         self.keypoints_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.keypoints_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -175,8 +154,8 @@ class ProgramKeypointsWidget(QWidget):
         self.cartesian_display_frame_combo.currentIndexChanged.connect(self._on_cartesian_display_frame_changed)
         self.target_mode_combo.currentIndexChanged.connect(self._on_target_mode_changed)
         self.motion_mode_combo.currentIndexChanged.connect(self._on_motion_mode_changed)
-        self.keypoints_table.itemSelectionChanged.connect(self._on_table_selection_changed)
-        self.keypoints_table.itemDoubleClicked.connect(self._on_table_item_double_clicked)
+        self.keypoints_table.selectionModel().selectionChanged.connect(self._on_table_selection_changed)
+        self.keypoints_table.doubleClicked.connect(self._on_table_item_double_clicked)
         self.btn_program_settings.clicked.connect(self.programSettingsRequested.emit)
 
     def _emit_selection_changed(self) -> None:
@@ -193,12 +172,8 @@ class ProgramKeypointsWidget(QWidget):
         self.btn_delete.setEnabled(has_selection and not is_locked)
         self.btn_program_settings.setEnabled(self._has_program)
 
-    _LOCKED_ROLES = frozenset({"HOME_START", "HOME_END", "APPROACH", "RETRACT", "EXTERNAL_SETUP"})
-
     def _is_row_locked(self, row: int) -> bool:
-        if row < 0 or row >= len(self._row_roles):
-            return False
-        return self._row_roles[row] in self._LOCKED_ROLES
+        return self.keypoints_model.is_row_locked(row)
 
     def _on_cartesian_display_frame_changed(self, _index: int) -> None:
         self.cartesianDisplayFrameChanged.emit(self.get_cartesian_display_frame())
@@ -267,13 +242,13 @@ class ProgramKeypointsWidget(QWidget):
         if row is not None:
             self.delete_requested.emit()
 
-    def _on_table_selection_changed(self) -> None:
+    def _on_table_selection_changed(self, *_args) -> None:
         self._update_buttons_state()
         self._emit_selection_changed()
 
-    def _on_table_item_double_clicked(self, item: QTableWidgetItem) -> None:
-        row = item.row()
-        if row < 0 or row >= len(self._keypoints):
+    def _on_table_item_double_clicked(self, index: QModelIndex) -> None:
+        row = index.row()
+        if row < 0 or row >= self.keypoints_model.rowCount():
             return
         self.edit_requested.emit(row)
         self.keypointSelectionChanged.emit(row)
@@ -287,88 +262,16 @@ class ProgramKeypointsWidget(QWidget):
             return None
         return indexes[0].row()
 
-    @staticmethod
-    def _keypoint_target_values(keypoint: TrajectoryKeypoint) -> list[float]:
-        if keypoint.target_type == KeypointTargetType.CARTESIAN:
-            return keypoint.cartesian_target.to_list()
-        return keypoint.joint_target.to_list()
-
-    @staticmethod
-    def _speed_text(keypoint: TrajectoryKeypoint) -> str:
-        if keypoint.mode == KeypointMotionMode.PTP:
-            return f"{keypoint.speed:.1f} %"
-        return f"{keypoint.speed:.3f} m/s"
-
-    @staticmethod
-    def _mode_text(keypoint: TrajectoryKeypoint) -> str:
-        if keypoint.mode == KeypointMotionMode.BEZIER:
-            return "Bézier"
-        if keypoint.mode == KeypointMotionMode.LINEAR:
-            return "LIN"
-        return keypoint.mode.value
-
     def _refresh_table(self) -> None:
-        self.keypoints_table.setRowCount(0)
-        for idx, keypoint in enumerate(self._keypoints):
-            self.keypoints_table.insertRow(idx)
-            target_values = self._keypoint_target_values(keypoint)
-
-            cible_override = self._row_cible_overrides[idx] if idx < len(self._row_cible_overrides) else None
-            cible_text = cible_override if cible_override is not None else (
-                "CARTESIAN" if keypoint.target_type == KeypointTargetType.CARTESIAN else "JOINT"
-            )
-            approx_text = self._row_approx_texts[idx] if idx < len(self._row_approx_texts) else ""
-
-            values = [
-                cible_text,
-                self._mode_text(keypoint),
-                self._speed_text(keypoint),
-            ]
-            values.extend(f"{v:.3f}" for v in target_values[:6])
-            values.append(approx_text)
-
-            ext_vals = self._ext_axis_values_per_row[idx] if idx < len(self._ext_axis_values_per_row) else ()
-            for col_idx in range(len(self._ext_axis_col_headers)):
-                v = ext_vals[col_idx] if col_idx < len(ext_vals) else float("nan")
-                values.append("" if v != v else f"{v:.3f}")  # nan check
-
-            for col, text in enumerate(values):
-                self.keypoints_table.setItem(idx, col, QTableWidgetItem(text))
-
-            if self._is_row_locked(idx):
-                gray = QBrush(QColor(180, 180, 180))
-                for col in range(self.keypoints_table.columnCount()):
-                    item = self.keypoints_table.item(idx, col)
-                    if item is not None:
-                        item.setForeground(gray)
-
         self._update_buttons_state()
 
     def set_keypoints(self, keypoints: list[TrajectoryKeypoint]) -> None:
-        self._keypoints = [keypoint.clone() for keypoint in keypoints]
-        n = len(self._keypoints)
-        if len(self._row_roles) != n:
-            self._row_roles = ["NORMAL"] * n
-        if len(self._row_approx_texts) != n:
-            self._row_approx_texts = [""] * n
-        if len(self._row_cible_overrides) != n:
-            self._row_cible_overrides = [None] * n
+        self.keypoints_model.set_keypoints(keypoints)
         self._refresh_table()
         self._emit_selection_changed()
 
     def setup_external_axes_columns(self, col_headers: list[str]) -> None:
-        self._ext_axis_col_headers = list(col_headers)
-        total = 10 + len(col_headers)
-        self.keypoints_table.setColumnCount(total)
-        base_labels = [
-            "Cible", "Mode", "Vitesse",
-            "J1 / X", "J2 / Y", "J3 / Z", "J4 / A", "J5 / B", "J6 / C",
-            "Approx",
-        ]
-        self.keypoints_table.setHorizontalHeaderLabels(base_labels + col_headers)
-        header = self.keypoints_table.horizontalHeader()
-        for col in range(total):
-            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self.keypoints_model.set_external_axis_headers(col_headers)
 
     def set_row_metadata(
         self,
@@ -377,63 +280,29 @@ class ProgramKeypointsWidget(QWidget):
         cible_overrides: list[str | None],
         ext_axis_values_per_row: list[tuple[float, ...]] | None = None,
     ) -> None:
-        self._row_roles = list(roles)
-        self._row_approx_texts = list(approx_texts)
-        self._row_cible_overrides = list(cible_overrides)
-        self._ext_axis_values_per_row = list(ext_axis_values_per_row) if ext_axis_values_per_row is not None else []
-        self._apply_row_metadata()
+        self.keypoints_model.set_row_metadata(
+            roles,
+            approx_texts,
+            cible_overrides,
+            list(ext_axis_values_per_row) if ext_axis_values_per_row is not None else [],
+        )
         self._update_buttons_state()
 
-    def _apply_row_metadata(self) -> None:
-        gray = QBrush(QColor(180, 180, 180))
-        default_fg = QBrush(QColor(0, 0, 0, 0))
-        for row in range(self.keypoints_table.rowCount()):
-            cible_override = self._row_cible_overrides[row] if row < len(self._row_cible_overrides) else None
-            approx_text = self._row_approx_texts[row] if row < len(self._row_approx_texts) else ""
-            locked = self._is_row_locked(row)
-
-            if cible_override is not None:
-                item = self.keypoints_table.item(row, 0)
-                if item is not None:
-                    item.setText(cible_override)
-
-            approx_item = self.keypoints_table.item(row, 9)
-            if approx_item is not None:
-                approx_item.setText(approx_text)
-            else:
-                self.keypoints_table.setItem(row, 9, QTableWidgetItem(approx_text))
-
-            ext_vals = self._ext_axis_values_per_row[row] if row < len(self._ext_axis_values_per_row) else ()
-            for col_idx in range(len(self._ext_axis_col_headers)):
-                col = 10 + col_idx
-                v = ext_vals[col_idx] if col_idx < len(ext_vals) else float("nan")
-                text = "" if v != v else f"{v:.3f}"
-                item = self.keypoints_table.item(row, col)
-                if item is not None:
-                    item.setText(text)
-                else:
-                    self.keypoints_table.setItem(row, col, QTableWidgetItem(text))
-
-            brush = gray if locked else default_fg
-            for col in range(self.keypoints_table.columnCount()):
-                item = self.keypoints_table.item(row, col)
-                if item is not None:
-                    item.setForeground(brush)
-
     def set_program_loaded(self, loaded: bool) -> None:
         self._has_program = bool(loaded)
         self._update_buttons_state()
 
     def get_keypoints(self) -> list[TrajectoryKeypoint]:
-        return [keypoint.clone() for keypoint in self._keypoints]
+        return [keypoint.clone() for keypoint in self.keypoints_model.keypoints()]
 
     def clear(self) -> None:
-        self._keypoints = []
+        self.keypoints_model.set_keypoints([])
         self._refresh_table()
 
     def select_row(self, row: int) -> None:
-        if 0 <= row < self.keypoints_table.rowCount():
+        if 0 <= row < self.keypoints_model.rowCount():
             self.keypoints_table.selectRow(row)
+            self.keypoints_table.scrollTo(self.keypoints_model.index(row, 0))
 
     def set_target_mode_enabled(self, enabled: bool) -> None:
         index_compensated = self.target_mode_combo.findData("COMPENSATED")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+
+from utils.reachability_map import (
+    ReachabilityGridSpec,
+    ReachabilityKinematics,
+    ReachabilityMap,
+    load_or_build_reachability_map,
+)
+
+
+class _ReachabilityDispatchProxy(QObject):
+    dispatch = pyqtSignal(object, object)
+
+
+class ReachabilityMapWorker(QObject):
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+    progress = pyqtSignal(str, int, int)
+
+    @pyqtSlot(object, object)
+    def process(self, kinematics: ReachabilityKinematics, spec: ReachabilityGridSpec) -> None:
+        robot_hash = kinematics.robot_hash
+        try:
+            grid_map = load_or_build_reachability_map(
+                kinematics,
+                spec,
+                progress=lambda done, total: self.progress.emit(robot_hash, done, total),
+            )
+        except Exception as exc:
+            self.failed.emit(robot_hash, str(exc))
+            return
+        self.loaded.emit(robot_hash, grid_map)
+
+
+class ReachabilityMapLoader(QObject):
+    """Calcul (ou relecture du cache disque) de la carte d'atteignabilité hors thread GUI."""
+
+    map_loaded = pyqtSignal(object)
+    map_failed = pyqtSignal(str)
+    progress_changed = pyqtSignal(int, int)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._thread = QThread(self)
+        self._worker = ReachabilityMapWorker()
+        self._dispatcher = _ReachabilityDispatchProxy(self)
+        self._worker.moveToThread(self._thread)
+        self._dispatcher.dispatch.connect(self._worker.process)
+        self._worker.loaded.connect(self._on_worker_loaded)
+        self._worker.failed.connect(self._on_worker_failed)
+        self._worker.progress.connect(self._on_worker_progress)
+        self._thread.start()
+        self._pending_hash: str | None = None
+        self._shutdown_requested = False
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def is_pending(self) -> bool:
+        return self._pending_hash is not None
+
+    def request(self, kinematics: ReachabilityKinematics, spec: ReachabilityGridSpec | None = None) -> None:
+        """Demande la carte de `kinematics` ; seule la dernière demande est publiée."""
+        if self._shutdown_requested or kinematics.robot_hash == self._pending_hash:
+            return
+        self._pending_hash = kinematics.robot_hash
+        self._dispatcher.dispatch.emit(kinematics, spec if spec is not None else ReachabilityGridSpec())
+
+    def shutdown(self) -> None:
+        if self._shutdown_requested:
+            return
+        self._shutdown_requested = True
+        self._thread.quit()
+        self._thread.wait()
+
+    def _on_worker_loaded(self, robot_hash: str, grid_map: ReachabilityMap) -> None:
+        if robot_hash != self._pending_hash:
+            return
+        self._pending_hash = None
+        self.map_loaded.emit(grid_map)
+
+    def _on_worker_failed(self, robot_hash: str, message: str) -> None:
+        if robot_hash != self._pending_hash:
+            return
+        self._pending_hash = None
+        self.map_failed.emit(message)
+
+    def _on_worker_progress(self, robot_hash: str, done: int, total: int) -> None:
+        if robot_hash == self._pending_hash:
+            self.progress_changed.emit(done, total)
+
+
+__all__ = [
+    "ReachabilityMapLoader",
+    "ReachabilityMapWorker",
+]
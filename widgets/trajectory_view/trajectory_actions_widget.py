@@ -11,6 +11,7 @@ class TrajectoryActionsWidget(QWidget):
     stop_requested = pyqtSignal()
     home_position_requested = pyqtSignal()
     export_trajectory_requested = pyqtSignal()
+    import_trajectory_requested = pyqtSignal()
     reverse_toggled = pyqtSignal(bool)
     loop_toggled = pyqtSignal(bool)
     time_value_changed = pyqtSignal(float)
@@ -28,7 +29,10 @@ class TrajectoryActionsWidget(QWidget):
         self.btn_play = QPushButton("Démarrer")
         self.btn_pause = QPushButton("Pause")
         self.btn_stop = QPushButton("Stop")
-        self.btn_export_trajectory = QPushButton("Exporter trajectoire CSV")
+        self.btn_export_trajectory = QPushButton("Exporter trajectoire")
+        self.btn_import_trajectory = QPushButton("Importer résultats")
+        self.btn_export_trajectory.setToolTip("CSV (texte) ou NPZ (colonnes binaires, réimportable sans recalcul)")
+        self.btn_import_trajectory.setToolTip("Recharge une archive NPZ de trajectoire ou de simulation programme")
 
         # Keep these options in code, but hide them from UI for now.
         self.cb_reverse = QCheckBox("Inverser à la fin")
@@ -58,6 +62,7 @@ class TrajectoryActionsWidget(QWidget):
         row_actions.addWidget(self.btn_pause)
         row_actions.addWidget(self.btn_stop)
         row_actions.addWidget(self.btn_export_trajectory)
+        row_actions.addWidget(self.btn_import_trajectory)
         row_actions.addStretch()
 
         row_timeline = QHBoxLayout()
@@ -82,6 +87,7 @@ class TrajectoryActionsWidget(QWidget):
     def _setup_connections(self) -> None:
         self.btn_compute.clicked.connect(self.compute_requested.emit)
         self.btn_export_trajectory.clicked.connect(self.export_trajectory_requested.emit)
+        self.btn_import_trajectory.clicked.connect(self.import_trajectory_requested.emit)
         self.btn_home.clicked.connect(self.home_position_requested.emit)
         self.btn_play.clicked.connect(self.play_requested.emit)
         self.btn_pause.clicked.connect(self.pause_requested.emit)
@@ -147,6 +153,7 @@ class TrajectoryActionsWidget(QWidget):
         playback_enabled = editing_enabled and not self._analysis_pending
         self.btn_compute.setEnabled(editing_enabled)
         self.btn_export_trajectory.setEnabled(playback_enabled)
+        self.btn_import_trajectory.setEnabled(editing_enabled)
         self.btn_home.setEnabled(editing_enabled)
         self.btn_play.setEnabled(playback_enabled)
         self.btn_pause.setEnabled(playback_enabled)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QDoubleSpinBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+import pyqtgraph as pg
+
+
+class TrajectoryClearanceGraphWidget(QWidget):
+    """Minimum clearance to obstacles along the trajectory, with a safety margin line."""
+
+    TIME_LABEL = "Temps"
+    TITLE = "Distance minimale aux obstacles"
+    CLEARANCE_COLOR = "#38bdf8"
+    BELOW_MARGIN_COLOR = "#ef4444"
+    MARGIN_COLOR = "#f59e0b"
+    DEFAULT_MARGIN_MM = 10.0
+
+    safetyMarginChanged = pyqtSignal(float)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.title_label = QLabel(self.TITLE)
+        self.margin_spin = QDoubleSpinBox()
+        self.min_clearance_label = QLabel()
+        self.plot = pg.PlotWidget()
+        self._clearance_item: Optional[pg.PlotDataItem] = None
+        self._below_margin_item: Optional[pg.PlotDataItem] = None
+        self._margin_line: Optional[pg.InfiniteLine] = None
+        self._key_time_lines: list[pg.InfiniteLine] = []
+        self._time_indicator_line: Optional[pg.InfiniteLine] = None
+        self._times: list[float] = []
+        self._clearances_mm: list[float] = []
+        self._setup_ui()
+        self._setup_plot()
+
+    def _setup_ui(self) -> None:
+        layout = QVBoxLayout(self)
+        header = QHBoxLayout()
+        self.title_label.setStyleSheet("font-size: 12px; font-weight: bold;")
+        header.addWidget(self.title_label)
+        header.addStretch()
+        header.addWidget(self.min_clearance_label)
+        header.addSpacing(12)
+        header.addWidget(QLabel("Marge de securite (mm)"))
+        self.margin_spin.setRange(0.0, 10000.0)
+        self.margin_spin.setDecimals(1)
+        self.margin_spin.setSingleStep(1.0)
+        self.margin_spin.setKeyboardTracking(False)
+        self.margin_spin.setValue(self.DEFAULT_MARGIN_MM)
+        self.margin_spin.valueChanged.connect(self._on_margin_changed)
+        header.addWidget(self.margin_spin)
+        layout.addLayout(header)
+        layout.addWidget(self.plot)
+
+    def _setup_plot(self) -> None:
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setLabel("bottom", f"{self.TIME_LABEL} (s)")
+        self.plot.setLabel("left", "Distance (mm)")
+        self._clearance_item = self.plot.plot([], [], pen=pg.mkPen(color=self.CLEARANCE_COLOR, width=2), connect="finite")
+        self._below_margin_item = self.plot.plot(
+            [],
+            [],
+            pen=pg.mkPen(color=self.BELOW_MARGIN_COLOR, width=3),
+            connect="finite",
+        )
+        self._margin_line = pg.InfiniteLine(
+            pos=self.get_safety_margin_mm(),
+            angle=0,
+            pen=pg.mkPen(color=self.MARGIN_COLOR, width=1, style=Qt.PenStyle.DashLine),
+        )
+        self.plot.addItem(self._margin_line)
+        self._refresh_min_clearance_label()
+
+    def get_safety_margin_mm(self) -> float:
+        return float(self.margin_spin.value())
+
+    def set_safety_margin_mm(self, margin_mm: float) -> None:
+        self.margin_spin.setValue(max(0.0, float(margin_mm)))
+
+    def clear(self) -> None:
+        self.set_clearance_data([], [])
+        self.set_key_times([])
+        self.set_time_indicator(None)
+
+    def set_clearance_data(self, time_s: List[float], clearances_mm: List[float | None]) -> None:
+        count = min(len(time_s), len(clearances_mm))
+        self._times = [float(value) for value in time_s[:count]]
+        self._clearances_mm = [math.nan if value is None else float(value) for value in clearances_mm[:count]]
+        self._refresh_curves()
+        if self._times:
+            min_x = min(0.0, self._times[0])
+            max_x = max(self._times[-1], min_x + 1e-6)
+            self.plot.setXRange(min_x, max_x, padding=0.02)
+
+    def set_key_times(self, times: List[float]) -> None:
+        for line in self._key_time_lines:
+            self.plot.removeItem(line)
+        self._key_time_lines = []
+
+        for value in times:
+            line = pg.InfiniteLine(
+                pos=float(value),
+                angle=90,
+                pen=pg.mkPen(color="#808080", width=1, style=Qt.PenStyle.DashLine),
+            )
+            self.plot.addItem(line)
+            self._key_time_lines.append(line)
+
+    def set_time_indicator(self, time_s: Optional[float]) -> None:
+        line = self._time_indicator_line
+        if time_s is None:
+            if line is not None:
+                self.plot.removeItem(line)
+            self._time_indicator_line = None
+            return
+
+        if line is None:
+            line = pg.InfiniteLine(pos=float(time_s), angle=90, pen=pg.mkPen(color="#ff3b30", width=2))
+            self.plot.addItem(line)
+            self._time_indicator_line = line
+            return
+
+        line.setValue(float(time_s))
+
+    def _on_margin_changed(self, value: float) -> None:
+        if self._margin_line is not None:
+            self._margin_line.setValue(float(value))
+        self._refresh_curves()
+        self.safetyMarginChanged.emit(float(value))
+
+    def _refresh_curves(self) -> None:
+        margin_mm = self.get_safety_margin_mm()
+        below_margin = [
+            value if not math.isnan(value) and value < margin_mm else math.nan
+            for value in self._clearances_mm
+        ]
+        if self._clearance_item is not None:
+            self._clearance_item.setData(self._times, self._clearances_mm, connect="finite")
+        if self._below_margin_item is not None:
+            self._below_margin_item.setData(self._times, below_margin, connect="finite")
+        self._refresh_min_clearance_label()
+
+    def _refresh_min_clearance_label(self) -> None:
+        finite_values = [value for value in self._clearances_mm if not math.isnan(value)]
+        if not finite_values:
+            self.min_clearance_label.setText("Min : n/a")
+            return
+        self.min_clearance_label.setText(f"Min : {min(finite_values):.1f} mm")
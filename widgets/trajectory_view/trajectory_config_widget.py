@@ -26,6 +26,7 @@ from PyQt6.QtWidgets import (
 
 import utils.math_utils as math_utils
 from utils.trajectory_keypoint_utils import resolve_keypoint_xyz
+from utils.reachability_map import ReachabilityMap
 from models.trajectory_keypoint import (
     ConfigurationPolicy,
     KeypointMotionMode,
@@ -58,11 +59,15 @@ class TrajectoryConfigWidget(QWidget):
     showRobotGhostRequested = pyqtSignal()
     hideRobotGhostRequested = pyqtSignal()
     updateRobotGhostRequested = pyqtSignal(object)
+    reachabilityMapRequested = pyqtSignal()
+    reachabilityHeatmapToggled = pyqtSignal(bool)
     goToRequested = pyqtSignal(int)
     timeSmoothingChanged = pyqtSignal(bool)
     cartesianDynamicsChanged = pyqtSignal()
     cartesianDisplayFrameChanged = pyqtSignal(str)
     jerkCheckChanged = pyqtSignal(bool)
+    timeOptimalChanged = pyqtSignal(bool)
+    adaptiveSamplingChanged = pyqtSignal(bool)
 
     def __init__(
         self,
@@ -88,6 +93,8 @@ class TrajectoryConfigWidget(QWidget):
         self.btn_delete_all = QPushButton("Tout supprimer")
         self.cb_smooth_time = QCheckBox("Lisser le temps")
         self.cb_check_jerk = QCheckBox("Vérif. jerk")
+        self.cb_time_optimal = QCheckBox("Temps optimal")
+        self.cb_adaptive_sampling = QCheckBox("Échant. adaptatif")
         self.cartesian_accel_spin = QDoubleSpinBox()
         self.cartesian_jerk_spin = QDoubleSpinBox()
         self.cartesian_display_frame_combo = QComboBox()
@@ -101,6 +108,16 @@ class TrajectoryConfigWidget(QWidget):
             "Active : signale les dépassements de jerk. "
             "Désactivé : conserve les controles vitesse et accéleration."
         )
+        self.cb_time_optimal.setChecked(False)
+        self.cb_time_optimal.setToolTip(
+            "Active : cadence les segments cartésiens au plus vite sous les limites "
+            "vitesse/accélération/jerk des axes. Désactivé : limites cartésiennes."
+        )
+        self.cb_adaptive_sampling.setChecked(False)
+        self.cb_adaptive_sampling.setToolTip(
+            "Active : échantillons resserrés seulement là où la trajectoire l'exige, "
+            "le reste est interpolé (export CSV toujours au pas fixe). Désactivé : pas fixe."
+        )
         self.cartesian_accel_spin.setRange(1.0, 1_000_000.0)
         self.cartesian_accel_spin.setDecimals(1)
         self.cartesian_accel_spin.setSingleStep(100.0)
@@ -120,6 +137,8 @@ class TrajectoryConfigWidget(QWidget):
         self._active_dialog_row: int | None = None
         self._is_editing_active = False
         self._trajectory_context: TrajectoryResult | None = None
+        self._reachability_map: ReachabilityMap | None = None
+        self._reachability_progress: tuple[int, int] | None = None
         self._last_emitted_cartesian_accel_limit_mm_s2 = self.get_cartesian_accel_limit_mm_s2()
         self._last_emitted_cartesian_jerk_limit_mm_s3 = self.get_cartesian_jerk_limit_mm_s3()
 
@@ -138,6 +157,8 @@ class TrajectoryConfigWidget(QWidget):
 
         options_row = QHBoxLayout()
         options_row.addWidget(self.cb_check_jerk)
+        options_row.addWidget(self.cb_time_optimal)
+        options_row.addWidget(self.cb_adaptive_sampling)
         options_row.addSpacing(12)
         options_row.addWidget(QLabel("Accel cart."))
         options_row.addWidget(self.cartesian_accel_spin)
@@ -194,6 +215,8 @@ class TrajectoryConfigWidget(QWidget):
         self.btn_export.clicked.connect(self._on_export_clicked)
         self.cb_smooth_time.toggled.connect(self._on_time_smoothing_toggled)
         self.cb_check_jerk.toggled.connect(self._on_jerk_check_toggled)
+        self.cb_time_optimal.toggled.connect(self._on_time_optimal_toggled)
+        self.cb_adaptive_sampling.toggled.connect(self._on_adaptive_sampling_toggled)
         self.cartesian_accel_spin.editingFinished.connect(self._on_cartesian_dynamics_editing_finished)
         self.cartesian_jerk_spin.editingFinished.connect(self._on_cartesian_dynamics_editing_finished)
         self.cartesian_display_frame_combo.currentIndexChanged.connect(self._on_cartesian_display_frame_changed)
@@ -211,6 +234,8 @@ class TrajectoryConfigWidget(QWidget):
         self.keypoints_table.setEnabled(not active)
         self.cb_smooth_time.setEnabled(not active)
         self.cb_check_jerk.setEnabled(not active)
+        self.cb_time_optimal.setEnabled(not active)
+        self.cb_adaptive_sampling.setEnabled(not active)
         self.cartesian_accel_spin.setEnabled(not active)
         self.cartesian_jerk_spin.setEnabled(not active)
         self._update_buttons_state()
@@ -221,6 +246,12 @@ class TrajectoryConfigWidget(QWidget):
     def _on_jerk_check_toggled(self, checked: bool) -> None:
         self.jerkCheckChanged.emit(bool(checked))
 
+    def _on_time_optimal_toggled(self, checked: bool) -> None:
+        self.timeOptimalChanged.emit(bool(checked))
+
+    def _on_adaptive_sampling_toggled(self, checked: bool) -> None:
+        self.adaptiveSamplingChanged.emit(bool(checked))
+
     def _remember_cartesian_dynamic_limits(self) -> None:
         self._last_emitted_cartesian_accel_limit_mm_s2 = self.get_cartesian_accel_limit_mm_s2()
         self._last_emitted_cartesian_jerk_limit_mm_s3 = self.get_cartesian_jerk_limit_mm_s3()
@@ -246,6 +277,12 @@ class TrajectoryConfigWidget(QWidget):
     def is_jerk_check_enabled(self) -> bool:
         return self.cb_check_jerk.isChecked()
 
+    def is_time_optimal_enabled(self) -> bool:
+        return self.cb_time_optimal.isChecked()
+
+    def is_adaptive_sampling_enabled(self) -> bool:
+        return self.cb_adaptive_sampling.isChecked()
+
     def get_cartesian_accel_limit_mm_s2(self) -> float:
         return float(self.cartesian_accel_spin.value())
 
@@ -296,6 +333,20 @@ class TrajectoryConfigWidget(QWidget):
         if emit_signal:
             self.jerkCheckChanged.emit(self.cb_check_jerk.isChecked())
 
+    def set_time_optimal_enabled(self, enabled: bool, emit_signal: bool = False) -> None:
+        self.cb_time_optimal.blockSignals(True)
+        self.cb_time_optimal.setChecked(bool(enabled))
+        self.cb_time_optimal.blockSignals(False)
+        if emit_signal:
+            self.timeOptimalChanged.emit(self.cb_time_optimal.isChecked())
+
+    def set_adaptive_sampling_enabled(self, enabled: bool, emit_signal: bool = False) -> None:
+        self.cb_adaptive_sampling.blockSignals(True)
+        self.cb_adaptive_sampling.setChecked(bool(enabled))
+        self.cb_adaptive_sampling.blockSignals(False)
+        if emit_signal:
+            self.adaptiveSamplingChanged.emit(self.cb_adaptive_sampling.isChecked())
+
     def _update_buttons_state(self) -> None:
         if self._is_editing_active:
             self.btn_add.setEnabled(False)
@@ -435,6 +486,20 @@ class TrajectoryConfigWidget(QWidget):
         keypoint.bezier_vectors[0] = (-previous_end_tangent).normalized()
         keypoint.bezier_amplitudes_mm[0] = amplitude_mm
 
+    def get_reachability_map(self) -> ReachabilityMap | None:
+        return self._reachability_map
+
+    def set_reachability_map(self, grid_map: ReachabilityMap | None) -> None:
+        self._reachability_map = grid_map
+        self._reachability_progress = None
+        if self._active_dialog is not None:
+            self._active_dialog.set_reachability_map(grid_map)
+
+    def set_reachability_progress(self, done: int, total: int) -> None:
+        self._reachability_progress = (done, total)
+        if self._active_dialog is not None:
+            self._active_dialog.set_reachability_progress(done, total)
+
     def _focus_active_dialog(self) -> bool:
         if self._active_dialog is None:
             return False
@@ -462,6 +527,11 @@ class TrajectoryConfigWidget(QWidget):
         self.showRobotGhostRequested.emit()
 
         dialog.updateRobotGhostRequested.connect(self.updateRobotGhostRequested.emit)
+        dialog.reachabilityMapRequested.connect(self.reachabilityMapRequested.emit)
+        dialog.reachabilityHeatmapToggled.connect(self.reachabilityHeatmapToggled.emit)
+        dialog.set_reachability_map(self._reachability_map)
+        if self._reachability_progress is not None:
+            dialog.set_reachability_progress(*self._reachability_progress)
         dialog.previewKeypointChanged.connect(self._on_active_dialog_preview_keypoint_changed)
         dialog.finished.connect(self._on_active_dialog_finished)
         dialog.set_keypoint_context(self.get_keypoints(), preview_index, self._trajectory_context)
@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QWIDGETSIZE_MAX
 from PyQt6.QtCore import Qt
 import pyqtgraph as pg
 from enum import Enum
 
+from utils.plot_decimation import DEFAULT_MAX_POINTS, minmax_decimation_indices, visible_index_range
+
 class GraphMode(Enum):
     CARTESIAN = 0
     ARTICULAR = 1
@@ -25,6 +28,7 @@ class TrajectoryGraphPanelWidget(QWidget):
     PANEL_MIN_HEIGHT_PX = 180
     PANEL_HEADER_HEIGHT_PX = 92
     PANEL_PLOT_HEIGHT_PX = 170
+    MAX_POINTS_PER_CURVE = DEFAULT_MAX_POINTS
 
     AXIS_COLORS = ["#ff3b30", "#34c759", "#007aff", "#ff00ff", "#ffd60a", "#00ffff"]
     AXIS_LABELS = {
@@ -56,13 +60,10 @@ class TrajectoryGraphPanelWidget(QWidget):
         self._plots = [self.position_plot, self.velocity_plot, self.acceleration_plot, self.jerk_plot]
         self._plot_items: List[List[pg.PlotDataItem]] = []
         self._axis_pens = [pg.mkPen(color=color, width=2) for color in self.AXIS_COLORS]
-        self._plot_data: List[List[List[float]]] = [
-            [[] for _ in range(6)],
-            [[] for _ in range(6)],
-            [[] for _ in range(6)],
-            [[] for _ in range(6)],
-        ]
-        self._time_data: List[List[float]] = [[], [], [], []]
+        # Séries (6, N) contiguës et temps (N,) par graphe : tracées par enveloppe min/max de la plage visible.
+        self._plot_data: List[np.ndarray] = [np.zeros((6, 0)) for _ in range(4)]
+        self._time_data: List[np.ndarray] = [np.zeros(0) for _ in range(4)]
+        self._drawn_windows: List[Optional[tuple[int, int]]] = [None, None, None, None]
         self._key_times: List[float] = []
         self._key_time_lines: List[List[pg.InfiniteLine]] = [[], [], [], []]
         self._time_indicator_lines: List[Optional[pg.InfiniteLine]] = [None, None, None, None]
@@ -141,12 +142,15 @@ class TrajectoryGraphPanelWidget(QWidget):
             plot.setTitle(title)
             plot.setLabel("bottom", TrajectoryGraphPanelWidget.lblWithUnit(self.TIME_LBL, "s"))
 
-        for plot in self._plots:
+        for plot_idx, plot in enumerate(self._plots):
             items = []
             for _color in self.AXIS_COLORS:
                 item = plot.plot([], [])
                 items.append(item)
             self._plot_items.append(items)
+            plot.getViewBox().sigXRangeChanged.connect(
+                lambda _view_box, _x_range, idx=plot_idx: self._on_x_range_changed(idx)
+            )
 
     def set_mode(self, mode: GraphMode) -> None:
         if mode not in self.AXIS_LABELS:
@@ -174,12 +178,13 @@ class TrajectoryGraphPanelWidget(QWidget):
 
     def set_trajectories(
         self,
-        time_s: List[float],
-        positions: Optional[List[List[float]]] = None,
-        velocities: Optional[List[List[float]]] = None,
-        accelerations: Optional[List[List[float]]] = None,
-        jerks: Optional[List[List[float]]] = None,
+        time_s: Sequence[float] | np.ndarray,
+        positions: Optional[Sequence[Sequence[float]] | np.ndarray] = None,
+        velocities: Optional[Sequence[Sequence[float]] | np.ndarray] = None,
+        accelerations: Optional[Sequence[Sequence[float]] | np.ndarray] = None,
+        jerks: Optional[Sequence[Sequence[float]] | np.ndarray] = None,
     ) -> None:
+        """Séries par axe, de préférence en tableaux (6, N) : aucune copie s'ils sont déjà contigus en float64."""
         if positions is not None:
             self._set_plot_data(0, time_s, positions)
         if velocities is not None:
@@ -273,26 +278,49 @@ class TrajectoryGraphPanelWidget(QWidget):
             else:
                 self._plot_time_indicator_dirty[idx] = True
 
-    def _set_plot_data(self, plot_idx: int, time_s: List[float], series: List[List[float]]) -> None:
-        if len(series) < 6:
+    def _set_plot_data(
+        self,
+        plot_idx: int,
+        time_s: Sequence[float] | np.ndarray,
+        series: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        values = np.asarray(series, dtype=float)
+        if values.ndim != 2 or values.shape[0] < 6:
             return
-        self._time_data[plot_idx] = list(time_s)
-        self._plot_data[plot_idx] = [list(values) for values in series[:6]]
+        times = np.asarray(time_s, dtype=float).reshape(-1)
+        count = min(len(times), values.shape[1])
+        self._time_data[plot_idx] = np.ascontiguousarray(times[:count])
+        self._plot_data[plot_idx] = np.ascontiguousarray(values[:6, :count])
         self._plot_range_dirty[plot_idx] = True
+        self._plot_data_dirty[plot_idx] = True
         if not self._plot_visible[plot_idx]:
-            self._plot_data_dirty[plot_idx] = True
             return
-        self._refresh_plot_items(plot_idx)
+        # La plage X est posée d'abord : la décimation porte sur la fenêtre réellement affichée.
         self._update_ranges(plot_idx)
+        self._refresh_plot_items(plot_idx)
+
+    def _visible_window(self, plot_idx: int) -> tuple[int, int]:
+        x_min, x_max = self._plots[plot_idx].getViewBox().viewRange()[0]
+        return visible_index_range(self._time_data[plot_idx], x_min, x_max)
+
+    def _on_x_range_changed(self, plot_idx: int) -> None:
+        if not self._plot_visible[plot_idx] or self._plot_data_dirty[plot_idx]:
+            return
+        if self._visible_window(plot_idx) != self._drawn_windows[plot_idx]:
+            self._refresh_plot_items(plot_idx)
 
     def _refresh_plot_items(self, plot_idx: int) -> None:
         time_s = self._time_data[plot_idx]
+        series = self._plot_data[plot_idx]
+        start, stop = self._visible_window(plot_idx)
         for axis in range(6):
+            indices = minmax_decimation_indices(series[axis], start, stop, self.MAX_POINTS_PER_CURVE)
             self._plot_items[plot_idx][axis].setData(
-                time_s,
-                self._plot_data[plot_idx][axis],
+                time_s[indices],
+                series[axis][indices],
                 **self._display_kwargs(axis),
             )
+        self._drawn_windows[plot_idx] = (start, stop)
         self._plot_data_dirty[plot_idx] = False
 
     def _display_kwargs(self, axis: int) -> dict:
@@ -363,8 +391,8 @@ class TrajectoryGraphPanelWidget(QWidget):
             return
 
         time_s = self._time_data[plot_idx]
-        if time_s:
-            self._plots[plot_idx].setXRange(min(time_s), max(time_s), padding=0.02)
+        if len(time_s):
+            self._plots[plot_idx].setXRange(float(time_s[0]), float(time_s[-1]), padding=0.02)
 
         visible_axes = [i for i, cb in enumerate(self.axis_checkboxes) if cb.isChecked()]
         if not visible_axes:
@@ -372,22 +400,15 @@ class TrajectoryGraphPanelWidget(QWidget):
             self._plot_range_dirty[plot_idx] = False
             return
 
-        min_val = None
-        max_val = None
-        for axis in visible_axes:
-            values = self._plot_data[plot_idx][axis]
-            if not values:
-                continue
-            local_min = min(values)
-            local_max = max(values)
-            min_val = local_min if min_val is None else min(min_val, local_min)
-            max_val = local_max if max_val is None else max(max_val, local_max)
-
-        if min_val is None or max_val is None:
+        values = self._plot_data[plot_idx][visible_axes]
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
             self._plots[plot_idx].setYRange(-1.0, 1.0)
             self._plot_range_dirty[plot_idx] = False
             return
 
+        min_val = float(finite.min())
+        max_val = float(finite.max())
         if min_val == max_val:
             min_val -= 1.0
             max_val += 1.0
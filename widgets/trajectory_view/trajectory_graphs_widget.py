@@ -2,12 +2,14 @@ from typing import Optional
 
 from PyQt6.QtWidgets import QCheckBox, QComboBox, QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
+from widgets.trajectory_view.trajectory_clearance_graph_widget import TrajectoryClearanceGraphWidget
 from widgets.trajectory_view.trajectory_config_timeline_widget import TrajectoryConfigTimelineWidget
 from widgets.trajectory_view.trajectory_graph_panel_widget import (
     GraphDisplayMode,
     GraphMode,
     TrajectoryGraphPanelWidget,
 )
+from widgets.trajectory_view.trajectory_singularity_graph_widget import TrajectorySingularityGraphWidget
 
 
 class TrajectoryGraphsWidget(QWidget):
@@ -20,6 +22,10 @@ class TrajectoryGraphsWidget(QWidget):
         self.cartesian_panel = TrajectoryGraphPanelWidget(GraphMode.CARTESIAN)
         self.config_timeline = TrajectoryConfigTimelineWidget()
         self.config_timeline.setMinimumHeight(230)
+        self.clearance_graph = TrajectoryClearanceGraphWidget()
+        self.clearance_graph.setMinimumHeight(200)
+        self.singularity_graph = TrajectorySingularityGraphWidget()
+        self.singularity_graph.setMinimumHeight(200)
 
         self.btn_popout = QPushButton("Détacher les graphes")
         self.display_mode_combo = QComboBox()
@@ -67,6 +73,8 @@ class TrajectoryGraphsWidget(QWidget):
 
         layout.addWidget(self._detachable_panels)
         layout.addWidget(self.config_timeline)
+        layout.addWidget(self.clearance_graph)
+        layout.addWidget(self.singularity_graph)
 
     def _setup_connections(self) -> None:
         self.btn_popout.clicked.connect(self._on_popout_clicked)
@@ -162,3 +170,9 @@ class TrajectoryGraphsWidget(QWidget):
 
     def get_configuration_timeline_widget(self) -> TrajectoryConfigTimelineWidget:
         return self.config_timeline
+
+    def get_clearance_graph_widget(self) -> TrajectoryClearanceGraphWidget:
+        return self.clearance_graph
+
+    def get_singularity_graph_widget(self) -> TrajectorySingularityGraphWidget:
+        return self.singularity_graph
@@ -37,6 +37,7 @@ from utils.trajectory_status import (
     join_issue_messages,
 )
 from utils.trajectory_keypoint_utils import resolve_keypoint_xyz
+from utils.reachability_map import ReachabilityMap, robot_configuration_hash
 from models.trajectory_keypoint import (
     ConfigurationPolicy,
     KeypointMotionMode,
@@ -59,6 +60,8 @@ class TrajectoryKeypointDialog(QDialog):
     """Dialog to edit a single trajectory keypoint."""
     updateRobotGhostRequested = pyqtSignal(object)
     previewKeypointChanged = pyqtSignal(object)
+    reachabilityMapRequested = pyqtSignal()
+    reachabilityHeatmapToggled = pyqtSignal(bool)
 
     CONFIG_ORDER = [
         MgiConfigKey.FUN,
@@ -101,6 +104,11 @@ class TrajectoryKeypointDialog(QDialog):
         self.cartesian_target_widget.set_spinbox_keyboard_tracking(False)
         self.joint_target_widget.set_spinbox_keyboard_tracking(False)
         self.cartesian_error_label = QLabel("")
+        self.reachability_label = QLabel("")
+        self.reachability_heatmap_checkbox = QCheckBox("Carte de chaleur")
+        self.reachability_compute_btn = QPushButton("Calculer la carte")
+        self._reachability_map: ReachabilityMap | None = None
+        self._reachability_computing = False
         self.cartesian_solutions_table_left = QTableWidget()
         self.cartesian_solutions_table_right = QTableWidget()
 
@@ -409,6 +417,17 @@ class TrajectoryKeypointDialog(QDialog):
         self.cartesian_error_label.setText("")
         layout.addWidget(self.cartesian_error_label)
 
+        reachability_layout = QHBoxLayout()
+        self.reachability_label.setWordWrap(True)
+        self.reachability_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.reachability_heatmap_checkbox.setToolTip("Affiche dans la vue 3D la part d'orientations atteignables par voxel.")
+        self.reachability_heatmap_checkbox.setEnabled(False)
+        self.reachability_compute_btn.setAutoDefault(False)
+        reachability_layout.addWidget(self.reachability_label, 1)
+        reachability_layout.addWidget(self.reachability_heatmap_checkbox)
+        reachability_layout.addWidget(self.reachability_compute_btn)
+        layout.addLayout(reachability_layout)
+
         group.setLayout(layout)
         return group
 
@@ -465,6 +484,8 @@ class TrajectoryKeypointDialog(QDialog):
         self.cartesian_target_widget.reference_frame_changed.connect(self._on_cartesian_reference_frame_changed)
         self.robot_model.cartesian_slider_limits_changed.connect(self._on_cartesian_limits_context_changed)
         self.workspace_model.workspace_changed.connect(self._on_cartesian_limits_context_changed)
+        self.reachability_compute_btn.clicked.connect(self.reachabilityMapRequested.emit)
+        self.reachability_heatmap_checkbox.toggled.connect(self.reachabilityHeatmapToggled.emit)
 
     def _robot_base_pose_world(self):
         return self.workspace_model.get_robot_base_transform_world()
@@ -709,6 +730,7 @@ class TrajectoryKeypointDialog(QDialog):
         self.cartesian_solutions_table_left.setRowCount(0)
         self.cartesian_solutions_table_right.setRowCount(0)
         if self._current_target_type() != KeypointTargetType.CARTESIAN:
+            self._refresh_reachability_hint()
             return
 
         target = self._get_cartesian_target_in_base_frame()
@@ -769,6 +791,62 @@ class TrajectoryKeypointDialog(QDialog):
 
         self.cartesian_solutions_table_left.resizeRowsToContents()
         self.cartesian_solutions_table_right.resizeRowsToContents()
+        self._refresh_reachability_hint()
+
+    # ====================================================================
+    # RÉGION: Carte d'atteignabilité
+    # ====================================================================
+
+    def set_reachability_map(self, grid_map: ReachabilityMap | None) -> None:
+        self._reachability_map = grid_map
+        self._reachability_computing = False
+        self.reachability_compute_btn.setEnabled(True)
+        self.reachability_heatmap_checkbox.setEnabled(grid_map is not None)
+        self._refresh_reachability_hint()
+
+    def set_reachability_progress(self, done: int, total: int) -> None:
+        self._reachability_computing = True
+        self.reachability_compute_btn.setEnabled(False)
+        percent = 100.0 * done / total if total > 0 else 0.0
+        self.reachability_label.setText(f"Carte d'atteignabilité : calcul en cours ({percent:.0f} %)")
+
+    def _current_reachability_map(self) -> ReachabilityMap | None:
+        grid_map = self._reachability_map
+        if grid_map is None:
+            return None
+        # Carte calculée pour une autre cinématique ou un autre outil : ignorée
+        if grid_map.robot_hash != robot_configuration_hash(self.robot_model, self.tool_model.get_tool()):
+            return None
+        return grid_map
+
+    def _refresh_reachability_hint(self) -> None:
+        if self._reachability_computing:
+            return
+        if self._current_target_type() != KeypointTargetType.CARTESIAN:
+            self.reachability_label.setText("")
+            return
+        grid_map = self._current_reachability_map()
+        if grid_map is None:
+            self.reachability_label.setText("Carte d'atteignabilité non calculée pour ce robot et cet outil.")
+            return
+
+        result = grid_map.query(
+            self._get_cartesian_target_in_base_frame(),
+            allowed_configs=set(self.robot_model.get_allowed_configurations()),
+        )
+        if not result.inside_grid:
+            self.reachability_label.setText("Carte : hors de l'enveloppe du robot.")
+            return
+        voxel_ratio = f"{100.0 * result.cell_reachability_ratio:.0f} % des orientations atteignables dans le voxel"
+        if not result.is_reachable:
+            self.reachability_label.setText(f"Carte : orientation non atteignable ({voxel_ratio}).")
+            return
+        configs = ", ".join(key.name for key in result.configurations)
+        self.reachability_label.setText(
+            f"Carte : {len(result.configurations)}/8 config. ({configs}) · "
+            f"manipulabilité {result.manipulability:.2f} · marge axes {100.0 * result.joint_margin:.0f} % · "
+            f"{voxel_ratio}"
+        )
 
     @staticmethod
     def _set_status_label(label: QLabel, title: str, messages: list[str]) -> None:
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QDoubleSpinBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+import pyqtgraph as pg
+
+from utils.singularity_analysis import SingularityKind, SingularityThresholds, singularity_kind_label
+
+
+class TrajectorySingularityGraphWidget(QWidget):
+    """Singularity index along the trajectory, with warning and singular-pass thresholds."""
+
+    TIME_LABEL = "Temps"
+    TITLE = "Proximité des singularités"
+    INDEX_COLOR = "#a78bfa"
+    WARNING_COLOR = "#f59e0b"
+    ERROR_COLOR = "#ef4444"
+
+    thresholdsChanged = pyqtSignal()
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.title_label = QLabel(self.TITLE)
+        self.warning_spin = QDoubleSpinBox()
+        self.error_spin = QDoubleSpinBox()
+        self.min_index_label = QLabel()
+        self.plot = pg.PlotWidget()
+        self._index_item: Optional[pg.PlotDataItem] = None
+        self._warning_item: Optional[pg.PlotDataItem] = None
+        self._error_item: Optional[pg.PlotDataItem] = None
+        self._warning_line: Optional[pg.InfiniteLine] = None
+        self._error_line: Optional[pg.InfiniteLine] = None
+        self._key_time_lines: list[pg.InfiniteLine] = []
+        self._time_indicator_line: Optional[pg.InfiniteLine] = None
+        self._times: list[float] = []
+        self._indices: list[float] = []
+        self._kinds: list[SingularityKind | None] = []
+        self._setup_ui()
+        self._setup_plot()
+
+    def _setup_ui(self) -> None:
+        defaults = SingularityThresholds()
+        layout = QVBoxLayout(self)
+        header = QHBoxLayout()
+        self.title_label.setStyleSheet("font-size: 12px; font-weight: bold;")
+        header.addWidget(self.title_label)
+        header.addStretch()
+        header.addWidget(self.min_index_label)
+        header.addSpacing(12)
+        for label, spin, value in (
+            ("Seuil alerte", self.warning_spin, defaults.warning_index),
+            ("Seuil singulier", self.error_spin, defaults.error_index),
+        ):
+            header.addWidget(QLabel(label))
+            spin.setRange(0.0, 1.0)
+            spin.setDecimals(3)
+            spin.setSingleStep(0.005)
+            spin.setKeyboardTracking(False)
+            spin.setValue(value)
+            spin.valueChanged.connect(self._on_thresholds_changed)
+            header.addWidget(spin)
+        self.setToolTip(
+            "Inverse du conditionnement de la jacobienne au TCP (0 = singulier, 1 = isotrope).\n"
+            "Les passages sous les seuils sont signalés avec le type de singularité le plus proche."
+        )
+        layout.addLayout(header)
+        layout.addWidget(self.plot)
+
+    def _setup_plot(self) -> None:
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setLabel("bottom", f"{self.TIME_LABEL} (s)")
+        self.plot.setLabel("left", "Indice")
+        self._index_item = self.plot.plot([], [], pen=pg.mkPen(color=self.INDEX_COLOR, width=2), connect="finite")
+        self._warning_item = self.plot.plot([], [], pen=pg.mkPen(color=self.WARNING_COLOR, width=3), connect="finite")
+        self._error_item = self.plot.plot([], [], pen=pg.mkPen(color=self.ERROR_COLOR, width=3), connect="finite")
+        thresholds = self.get_thresholds()
+        self._warning_line = pg.InfiniteLine(
+            pos=thresholds.warning_index,
+            angle=0,
+            pen=pg.mkPen(color=self.WARNING_COLOR, width=1, style=Qt.PenStyle.DashLine),
+        )
+        self._error_line = pg.InfiniteLine(
+            pos=thresholds.error_index,
+            angle=0,
+            pen=pg.mkPen(color=self.ERROR_COLOR, width=1, style=Qt.PenStyle.DashLine),
+        )
+        self.plot.addItem(self._warning_line)
+        self.plot.addItem(self._error_line)
+        self._refresh_min_index_label()
+
+    def get_thresholds(self) -> SingularityThresholds:
+        return SingularityThresholds(
+            warning_index=float(self.warning_spin.value()),
+            error_index=float(self.error_spin.value()),
+        )
+
+    def set_thresholds(self, thresholds: SingularityThresholds) -> None:
+        self.warning_spin.setValue(float(thresholds.warning_index))
+        self.error_spin.setValue(float(thresholds.error_index))
+
+    def clear(self) -> None:
+        self.set_singularity_data([], [], [])
+        self.set_key_times([])
+        self.set_time_indicator(None)
+
+    def set_singularity_data(
+        self,
+        time_s: List[float],
+        indices: List[float | None],
+        kinds: List[SingularityKind | None],
+    ) -> None:
+        count = min(len(time_s), len(indices), len(kinds))
+        self._times = [float(value) for value in time_s[:count]]
+        self._indices = [math.nan if value is None else float(value) for value in indices[:count]]
+        self._kinds = list(kinds[:count])
+        self._refresh_curves()
+        if self._times:
+            min_x = min(0.0, self._times[0])
+            max_x = max(self._times[-1], min_x + 1e-6)
+            self.plot.setXRange(min_x, max_x, padding=0.02)
+
+    def set_key_times(self, times: List[float]) -> None:
+        for line in self._key_time_lines:
+            self.plot.removeItem(line)
+        self._key_time_lines = []
+
+        for value in times:
+            line = pg.InfiniteLine(
+                pos=float(value),
+                angle=90,
+                pen=pg.mkPen(color="#808080", width=1, style=Qt.PenStyle.DashLine),
+            )
+            self.plot.addItem(line)
+            self._key_time_lines.append(line)
+
+    def set_time_indicator(self, time_s: Optional[float]) -> None:
+        line = self._time_indicator_line
+        if time_s is None:
+            if line is not None:
+                self.plot.removeItem(line)
+            self._time_indicator_line = None
+            return
+
+        if line is None:
+            line = pg.InfiniteLine(pos=float(time_s), angle=90, pen=pg.mkPen(color="#ff3b30", width=2))
+            self.plot.addItem(line)
+            self._time_indicator_line = line
+            return
+
+        line.setValue(float(time_s))
+
+    def _on_thresholds_changed(self, _value: float) -> None:
+        thresholds = self.get_thresholds()
+        if self._warning_line is not None:
+            self._warning_line.setValue(thresholds.warning_index)
+        if self._error_line is not None:
+            self._error_line.setValue(thresholds.error_index)
+        self._refresh_curves()
+        self.thresholdsChanged.emit()
+
+    def _refresh_curves(self) -> None:
+        thresholds = self.get_thresholds()
+        below_warning = [
+            value if not math.isnan(value) and value < thresholds.warning_index else math.nan
+            for value in self._indices
+        ]
+        below_error = [
+            value if not math.isnan(value) and value < thresholds.error_index else math.nan
+            for value in self._indices
+        ]
+        if self._index_item is not None:
+            self._index_item.setData(self._times, self._indices, connect="finite")
+        if self._warning_item is not None:
+            self._warning_item.setData(self._times, below_warning, connect="finite")
+        if self._error_item is not None:
+            self._error_item.setData(self._times, below_error, connect="finite")
+        self._refresh_min_index_label()
+
+    def _refresh_min_index_label(self) -> None:
+        finite = [(value, kind) for value, kind in zip(self._indices, self._kinds) if not math.isnan(value)]
+        if not finite:
+            self.min_index_label.setText("Min : n/a")
+            return
+        value, kind = min(finite, key=lambda item: item[0])
+        suffix = f" ({singularity_kind_label(kind)})" if kind is not None else ""
+        self.min_index_label.setText(f"Min : {value:.3f}{suffix}")
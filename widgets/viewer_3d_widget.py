@@ -1,5 +1,6 @@
 import os
 import time
+import weakref
 from collections import deque
 from dataclasses import dataclass
 from PyQt6.QtWidgets import (
@@ -49,9 +50,24 @@ from models.tool_model import ToolModel
 from models.workspace_cad_element import WorkspaceCadElement
 from models.workspace_model import WorkspaceModel
 from models.viewer_theme_store import ViewerThemeStore
+from utils.polyline_simplification import (
+    point_at_key,
+    simplify_polyline_indices,
+    split_crossing_pairs,
+    tolerance_for_level,
+    tolerance_level,
+)
 
 
 TangentSegment = tuple[XYZ3, XYZ3]
+PathColor = tuple[float, float, float, float] | np.ndarray
+# (points, couleur) ou (points, couleur, clés de split par point, couleur "réalisé")
+TrajectoryPathSegment = (
+    tuple[list[list[float]] | np.ndarray, PathColor]
+    | tuple[list[list[float]] | np.ndarray, PathColor, np.ndarray, PathColor]
+)
+# (matrice 4x4 monde, longueur des axes, couleur unique ou None pour RGB)
+FrameGlyph = tuple[np.ndarray, float, tuple[float, float, float] | None]
 
 
 @dataclass
@@ -64,12 +80,17 @@ class PickCacheEntry:
 
 
 from widgets.viewer_control_overlay_widget import ViewerControlOverlayWidget
+from widgets.viewer_mesh_loader import ViewerMeshLoader, estimate_stl_bounds
 from utils.reference_frame_utils import (
     FrameTransform,
     pose_to_matrix,
     transform_matrix_base_to_world,
     transform_points_base_to_world,
 )
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
 
 
 class CalibraXGLViewWidget(gl.GLViewWidget):
@@ -91,6 +112,8 @@ class CalibraXGLViewWidget(gl.GLViewWidget):
         self._orthographic_zoom_factor = 1.0
         self._grid_reference = None
         self._trajectory_world_points_provider = None
+        # Appelé avant chaque rendu avec l'échelle mm/pixel courante (LOD du chemin)
+        self._view_scale_listener = None
         self._pick_cache: PickCacheEntry | None = None
         self._pan_gesture_speed_factor: float | None = None
         self._local_tris_cache: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
@@ -433,8 +456,22 @@ class CalibraXGLViewWidget(gl.GLViewWidget):
             )
         return tr
 
+    def world_units_per_pixel(self) -> float:
+        """Taille d'un pixel écran en mm-monde au niveau du centre de vue."""
+        W = max(1, self.width())
+        half_tan = float(np.tan(np.radians(max(1.0, float(self.opts.get("fov", 60.0))) / 2.0)))
+        distance = max(1e-6, float(self.opts.get("distance", 2000.0)))
+        if not self.is_perspective_enabled():
+            distance *= max(1e-3, float(self._orthographic_zoom_factor))
+        return 2.0 * distance * half_tan / W
+
+    def set_view_scale_listener(self, listener) -> None:
+        self._view_scale_listener = listener
+
     def paintGL(self) -> None:
         from OpenGL import GL
+        if self._view_scale_listener is not None:
+            self._view_scale_listener(self.world_units_per_pixel())
         region = self.getViewport()
         if self._background_mode != "gradient":
             GL.glDepthMask(GL.GL_TRUE)
@@ -1287,6 +1324,8 @@ class Viewer3DWidget(QWidget):
     LAYER_SCENE_OPAQUE = 0      # Géométrie pleine : test+écriture depth, pas de blend
     LAYER_SCENE_TRANSLUCENT = 5 # Transparents+trajectoire : test depth, NO écriture, blend over
     LAYER_OVERLAY = 10          # Repères X/Y/Z : NO depth test, NO écriture, blend over
+    # Écart max toléré (en pixels écran) entre le chemin simplifié et le chemin complet
+    TRAJECTORY_PATH_TOLERANCE_PX = 0.5
     DEFAULT_BACKGROUND_MODE = "solid"
     DEFAULT_BACKGROUND_PRIMARY_COLOR = QColor(45, 45, 48, 255)
     DEFAULT_BACKGROUND_SECONDARY_COLOR = QColor(15, 15, 18, 255)
@@ -1304,13 +1343,39 @@ class Viewer3DWidget(QWidget):
         self.robot_links: list[gl.GLMeshItem] = []
         self.robot_ghost_links: list[gl.GLMeshItem] = []
         self._trajectory_path_items: list[gl.GLLinePlotItem] = []
+        # Bout de la portion "réalisée" dans les paires simplifiées coupées par le split
+        self._trajectory_split_tip_items: list[gl.GLLinePlotItem] = []
         self._trajectory_keypoints_item: gl.GLScatterPlotItem | None = None
         self._trajectory_keypoint_selected_item: gl.GLScatterPlotItem | None = None
         self._trajectory_keypoint_editing_item: gl.GLScatterPlotItem | None = None
+        # Carte d'atteignabilité : centres de voxels (repère robot) et couleurs RGBA
+        self._reachability_heatmap_item: gl.GLScatterPlotItem | None = None
+        self._reachability_heatmap_points: np.ndarray | None = None
+        self._reachability_heatmap_colors: np.ndarray | None = None
         self._trajectory_tangent_out_items: list[gl.GLLinePlotItem] = []
         self._trajectory_tangent_in_items: list[gl.GLLinePlotItem] = []
         # Couleur par segment : tuple uniform ou np.ndarray (N,4) par-vertex
-        self._trajectory_path_segments: list[tuple[np.ndarray, tuple[float, float, float, float] | np.ndarray]] | None = None
+        self._trajectory_path_segments: list[tuple[np.ndarray, PathColor]] | None = None
+        # Clés de split (ex. temps) et couleur "réalisé" par segment, None si pas de split
+        self._trajectory_path_split_keys: list[np.ndarray | None] = []
+        self._trajectory_path_done_colors: list[PathColor | None] = []
+        # Buffer unique du chemin (mode 'lines') : positions, couleurs affichées,
+        # couleurs de base / réalisées, et clés triées pour ne recolorer qu'une plage
+        self._traj_line_pos: np.ndarray | None = None
+        self._traj_line_colors: np.ndarray | None = None
+        self._traj_line_base_colors: np.ndarray | None = None
+        self._traj_line_done_colors: np.ndarray | None = None
+        self._traj_split_order: np.ndarray | None = None
+        self._traj_split_sorted_keys: np.ndarray | None = None
+        # Par paire du buffer : clés de début/fin et segment d'origine (pour le bout exact du split)
+        self._traj_pair_start_keys: np.ndarray | None = None
+        self._traj_pair_end_keys: np.ndarray | None = None
+        self._traj_pair_segments: np.ndarray | None = None
+        self._traj_split_value: float = -np.inf
+        self._traj_line_dirty = False
+        # Simplification écran du chemin : indices conservés par segment, par palier de tolérance
+        self._traj_simplify_level: int | None = None
+        self._traj_simplify_cache: dict[int, list[np.ndarray]] = {}
         # Cache pts transformés en repère monde : évite O(n) re-transformations par frame pendant le playback
         self._traj_world_pts_cache: list[np.ndarray] = []
         self._traj_cache_base_rev: int = -1
@@ -1348,6 +1413,13 @@ class Viewer3DWidget(QWidget):
         self._workspace_structure_revision: int | None = None
         self._mesh_data_cache: dict[str, gl.MeshData] = {}
         self._missing_mesh_paths: set[str] = set()
+        # Items affichés avec un volume provisoire en attendant la fin du décodage STL. Références
+        # faibles : un item retiré de la scène pendant le décodage est libéré et ne reçoit rien.
+        self._pending_mesh_items: dict[str, weakref.WeakSet[gl.GLMeshItem]] = {}
+        self._mesh_loader = ViewerMeshLoader(parent=self)
+        self._mesh_loader.mesh_loaded.connect(self._on_mesh_loaded)
+        self._mesh_loader.mesh_failed.connect(self._on_mesh_failed)
+        self._mesh_loader.pending_changed.connect(self._on_mesh_loading_pending_changed)
         self._primitive_mesh_cache: dict[str, gl.MeshData] = {}
         self._workspace_elements: list[WorkspaceElementState] = []
         self._workspace_frame_matrices: list[np.ndarray] = []
@@ -1430,6 +1502,7 @@ class Viewer3DWidget(QWidget):
         self.viewer = CalibraXGLViewWidget()
         self.viewer.setCameraPosition(distance=2000, elevation=40, azimuth=45)
         self.viewer._trajectory_world_points_provider = self._get_trajectory_world_points
+        self.viewer.set_view_scale_listener(self._on_view_scale_changed)
         #self.viewer.setMinimumSize(900, 400)
         self.viewer.set_background_style(
             self._viewer_background_mode,
@@ -1978,7 +2051,7 @@ class Viewer3DWidget(QWidget):
             self._loading_feedback_depth -= 1
         if self._loading_feedback_depth <= 0:
             self._loading_feedback_depth = 0
-            self._clear_label_msg()
+            self._on_mesh_loading_pending_changed(self._mesh_loader.pending_count())
             try:
                 while QApplication.overrideCursor() is not None:
                     QApplication.restoreOverrideCursor()
@@ -3518,9 +3591,11 @@ class Viewer3DWidget(QWidget):
         self._robot_frame_items = []
         self._workspace_frame_items = []
         self._trajectory_path_items = []
+        self._trajectory_split_tip_items = []
         self._trajectory_keypoints_item = None
         self._trajectory_keypoint_selected_item = None
         self._trajectory_keypoint_editing_item = None
+        self._reachability_heatmap_item = None
         self._trajectory_tangent_out_items = []
         self._trajectory_tangent_in_items = []
         self._external_axes_links = []
@@ -3538,25 +3613,75 @@ class Viewer3DWidget(QWidget):
 
     def set_trajectory_path_segments(
         self,
-        segments: list[tuple[list[list[float]] | np.ndarray, tuple[float, float, float, float] | np.ndarray]],
+        segments: list[TrajectoryPathSegment],
         in_world: bool = False,
+        split_key: float | None = None,
     ) -> None:
-        parsed: list[tuple[np.ndarray, tuple[float, float, float, float] | np.ndarray]] = []
-        for points_xyz, color in segments:
+        """Remplace le chemin affiché (un seul buffer GPU pour tous les segments).
+
+        Les segments peuvent porter une clé de split par point (ex. temps) et une
+        couleur "réalisé" : les points dont la clé est <= split_key prennent cette
+        couleur, voir set_trajectory_path_split().
+        """
+        parsed: list[tuple[np.ndarray, PathColor]] = []
+        split_keys: list[np.ndarray | None] = []
+        done_colors: list[PathColor | None] = []
+        for segment in segments:
+            points_xyz, color = segment[0], segment[1]
             pts = np.asarray(points_xyz, dtype=np.float64)
             if len(pts) < 2:
                 continue
             parsed.append((pts, color))
+            if len(segment) >= 4 and segment[2] is not None:
+                split_keys.append(np.asarray(segment[2], dtype=np.float64))
+                done_colors.append(segment[3])
+            else:
+                split_keys.append(None)
+                done_colors.append(None)
         if self._trajectory_path_in_world != bool(in_world):
             self._traj_cache_pts_ids = []
         self._trajectory_path_in_world = bool(in_world)
         self._trajectory_path_segments = parsed if parsed else None
+        self._trajectory_path_split_keys = split_keys
+        self._trajectory_path_done_colors = done_colors
+        self._traj_split_value = -np.inf if split_key is None else float(split_key)
+        self._traj_simplify_cache = {}
+        self._traj_line_dirty = True
         self._render_trajectory_overlay()
 
+    def set_trajectory_path_split(self, split_key: float | None) -> None:
+        """Avance/recule la portion "réalisée" sans reconstruire le chemin.
+
+        Seuls les sommets dont la clé est comprise entre l'ancien et le nouveau
+        split sont recolorés ; les positions restent en place côté GPU.
+        """
+        new_value = -np.inf if split_key is None else float(split_key)
+        old_value = self._traj_split_value
+        if new_value == old_value:
+            return
+        self._traj_split_value = new_value
+        if self._traj_line_colors is None or self._traj_split_sorted_keys is None:
+            return
+        self._update_trajectory_split_tip()
+        low, high = (old_value, new_value) if new_value > old_value else (new_value, old_value)
+        start = int(np.searchsorted(self._traj_split_sorted_keys, low, side="right"))
+        stop = int(np.searchsorted(self._traj_split_sorted_keys, high, side="right"))
+        if stop <= start:
+            return
+        indices = self._traj_split_order[start:stop]
+        source = self._traj_line_done_colors if new_value > old_value else self._traj_line_base_colors
+        self._traj_line_colors[indices] = source[indices]
+        for item in self._trajectory_path_items:
+            item.setData(color=self._traj_line_colors)
+
     def clear_trajectory_path(self) -> None:
         self._trajectory_path_segments = None
+        self._trajectory_path_split_keys = []
+        self._trajectory_path_done_colors = []
         self._traj_world_pts_cache = []
         self._traj_cache_pts_ids = []
+        self._traj_simplify_cache = {}
+        self._traj_line_dirty = True
         self._render_trajectory_overlay()
 
     def get_accent_color_rgba(self) -> tuple[float, float, float, float]:
@@ -3579,6 +3704,44 @@ class Viewer3DWidget(QWidget):
         self._trajectory_keypoint_editing_index = editing_index
         self._render_trajectory_overlay()
 
+    def set_reachability_heatmap(self, points_xyz: np.ndarray, values: np.ndarray) -> None:
+        """Affiche les voxels atteignables (repère robot), colorés du rouge (0) au vert (1)."""
+        points = np.asarray(points_xyz, dtype=float).reshape(-1, 3)
+        values = np.clip(np.asarray(values, dtype=float).reshape(-1), 0.0, 1.0)
+        visible = values > 0.0
+        if not np.any(visible):
+            self.clear_reachability_heatmap()
+            return
+        values = values[visible]
+        colors = np.empty((len(values), 4), dtype=float)
+        colors[:, 0] = 1.0 - values
+        colors[:, 1] = values
+        colors[:, 2] = 0.15
+        colors[:, 3] = 0.25 + 0.35 * values
+        self._reachability_heatmap_points = points[visible]
+        self._reachability_heatmap_colors = colors
+        self._render_reachability_heatmap()
+
+    def clear_reachability_heatmap(self) -> None:
+        self._reachability_heatmap_points = None
+        self._reachability_heatmap_colors = None
+        self._render_reachability_heatmap()
+
+    def _render_reachability_heatmap(self) -> None:
+        if self._reachability_heatmap_item is not None:
+            self.viewer.removeItem(self._reachability_heatmap_item)
+            self._reachability_heatmap_item = None
+        if self._reachability_heatmap_points is None:
+            return
+        self._reachability_heatmap_item = gl.GLScatterPlotItem(
+            pos=self._transform_robot_points_to_world(self._reachability_heatmap_points),
+            color=self._reachability_heatmap_colors,
+            size=6,
+            pxMode=True,
+        )
+        self._apply_layer(self._reachability_heatmap_item, self.LAYER_SCENE_TRANSLUCENT)
+        self.viewer.addItem(self._reachability_heatmap_item)
+
     def clear_trajectory_keypoints(self) -> None:
         self._trajectory_keypoint_points = None
         self._trajectory_keypoint_selected_index = None
@@ -3671,17 +3834,18 @@ class Viewer3DWidget(QWidget):
 
         return keypoints_world, path_segments_world
 
-    def _rebuild_traj_world_cache(self, path_segs: list) -> None:
+    def _rebuild_traj_world_cache(self, path_segs: list) -> bool:
+        """Met à jour le cache des points monde ; retourne True s'il a changé."""
         if self._trajectory_path_in_world:
             # Points déjà en monde : indépendants de la base robot
             pts_ids = [id(pts) for pts, _ in path_segs]
             if self._traj_cache_pts_ids == pts_ids:
-                return
+                return False
             self._traj_world_pts_cache = [pts for pts, _ in path_segs]
             self._traj_cache_pts_ids = pts_ids
             self._traj_cache_base_rev = -1
             self._traj_cache_override_id = -1
-            return
+            return True
         base_rev = self._robot_base_transform_world.revision
         override_id = id(self._external_robot_base_override)
         pts_ids = [id(pts) for pts, _ in path_segs]
@@ -3690,43 +3854,180 @@ class Viewer3DWidget(QWidget):
             and self._traj_cache_override_id == override_id
             and self._traj_cache_pts_ids == pts_ids
         ):
-            return
+            return False
         self._traj_world_pts_cache = [self._transform_robot_points_to_world(pts) for pts, _ in path_segs]
         self._traj_cache_base_rev = base_rev
         self._traj_cache_override_id = override_id
         self._traj_cache_pts_ids = pts_ids
+        return True
 
-    def _render_trajectory_overlay(self) -> None:
-        # --- Segments de trajectoire : setData() si items déjà présents (pas de VBO churn) ---
-        path_segs = self._trajectory_path_segments or []
-        n_new = len(path_segs)
-        n_old = len(self._trajectory_path_items)
-        if n_new < n_old:
-            for item in self._trajectory_path_items[n_new:]:
-                self.viewer.removeItem(item)
-            self._trajectory_path_items = self._trajectory_path_items[:n_new]
-        while len(self._trajectory_path_items) < n_new:
-            item = gl.GLLinePlotItem(
-                pos=np.zeros((2, 3), dtype=np.float64),
-                color=(1.0, 1.0, 1.0, 1.0),
-                width=2,
-                antialias=False,
+    @staticmethod
+    def _path_vertex_colors(color: PathColor, count: int) -> np.ndarray:
+        colors = np.empty((count, 4), dtype=np.float32)
+        if isinstance(color, np.ndarray):
+            colors[:, :3] = color[:count, :3]
+        else:
+            colors[:, :3] = color[:3]
+        # Le chemin est toujours rendu opaque
+        colors[:, 3] = 1.0
+        return colors
+
+    def _simplified_path_indices(self, path_segs: list) -> list[np.ndarray]:
+        """Indices conservés par segment pour le palier de tolérance courant (mis en cache)."""
+        level = self._traj_simplify_level
+        if level is None:
+            return [np.arange(len(pts)) for pts, _ in path_segs]
+        cached = self._traj_simplify_cache.get(level)
+        if cached is not None and len(cached) == len(path_segs):
+            return cached
+        tolerance = tolerance_for_level(level)
+        kept_indices: list[np.ndarray] = []
+        for i, (pts, color) in enumerate(path_segs):
+            keep_mask = np.zeros(len(pts), dtype=bool)
+            if isinstance(color, np.ndarray) and len(color) == len(pts) and len(pts) > 2:
+                # Les changements de couleur (statut par sample) restent visibles
+                change = np.any(color[1:, :3] != color[:-1, :3], axis=1)
+                keep_mask[1:] |= change
+                keep_mask[:-1] |= change
+            # Les distances sont invariantes par la transformation base -> monde
+            kept_indices.append(simplify_polyline_indices(pts, tolerance, keep_mask))
+        self._traj_simplify_cache[level] = kept_indices
+        return kept_indices
+
+    def _on_view_scale_changed(self, mm_per_pixel: float) -> None:
+        """Ne ré-simplifie le chemin que lorsque le zoom change d'un facteur 2."""
+        level = tolerance_level(mm_per_pixel * self.TRAJECTORY_PATH_TOLERANCE_PX)
+        if level == self._traj_simplify_level:
+            return
+        self._traj_simplify_level = level
+        if not self._trajectory_path_segments:
+            return
+        self._traj_line_dirty = True
+        # Reporté hors de paintGL : le prochain rendu utilise le nouveau buffer
+        QTimer.singleShot(0, self._render_trajectory_overlay)
+
+    def _pack_trajectory_path_buffer(self, path_segs: list) -> None:
+        """Empile tous les segments en paires de sommets (mode 'lines') dans un seul buffer."""
+        pos_blocks: list[np.ndarray] = []
+        base_blocks: list[np.ndarray] = []
+        done_blocks: list[np.ndarray] = []
+        key_blocks: list[np.ndarray] = []
+        start_key_blocks: list[np.ndarray] = []
+        segment_blocks: list[np.ndarray] = []
+        kept_indices = self._simplified_path_indices(path_segs)
+        for i, (_pts, color) in enumerate(path_segs):
+            world_pts = self._traj_world_pts_cache[i]
+            count = len(world_pts)
+            kept = kept_indices[i]
+            # 0,1,1,2,2,...,n-1 : chaque point intérieur termine une paire et ouvre la suivante
+            pair_index = kept[np.repeat(np.arange(len(kept)), 2)[1:-1]]
+            base_colors = self._path_vertex_colors(color, count)
+            split_keys = self._trajectory_path_split_keys[i] if i < len(self._trajectory_path_split_keys) else None
+            done_color = self._trajectory_path_done_colors[i] if i < len(self._trajectory_path_done_colors) else None
+            if split_keys is None or done_color is None or len(split_keys) < count:
+                done_colors = base_colors
+                keys = np.full(count, np.inf, dtype=np.float64)
+            else:
+                done_colors = self._path_vertex_colors(done_color, count)
+                keys = split_keys[:count]
+            pos_blocks.append(world_pts[pair_index])
+            base_blocks.append(base_colors[pair_index])
+            done_blocks.append(done_colors[pair_index])
+            # Une paire passe en "réalisé" d'un bloc quand le split atteint sa fin ; la paire en
+            # cours est complétée par le bout exact (_update_trajectory_split_tip)
+            key_blocks.append(np.repeat(keys[kept[1:]], 2))
+            start_key_blocks.append(keys[kept[:-1]])
+            segment_blocks.append(np.full(len(kept) - 1, i, dtype=np.int64))
+
+        if not pos_blocks:
+            self._traj_line_pos = None
+            self._traj_line_colors = None
+            self._traj_line_base_colors = None
+            self._traj_line_done_colors = None
+            self._traj_split_order = None
+            self._traj_split_sorted_keys = None
+            self._traj_pair_start_keys = None
+            self._traj_pair_end_keys = None
+            self._traj_pair_segments = None
+            return
+
+        keys = np.concatenate(key_blocks)
+        self._traj_pair_start_keys = np.concatenate(start_key_blocks)
+        self._traj_pair_end_keys = keys[1::2]
+        self._traj_pair_segments = np.concatenate(segment_blocks)
+        self._traj_line_pos = np.ascontiguousarray(np.vstack(pos_blocks), dtype=np.float32)
+        self._traj_line_base_colors = np.vstack(base_blocks)
+        self._traj_line_done_colors = np.vstack(done_blocks)
+        self._traj_split_order = np.argsort(keys, kind="stable")
+        self._traj_split_sorted_keys = keys[self._traj_split_order]
+        done_mask = keys <= self._traj_split_value
+        self._traj_line_colors = np.where(
+            done_mask[:, None], self._traj_line_done_colors, self._traj_line_base_colors
+        ).astype(np.float32)
+
+    def _update_trajectory_split_tip(self) -> None:
+        """Trace la portion "réalisée" des paires coupées par le split, jusqu'au point exact du split.
+
+        Le chemin simplifié ne garde aucun sommet imposé par le split : le bout va du début de
+        la paire au point interpolé sur le chemin complet, en couleur "réalisé".
+        """
+        pairs = np.zeros(0, dtype=np.int64)
+        if self._traj_line_pos is not None and self._traj_pair_start_keys is not None:
+            pairs = split_crossing_pairs(self._traj_pair_start_keys, self._traj_pair_end_keys, self._traj_split_value)
+        if len(pairs) == 0:
+            for item in self._trajectory_split_tip_items:
+                item.setVisible(False)
+            return
+        pos = np.empty((2 * len(pairs), 3), dtype=np.float32)
+        pos[0::2] = self._traj_line_pos[2 * pairs]
+        for row, pair in enumerate(pairs):
+            segment = int(self._traj_pair_segments[pair])
+            pos[2 * row + 1] = point_at_key(
+                self._traj_world_pts_cache[segment],
+                self._trajectory_path_split_keys[segment],
+                self._traj_split_value,
             )
+        colors = np.repeat(self._traj_line_done_colors[2 * pairs], 2, axis=0).astype(np.float32)
+        if not self._trajectory_split_tip_items:
+            item = gl.GLLinePlotItem(pos=pos, color=colors, width=2, antialias=False, mode='lines')
             self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
-            self._trajectory_path_items.append(item)
+            self._trajectory_split_tip_items.append(item)
             self.viewer.addItem(item)
-        if path_segs:
-            self._rebuild_traj_world_cache(path_segs)
-        for i, (item, (pts, color)) in enumerate(zip(self._trajectory_path_items, path_segs)):
-            world_pts = self._traj_world_pts_cache[i]
-            if isinstance(color, np.ndarray):
-                # Couleur par-vertex : forcer alpha=1.0
-                render_color = np.empty_like(color)
-                render_color[:, :3] = color[:, :3]
-                render_color[:, 3] = 1.0
+        else:
+            item = self._trajectory_split_tip_items[0]
+            item.setData(pos=pos, color=colors)
+            item.setVisible(True)
+            self._ensure_viewer_item(item)
+
+    def _render_trajectory_overlay(self) -> None:
+        # --- Chemin : un seul GLLinePlotItem, positions ré-uploadées seulement si elles changent ---
+        path_segs = self._trajectory_path_segments or []
+        if not path_segs:
+            self._clear_viewer_items(self._trajectory_path_items)
+            self._clear_viewer_items(self._trajectory_split_tip_items)
+            self._pack_trajectory_path_buffer([])
+            self._traj_line_dirty = False
+        else:
+            world_changed = self._rebuild_traj_world_cache(path_segs)
+            if world_changed or self._traj_line_dirty or self._traj_line_pos is None:
+                self._pack_trajectory_path_buffer(path_segs)
+                self._traj_line_dirty = False
+                if self._trajectory_path_items:
+                    self._trajectory_path_items[0].setData(pos=self._traj_line_pos, color=self._traj_line_colors)
+            if not self._trajectory_path_items:
+                item = gl.GLLinePlotItem(
+                    pos=self._traj_line_pos,
+                    color=self._traj_line_colors,
+                    width=2,
+                    antialias=False,
+                    mode='lines',
+                )
+                self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
+                self._trajectory_path_items.append(item)
+                self.viewer.addItem(item)
             else:
-                render_color = (color[0], color[1], color[2], 1.0)
-            item.setData(pos=world_pts, color=render_color)
+                self._ensure_viewer_item(self._trajectory_path_items[0])
+            self._update_trajectory_split_tip()
 
         if self._trajectory_keypoints_item is not None:
             self.viewer.removeItem(self._trajectory_keypoints_item)
@@ -3737,12 +4038,6 @@ class Viewer3DWidget(QWidget):
         if self._trajectory_keypoint_editing_item is not None:
             self.viewer.removeItem(self._trajectory_keypoint_editing_item)
             self._trajectory_keypoint_editing_item = None
-        for item in self._trajectory_tangent_out_items:
-            self.viewer.removeItem(item)
-        self._trajectory_tangent_out_items = []
-        for item in self._trajectory_tangent_in_items:
-            self.viewer.removeItem(item)
-        self._trajectory_tangent_in_items = []
 
         if self._trajectory_keypoint_points is not None and len(self._trajectory_keypoint_points) > 0:
             points = self._trajectory_keypoint_points
@@ -3792,45 +4087,39 @@ class Viewer3DWidget(QWidget):
                 self._apply_layer(self._trajectory_keypoint_editing_item, self.LAYER_SCENE_TRANSLUCENT)
                 self.viewer.addItem(self._trajectory_keypoint_editing_item)
 
-        if self._trajectory_tangent_out_segments is not None:
-            for segment in self._trajectory_tangent_out_segments:
-                if len(segment) < 2:
-                    continue
-                world_segment = self._transform_robot_points_to_world(segment)
-                item = gl.GLLinePlotItem(
-                    pos=world_segment,
-                    color=(1.0, 0.5, 0.1, 1.0),
-                    width=2,
-                    antialias=True,
-                )
-                self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
-                self._trajectory_tangent_out_items.append(item)
-                self.viewer.addItem(item)
+        # --- Tangentes : toutes les paires de points d'un sens dans un seul item ---
+        self._set_line_batch(
+            self._trajectory_tangent_out_items,
+            self._tangent_segments_world_lines(self._trajectory_tangent_out_segments),
+            (1.0, 0.5, 0.1, 1.0),
+            width=2,
+            layer=self.LAYER_SCENE_TRANSLUCENT,
+        )
+        self._set_line_batch(
+            self._trajectory_tangent_in_items,
+            self._tangent_segments_world_lines(self._trajectory_tangent_in_segments),
+            (0.25, 1.0, 0.55, 1.0),
+            width=2,
+            layer=self.LAYER_SCENE_TRANSLUCENT,
+        )
 
-        if self._trajectory_tangent_in_segments is not None:
-            for segment in self._trajectory_tangent_in_segments:
-                if len(segment) < 2:
-                    continue
-                world_segment = self._transform_robot_points_to_world(segment)
-                item = gl.GLLinePlotItem(
-                    pos=world_segment,
-                    color=(0.25, 1.0, 0.55, 1.0),
-                    width=2,
-                    antialias=True,
-                )
-                self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
-                self._trajectory_tangent_in_items.append(item)
-                self.viewer.addItem(item)
+    def _tangent_segments_world_lines(self, segments: list[np.ndarray] | None) -> np.ndarray | None:
+        if not segments:
+            return None
+        pairs = [segment[:2] for segment in segments if len(segment) >= 2]
+        if not pairs:
+            return None
+        return self._transform_robot_points_to_world(np.vstack(pairs))
 
     def _render_cameras(self) -> None:
         self._clear_viewer_items(self._camera_mesh_items)
         self._clear_viewer_items(self._camera_frustum_items)
         self._clear_viewer_items(self._camera_line_items)
-        self._clear_viewer_items(self._camera_frame_items)
         self._clear_viewer_items(self._camera_target_mesh_items)
         self._clear_viewer_items(self._camera_target_point_items)
-        self._clear_viewer_items(self._camera_target_frame_items)
         if self._camera_model is None:
+            self._clear_viewer_items(self._camera_frame_items)
+            self._clear_viewer_items(self._camera_target_frame_items)
             return
 
         self._render_camera_target_body()
@@ -3841,6 +4130,9 @@ class Viewer3DWidget(QWidget):
             for camera_id, visible in self._camera_frames_visible.items()
             if camera_id in existing_ids
         }
+        frustum_lines: list[np.ndarray] = []
+        frustum_colors: list[np.ndarray] = []
+        camera_frames: list[FrameGlyph] = []
         for index, camera in enumerate(cameras):
             self._camera_frames_visible.setdefault(camera.camera_id, True)
             if not camera.enabled:
@@ -3854,18 +4146,24 @@ class Viewer3DWidget(QWidget):
                     self._camera_mesh_items.append(mesh_item)
 
             if camera.visual.show_frustum:
-                frustum_item = self._build_camera_frustum_item(
-                    camera,
-                    self._camera_optical_world_matrix(camera),
-                    selected=index == self._selected_camera_index,
-                )
-                if frustum_item is not None:
-                    self.viewer.addItem(frustum_item)
-                    self._camera_frustum_items.append(frustum_item)
+                selected = index == self._selected_camera_index
+                lines = self._build_camera_frustum_lines(camera, self._camera_optical_world_matrix(camera))
+                if selected:
+                    # Le frustum sélectionné garde son trait épais dans un item dédié
+                    color = self._hex_to_rgba_tuple(camera.visual.color, alpha=1.0)
+                    self._add_camera_frustum_item(lines, color, width=3)
+                else:
+                    color = self._hex_to_rgba_tuple(camera.visual.color, alpha=0.25)
+                    frustum_lines.append(lines)
+                    frustum_colors.append(np.tile(np.array(color, dtype=float), (len(lines), 1)))
 
             if self._camera_frames_visible.get(camera.camera_id, True):
                 frame_length = 180.0 if index == self._selected_camera_index else 120.0
-                self._camera_frame_items.extend(self.draw_frame(camera_mount_world, longueur=frame_length))
+                camera_frames.append((camera_mount_world, frame_length, None))
+
+        if frustum_lines:
+            self._add_camera_frustum_item(np.vstack(frustum_lines), np.vstack(frustum_colors), width=2)
+        self.draw_frames(self._camera_frame_items, camera_frames)
 
     def _render_camera_target_body(self) -> None:
         if self._camera_model is None:
@@ -3873,10 +4171,13 @@ class Viewer3DWidget(QWidget):
         target_body = self._camera_model.get_target_body()
         target_world = self._target_body_world_matrix(target_body)
         if target_world is None:
+            self._clear_viewer_items(self._camera_target_frame_items)
             return
 
+        target_frames: list[FrameGlyph] = []
         if self._camera_target_frame_visible:
-            self._camera_target_frame_items.extend(self.draw_frame(target_world, longueur=100.0))
+            target_frames.append((target_world, 100.0, None))
+        self.draw_frames(self._camera_target_frame_items, target_frames)
 
         points_world = self._target_body_points_world(target_body, target_world)
         for point, point_world in points_world:
@@ -4135,44 +4436,41 @@ class Viewer3DWidget(QWidget):
             T[3, 0], T[3, 1], T[3, 2], T[3, 3],
         )
 
-    def _build_camera_frustum_item(
-        self,
-        camera: CameraConfiguration,
-        camera_world_matrix: np.ndarray,
-        selected: bool = False,
-    ) -> gl.GLLinePlotItem | None:
+    @staticmethod
+    def _build_camera_frustum_lines(camera: CameraConfiguration, camera_world_matrix: np.ndarray) -> np.ndarray:
+        """Arêtes du frustum en repère monde, en paires de sommets (mode 'lines')."""
         range_mm = max(1.0, float(camera.fov.range_mm))
         half_h = np.tan(np.radians(camera.fov.horizontal_deg * 0.5)) * range_mm
         half_v = np.tan(np.radians(camera.fov.vertical_deg * 0.5)) * range_mm
-        local_points = np.array(
+        corners = np.array(
             [
-                [0.0, 0.0, 0.0],
-                [-half_h, -half_v, range_mm],
-                [0.0, 0.0, 0.0],
-                [half_h, -half_v, range_mm],
-                [0.0, 0.0, 0.0],
-                [half_h, half_v, range_mm],
-                [0.0, 0.0, 0.0],
-                [-half_h, half_v, range_mm],
                 [-half_h, -half_v, range_mm],
                 [half_h, -half_v, range_mm],
                 [half_h, half_v, range_mm],
                 [-half_h, half_v, range_mm],
-                [-half_h, -half_v, range_mm],
             ],
             dtype=float,
         )
-        local_h = np.column_stack([local_points, np.ones(len(local_points))])
-        world_points = (camera_world_matrix @ local_h.T).T[:, :3]
-        color = self._hex_to_rgba_tuple(camera.visual.color, alpha=1.0 if selected else 0.25)
-        item = gl.GLLinePlotItem(
-            pos=world_points,
-            color=color,
-            width=3 if selected else 2,
-            antialias=True,
-        )
+        apex = np.zeros(3, dtype=float)
+        local_points = np.empty((16, 3), dtype=float)
+        # 4 arêtes sommet -> coins puis les 4 côtés du rectangle de portée
+        local_points[0:8:2] = apex
+        local_points[1:8:2] = corners
+        local_points[8::2] = corners
+        local_points[9::2] = np.roll(corners, -1, axis=0)
+        T = np.array(camera_world_matrix, dtype=float)
+        return local_points @ T[:3, :3].T + T[:3, 3]
+
+    def _add_camera_frustum_item(
+        self,
+        lines: np.ndarray,
+        color: tuple[float, float, float, float] | np.ndarray,
+        width: float,
+    ) -> None:
+        item = gl.GLLinePlotItem(pos=lines, color=color, width=width, antialias=True, mode='lines')
         self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
-        return item
+        self.viewer.addItem(item)
+        self._camera_frustum_items.append(item)
 
     @staticmethod
     def _camera_line_color(result: CameraVisibilityResult | None) -> tuple[float, float, float, float]:
@@ -4466,55 +4764,100 @@ class Viewer3DWidget(QWidget):
                     candidates.append(float(t))
         return min(candidates) if candidates else None
 
-    def draw_frame(self, T, longueur=100, color: tuple[int, int, int]=None):
-        """Dessine un repère unique"""
-        origine = T[:3, 3]
-        R = T[:3, :3]
+    @staticmethod
+    def _frame_axis_colors(color: tuple[int, int, int] | None) -> np.ndarray:
+        if color is None:
+            return np.array([(1.0, 0.0, 0.0, 1.0), (0.0, 1.0, 0.0, 1.0), (0.0, 0.0, 1.0, 1.0)], dtype=float)
+        r, g, b = color[0], color[1], color[2]
+        # normalise si entiers 0-255
+        if any(v > 1.0 for v in (r, g, b)):
+            r, g, b = r / 255.0, g / 255.0, b / 255.0
+        return np.array([(r, g, b, 1.0)] * 3, dtype=float)
 
-        axes = [
-            np.array([origine, origine + R[:, 0] * longueur]),  # X
-            np.array([origine, origine + R[:, 1] * longueur]),  # Y
-            np.array([origine, origine + R[:, 2] * longueur]),  # Z
-        ]
+    @classmethod
+    def _build_frames_line_data(cls, frames: list[FrameGlyph]) -> tuple[np.ndarray, np.ndarray]:
+        """Empile les axes X/Y/Z de plusieurs repères en paires de sommets (mode 'lines')."""
+        count = len(frames)
+        if count == 0:
+            return np.zeros((0, 3), dtype=float), np.zeros((0, 4), dtype=float)
+        transforms = np.array([np.asarray(T, dtype=float)[:4, :4] for T, _, _ in frames], dtype=float)
+        lengths = np.array([float(length) for _, length, _ in frames], dtype=float)
+        origins = transforms[:, :3, 3]
+        # Lignes = axes X, Y, Z (colonnes de R) mis à l'échelle
+        axes = np.transpose(transforms[:, :3, :3], (0, 2, 1)) * lengths[:, None, None]
+        pos = np.empty((count, 3, 2, 3), dtype=float)
+        pos[:, :, 0, :] = origins[:, None, :]
+        pos[:, :, 1, :] = origins[:, None, :] + axes
+        colors = np.empty((count, 3, 2, 4), dtype=float)
+        for index, (_, _, color) in enumerate(frames):
+            colors[index] = cls._frame_axis_colors(color)[:, None, :]
+        return pos.reshape(-1, 3), colors.reshape(-1, 4)
+
+    def _set_line_batch(
+        self,
+        items: list,
+        pos: np.ndarray | None,
+        color: tuple[float, float, float, float] | np.ndarray,
+        width: float = 3,
+        layer: int = LAYER_OVERLAY,
+    ) -> None:
+        """Met à jour l'unique GLLinePlotItem (mode 'lines') d'une catégorie.
 
-        if color is None:
-            couleurs = [(1.0, 0.0, 0.0, 1.0), (0.0, 1.0, 0.0, 1.0), (0.0, 0.0, 1.0, 1.0)]
-        else:
-            r, g, b = color[0], color[1], color[2]
-            # normalise si entiers 0-255
-            if any(v > 1.0 for v in (r, g, b)):
-                r, g, b = r / 255.0, g / 255.0, b / 255.0
-            couleurs = [(r, g, b, 1.0), (r, g, b, 1.0), (r, g, b, 1.0)]
-
-        items = []
-        for i, axis in enumerate(axes):
-            plt = gl.GLLinePlotItem(pos=axis, color=couleurs[i], width=3, antialias=True)
-            self._apply_layer(plt, self.LAYER_OVERLAY)
-            self.viewer.addItem(plt)
-            items.append(plt)
+        Toute la catégorie tient dans un seul VBO : un draw call, et setData()
+        au lieu de recréer les items à chaque rafraîchissement.
+        """
+        if pos is None or len(pos) < 2:
+            self._clear_viewer_items(items)
+            return
+        if len(items) == 1:
+            item = items[0]
+            item.setData(pos=pos, color=color, width=width, mode='lines')
+            self._ensure_viewer_item(item)
+            return
+        self._clear_viewer_items(items)
+        item = gl.GLLinePlotItem(pos=pos, color=color, width=width, antialias=True, mode='lines')
+        self._apply_layer(item, layer)
+        self.viewer.addItem(item)
+        items.append(item)
+
+    def draw_frames(self, items: list, frames: list[FrameGlyph]) -> None:
+        """Dessine tous les repères d'une catégorie dans un seul item de lignes."""
+        pos, colors = self._build_frames_line_data(frames)
+        self._set_line_batch(items, pos, colors)
+
+    def draw_frame(self, T, longueur=100, color: tuple[int, int, int]=None):
+        """Dessine un repère unique"""
+        items: list[gl.GLLinePlotItem] = []
+        self.draw_frames(items, [(T, longueur, color)])
         return items
 
     def draw_all_frames(self, matrices):
         """Dessine les repères en fonction de leur visibilité individuelle"""
-        self._clear_viewer_items(self._robot_frame_items)
-        for i, T in enumerate(matrices):
+        frames: list[FrameGlyph] = [
+            (self._transform_robot_matrix_to_world(T), 100, None)
+            for i, T in enumerate(matrices)
             # On dessine seulement si l'index est marqué visible dans la liste
-            if i < len(self.frames_visibility) and self.frames_visibility[i]:
-                self._robot_frame_items.extend(self.draw_frame(self._transform_robot_matrix_to_world(T)))
-    
+            if i < len(self.frames_visibility) and self.frames_visibility[i]
+        ]
+        self.draw_frames(self._robot_frame_items, frames)
+
     def draw_workspace_frames(self) -> None:
-        self._clear_viewer_items(self._workspace_frame_items)
-        for i, transform in enumerate(self._workspace_frame_matrices):
-            if i < len(self.workspace_frames_visibility) and self.workspace_frames_visibility[i]:
-                self._workspace_frame_items.extend(self.draw_frame(transform))
+        frames: list[FrameGlyph] = [
+            (transform, 100, None)
+            for i, transform in enumerate(self._workspace_frame_matrices)
+            if i < len(self.workspace_frames_visibility) and self.workspace_frames_visibility[i]
+        ]
+        self.draw_frames(self._workspace_frame_items, frames)
 
     def draw_external_axes_frames(self) -> None:
         """Redessine tous les repères des axes externes en respectant leur visibilité."""
-        self._clear_viewer_items(self._external_axes_frame_items)
-        for axis in self._last_external_axes_snapshot:
-            transforms = self._last_external_world_transforms.get(axis.id)
-            if transforms is not None:
-                self._draw_external_axis_frames(axis, transforms)
+        self._render_external_axes_frames(
+            {
+                axis.id: self._last_external_world_transforms[axis.id]
+                for axis in self._last_external_axes_snapshot
+                if axis.id in self._last_external_world_transforms
+            }
+        )
 
     def set_program_frame(self, program_base_pose: Pose6 | None, label: str = "Program Frame") -> None:
         self._program_frame_pose_base = None if program_base_pose is None else program_base_pose.copy()
@@ -4628,16 +4971,16 @@ class Viewer3DWidget(QWidget):
                     self._missing_mesh_paths.remove(resolved_stl_path)
                 else:
                     return None
+            if not os.path.isfile(resolved_stl_path):
+                raise FileNotFoundError(resolved_stl_path)
             mesh_data = self._mesh_data_cache.get(resolved_stl_path)
             if mesh_data is None:
-                stl_mesh = mesh.Mesh.from_file(resolved_stl_path)
-                verts = stl_mesh.vectors.reshape(-1, 3)
-                faces = np.arange(len(verts)).reshape(-1, 3)
-                mesh_data = gl.MeshData(vertexes=verts, faces=faces)
-                self._mesh_data_cache[resolved_stl_path] = mesh_data
+                # Décodage en tâche de fond : un volume provisoire occupe la place du
+                # maillage jusqu'à son arrivée (voir _on_mesh_loaded).
+                self._mesh_loader.request(resolved_stl_path)
 
             mesh_item = gl.GLMeshItem(
-                meshdata=mesh_data,
+                meshdata=mesh_data if mesh_data is not None else self._placeholder_mesh_data(resolved_stl_path),
                 smooth=True,
                 color=self._brighten_mesh_color(color),
                 shader=Viewer3DWidget.CAD_SHADER_NAME,
@@ -4651,6 +4994,8 @@ class Viewer3DWidget(QWidget):
             )
             mesh_item.setTransform(qmat)
             self._tag_occlusion_mesh_item(mesh_item, mesh_data, T, os.path.basename(resolved_stl_path))
+            if mesh_data is None:
+                self._pending_mesh_items.setdefault(resolved_stl_path, weakref.WeakSet()).add(mesh_item)
             return mesh_item
         except Exception as e:
             resolved_stl_path = self._resolve_filesystem_path(stl_path)
@@ -4659,6 +5004,50 @@ class Viewer3DWidget(QWidget):
             print(f"Erreur STL {resolved_stl_path or stl_path}: {e}")
             return None
 
+    def _placeholder_mesh_data(self, stl_path: str) -> gl.MeshData:
+        # Boîte englobante estimée sur un échantillon du STL binaire ; cube de 100 mm posé sur
+        # le repère si le fichier est ASCII ou illisible.
+        bounds = estimate_stl_bounds(stl_path)
+        if bounds is None:
+            return self._build_primitive_mesh_data("box", 100.0, 100.0, 100.0, 0.0, 0.0)
+        lower, upper = bounds
+        size = upper - lower
+        box = self._build_primitive_mesh_data("box", size[0], size[1], size[2], 0.0, 0.0)
+        offset = np.array([(lower[0] + upper[0]) * 0.5, (lower[1] + upper[1]) * 0.5, lower[2]])
+        return gl.MeshData(vertexes=box.vertexes() + offset, faces=box.faces())
+
+    def has_pending_meshes(self) -> bool:
+        return self._mesh_loader.pending_count() > 0
+
+    def _on_mesh_loaded(self, stl_path: str, mesh_data: object) -> None:
+        if not isinstance(mesh_data, gl.MeshData):
+            self._on_mesh_failed(stl_path, "MeshData invalide")
+            return
+        self._mesh_data_cache[stl_path] = mesh_data
+        items = list(self._pending_mesh_items.pop(stl_path, ()))
+        with _SPANS.span("mesh_attach", "mesh", lazy_args=lambda: {"path": os.path.basename(stl_path), "items": len(items)}):
+            for item in items:
+                item.setMeshData(meshdata=mesh_data)
+                # L'occultation des caméras ne tient compte du maillage qu'une fois chargé.
+                item._calibrax_mesh_data = mesh_data
+            if items:
+                self.refresh_camera_visibility()
+                self.viewer.update()
+
+    def _on_mesh_failed(self, stl_path: str, message: str) -> None:
+        print(f"Erreur STL {stl_path}: {message}")
+        self._missing_mesh_paths.add(stl_path)
+        for item in list(self._pending_mesh_items.pop(stl_path, ())):
+            item.setMeshData(meshdata=item.opts["meshdata"], drawFaces=False)
+        self.viewer.update()
+        self.stl_load_errors_changed.emit(sorted(self._missing_mesh_paths))
+
+    def _on_mesh_loading_pending_changed(self, pending_count: int) -> None:
+        if pending_count > 0:
+            self._set_label_msg(f"Chargement CAO... ({pending_count} fichier(s) restant(s))")
+        elif self._loading_feedback_depth <= 0:
+            self._clear_label_msg()
+
     @staticmethod
     def _tag_occlusion_mesh_item(mesh_item, mesh_data, transform: np.ndarray, name: str) -> None:
         try:
@@ -4975,6 +5364,7 @@ class Viewer3DWidget(QWidget):
         if same_workspace and pose_changed and not structure_changed:
             self._refresh_robot_state_items()
             self._render_trajectory_overlay()
+            self._render_reachability_heatmap()
             self._render_workspace_models()
             self._normalize_workspace_frames_visibility()
             self.draw_workspace_frames()
@@ -5093,8 +5483,6 @@ class Viewer3DWidget(QWidget):
             self._external_axes_links.clear()
             self._external_axes_link_keys.clear()
             self._external_axes_cad_offsets.clear()
-            self._clear_viewer_items(self._external_axes_frame_items)
-
             for axis in axes:
                 transforms = world_transforms.get(axis.id)
                 if transforms is None:
@@ -5131,38 +5519,30 @@ class Viewer3DWidget(QWidget):
                             self._external_axes_link_keys.append((axis.id, ji))
                             self._external_axes_cad_offsets.append(cad_offset)
 
-                # ── Repères ────────────────────────────────────────────────
-                self._draw_external_axis_frames(axis, transforms)
+            # ── Repères (un seul item pour tous les axes) ──────────────────
+            self._render_external_axes_frames(
+                {axis.id: world_transforms[axis.id] for axis in axes if axis.id in world_transforms}
+            )
 
             self.update_frame_list_ui()
         finally:
             self.end_loading_feedback()
 
-    def _draw_external_axis_frames(self, axis, transforms: dict) -> None:
-        """Dessine les repères XYZ de la base, des joints et du point de montage."""
-        if not self._ext_axis_frames_visible.get(axis.id, True):
-            return
+    def _external_axis_frame_glyphs(self, axis_id: str, transforms: dict) -> list[FrameGlyph]:
+        """Repères XYZ de la base, des joints et du point de montage d'un axe."""
+        if not self._ext_axis_frames_visible.get(axis_id, True):
+            return []
         L = self.EXTERNAL_AXIS_FRAME_LENGTH
+        frames: list[FrameGlyph] = [(transforms["base"], L * 0.6, None)]
+        frames.extend((T_joint, L, None) for T_joint in transforms["joint_links"])
+        frames.append((transforms["end"], L * 1.2, None))
+        return frames
 
-        # Repère base (grisé, axes courts)
-        self._external_axes_frame_items.extend(
-            self.draw_frame(transforms["base"], longueur=L * 0.6,
-                            color=None)   # RGB classique
-        )
-
-        # Repères joints (couleur bleue-cyan pour distinguer du robot)
-        for T_joint in transforms["joint_links"]:
-            self._external_axes_frame_items.extend(
-                self.draw_frame(T_joint, longueur=L,
-                                color=None)
-            )
-
-        # Repère sortie / montage (vert vif — point d'attache)
-        T_end = transforms["end"]
-        end_frame_items = self.draw_frame(T_end, longueur=L * 1.2)
-        # Redessiner en couleurs personnalisées pour se démarquer
-        # (draw_frame a déjà ajouté les items au viewer — on les colorise après)
-        self._external_axes_frame_items.extend(end_frame_items)
+    def _render_external_axes_frames(self, world_transforms: dict) -> None:
+        frames: list[FrameGlyph] = []
+        for axis_id, transforms in world_transforms.items():
+            frames.extend(self._external_axis_frame_glyphs(axis_id, transforms))
+        self.draw_frames(self._external_axes_frame_items, frames)
 
     def update_external_axes_poses(self, world_transforms: dict) -> None:
         """Met à jour les positions des CAO ET redessine les repères axes externes."""
@@ -5203,29 +5583,8 @@ class Viewer3DWidget(QWidget):
                 if hasattr(mesh_item, "_calibrax_world_transform"):
                     mesh_item._calibrax_world_transform = np.array(T_render, dtype=float)
 
-        # ── Redessiner les repères (cheap : lignes seulement) ──────────
-        # On reconstruit depuis les objets axis stockés dans les clés
-        # Pour cela on passe par reload uniquement des frames (sans recréer les meshes)
-        self._clear_viewer_items(self._external_axes_frame_items)
-        # Regrouper par axis_id les transforms disponibles
-        for axis_id, transforms in world_transforms.items():
-            self._draw_external_axis_frames_by_id(axis_id, transforms)
-
-    def _draw_external_axis_frames_by_id(self, axis_id: str, transforms: dict) -> None:
-        """Redessine uniquement les repères d'un axe (sans info ExternalAxis complète)."""
-        if not self._ext_axis_frames_visible.get(axis_id, True):
-            return
-        L = self.EXTERNAL_AXIS_FRAME_LENGTH
-        self._external_axes_frame_items.extend(
-            self.draw_frame(transforms["base"], longueur=L * 0.6)
-        )
-        for T_joint in transforms["joint_links"]:
-            self._external_axes_frame_items.extend(
-                self.draw_frame(T_joint, longueur=L)
-            )
-        self._external_axes_frame_items.extend(
-            self.draw_frame(transforms["end"], longueur=L * 1.2)
-        )
+        # ── Redessiner les repères (cheap : setData sur un seul item) ──
+        self._render_external_axes_frames(world_transforms)
 
     def _restore_external_axes(self) -> None:
         """Recharge les axes externes depuis le snapshot après un clear_viewer()."""
@@ -5306,9 +5665,7 @@ class Viewer3DWidget(QWidget):
         if self._ext_axis_frames_visible.get(axis_id) == bool(checked):
             return
         self._ext_axis_frames_visible[axis_id] = bool(checked)
-        self._clear_viewer_items(self._external_axes_frame_items)
-        for aid, transforms in self._last_external_world_transforms.items():
-            self._draw_external_axis_frames_by_id(aid, transforms)
+        self._render_external_axes_frames(self._last_external_world_transforms)
         self._refresh_toolbar_buttons()
         self._emit_display_state_changed()
 
@@ -5474,21 +5831,17 @@ class Viewer3DWidget(QWidget):
         garantir que les repères (additive) sont rendus après les meshes (opaque)
         dans la liste d'items du viewer.
         """
-        self._clear_viewer_items(self._tooling_frame_items)
-        self._tooling_frame_items = []
-        self._clear_viewer_items(self._workpiece_frame_items)
-        self._workpiece_frame_items = []
-
+        tooling_frames: list[FrameGlyph] = []
         if self._tooling_frames_visible and self._tooling_snapshot:
             L = self.TOOLING_FRAME_LENGTH
-            for snap in self._tooling_snapshot:
-                frame_T_world = snap["frame_T_world"]
-                self._tooling_frame_items.extend(self.draw_frame(frame_T_world, longueur=L))
+            tooling_frames = [(snap["frame_T_world"], L, None) for snap in self._tooling_snapshot]
+        self.draw_frames(self._tooling_frame_items, tooling_frames)
 
+        workpiece_frames: list[FrameGlyph] = []
         if self._workpiece_frame_visible and self._workpiece_snapshot is not None:
             L = self.WORKPIECE_FRAME_LENGTH
-            frame_T_world = self._workpiece_snapshot["frame_T_world"]
-            self._workpiece_frame_items.extend(self.draw_frame(frame_T_world, longueur=L))
+            workpiece_frames = [(self._workpiece_snapshot["frame_T_world"], L, None)]
+        self.draw_frames(self._workpiece_frame_items, workpiece_frames)
 
     # ------------------------------------------------------------------
 
@@ -5523,60 +5876,98 @@ class Viewer3DWidget(QWidget):
             self._workspace_frame_labels.append(self._program_frame_label)
 
     def _render_workspace_zones(self) -> None:
-        self._clear_viewer_items(self._workspace_tcp_zone_items)
-        self._clear_viewer_items(self._workspace_collision_zone_items)
+        self._set_primitive_batch(
+            self._workspace_tcp_zone_items,
+            [(zone, zone.world_transform) for zone in self._workspace_tcp_zones],
+            (1.0, 0.93, 0.2, 0.22),
+            self._workspace_tcp_zones_visible,
+        )
+        self._set_primitive_batch(
+            self._workspace_collision_zone_items,
+            [(zone, zone.world_transform) for zone in self._workspace_collision_zones],
+            (1.0, 0.2, 0.2, 0.22),
+            self._workspace_collision_zones_visible,
+        )
 
-        for zone in self._workspace_tcp_zones:
-            item = self._build_primitive_item(zone, (1.0, 0.93, 0.2, 0.22))
-            if item is None:
-                continue
-            self.viewer.addItem(item)
-            self._workspace_tcp_zone_items.append(item)
-            if not self._workspace_tcp_zones_visible:
-                item.hide()
+    def _render_robot_axis_colliders(self) -> None:
+        self._set_primitive_batch(
+            self._robot_collider_items,
+            [
+                (collider, self._collider_world_transform(collider))
+                for collider in self._robot_colliders
+                if collider.enabled
+            ],
+            (0.2, 0.55, 1.0, 0.18),
+            self._robot_colliders_visible,
+        )
 
-        for zone in self._workspace_collision_zones:
-            item = self._build_primitive_item(zone, (1.0, 0.2, 0.2, 0.22))
-            if item is None:
-                continue
-            self.viewer.addItem(item)
-            self._workspace_collision_zone_items.append(item)
-            if not self._workspace_collision_zones_visible:
-                item.hide()
+    def _render_tool_colliders(self) -> None:
+        self._set_primitive_batch(
+            self._tool_collider_items,
+            [
+                (collider, self._collider_world_transform(collider))
+                for collider in self._tool_colliders
+                if collider.enabled
+            ],
+            (0.85, 0.35, 1.0, 0.24),
+            self._tool_colliders_visible,
+        )
 
-    def _render_robot_axis_colliders(self) -> None:
-        self._clear_viewer_items(self._robot_collider_items)
-        for collider in self._robot_colliders:
-            if not collider.enabled:
-                continue
-            item = self._build_primitive_item(
-                collider,
-                (0.2, 0.55, 1.0, 0.18),
-                world_transform=self._collider_world_transform(collider),
-            )
-            if item is None:
-                continue
+    def _set_primitive_batch(
+        self,
+        items: list,
+        primitives: list[tuple[PrimitiveCollider, np.ndarray]],
+        color: tuple[float, float, float, float],
+        visible: bool,
+    ) -> None:
+        """Fusionne les primitives d'une catégorie dans un seul GLMeshItem (un draw call).
+
+        Les sommets sont exprimés directement en repère monde ; l'item existant est
+        réutilisé via setMeshData() quand les colliders suivent la pose du robot.
+        """
+        mesh_data = self._build_primitive_batch_mesh_data(primitives)
+        if mesh_data is None:
+            self._clear_viewer_items(items)
+            return
+        if len(items) == 1:
+            item = items[0]
+            item.setMeshData(meshdata=mesh_data)
+            item.setColor(color)
+            self._ensure_viewer_item(item)
+        else:
+            self._clear_viewer_items(items)
+            item = gl.GLMeshItem(meshdata=mesh_data, smooth=True, color=color, shader='shaded')
+            self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
             self.viewer.addItem(item)
-            self._robot_collider_items.append(item)
-            if not self._robot_colliders_visible:
-                item.hide()
+            items.append(item)
+        item.setVisible(bool(visible))
 
-    def _render_tool_colliders(self) -> None:
-        self._clear_viewer_items(self._tool_collider_items)
-        for collider in self._tool_colliders:
-            if not collider.enabled:
-                continue
-            item = self._build_primitive_item(
-                collider,
-                (0.85, 0.35, 1.0, 0.24),
-                world_transform=self._collider_world_transform(collider),
+    def _build_primitive_batch_mesh_data(
+        self,
+        primitives: list[tuple[PrimitiveCollider, np.ndarray]],
+    ) -> gl.MeshData | None:
+        vertex_blocks: list[np.ndarray] = []
+        face_blocks: list[np.ndarray] = []
+        vertex_offset = 0
+        for primitive, world_transform in primitives:
+            mesh_data = self._build_primitive_mesh_data(
+                primitive.shape.value,
+                primitive.size_x,
+                primitive.size_y,
+                primitive.size_z,
+                primitive.radius,
+                primitive.height,
             )
-            if item is None:
+            if mesh_data is None:
                 continue
-            self.viewer.addItem(item)
-            self._tool_collider_items.append(item)
-            if not self._tool_colliders_visible:
-                item.hide()
+            vertexes = mesh_data.vertexes()
+            T = np.array(world_transform, dtype=float)
+            vertex_blocks.append(vertexes @ T[:3, :3].T + T[:3, 3])
+            face_blocks.append(mesh_data.faces() + vertex_offset)
+            vertex_offset += len(vertexes)
+        if not vertex_blocks:
+            return None
+        return gl.MeshData(vertexes=np.vstack(vertex_blocks), faces=np.vstack(face_blocks))
 
     def _refresh_robot_state_items(self) -> None:
         num_frames = len(self.last_dh_matrices)
@@ -5646,6 +6037,8 @@ class Viewer3DWidget(QWidget):
         self.draw_external_axes_frames()
         self._redraw_piece_frames()
 
+        self._render_reachability_heatmap()
+
         # 3. Trajectoire en dernier (additive → au premier plan absolu)
         self._render_trajectory_overlay()
         self.refresh_camera_visibility()
@@ -5675,55 +6068,6 @@ class Viewer3DWidget(QWidget):
                     mesh_item._calibrax_world_transform = np.array(T, dtype=float)
                 self._ensure_viewer_item(mesh_item)
 
-    def _build_primitive_item(
-        self,
-        primitive: PrimitiveCollider | PrimitiveColliderState,
-        color: tuple[float, float, float, float],
-        base_transform: np.ndarray | None = None,
-        world_transform: np.ndarray | None = None,
-        skip_pose: bool = False,
-    ) -> gl.GLMeshItem | None:
-        if isinstance(primitive, PrimitiveCollider):
-            shape = primitive.shape.value
-            size_x = primitive.size_x
-            size_y = primitive.size_y
-            size_z = primitive.size_z
-            radius = primitive.radius
-            height = primitive.height
-            transform_source = primitive.world_transform if world_transform is None else world_transform
-            transform = np.array(transform_source, dtype=float)
-        elif isinstance(primitive, PrimitiveColliderState):
-            shape = primitive.shape
-            size_x = primitive.size_x
-            size_y = primitive.size_y
-            size_z = primitive.size_z
-            radius = primitive.radius
-            height = primitive.height
-            primitive_transform = primitive.local_transform
-        else:
-            raise TypeError("primitive must be a PrimitiveCollider or PrimitiveColliderState")
-
-        mesh_data = self._build_primitive_mesh_data(shape, size_x, size_y, size_z, radius, height)
-        if mesh_data is None:
-            return None
-
-        if not isinstance(primitive, PrimitiveCollider):
-            transform = np.array(base_transform if base_transform is not None else np.eye(4), dtype=float)
-            if not skip_pose:
-                transform = transform @ primitive_transform
-
-        item = gl.GLMeshItem(meshdata=mesh_data, smooth=True, color=color, shader='shaded')
-        item.setTransform(
-            QtGui.QMatrix4x4(
-                transform[0, 0], transform[0, 1], transform[0, 2], transform[0, 3],
-                transform[1, 0], transform[1, 1], transform[1, 2], transform[1, 3],
-                transform[2, 0], transform[2, 1], transform[2, 2], transform[2, 3],
-                transform[3, 0], transform[3, 1], transform[3, 2], transform[3, 3],
-            )
-        )
-        self._apply_layer(item, self.LAYER_SCENE_TRANSLUCENT)
-        return item
-
     def _build_primitive_mesh_data(
         self,
         shape: str,
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pyqtgraph.opengl as gl
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+from stl import mesh
+
+from utils.span_recorder import get_span_recorder
+
+
+_SPANS = get_span_recorder()
+
+
+def decode_stl_mesh_data(stl_path: str) -> gl.MeshData:
+    """Décode un STL en MeshData prêt à l'affichage (normales lissées précalculées)."""
+    with _SPANS.span("decode_stl", "mesh", lazy_args=lambda: {"path": os.path.basename(stl_path)}):
+        stl_mesh = mesh.Mesh.from_file(stl_path)
+        verts = stl_mesh.vectors.reshape(-1, 3)
+        faces = np.arange(len(verts)).reshape(-1, 3)
+        mesh_data = gl.MeshData(vertexes=verts, faces=faces)
+    with _SPANS.span("vertex_normals", "mesh", faces=len(faces)):
+        # Le calcul des normales par sommet (boucle Python) est fait ici, hors thread GUI,
+        # plutôt qu'au premier rendu du GLMeshItem (smooth=True).
+        mesh_data.vertexNormals()
+    return mesh_data
+
+
+_BINARY_STL_HEADER_BYTES = 84
+_BINARY_STL_RECORD = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+
+
+def estimate_stl_bounds(stl_path: str, max_triangles: int = 2048) -> tuple[np.ndarray, np.ndarray] | None:
+    """Boîte englobante approchée (min, max) d'un STL binaire, sans décoder tout le fichier.
+
+    Seuls max_triangles enregistrements répartis sur le fichier sont lus : la boîte peut être
+    un peu plus petite que la vraie, ce qui suffit pour un volume provisoire. Retourne None
+    pour un STL ASCII ou un fichier illisible.
+    """
+    try:
+        size = os.path.getsize(stl_path)
+        with open(stl_path, "rb") as handle:
+            header = handle.read(_BINARY_STL_HEADER_BYTES)
+        if len(header) < _BINARY_STL_HEADER_BYTES:
+            return None
+        count = int(np.frombuffer(header, dtype="<u4", count=1, offset=80)[0])
+        if count == 0 or size != _BINARY_STL_HEADER_BYTES + count * _BINARY_STL_RECORD.itemsize:
+            return None
+        records = np.memmap(stl_path, dtype=_BINARY_STL_RECORD, mode="r", offset=_BINARY_STL_HEADER_BYTES, shape=(count,))
+        indices = np.unique(np.linspace(0, count - 1, min(count, max(1, int(max_triangles)))).astype(np.int64))
+        vertices = np.asarray(records["vertices"][indices], dtype=float).reshape(-1, 3)
+    except (OSError, ValueError):
+        return None
+    if not np.all(np.isfinite(vertices)):
+        return None
+    return vertices.min(axis=0), vertices.max(axis=0)
+
+
+class _MeshDispatchProxy(QObject):
+    dispatch = pyqtSignal(str)
+
+
+class MeshLoadWorker(QObject):
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+    @pyqtSlot(str)
+    def process(self, stl_path: str) -> None:
+        try:
+            mesh_data = decode_stl_mesh_data(stl_path)
+        except Exception as exc:
+            self.failed.emit(stl_path, str(exc))
+            return
+        self.loaded.emit(stl_path, mesh_data)
+
+
+class ViewerMeshLoader(QObject):
+    """Pool de threads de décodage STL ; les résultats reviennent sur le thread GUI."""
+
+    mesh_loaded = pyqtSignal(str, object)
+    mesh_failed = pyqtSignal(str, str)
+    pending_changed = pyqtSignal(int)
+
+    def __init__(self, pool_size: int | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        if pool_size is None:
+            pool_size = min(4, max(1, (os.cpu_count() or 2) - 1))
+        self._pool_size = max(1, int(pool_size))
+        self._threads: list[QThread] = []
+        self._workers: list[MeshLoadWorker] = []
+        self._dispatchers: list[_MeshDispatchProxy] = []
+        self._pending_paths: set[str] = set()
+        self._next_worker_index = 0
+        self._shutdown_requested = False
+
+        for _ in range(self._pool_size):
+            thread = QThread(self)
+            worker = MeshLoadWorker()
+            dispatcher = _MeshDispatchProxy(self)
+            worker.moveToThread(thread)
+            dispatcher.dispatch.connect(worker.process)
+            worker.loaded.connect(self._on_worker_loaded)
+            worker.failed.connect(self._on_worker_failed)
+            thread.start()
+            self._threads.append(thread)
+            self._workers.append(worker)
+            self._dispatchers.append(dispatcher)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    def pending_count(self) -> int:
+        return len(self._pending_paths)
+
+    def is_pending(self, stl_path: str) -> bool:
+        return stl_path in self._pending_paths
+
+    def request(self, stl_path: str) -> None:
+        """Demande le décodage de `stl_path` ; sans effet si déjà en cours."""
+        if self._shutdown_requested or stl_path in self._pending_paths:
+            return
+        self._pending_paths.add(stl_path)
+        _SPANS.async_begin("mesh_load", stl_path, "mesh", path=os.path.basename(stl_path))
+        worker_index = self._next_worker_index % len(self._dispatchers)
+        self._next_worker_index += 1
+        self._dispatchers[worker_index].dispatch.emit(stl_path)
+        self.pending_changed.emit(len(self._pending_paths))
+
+    def shutdown(self) -> None:
+        if self._shutdown_requested:
+            return
+        self._shutdown_requested = True
+        for thread in self._threads:
+            thread.quit()
+            thread.wait()
+
+    def _consume(self, stl_path: str) -> bool:
+        if stl_path not in self._pending_paths:
+            return False
+        self._pending_paths.discard(stl_path)
+        _SPANS.async_end("mesh_load", stl_path, "mesh")
+        return True
+
+    def _on_worker_loaded(self, stl_path: str, mesh_data: object) -> None:
+        if not self._consume(stl_path):
+            return
+        self.mesh_loaded.emit(stl_path, mesh_data)
+        self.pending_changed.emit(len(self._pending_paths))
+
+    def _on_worker_failed(self, stl_path: str, message: str) -> None:
+        if not self._consume(stl_path):
+            return
+        self.mesh_failed.emit(stl_path, message)
+        self.pending_changed.emit(len(self._pending_paths))
+
+
+__all__ = [
+    "MeshLoadWorker",
+    "ViewerMeshLoader",
+    "decode_stl_mesh_data",
+    "estimate_stl_bounds",
+]